@@ -5,11 +5,24 @@ import numpy as np
 from datetime import datetime, timedelta
 
 from services.binance_service import BinanceService
-from utils.technical_indicators import TechnicalIndicators
+from services.indicator_cache import indicator_cache
+from technical_analysis.indicators import TechnicalIndicators
+from technical_analysis.engine import parse_fields
 
 router = APIRouter(prefix="/crypto", tags=["Kripto"])
 binance_service = BinanceService()
 
+# /technical yanıtındaki "indicators" bölümünün varsayılan sütunları
+SUMMARY_COLUMNS = [
+    "rsi", "macd", "macd_signal", "macd_hist", "stoch_k", "stoch_d",
+    "bb_upper", "bb_middle", "bb_lower", "ma7", "ma25", "ma99", "adx"
+]
+
+
+def _analysis_columns(columns: List[str]) -> List[str]:
+    """İstenen sütunlar ile trend/sinyal analizinin okuduğu sütunların birleşimi"""
+    return list(dict.fromkeys(columns + TechnicalIndicators.TREND_COLUMNS + TechnicalIndicators.SIGNAL_COLUMNS))
+
 @router.get("/symbols")
 async def get_all_symbols():
     """
@@ -60,7 +73,8 @@ async def get_klines(
     symbol: str,
     interval: str = "1h",
     limit: int = 100,
-    add_indicators: bool = False
+    add_indicators: bool = False,
+    fields: Optional[str] = Query(None, description="Virgülle ayrılmış gösterge sütunları (örn. rsi,macd); boşsa tümü")
 ):
     """
     Belirli bir sembol için OHLCV (mum) verisini döndürür
@@ -75,41 +89,45 @@ async def get_klines(
         Dict: OHLCV verisi ve opsiyonel olarak teknik göstergeler
     """
     try:
-        # OHLCV verilerini al
+        columns = parse_fields(fields, list(TechnicalIndicators.COLUMNS)) or list(TechnicalIndicators.COLUMNS)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    async def build() -> Dict[str, Any]:
+        # OHLCV verilerini al (kapanmış mumlar yerel depodan okunur)
         klines = await binance_service.get_klines(symbol, interval, limit)
         
-        # DataFrame'e dönüştür
-        df = pd.DataFrame(klines, columns=[
-            'open_time', 'open', 'high', 'low', 'close', 'volume',
-            'close_time', 'quote_asset_volume', 'number_of_trades',
-            'taker_buy_base_asset_volume', 'taker_buy_quote_asset_volume', 'ignore'
-        ])
-        
-        # Veri tipleri düzeltme
-        for col in ['open', 'high', 'low', 'close', 'volume']:
-            df[col] = pd.to_numeric(df[col], errors='coerce')
-        
-        df['open_time'] = pd.to_datetime(df['open_time'], unit='ms')
+        # Açılış zamanını sütuna çevir
+        df = klines.reset_index().rename(columns={'timestamp': 'open_time'})
         df['close_time'] = pd.to_datetime(df['close_time'], unit='ms')
         
-        # Teknik göstergeleri ekle
+        # Teknik göstergeleri ekle (analizlerin okuduğu sütunlar da tek seferde hesaplanır)
+        analysis_df = df
         if add_indicators:
-            df = TechnicalIndicators.add_all_indicators(df)
+            analysis_df = TechnicalIndicators.add_all_indicators(df, _analysis_columns(columns))
+            df = analysis_df[list(df.columns) + columns]
         
-        # Sonucu JSON formatına dönüştür
+        # Sonucu JSON formatına dönüştür (ısınma dönemindeki NaN değerler null olur)
         result = {
             "symbol": symbol,
             "interval": interval,
-            "data": df.to_dict(orient='records')
+            "data": df.astype(object).where(df.notna(), None).to_dict(orient='records')
         }
         
         # Teknik göstergeler eklendiyse, trend analizi de ekle
         if add_indicators:
-            result["trend_analysis"] = TechnicalIndicators.get_trend(df)
-            result["signals"] = TechnicalIndicators.get_signals(df)
-            result["support_resistance"] = TechnicalIndicators.identify_support_resistance(df)
+            result["trend_analysis"] = TechnicalIndicators.get_trend(analysis_df)
+            result["signals"] = TechnicalIndicators.get_signals(analysis_df)
+            result["support_resistance"] = TechnicalIndicators.identify_support_resistance(analysis_df)
         
         return result
+    
+    try:
+        if not add_indicators:
+            return await build()
+        # Göstergeli sonuç kısa süre (en geç mum sınırına kadar) önbellekten sunulur
+        key = indicator_cache.series_key("crypto.klines", symbol, interval, limit, columns)
+        return await indicator_cache.get_or_compute(key, interval, build)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"OHLCV verisi alınırken hata oluştu: {str(e)}")
 
@@ -172,7 +190,8 @@ async def get_top_volume(
 async def get_technical_analysis(
     symbol: str,
     interval: str = "1h",
-    limit: int = 100
+    limit: int = 100,
+    fields: Optional[str] = Query(None, description="Virgülle ayrılmış gösterge sütunları (örn. rsi,adx); boşsa temel göstergeler")
 ):
     """
     Bir sembol için detaylı teknik analiz bilgilerini döndürür
@@ -181,30 +200,26 @@ async def get_technical_analysis(
         symbol: İstenilen kripto para sembolü (örn. BTCUSDT)
         interval: Zaman aralığı (1m, 3m, 5m, 15m, 30m, 1h, 2h, 4h, 6h, 8h, 12h, 1d, 3d, 1w, 1M)
         limit: Kaç mum kullanılacağı
+        fields: "indicators" bölümünde döndürülecek gösterge sütunları
         
     Returns:
         Dict: Teknik analiz sonuçları ve öneriler
     """
     try:
-        # OHLCV verilerini al
+        columns = parse_fields(fields, list(TechnicalIndicators.COLUMNS)) or SUMMARY_COLUMNS
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    async def build() -> Dict[str, Any]:
+        # OHLCV verilerini al (kapanmış mumlar yerel depodan okunur)
         klines = await binance_service.get_klines(symbol, interval, limit)
         
-        # DataFrame'e dönüştür
-        df = pd.DataFrame(klines, columns=[
-            'open_time', 'open', 'high', 'low', 'close', 'volume',
-            'close_time', 'quote_asset_volume', 'number_of_trades',
-            'taker_buy_base_asset_volume', 'taker_buy_quote_asset_volume', 'ignore'
-        ])
-        
-        # Veri tipleri düzeltme
-        for col in ['open', 'high', 'low', 'close', 'volume']:
-            df[col] = pd.to_numeric(df[col], errors='coerce')
-        
-        df['open_time'] = pd.to_datetime(df['open_time'], unit='ms')
+        # Açılış zamanını sütuna çevir
+        df = klines.reset_index().rename(columns={'timestamp': 'open_time'})
         df['close_time'] = pd.to_datetime(df['close_time'], unit='ms')
         
-        # Teknik göstergeleri ekle
-        df = TechnicalIndicators.add_all_indicators(df)
+        # Teknik göstergeleri ekle (yalnızca özet ve analizlerin okuduğu sütunlar)
+        df = TechnicalIndicators.add_all_indicators(df, _analysis_columns(columns))
         
         # Son fiyat
         current_price = df['close'].iloc[-1]
@@ -230,19 +245,8 @@ async def get_technical_analysis(
         
         # Temel teknik gösterge değerleri
         indicators = {
-            "rsi": float(df['rsi'].iloc[-1]),
-            "macd": float(df['macd'].iloc[-1]),
-            "macd_signal": float(df['macd_signal'].iloc[-1]),
-            "macd_hist": float(df['macd_hist'].iloc[-1]),
-            "stoch_k": float(df['stoch_k'].iloc[-1]),
-            "stoch_d": float(df['stoch_d'].iloc[-1]),
-            "bb_upper": float(df['bb_upper'].iloc[-1]),
-            "bb_middle": float(df['bb_middle'].iloc[-1]),
-            "bb_lower": float(df['bb_lower'].iloc[-1]),
-            "ma7": float(df['ma7'].iloc[-1]),
-            "ma25": float(df['ma25'].iloc[-1]),
-            "ma99": float(df['ma99'].iloc[-1]),
-            "adx": float(df['adx'].iloc[-1])
+            column: None if pd.isna(df[column].iloc[-1]) else float(df[column].iloc[-1])
+            for column in columns
         }
         
         # Sonuç
@@ -256,5 +260,10 @@ async def get_technical_analysis(
             "signals": signals,
             "support_resistance": support_resistance
         }
+    
+    try:
+        # Sonuç kısa süre (en geç mum sınırına kadar) önbellekten sunulur
+        key = indicator_cache.series_key("crypto.technical", symbol, interval, limit, columns)
+        return await indicator_cache.get_or_compute(key, interval, build)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Teknik analiz yapılırken hata oluştu: {str(e)}") 
\ No newline at end of file
@@ -2,6 +2,7 @@ from fastapi import APIRouter, HTTPException, Depends, Query
 from typing import List, Optional
 
 from services.binance_service import BinanceService
+from services.symbol_registry import symbol_registry
 
 router = APIRouter(
     prefix="/symbols",
@@ -18,12 +19,10 @@ async def get_symbols(
     Kripto para sembollerini listeler
     """
     try:
-        binance_service = BinanceService()
-        symbols_info = await binance_service.get_symbols_info()
+        await symbol_registry.ensure_loaded()
         
-        # Filtrele
-        if quote_asset:
-            symbols_info = [s for s in symbols_info if s["quoteAsset"] == quote_asset]
+        # Kote varlık indeksi üzerinden filtrele (varsayılan: USDT)
+        symbols_info = symbol_registry.symbols(quote_asset=quote_asset or "USDT", status="TRADING")
         
         # Favori filtreleme (gerçek uygulamada veritabanından çekilir)
         if only_favorites:
@@ -46,13 +45,11 @@ async def get_symbol_info(symbol: str):
     try:
         binance_service = BinanceService()
         
-        # Sembol bilgisini al
-        symbols_info = await binance_service.get_symbols_info()
-        
-        # İstenen sembolü bul
-        symbol_info = next((s for s in symbols_info if s["symbol"] == symbol.upper()), None)
+        # Sembol bilgisini kayıttan al (sözlük araması)
+        await symbol_registry.ensure_loaded()
+        symbol_info = symbol_registry.get(symbol)
         
-        if not symbol_info:
+        if not symbol_info or symbol_info["status"] != "TRADING":
             raise HTTPException(status_code=404, detail=f"Sembol bulunamadı: {symbol}")
         
         # 24 saatlik fiyat değişim bilgilerini al
@@ -61,6 +58,7 @@ async def get_symbol_info(symbol: str):
         # Bilgileri birleştir
         result = {
             **symbol_info,
+            "filters": symbol_registry.get_filters(symbol),
             "price": ticker_info["lastPrice"],
             "priceChange": ticker_info["priceChange"],
             "priceChangePercent": ticker_info["priceChangePercent"],
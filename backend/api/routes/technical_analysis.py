@@ -1,9 +1,16 @@
 from fastapi import APIRouter, HTTPException, Query, Depends
 from typing import List, Dict, Any, Optional
 import asyncio
+import time
 
+from data.rate_limiter import Priority
 from services.binance_service import BinanceService
+from services.indicator_cache import indicator_cache
+from utils.intervals import INTERVAL_MS
 from utils.technical_indicators import TechnicalIndicators
+from technical_analysis.engine import parse_fields
+from technical_analysis.batch import batch_trends
+from technical_analysis.backtest import BACKTEST_MAX_CANDLES, BacktestConfig, SIGNAL_NAMES, run_backtest
 
 router = APIRouter(
     prefix="/technical",
@@ -16,17 +23,23 @@ async def get_technical_indicators(
     symbol: str, 
     interval: str = Query("1d", description="Mum aralığı: 1m, 5m, 15m, 30m, 1h, 4h, 1d, 1w, 1M"),
     limit: int = Query(100, ge=10, le=1000, description="Kaç kayıt getirileceği"),
+    fields: Optional[str] = Query(None, description="Virgülle ayrılmış gösterge alanları (örn. rsi_14,macd); boşsa tümü"),
 ):
     """
     Belirli bir sembol için teknik göstergeleri hesaplar ve döndürür
     """
     try:
+        selected = parse_fields(fields, TechnicalIndicators.INDICATOR_FIELDS)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    async def build() -> Dict[str, Any]:
         # Binance servisinden veri al
         binance_service = BinanceService()
         klines = await binance_service.get_klines(symbol, interval, limit)
         
-        # Teknik göstergeleri hesapla
-        indicators_df = TechnicalIndicators.calculate_indicators(klines)
+        # Teknik göstergeleri hesapla (yalnızca istenen alanlar ve bağımlılıkları)
+        indicators_df = TechnicalIndicators.calculate_indicators(klines, selected)
         
         # JSON'a dönüştür (son 30 kayıt)
         result = indicators_df.tail(30).to_dict(orient="records")
@@ -36,6 +49,11 @@ async def get_technical_indicators(
             "interval": interval,
             "data": result
         }
+    
+    try:
+        # Sonuç kısa süre (en geç mum sınırına kadar) önbellekten sunulur
+        key = indicator_cache.series_key("technical.indicators", symbol, interval, limit, selected)
+        return await indicator_cache.get_or_compute(key, interval, build)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Teknik göstergeler hesaplanırken hata oluştu: {str(e)}")
 
@@ -48,25 +66,128 @@ async def get_trend_analysis(
     """
     Belirli bir sembol için teknik analiz trend sonuçlarını döndürür
     """
-    try:
+    async def build() -> Dict[str, Any]:
         # Binance servisinden veri al
         binance_service = BinanceService()
         klines = await binance_service.get_klines(symbol, interval, limit)
         
-        # Teknik göstergeleri hesapla
-        indicators_df = TechnicalIndicators.calculate_indicators(klines)
-        
-        # Trend analizi yap
-        trend = TechnicalIndicators.analyze_trend(indicators_df)
+        # Trend analizi yap (yalnızca trendin okuduğu göstergeler hesaplanır)
+        trend = TechnicalIndicators.analyze_trend(klines)
         
         return {
             "symbol": symbol,
             "interval": interval,
             "trend": trend
         }
+    
+    try:
+        key = indicator_cache.series_key("technical.trend", symbol, interval, limit)
+        return await indicator_cache.get_or_compute(key, interval, build)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Trend analizi yapılırken hata oluştu: {str(e)}")
 
+@router.get("/confluence/{symbol}")
+async def get_confluence(
+    symbol: str,
+    intervals: str = Query("5m,15m,1h,4h,1d", description="Virgülle ayrılmış mum aralıkları (1M hariç)"),
+    limit: int = Query(100, ge=10, le=1000, description="Aralık başına kaç mum kullanılacağı"),
+):
+    """
+    Bir sembolün birden çok zaman dilimindeki trendlerini ve aralarındaki uyumu döndürür.
+    Tüm aralıklar tek bir 1m mum serisinden üretilir (aralık başına ayrı istek yapılmaz).
+    """
+    selected = list(dict.fromkeys(part.strip() for part in intervals.split(",") if part.strip()))
+    unknown = [interval for interval in selected if interval not in INTERVAL_MS]
+    if not selected or unknown:
+        raise HTTPException(status_code=400, detail=f"Geçersiz mum aralıkları: {', '.join(unknown) or intervals}")
+    selected.sort(key=INTERVAL_MS.get)
+    
+    async def build() -> Dict[str, Any]:
+        binance_service = BinanceService()
+        frames = await binance_service.get_multi_timeframe_klines(symbol, selected, limit)
+        
+        return {
+            "symbol": symbol,
+            "intervals": selected,
+            "confluence": TechnicalIndicators.analyze_confluence(frames)
+        }
+    
+    try:
+        # Sonuç kısa süre (en geç en küçük aralığın mum sınırına kadar) önbellekten sunulur
+        key = indicator_cache.series_key("technical.confluence", symbol, selected[0], limit, selected)
+        return await indicator_cache.get_or_compute(key, selected[0], build)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Çoklu zaman dilimi analizi yapılırken hata oluştu: {str(e)}")
+
+@router.get("/backtest/{symbol}")
+async def get_backtest(
+    symbol: str,
+    interval: str = Query("1h", description="Mum aralığı: 1m, 5m, 15m, 30m, 1h, 4h, 1d, 1w"),
+    days: int = Query(90, ge=1, le=3650, description="Test edilecek gün sayısı (bugüne kadar)"),
+    signal: str = Query("overall", description=f"Kullanılacak sinyal: {', '.join(SIGNAL_NAMES)}"),
+    fee: float = Query(BacktestConfig.fee, ge=0, lt=0.1, description="İşlem tarafı başına komisyon oranı"),
+    slippage: float = Query(BacktestConfig.slippage, ge=0, lt=0.1, description="Piyasa emirlerinde kayma oranı"),
+    stop_atr: float = Query(BacktestConfig.stop_atr, ge=0, description="Zarar durdur mesafesi (ATR katı, 0: kapalı)"),
+    take_profit_atr: float = Query(BacktestConfig.take_profit_atr, ge=0, description="Kâr al mesafesi (ATR katı, 0: kapalı)"),
+    allow_short: bool = Query(False, description="SAT sinyalinde açığa satış pozisyonu açılsın mı"),
+    points: int = Query(500, ge=10, le=5000, description="Özsermaye eğrisinin nokta sayısı"),
+    trades: int = Query(100, ge=0, le=1000, description="Döndürülecek son işlem sayısı"),
+):
+    """
+    `get_signals` sinyallerinin geçmiş veride nasıl sonuç vereceğini test eder: her mumun
+    sinyali bir sonraki mumun açılışında komisyon ve kaymayla işleme dönüştürülür, ATR
+    tabanlı zarar durdur/kâr al uygulanır. Özsermaye eğrisi, düşüş, kazanma oranı ve
+    Sharpe oranı döndürülür.
+    """
+    if interval not in INTERVAL_MS:
+        raise HTTPException(status_code=400, detail=f"Geçersiz mum aralığı: {interval}")
+    if signal not in SIGNAL_NAMES:
+        raise HTTPException(status_code=400, detail=f"Bilinmeyen sinyal: {signal}. Geçerli değerler: {', '.join(SIGNAL_NAMES)}")
+    span = days * INTERVAL_MS["1d"]
+    if span // INTERVAL_MS[interval] > BACKTEST_MAX_CANDLES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"İstenen aralık {BACKTEST_MAX_CANDLES} mumdan fazla; daha kısa bir süre ya da daha büyük bir aralık seçin"
+        )
+    config = BacktestConfig(
+        fee=fee, slippage=slippage, stop_atr=stop_atr, take_profit_atr=take_profit_atr, allow_short=allow_short
+    )
+    
+    async def build() -> Dict[str, Any]:
+        binance_service = BinanceService()
+        end_time = int(time.time() * 1000)
+        history = await binance_service.get_historical_klines(
+            symbol, interval, end_time - span, end_time, priority=Priority.INTERACTIVE
+        )
+        klines = history["klines"]
+        if klines.empty:
+            raise ValueError(f"{symbol} için mum verisi bulunamadı")
+        
+        # Uzun serilerde hesaplama olay döngüsünü bekletmesin
+        result = await asyncio.to_thread(run_backtest, klines, interval, signal, config)
+        
+        return {
+            "symbol": symbol,
+            "interval": interval,
+            "signal": signal,
+            "start_time": int(klines.index[0].value // 1_000_000),
+            "end_time": int(klines.index[-1].value // 1_000_000),
+            **result.to_dict(points, trades)
+        }
+    
+    try:
+        key = indicator_cache.series_key(
+            "technical.backtest", symbol, interval, days,
+            (signal, fee, slippage, stop_atr, take_profit_atr, allow_short, points, trades)
+        )
+        return await indicator_cache.get_or_compute(key, interval, build)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Geriye dönük test yapılırken hata oluştu: {str(e)}")
+
 @router.get("/multi-trends")
 async def get_multiple_trends(
     symbols: List[str] = Query(..., description="Analiz edilecek semboller"),
@@ -78,24 +199,24 @@ async def get_multiple_trends(
     try:
         binance_service = BinanceService()
         
-        async def analyze_symbol(symbol):
-            try:
-                klines = await binance_service.get_klines(symbol, interval, 100)
-                indicators_df = TechnicalIndicators.calculate_indicators(klines)
-                trend = TechnicalIndicators.analyze_trend(indicators_df)
-                return {
-                    "symbol": symbol,
-                    "trend": trend
-                }
-            except Exception as e:
-                return {
-                    "symbol": symbol,
-                    "error": str(e)
-                }
-        
-        # Tüm sembolleri paralel olarak analiz et
-        tasks = [analyze_symbol(symbol) for symbol in symbols]
-        results = await asyncio.gather(*tasks)
+        # Mum verilerini paralel olarak al
+        klines = await asyncio.gather(
+            *(binance_service.get_klines(symbol, interval, 100) for symbol in symbols),
+            return_exceptions=True
+        )
+        frames = {symbol: data for symbol, data in zip(symbols, klines) if not isinstance(data, Exception)}
+        
+        # Tüm semboller için göstergeleri tek toplu hesaplamada (semboller x zaman) hesapla
+        trends = batch_trends(frames)
+        
+        results = []
+        for symbol, data in zip(symbols, klines):
+            if isinstance(data, Exception):
+                results.append({"symbol": symbol, "error": str(data)})
+            elif symbol not in trends:
+                results.append({"symbol": symbol, "error": "Mum verisi yok"})
+            else:
+                results.append({"symbol": symbol, "trend": trends[symbol]})
         
         return {
             "interval": interval,
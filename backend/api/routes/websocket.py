@@ -1,5 +1,6 @@
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Query, HTTPException
 from fastapi.responses import JSONResponse
+from fastapi.websockets import WebSocketState
 import json
 import asyncio
 import logging
@@ -7,7 +8,12 @@ from typing import Dict, List, Any, Optional
 import pandas as pd
 
 from data.binance_client import binance_client
+from services.binance_service import BinanceService
+from services.live_candles import live_candles
 from utils.technical_indicators import TechnicalIndicators
+from technical_analysis.streaming import StreamingIndicators
+from utils.intervals import INTERVAL_MS
+from utils.ring_buffer import CandleRingBuffer
 
 # Logger
 logger = logging.getLogger("torypto")
@@ -17,9 +23,68 @@ router = APIRouter(
     tags=["WebSocket"],
 )
 
+binance_service = BinanceService()
+
+# Kline akışı başına tutulan mum sayısı (ilk veri ve canlı pencere)
+KLINE_WINDOW = 100
+# Canlı pencerede tutulan mum alanları
+WINDOW_FIELDS = (
+    "open", "high", "low", "close", "volume", "quote_asset_volume", "number_of_trades",
+    "taker_buy_base_asset_volume", "taker_buy_quote_asset_volume",
+)
+
 # Aktif bağlantıları tutan değişkenler
 connected_price_clients: Dict[str, List[WebSocket]] = {}  # symbol -> [websocket, websocket]
 connected_indicator_clients: Dict[str, List[WebSocket]] = {}  # symbol_interval -> [websocket, websocket]
+indicator_states: Dict[str, StreamingIndicators] = {}  # symbol_interval -> artımlı gösterge durumu
+candle_windows: Dict[str, CandleRingBuffer] = {}  # symbol_interval -> son mumların canlı penceresi
+indicator_callbacks: Dict[str, Any] = {}  # symbol_interval -> canlı mumlara abone olan callback (abonelik kaydı)
+price_callbacks: Dict[str, Any] = {}  # symbol -> ticker akışına abone olan callback (abonelik kaydı)
+
+
+def _kline_records(klines_df: pd.DataFrame) -> List[Dict[str, Any]]:
+    """
+    Mum tablosunu JSON'a yazılabilir satırlara çevirir. Açılış zamanı indeksi (Timestamp)
+    canlı `kline_update` olaylarıyla aynı biçimde epoch milisaniye `open_time` olarak yazılır.
+    """
+    records = klines_df.reset_index(drop=True)
+    records.insert(0, "open_time", pd.DatetimeIndex(klines_df.index).as_unit("ms").asi8)
+    return records.to_dict(orient="records")
+
+
+async def _release_price_client(symbol: str, stream_name: str, websocket: WebSocket) -> None:
+    """
+    Fiyat istemcisini listeden çıkarır; son istemci ayrıldıysa akış aboneliğini kaldırır.
+    Bağlantı hangi yoldan sonlanırsa sonlansın (kopma, hata) çağrılır.
+    """
+    clients = connected_price_clients.get(symbol)
+    if clients is not None and websocket in clients:
+        clients.remove(websocket)
+    if clients:
+        return
+    connected_price_clients.pop(symbol, None)
+    if price_callbacks.pop(symbol, None) is not None:
+        await binance_client.unsubscribe_stream(stream_name)
+
+
+async def _release_kline_client(key: str, symbol: str, interval: str, websocket: WebSocket) -> None:
+    """
+    Kline istemcisini listeden çıkarır; son istemci ayrıldıysa canlı mum aboneliğini,
+    gösterge durumunu ve canlı pencereyi kaldırır. Bağlantı hangi yoldan sonlanırsa
+    sonlansın (ısınma hatası, kopma, hata) çağrılır.
+    """
+    clients = connected_indicator_clients.get(key)
+    if clients is not None and websocket in clients:
+        clients.remove(websocket)
+    if clients:
+        return
+    connected_indicator_clients.pop(key, None)
+    indicator_states.pop(key, None)
+    candle_windows.pop(key, None)
+    callback = indicator_callbacks.pop(key, None)
+    if callback is not None:
+        await live_candles.unsubscribe(symbol, interval, callback)
+
 
 @router.websocket("/price/{symbol}")
 async def websocket_price_endpoint(websocket: WebSocket, symbol: str):
@@ -36,17 +101,14 @@ async def websocket_price_endpoint(websocket: WebSocket, symbol: str):
     symbol = symbol.lower()
     stream_name = f"{symbol}@ticker"
     
-    # Bağlantıyı kaydet
-    if symbol not in connected_price_clients:
-        connected_price_clients[symbol] = []
-    connected_price_clients[symbol].append(websocket)
+    # Bağlantıyı kaydet (akışa yalnızca bir kez abone olunur, callback tüm istemcilere yayınlar)
+    connected_price_clients.setdefault(symbol, []).append(websocket)
     
     # Callback fonksiyonu
-    async def on_message(message):
-        data = json.loads(message)
+    async def on_message(data):
         # Tüm bağlı istemcilere gönder
         for client in connected_price_clients.get(symbol, []):
-            if client.client_state.CONNECTED:  # Sadece aktif bağlantılara gönder
+            if client.client_state == WebSocketState.CONNECTED:  # Sadece aktif bağlantılara gönder
                 try:
                     await client.send_json({
                         "event": "price_update",
@@ -65,26 +127,29 @@ async def websocket_price_endpoint(websocket: WebSocket, symbol: str):
     # Binance WebSocket bağlantısını başlat
     try:
         logger.info(f"Binance WebSocket bağlantısı kuruluyor: {stream_name}")
-        await binance_client.connect_websocket(stream_name, on_message)
+        # Abonelik açıkça kaydedilir; kayıt await'ten önce yapılır ki eşzamanlı istemciler
+        # ikinci kez abone olmasın
+        if symbol not in price_callbacks:
+            price_callbacks[symbol] = on_message
+            try:
+                await binance_client.subscribe_stream(stream_name, on_message)
+            except Exception:
+                price_callbacks.pop(symbol, None)
+                raise
         
         # Bağlantı kesilene kadar bekle
-        try:
-            while True:
-                data = await websocket.receive_text()
-                logger.debug(f"İstemciden alınan mesaj: {data}")
-                # İstemci komutlarını buradan işleyebilirsiniz
-        except WebSocketDisconnect:
-            logger.info(f"İstemci bağlantısı kesildi: {symbol}")
-            # Bağlantıyı listeden kaldır
-            if symbol in connected_price_clients:
-                connected_price_clients[symbol].remove(websocket)
-                # Hiç istemci kalmadıysa, Binance WS bağlantısını da kapat
-                if not connected_price_clients[symbol]:
-                    await binance_client.disconnect_websocket(stream_name)
-                    del connected_price_clients[symbol]
+        while True:
+            data = await websocket.receive_text()
+            logger.debug(f"İstemciden alınan mesaj: {data}")
+            # İstemci komutlarını buradan işleyebilirsiniz
+    except WebSocketDisconnect:
+        logger.info(f"İstemci bağlantısı kesildi: {symbol}")
     except Exception as e:
         logger.error(f"WebSocket fiyat akışı hatası: {e}")
-        await websocket.close(code=1011, reason=f"Sunucu hatası: {str(e)}")
+        await _close(websocket, f"Sunucu hatası: {str(e)}")
+    finally:
+        # Bağlantı her durumda listeden çıkarılır; son istemciyle abonelik de kaldırılır
+        await _release_price_client(symbol, stream_name, websocket)
 
 @router.websocket("/kline/{symbol}")
 async def websocket_kline_endpoint(
@@ -94,8 +159,9 @@ async def websocket_kline_endpoint(
 ):
     """
     Belirli bir sembol ve zaman aralığı için gerçek zamanlı mum verisi ve teknik gösterge güncellemeleri sağlar.
-    WebSocket bağlantısı kurulduğunda, sembol için Binance WebSocket akışına abone olur
-    ve mum verisi güncellemelerini istemciye iletir.
+    WebSocket bağlantısı kurulduğunda sembolün canlı mumlarına abone olur ve mum verisi
+    güncellemelerini istemciye iletir. Tüm aralıklar sembol başına tek bir Binance 1m
+    akışından türetilir (bkz. `services.live_candles`).
     
     Örnek bağlantı URL'i: ws://localhost:8002/ws/kline/btcusdt?interval=1m
     """
@@ -103,98 +169,136 @@ async def websocket_kline_endpoint(
     
     # Sembolü küçük harfe çevir
     symbol = symbol.lower()
-    stream_name = f"{symbol}@kline_{interval}"
     key = f"{symbol}_{interval}"
     
-    # Bağlantıyı kaydet
-    if key not in connected_indicator_clients:
-        connected_indicator_clients[key] = []
-    connected_indicator_clients[key].append(websocket)
-    
-    # Mum verilerini saklamak için bir DataFrame
-    # Her yeni mum geldiğinde güncellenir ve teknik göstergeler hesaplanır
+    # Bağlantıyı kaydet (akışa yalnızca bir kez abone olunur, callback tüm istemcilere yayınlar)
+    connected_indicator_clients.setdefault(key, []).append(websocket)
+    try:
+        await _stream_klines(websocket, key, symbol, interval)
+    except WebSocketDisconnect:
+        logger.info(f"İstemci bağlantısı kesildi: {key}")
+    except Exception as e:
+        logger.error(f"WebSocket kline akışı hatası: {e}")
+        await _close(websocket, f"Sunucu hatası: {str(e)}")
+    finally:
+        # Bağlantı her durumda listeden çıkarılır; son istemciyle abonelik ve durum da kaldırılır
+        await _release_kline_client(key, symbol, interval, websocket)
+
+
+async def _close(websocket: WebSocket, reason: str) -> None:
+    """
+    Bağlantıyı sunucu hatasıyla kapatır (zaten kapanmışsa sessizce geçer)
+    """
+    if websocket.client_state == WebSocketState.CONNECTED:
+        try:
+            await websocket.close(code=1011, reason=reason[:120])
+        except Exception as e:
+            logger.debug(f"WebSocket kapatma hatası: {e}")
+
+
+async def _stream_klines(websocket: WebSocket, key: str, symbol: str, interval: str) -> None:
+    """
+    İlk veriyi gönderir, canlı mumlara (gerekirse) abone olur ve istemci ayrılana kadar bekler.
+    Isınma veya gönderim hatası çağırana iletilir; temizlik çağıranın `finally` bloğundadır.
+    """
+    # İlk veriler için mum verileri ve göstergeler
     klines_df = None
     
     # İlk veriyi al
     try:
-        # Geçmiş mum verilerini al
-        klines = await binance_client.get_klines(
-            symbol=symbol.upper(), 
-            interval=interval, 
-            limit=100
-        )
-        
-        # DataFrame'e dönüştür
-        klines_df = pd.DataFrame(klines, columns=[
-            "timestamp", "open", "high", "low", "close", "volume",
-            "close_time", "quote_asset_volume", "number_of_trades",
-            "taker_buy_base_asset_volume", "taker_buy_quote_asset_volume", "ignore"
-        ])
+        window = candle_windows.get(key)
+        if key in indicator_states and window is not None and len(window) and interval in INTERVAL_MS:
+            # Akış zaten canlıysa ilk veri canlı pencereden üretilir (yeniden istek yapılmaz)
+            klines_df = window.to_frame()
+            klines_df["close_time"] = window.open_times() + INTERVAL_MS[interval] - 1
+            klines_df["number_of_trades"] = klines_df["number_of_trades"].astype("int64")
+        else:
+            # Geçmiş mum verilerini al (kapanmış mumlar yerel depodan okunur)
+            klines_df = await binance_service.get_klines(
+                symbol=symbol.upper(), 
+                interval=interval, 
+                limit=KLINE_WINDOW
+            )
         
-        # Veri tiplerini düzelt
-        numeric_columns = ["open", "high", "low", "close", "volume"]
-        for col in numeric_columns:
-            klines_df[col] = pd.to_numeric(klines_df[col])
-        
-        # Zaman damgasını datetime'a dönüştür
-        klines_df["timestamp"] = pd.to_datetime(klines_df["timestamp"], unit="ms")
-        klines_df.set_index("timestamp", inplace=True)
+        # Kapanan mumlarda göstergeler artımlı güncellenir; durum kapanmış mumlarla ısıtılır
+        # (eşzamanlı bağlanan istemcilerden yalnızca ilk tamamlanan durumu kurar)
+        if key not in indicator_states:
+            now_ms = int(pd.Timestamp.now(tz="UTC").timestamp() * 1000)
+            indicator_states[key] = StreamingIndicators.from_frame(klines_df[klines_df["close_time"] < now_ms])
+            # Canlı pencere sabit kapasitelidir; mumlar yerinde güncellenir, mum başına bellek ayrılmaz
+            window = CandleRingBuffer(KLINE_WINDOW, WINDOW_FIELDS)
+            window.extend_frame(klines_df)
+            candle_windows[key] = window
         
         # Teknik göstergeleri hesapla
         klines_df = TechnicalIndicators.calculate_indicators(klines_df)
         
     except Exception as e:
         logger.error(f"Geçmiş mum verilerini alma hatası: {e}")
-        await websocket.close(code=1011, reason=f"Veri alma hatası: {str(e)}")
+        await _close(websocket, f"Veri alma hatası: {str(e)}")
         return
     
     # Callback fonksiyonu
-    async def on_message(message):
-        nonlocal klines_df
-        
+    async def on_message(data):
         try:
-            data = json.loads(message)
             kline = data.get("k", {})
             
             # Mum tamamlandı mı kontrol et
             is_closed = kline.get("x", False)
             
-            # Tamamlanmış mum ise DataFrame'i güncelle ve göstergeleri yeniden hesapla
-            if is_closed:
-                # Yeni satır oluştur
-                timestamp = pd.to_datetime(kline.get("t"), unit="ms")
-                new_row = pd.DataFrame([{
+            # Canlı pencereyi güncelle (açık mum yerinde güncellenir, yeni mum O(1) eklenir)
+            window = candle_windows.get(key)
+            if window is not None:
+                window.upsert(kline.get("t"), {
                     "open": float(kline.get("o")),
                     "high": float(kline.get("h")),
                     "low": float(kline.get("l")),
                     "close": float(kline.get("c")),
                     "volume": float(kline.get("v")),
-                    "close_time": pd.to_datetime(kline.get("T"), unit="ms"),
                     "quote_asset_volume": float(kline.get("q")),
                     "number_of_trades": kline.get("n"),
                     "taker_buy_base_asset_volume": float(kline.get("V")),
                     "taker_buy_quote_asset_volume": float(kline.get("Q")),
-                    "ignore": 0
-                }], index=[timestamp])
-                
-                # DataFrame'e ekle ve en eski satırı kaldır
-                klines_df = pd.concat([klines_df, new_row]).iloc[-100:]
+                })
+            
+            # Tamamlanmış mum ise göstergeleri artımlı güncelle (mum başına O(1))
+            if is_closed:
+                state = indicator_states.get(key)
+                open_time = kline.get("t")
+                # Aynı mum tekrar gelirse (yeniden bağlanma sonrası boşluk doldurma) atla
+                if state is None or (state.last_open_time is not None and open_time <= state.last_open_time):
+                    return
                 
-                # Teknik göstergeleri yeniden hesapla
-                klines_df = TechnicalIndicators.calculate_indicators(klines_df)
+                close = float(kline.get("c"))
+                state.update(
+                    float(kline.get("o")),
+                    float(kline.get("h")),
+                    float(kline.get("l")),
+                    close,
+                    float(kline.get("v")),
+                    float(kline.get("V")),
+                    open_time
+                )
                 
-                # Son satırı al ve teknik göstergeleri çıkar
-                last_row = klines_df.iloc[-1].to_dict()
+                # Son satır: mum alanları ve göstergeler (ısınma dönemindeki değerler 0)
+                last_row = {
+                    "quote_asset_volume": float(kline.get("q")),
+                    "number_of_trades": kline.get("n"),
+                    "taker_buy_base_asset_volume": float(kline.get("V")),
+                    "taker_buy_quote_asset_volume": float(kline.get("Q")),
+                    **state.snapshot(fill_value=0.0)
+                }
+                last_frame = pd.DataFrame([{"close": close, **last_row}])
                 
                 # Trend analizi yap
-                trend = TechnicalIndicators.analyze_trend(klines_df)
+                trend = TechnicalIndicators.analyze_trend(last_frame)
                 
                 # Sinyalleri hesapla
-                signals = TechnicalIndicators.get_signals(klines_df)
+                signals = TechnicalIndicators.get_signals(last_frame)
                 
                 # Tüm bağlı istemcilere gönder
                 for client in connected_indicator_clients.get(key, []):
-                    if client.client_state.CONNECTED:  # Sadece aktif bağlantılara gönder
+                    if client.client_state == WebSocketState.CONNECTED:  # Sadece aktif bağlantılara gönder
                         try:
                             await client.send_json({
                                 "event": "kline_update",
@@ -210,7 +314,7 @@ async def websocket_kline_endpoint(
                                         "volume": kline.get("v"),
                                         "close_time": kline.get("T"),
                                     },
-                                    "indicators": {key: last_row[key] for key in last_row if key not in ['open', 'high', 'low', 'close', 'volume', 'close_time']},
+                                    "indicators": last_row,
                                     "trend": trend,
                                     "signals": signals
                                 }
@@ -220,7 +324,7 @@ async def websocket_kline_endpoint(
             else:
                 # Tamamlanmamış mum için sadece fiyat güncellemesi gönder
                 for client in connected_indicator_clients.get(key, []):
-                    if client.client_state.CONNECTED:
+                    if client.client_state == WebSocketState.CONNECTED:
                         try:
                             await client.send_json({
                                 "event": "kline_progress",
@@ -240,47 +344,41 @@ async def websocket_kline_endpoint(
         except Exception as e:
             logger.error(f"WebSocket kline işleme hatası: {e}")
     
-    # Binance WebSocket bağlantısını başlat
-    try:
-        logger.info(f"Binance WebSocket kline bağlantısı kuruluyor: {stream_name}")
-        await binance_client.connect_websocket(stream_name, on_message)
-        
-        # İlk verileri gönder
-        if klines_df is not None:
-            last_indicators = klines_df.iloc[-1].to_dict()
-            trend = TechnicalIndicators.analyze_trend(klines_df)
-            signals = TechnicalIndicators.get_signals(klines_df)
-            
-            await websocket.send_json({
-                "event": "initial_data",
-                "symbol": symbol,
-                "interval": interval,
-                "data": {
-                    "indicators": {key: last_indicators[key] for key in last_indicators if key not in ['open', 'high', 'low', 'close', 'volume', 'close_time']},
-                    "trend": trend,
-                    "signals": signals,
-                    "klines": klines_df.reset_index().to_dict(orient="records")
-                }
-            })
-        
-        # Bağlantı kesilene kadar bekle
+    # Canlı mum aboneliğini başlat
+    logger.info(f"Canlı mum aboneliği kuruluyor: {symbol} {interval}")
+    # Abonelik açıkça kaydedilir; kayıt await'ten önce yapılır ki eşzamanlı istemciler
+    # ikinci kez abone olmasın
+    if key not in indicator_callbacks:
+        indicator_callbacks[key] = on_message
         try:
-            while True:
-                data = await websocket.receive_text()
-                logger.debug(f"İstemciden alınan mesaj: {data}")
-                # İstemci komutlarını buradan işleyebilirsiniz
-        except WebSocketDisconnect:
-            logger.info(f"İstemci bağlantısı kesildi: {key}")
-            # Bağlantıyı listeden kaldır
-            if key in connected_indicator_clients:
-                connected_indicator_clients[key].remove(websocket)
-                # Hiç istemci kalmadıysa, Binance WS bağlantısını da kapat
-                if not connected_indicator_clients[key]:
-                    await binance_client.disconnect_websocket(stream_name)
-                    del connected_indicator_clients[key]
-    except Exception as e:
-        logger.error(f"WebSocket kline akışı hatası: {e}")
-        await websocket.close(code=1011, reason=f"Sunucu hatası: {str(e)}")
+            await live_candles.subscribe(symbol, interval, on_message)
+        except Exception:
+            indicator_callbacks.pop(key, None)
+            raise
+    
+    # İlk verileri gönder
+    if klines_df is not None:
+        last_indicators = klines_df.iloc[-1].to_dict()
+        trend = TechnicalIndicators.analyze_trend(klines_df)
+        signals = TechnicalIndicators.get_signals(klines_df)
+        
+        await websocket.send_json({
+            "event": "initial_data",
+            "symbol": symbol,
+            "interval": interval,
+            "data": {
+                "indicators": {name: last_indicators[name] for name in last_indicators if name not in ['open', 'high', 'low', 'close', 'volume', 'close_time']},
+                "trend": trend,
+                "signals": signals,
+                "klines": _kline_records(klines_df)
+            }
+        })
+    
+    # Bağlantı kesilene kadar bekle (kopma WebSocketDisconnect olarak çağırana iletilir)
+    while True:
+        data = await websocket.receive_text()
+        logger.debug(f"İstemciden alınan mesaj: {data}")
+        # İstemci komutlarını buradan işleyebilirsiniz
 
 @router.get("/status")
 async def websocket_status():
@@ -0,0 +1,111 @@
+"""
+Gösterge arka uçlarını (talib, numba, numpy) karşılaştırır: her göstergenin her arka uçta
+numpy arka ucuyla tolerans içinde aynı olduğunu (ısınma dönemi NaN konumları dahil)
+doğrular ve dağıtım başına en hızlı arka ucu seçmek için süre tablosu basar. Bu
+ortamda kurulu olmayan arka uçlar atlanır.
+
+Kullanım:
+    python -m benchmarks.bench_backends --candles 1000 100000 1000000
+"""
+import argparse
+import time
+from typing import Callable, Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.bench_volume_indicators import make_ohlcv
+from technical_analysis import backends
+from technical_analysis.backends import Backend
+from technical_analysis.indicators import TechnicalIndicators as TAIndicators
+
+RTOL = 1e-8
+ATOL = 1e-8
+
+Arrays = Dict[str, np.ndarray]
+
+# Gösterge adı -> arka uç ve OHLCV dizileriyle çağrı
+CALLS: Dict[str, Callable[[Backend, Arrays], object]] = {
+    "ema(25)": lambda b, a: b.ema(a["close"], 25),
+    "rsi(14)": lambda b, a: b.rsi(a["close"], 14),
+    "macd(12,26,9)": lambda b, a: b.macd(a["close"], 12, 26, 9),
+    "stddev(20)": lambda b, a: b.stddev(a["close"], 20),
+    "atr(14)": lambda b, a: b.atr(a["high"], a["low"], a["close"], 14),
+    "stoch(14,3,3)": lambda b, a: b.stoch(a["high"], a["low"], a["close"], 14, 3, 3),
+    "dmi/adx(14)": lambda b, a: b.dmi(a["high"], a["low"], a["close"], 14),
+    "cci(14)": lambda b, a: b.cci(a["high"], a["low"], a["close"], 14),
+    "obv": lambda b, a: b.obv(a["close"], a["volume"]),
+    "sar(0.02,0.2)": lambda b, a: b.sar(a["high"], a["low"], 0.02, 0.2),
+}
+
+
+def arrays(df: pd.DataFrame) -> Arrays:
+    return {column: df[column].to_numpy(dtype=float) for column in ("open", "high", "low", "close", "volume")}
+
+
+def _outputs(result) -> Tuple[np.ndarray, ...]:
+    return tuple(result) if isinstance(result, tuple) else (result,)
+
+
+def check_parity(df: pd.DataFrame) -> List[str]:
+    """
+    Her göstergeyi her arka uçta numpy arka ucuyla karşılaştırır
+
+    Returns:
+        List[str]: Karşılaştırılan arka uçlar
+    """
+    data = arrays(df)
+    names = backends.available_backends()
+    reference = backends.use_backend("numpy")
+    expected = {name: _outputs(call(reference, data)) for name, call in CALLS.items()}
+    frame = TAIndicators.add_all_indicators(df)
+    for backend_name in names:
+        backend = backends.use_backend(backend_name)
+        for name, call in CALLS.items():
+            for index, (got, want) in enumerate(zip(_outputs(call(backend, data)), expected[name])):
+                message = f"{backend_name} {name} çıktı {index}"
+                np.testing.assert_array_equal(np.isnan(got), np.isnan(want), err_msg=f"{message}: NaN konumları")
+                np.testing.assert_allclose(got, want, rtol=RTOL, atol=ATOL, equal_nan=True, err_msg=message)
+        pd.testing.assert_frame_equal(TAIndicators.add_all_indicators(df), frame, rtol=RTOL, atol=ATOL,
+                                      obj=f"{backend_name} add_all_indicators")
+    return names
+
+
+def _timed(func: Callable[[], object], repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - started) * 1000)
+    return min(timings)
+
+
+def main(candle_counts: List[int], repeat: int) -> None:
+    names = check_parity(make_ohlcv(3000, seed=5))
+    print(f"parity: {len(CALLS)} gösterge, arka uçlar: {', '.join(names)} (rtol={RTOL:g}, atol={ATOL:g})")
+    print(f"auto seçimi: {backends.use_backend('auto').name}")
+
+    header = f"{'candles':>9} {'indicator':>15}" + "".join(f" {name + ' (ms)':>12}" for name in names)
+    print(header + f" {'fastest':>8}")
+    for candles in candle_counts:
+        df = make_ohlcv(candles, seed=1)
+        data = arrays(df)
+        rows = {name: (lambda b, call=call: call(b, data)) for name, call in CALLS.items()}
+        rows["ta view (all)"] = lambda b: TAIndicators.add_all_indicators(df)
+        for indicator, call in rows.items():
+            timings = {}
+            for backend_name in names:
+                backend = backends.use_backend(backend_name)
+                timings[backend_name] = _timed(lambda: call(backend), repeat)
+            fastest = min(timings, key=timings.get)
+            print(f"{candles:>9} {indicator:>15}" + "".join(f" {timings[name]:>12.2f}" for name in names)
+                  + f" {fastest:>8}")
+    backends.use_backend(backends.INDICATOR_BACKEND)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Gösterge arka uçları benchmark'ı")
+    parser.add_argument("--candles", type=int, nargs="+", default=[1000, 100000, 1000000], help="Mum sayıları")
+    parser.add_argument("--repeat", type=int, default=3, help="Ölçüm tekrar sayısı (en iyisi alınır)")
+    args = parser.parse_args()
+    main(args.candles, args.repeat)
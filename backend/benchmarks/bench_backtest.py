@@ -0,0 +1,155 @@
+"""
+Geriye dönük test motorunu (`technical_analysis.backtest`) doğrular ve yıllarca 1m mum
+üzerinde ölçer. numba ve numpy arka uçlarının aynı işlemleri ve özsermaye eğrisini
+ürettiği, nakitteki her mumda özsermayenin kapanan işlemlerin getirilerinin çarpımına
+eşit olduğu ve elle hesaplanan küçük senaryoların (sinyalle giriş/çıkış, zarar durdur,
+kâr al, açığa satış) aynı sonucu verdiği doğrulanır. `/technical/backtest` uç noktası
+sahte `get_historical_klines` ile çağrılır.
+
+Kullanım:
+    python -m benchmarks.bench_backtest --years 1 2
+"""
+import argparse
+import asyncio
+import time
+from typing import List
+
+import numpy as np
+import pandas as pd
+
+from api.routes import technical_analysis
+from benchmarks.bench_volume_indicators import make_ohlcv
+from services.binance_service import BinanceService
+from technical_analysis import jit
+from technical_analysis.backtest import BacktestConfig, backtest, run_backtest
+from technical_analysis.indicators import TechnicalIndicators
+
+MINUTES_PER_YEAR = 365 * 24 * 60
+
+
+def minutes(count: int, seed: int = 11) -> pd.DataFrame:
+    df = make_ohlcv(count, seed=seed)
+    df.index = pd.DatetimeIndex(pd.to_datetime(np.arange(count) * 60_000, unit="ms"), name="timestamp")
+    return df
+
+
+def check_scenarios() -> None:
+    """
+    Elle hesaplanan küçük senaryolar
+    """
+    open_ = np.array([100.0, 100, 102, 104, 106, 108, 110])
+    close = open_ + 1
+    high, low = close + 0.5, open_ - 0.5
+    atr = np.full(len(open_), 1.0)
+    plain = BacktestConfig(fee=0.0, slippage=0.0, stop_atr=0.0, take_profit_atr=0.0)
+
+    # 1. mumda AL -> 2. mumun açılışında giriş; 4. mumda SAT -> 5. mumun açılışında çıkış
+    signal = np.array([0, 1, 0, 0, -1, 0, 0])
+    result = backtest(signal, open_, high, low, close, atr, plain)
+    assert result.trades["return"].tolist() == [108 / 102 - 1]
+    assert result.position.tolist() == [0, 0, 1, 1, 1, 0, 0]
+    np.testing.assert_allclose(result.equity[2:5], close[2:5] / 102)
+    assert result.equity[-1] == result.equity[5] == 108 / 102
+
+    # Komisyon ve kayma: giriş aleyhe 102 * 1.001, çıkış 108 * 0.999, iki tarafta %0.1
+    costly = BacktestConfig(fee=0.001, slippage=0.001, stop_atr=0.0, take_profit_atr=0.0)
+    result = backtest(signal, open_, high, low, close, atr, costly)
+    expected = 0.999 * 0.999 * (108 * 0.999) / (102 * 1.001) - 1
+    np.testing.assert_allclose(result.trades["return"], [expected])
+    np.testing.assert_allclose(result.equity[-1], 1 + expected)
+
+    # Zarar durdur: giriş 102, ATR 1 -> durdurma 100; 3. mumun düşüğü 99 (açılış 101)
+    dip = low.copy()
+    dip[3] = 99.0
+    falling_open = open_.copy()
+    falling_open[3] = 101.0
+    stop = BacktestConfig(fee=0.0, slippage=0.0, stop_atr=2.0, take_profit_atr=0.0)
+    result = backtest(signal, falling_open, high, dip, close, atr, stop)
+    assert result.trades[["exit_index", "exit_price", "reason"]].values.tolist() == [[3, 100.0, 1]]
+    # Açılış durdurmanın altındaysa (boşluk) açılıştan çıkılır
+    falling_open[3] = 99.5
+    result = backtest(signal, falling_open, high, dip, close, atr, stop)
+    assert result.trades["exit_price"].tolist() == [99.5]
+
+    # Kâr al: giriş 102, hedef 102 + 3 = 105; 3. mumun yükseği 105.5
+    target = BacktestConfig(fee=0.0, slippage=0.0, stop_atr=0.0, take_profit_atr=3.0)
+    result = backtest(signal, open_, high, low, close, atr, target)
+    assert result.trades[["exit_index", "exit_price", "reason"]].values.tolist() == [[3, 105.0, 2]]
+
+    # Açığa satış: SAT sinyali uzun pozisyonu kapatıp kısa pozisyon açar
+    short = BacktestConfig(fee=0.0, slippage=0.0, stop_atr=0.0, take_profit_atr=0.0, allow_short=True)
+    result = backtest(signal, open_, high, low, close, atr, short)
+    assert result.trades["side"].tolist() == [1] and result.position.tolist() == [0, 0, 1, 1, 1, -1, -1]
+    np.testing.assert_allclose(result.equity[-1], (108 / 102) * (2 - close[-1] / 108))
+
+
+def check_backends(df: pd.DataFrame) -> None:
+    for config in (BacktestConfig(), BacktestConfig(allow_short=True, stop_atr=1.0, take_profit_atr=1.5)):
+        jit.set_backend("numpy")
+        expected = run_backtest(df, "1m", config=config)
+        jit.set_backend("auto")
+        got = run_backtest(df, "1m", config=config)
+        np.testing.assert_array_equal(got.equity, expected.equity)
+        np.testing.assert_array_equal(got.position, expected.position)
+        pd.testing.assert_frame_equal(got.trades, expected.trades)
+        assert got.stats == expected.stats
+        check_compounding(got)
+
+
+def check_compounding(result) -> None:
+    """
+    Nakitteki her mumda özsermaye, o muma kadar kapanan işlemlerin getirilerinin çarpımıdır
+    """
+    trades = result.trades
+    assert len(trades) > 100 and set(trades["reason"]) == {0, 1, 2}
+    growth = np.cumprod(np.concatenate(([1.0], 1 + trades["return"].to_numpy())))
+    closed = np.searchsorted(trades["exit_index"].to_numpy(), np.arange(len(result.equity)), side="right")
+    flat = result.position == 0
+    np.testing.assert_allclose(result.equity[flat], growth[closed[flat]], rtol=1e-9)
+
+
+async def check_endpoint(df: pd.DataFrame) -> None:
+    async def get_historical_klines(self, symbol, interval, start_time, end_time=None, concurrency=8, priority=0):
+        return {"klines": df, "gaps": [], "requests": 0}
+
+    BinanceService.get_historical_klines = get_historical_klines
+    response = await technical_analysis.get_backtest(
+        "BTCUSDT", "1m", 30, "macd", 0.001, 0.0005, 2.0, 3.0, False, 100, 5
+    )
+    expected = run_backtest(df, "1m", "macd", BacktestConfig(0.001, 0.0005, 2.0, 3.0, False))
+    assert response["stats"] == expected.stats and len(response["equity_curve"]) == 100
+    assert len(response["trades"]) == min(5, len(expected.trades))
+
+
+def main(years: List[float]) -> None:
+    check_scenarios()
+    sample = minutes(50_000)
+    check_backends(sample)
+    asyncio.run(check_endpoint(sample))
+    print("parity: senaryolar, numba == numpy, özsermaye = işlem getirilerinin çarpımı, uç nokta")
+
+    print(f"{'years':>6} {'candles':>9} {'signals (ms)':>13} {'numba (ms)':>11} {'python (ms)':>12} {'trades':>7}")
+    for year in years:
+        df = minutes(int(year * MINUTES_PER_YEAR))
+        started = time.perf_counter()
+        df = TechnicalIndicators.add_all_indicators(df, TechnicalIndicators.SIGNAL_COLUMNS + ["atr"])
+        codes = TechnicalIndicators.signal_series(df)["overall"].to_numpy()
+        signal_ms = (time.perf_counter() - started) * 1000
+        arrays = (codes, df["open"], df["high"], df["low"], df["close"], df["atr"])
+
+        timings = {}
+        for backend in ("auto", "numpy"):
+            jit.set_backend(backend)
+            started = time.perf_counter()
+            result = backtest(*arrays)
+            timings[backend] = (time.perf_counter() - started) * 1000
+        jit.set_backend("auto")
+        print(f"{year:>6} {len(df):>9} {signal_ms:>13.0f} {timings['auto']:>11.0f} {timings['numpy']:>12.0f} "
+              f"{result.stats['trades']:>7}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Geriye dönük test benchmark'ı")
+    parser.add_argument("--years", type=float, nargs="+", default=[1, 2], help="1m mum verisi (yıl)")
+    args = parser.parse_args()
+    main(args.years)
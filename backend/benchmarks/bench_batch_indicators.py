@@ -0,0 +1,92 @@
+"""
+Piyasa geneli tarama: sembol başına DataFrame hattı (calculate_indicators + analyze_trend)
+ile (semboller x zaman) matrisleri üzerindeki toplu hesaplamayı karşılaştırır ve son
+satır değerlerinin aynı olduğunu doğrular.
+
+Kullanım:
+    python -m benchmarks.bench_batch_indicators --symbols 400 --candles 100
+"""
+import argparse
+import time
+from typing import Dict
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.bench_volume_indicators import make_ohlcv
+from technical_analysis.batch import MarketMatrix, batch_trends, compute_batch, snapshot
+from utils.technical_indicators import TechnicalIndicators
+
+
+def make_market(symbols: int, candles: int) -> Dict[str, pd.DataFrame]:
+    """
+    Ortak zaman ekseninde semboller; bazıları yeni listelenmiş gibi daha kısa
+    """
+    index = pd.date_range("2024-01-01", periods=candles, freq="h", name="timestamp")
+    frames = {}
+    for i in range(symbols):
+        df = make_ohlcv(candles, seed=i)
+        df.index = index
+        if i % 10 == 0:
+            df = df.iloc[candles // 3:]
+        frames[f"SYM{i:04d}USDT"] = df
+    return frames
+
+
+def per_symbol(frames: Dict[str, pd.DataFrame]):
+    indicators, trends = {}, {}
+    for symbol, df in frames.items():
+        result = TechnicalIndicators.calculate_indicators(df)
+        indicators[symbol] = result.iloc[-1]
+        trends[symbol] = TechnicalIndicators.analyze_trend(result)
+    return indicators, trends
+
+
+def check_parity(frames: Dict[str, pd.DataFrame]) -> None:
+    matrix = MarketMatrix.from_frames(frames)
+    last = snapshot(matrix, compute_batch(matrix))
+    expected, trends = per_symbol(frames)
+    for symbol, row in expected.items():
+        for field in TechnicalIndicators.INDICATOR_FIELDS:
+            np.testing.assert_allclose(last.at[symbol, field], row[field], rtol=1e-9, atol=1e-9,
+                                       err_msg=f"{symbol} {field}")
+    batch = batch_trends(frames)
+    for symbol, trend in trends.items():
+        assert batch[symbol]["trend"] == trend["trend"] and batch[symbol]["strength"] == trend["strength"], symbol
+
+
+def main(symbols: int, candles: int, repeat: int) -> None:
+    frames = make_market(symbols, candles)
+    check_parity(frames)
+    print(f"parity: {symbols} sembol, {len(TechnicalIndicators.INDICATOR_FIELDS)} alan ve trendler aynı")
+
+    started = time.perf_counter()
+    per_symbol(frames)
+    per_symbol_ms = (time.perf_counter() - started) * 1000
+
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        batch_trends(frames)
+        timings.append((time.perf_counter() - started) * 1000)
+    batch_ms = min(timings)
+
+    matrix = MarketMatrix.from_frames(frames)
+    started = time.perf_counter()
+    compute_batch(matrix, TechnicalIndicators.TREND_FIELDS)
+    compute_ms = (time.perf_counter() - started) * 1000
+
+    print(f"{'method':>28} {'time (ms)':>10}")
+    print(f"{'per-symbol DataFrame':>28} {per_symbol_ms:>10.1f}")
+    print(f"{'batch (align + trends)':>28} {batch_ms:>10.1f}")
+    print(f"{'batch indicators only':>28} {compute_ms:>10.1f}")
+    print(f"speed-up: {per_symbol_ms / batch_ms:.0f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Toplu gösterge benchmark'ı")
+    parser.add_argument("--symbols", type=int, default=400, help="Sembol sayısı")
+    parser.add_argument("--candles", type=int, default=100, help="Sembol başına mum sayısı")
+    parser.add_argument("--repeat", type=int, default=5, help="Toplu ölçüm tekrar sayısı")
+    args = parser.parse_args()
+    main(args.symbols, args.candles, args.repeat)
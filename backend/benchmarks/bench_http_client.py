@@ -0,0 +1,100 @@
+"""
+Paylaşımlı (havuzlu) HTTP istemcisi ile çağrı başına yeni istemci açma davranışını karşılaştırır.
+
+Yerel bir sahte Binance sunucusu başlatır ve her iki yöntemle aynı istekleri göndererek
+p50/p99 gecikmelerini raporlar.
+
+Kullanım:
+    python -m benchmarks.bench_http_client --requests 500 --concurrency 20
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from typing import Awaitable, Callable, List
+
+import httpx
+from aiohttp import web
+
+from services.binance_service import BinanceService
+
+
+async def _start_mock_upstream(port: int) -> web.AppRunner:
+    """
+    Sabit bir ticker yanıtı döndüren yerel sahte sunucuyu başlatır
+    """
+    payload = json.dumps({"symbol": "BTCUSDT", "price": "65000.00000000"})
+
+    async def ticker_price(request: web.Request) -> web.Response:
+        return web.Response(text=payload, content_type="application/json")
+
+    app = web.Application()
+    app.router.add_get("/api/v3/ticker/price", ticker_price)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    await web.TCPSite(runner, "127.0.0.1", port).start()
+    return runner
+
+
+async def _per_call_price(base_url: str, symbol: str) -> float:
+    """
+    Eski davranış: her çağrıda yeni bir httpx istemcisi oluşturur
+    """
+    async with httpx.AsyncClient(timeout=30.0) as client:
+        response = await client.get(f"{base_url}/api/v3/ticker/price", params={"symbol": symbol})
+        response.raise_for_status()
+        return float(response.json()["price"])
+
+
+async def _measure(call: Callable[[], Awaitable[float]], total: int, concurrency: int) -> List[float]:
+    """
+    Verilen çağrıyı sınırlı eşzamanlılıkla çalıştırır ve gecikmeleri (ms) döndürür
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+
+    async def one():
+        async with semaphore:
+            started = time.perf_counter()
+            await call()
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    await asyncio.gather(*(one() for _ in range(total)))
+    return latencies
+
+
+def _report(name: str, latencies: List[float], elapsed: float) -> None:
+    ordered = sorted(latencies)
+    p50 = statistics.median(ordered)
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    print(f"{name:<12} p50={p50:8.2f} ms  p99={p99:8.2f} ms  throughput={len(ordered) / elapsed:8.1f} req/s")
+
+
+async def main(total: int, concurrency: int, port: int) -> None:
+    runner = await _start_mock_upstream(port)
+    base_url = f"http://127.0.0.1:{port}"
+    try:
+        started = time.perf_counter()
+        per_call = await _measure(lambda: _per_call_price(base_url, "BTCUSDT"), total, concurrency)
+        _report("per-call", per_call, time.perf_counter() - started)
+
+        await BinanceService.start()
+        service = BinanceService(base_url=base_url)
+        # Havuzu ısıt
+        await service.get_price("BTCUSDT")
+        started = time.perf_counter()
+        pooled = await _measure(lambda: service.get_price("BTCUSDT"), total, concurrency)
+        _report("pooled", pooled, time.perf_counter() - started)
+    finally:
+        await BinanceService.shutdown()
+        await runner.cleanup()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="HTTP istemci havuzu benchmark'ı")
+    parser.add_argument("--requests", type=int, default=500, help="Toplam istek sayısı")
+    parser.add_argument("--concurrency", type=int, default=20, help="Eşzamanlı istek sayısı")
+    parser.add_argument("--port", type=int, default=18081, help="Sahte sunucu portu")
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.concurrency, args.port))
@@ -0,0 +1,111 @@
+"""
+Çok sayıda panonun aynı göstergeleri yoklamasını (polling) gösterge sonucu önbelleği
+olmadan ve önbellekle karşılaştırır. Uç nokta fonksiyonları doğrudan çağrılır; mum verisi
+sabit gecikmeli sahte bir `get_klines` ile üretilir. Önbellekten dönen yanıtların yeniden
+hesaplananlarla aynı olduğunu doğrular.
+
+Kullanım:
+    python -m benchmarks.bench_indicator_cache --dashboards 50 --polls 20 --symbols 10
+"""
+import argparse
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, List
+
+import pandas as pd
+
+from api.routes import crypto, technical_analysis
+from benchmarks.bench_volume_indicators import make_ohlcv
+from services.binance_service import BinanceService
+from services.indicator_cache import indicator_cache
+
+INTERVAL = "1h"
+LIMIT = 200
+
+
+def install_fake_klines(latency_ms: float) -> List[str]:
+    """
+    `BinanceService.get_klines` yerine sembol başına sabit veri döndüren gecikmeli sahte
+    fonksiyon koyar
+
+    Returns:
+        List[str]: Her çağrıda sembol adı eklenen sayaç listesi
+    """
+    calls: List[str] = []
+
+    async def get_klines(self, symbol: str, interval: str, limit: int = 100, priority: int = 0) -> pd.DataFrame:
+        calls.append(symbol)
+        await asyncio.sleep(latency_ms / 1000)
+        df = make_ohlcv(limit, seed=sum(map(ord, symbol)))
+        df.index = pd.DatetimeIndex(
+            pd.date_range(end=pd.Timestamp.now().floor("h"), periods=limit, freq="h"), name="timestamp"
+        )
+        df["close_time"] = df.index.as_unit("ms").asi8 + 3_600_000 - 1
+        return df
+
+    BinanceService.get_klines = get_klines
+    return calls
+
+
+def requests_for(symbol: str) -> List[Callable[[], Awaitable[Any]]]:
+    """
+    Bir panonun her yoklamada çağırdığı uç noktalar
+    """
+    return [
+        lambda: technical_analysis.get_technical_indicators(symbol, INTERVAL, LIMIT, None),
+        lambda: technical_analysis.get_trend_analysis(symbol, INTERVAL, LIMIT),
+        lambda: crypto.get_technical_analysis(symbol, INTERVAL, LIMIT, None),
+        lambda: crypto.get_klines(symbol, INTERVAL, LIMIT, True, "rsi,macd"),
+    ]
+
+
+async def poll(dashboards: int, polls: int, symbols: List[str]) -> float:
+    """
+    Her pano `polls` kez kendi sembolünün tüm uç noktalarını çağırır; toplam süre (ms)
+    """
+    async def dashboard(index: int) -> None:
+        calls = requests_for(symbols[index % len(symbols)])
+        for _ in range(polls):
+            await asyncio.gather(*(call() for call in calls))
+
+    started = time.perf_counter()
+    await asyncio.gather(*(dashboard(i) for i in range(dashboards)))
+    return (time.perf_counter() - started) * 1000
+
+
+async def check_parity(symbols: List[str]) -> None:
+    indicator_cache.enabled = False
+    expected = [await call() for call in requests_for(symbols[0])]
+    indicator_cache.enabled = True
+    indicator_cache.clear()
+    for _ in range(2):
+        got = [await call() for call in requests_for(symbols[0])]
+        assert got == expected
+
+
+async def main(dashboards: int, polls: int, symbol_count: int, latency_ms: float) -> None:
+    calls = install_fake_klines(latency_ms)
+    symbols = [f"SYM{i:03d}USDT" for i in range(symbol_count)]
+    await check_parity(symbols)
+    print("parity: önbellekten dönen yanıtlar yeniden hesaplananlarla aynı")
+
+    total = dashboards * polls * len(requests_for(symbols[0]))
+    print(f"{'mode':>10} {'requests':>9} {'computations':>13} {'time (ms)':>10} {'per request (ms)':>17}")
+    for enabled in (False, True):
+        indicator_cache.enabled = enabled
+        indicator_cache.clear()
+        calls.clear()
+        elapsed = await poll(dashboards, polls, symbols)
+        mode = "cache" if enabled else "no cache"
+        print(f"{mode:>10} {total:>9} {len(calls):>13} {elapsed:>10.1f} {elapsed / total:>17.3f}")
+    print(indicator_cache.stats())
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Gösterge önbelleği benchmark'ı")
+    parser.add_argument("--dashboards", type=int, default=50, help="Eşzamanlı pano sayısı")
+    parser.add_argument("--polls", type=int, default=20, help="Pano başına yoklama sayısı")
+    parser.add_argument("--symbols", type=int, default=10, help="Farklı sembol sayısı")
+    parser.add_argument("--latency-ms", type=float, default=20, help="Sahte mum isteği gecikmesi (ms)")
+    args = parser.parse_args()
+    asyncio.run(main(args.dashboards, args.polls, args.symbols, args.latency_ms))
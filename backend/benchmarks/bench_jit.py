@@ -0,0 +1,170 @@
+"""
+Yola bağımlı gösterge çekirdeklerini (Wilder/EMA özyinelemesi, ADX/DMI, pencere en
+yüksek/en düşükleri, Parabolic SAR, SuperTrend, pivot taraması) önceki pandas
+uygulamaları, numpy arka ucu ve numba arka ucuyla karşılaştırır. numba ve numpy arka
+uçlarının birebir aynı sonucu verdiğini doğrular. TA-Lib kuruluysa ADX ve SAR için
+TA-Lib de ölçülür.
+
+Kullanım:
+    python -m benchmarks.bench_jit --candles 10000 100000 1000000
+"""
+import argparse
+import time
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.bench_volume_indicators import make_ohlcv
+from technical_analysis import jit, kernels
+from technical_analysis.indicators import TechnicalIndicators as TAIndicators
+from utils.technical_indicators import TechnicalIndicators
+
+try:
+    import talib
+except ImportError:
+    talib = None
+
+
+def legacy_wilder(series: pd.Series, period: int) -> pd.Series:
+    """
+    Önceki `TechnicalIndicators.wilder_smoothing` (pandas Series üzerinde ewm)
+    """
+    result = pd.Series(np.nan, index=series.index, dtype=float)
+    tail = series.iloc[period-1:].astype(float)
+    tail.iloc[0] = series.iloc[:period].mean()
+    result.iloc[period-1:] = tail.ewm(alpha=1/period, adjust=False).mean().to_numpy()
+    return result
+
+
+def legacy_pivot_scan(df: pd.DataFrame, window: int = 10) -> Dict[str, List[float]]:
+    """
+    Önceki `identify_support_resistance` taraması (.iloc döngüsü ve liste üyelik testi)
+    """
+    df_min = df['low'].rolling(window=window, center=True).min()
+    df_max = df['high'].rolling(window=window, center=True).max()
+    supports, resistances = [], []
+    for i in range(window, len(df) - window):
+        if df['low'].iloc[i] == df_min.iloc[i] and df['low'].iloc[i] not in supports:
+            supports.append(round(df['low'].iloc[i], 2))
+    for i in range(window, len(df) - window):
+        if df['high'].iloc[i] == df_max.iloc[i] and df['high'].iloc[i] not in resistances:
+            resistances.append(round(df['high'].iloc[i], 2))
+    return {"support": supports, "resistance": resistances}
+
+
+def _timed(func: Callable[[], object], repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - started) * 1000)
+    return min(timings)
+
+
+def _on(backend: str, func: Callable[[], object]) -> object:
+    jit.set_backend(backend)
+    return func()
+
+
+def _true_range(df: pd.DataFrame) -> np.ndarray:
+    high, low, close = (df[column].to_numpy() for column in ("high", "low", "close"))
+    previous = np.roll(close, 1)
+    true_range = np.maximum(high - low, np.maximum(np.abs(high - previous), np.abs(low - previous)))
+    true_range[0] = high[0] - low[0]
+    return true_range
+
+
+def kernels_for(df: pd.DataFrame) -> Dict[str, Callable[[], object]]:
+    high, low, close = (df[column].to_numpy() for column in ("high", "low", "close"))
+    true_range = _true_range(df)
+    atr = kernels.atr(true_range, 10)
+    return {
+        "wilder": lambda: kernels.wilder(close, 14),
+        "dmi/adx": lambda: kernels.dmi(high, low, true_range, 14),
+        "rolling max/min": lambda: (jit.rolling_max(high, 52), jit.rolling_min(low, 52)),
+        "psar": lambda: jit.psar(high, low),
+        "supertrend": lambda: jit.supertrend(high, low, close, atr),
+        "pivot scan": lambda: jit.pivots(high, low, 10),
+    }
+
+
+def references_for(df: pd.DataFrame, legacy_limit: int) -> Dict[str, Optional[Callable[[], object]]]:
+    """
+    Karşılaştırma için önceki uygulamalar (yoksa None)
+    """
+    high, low, close = (df[column].to_numpy() for column in ("high", "low", "close"))
+    references: Dict[str, Optional[Callable[[], object]]] = {
+        "wilder": lambda: legacy_wilder(df["close"], 14),
+        "dmi/adx": (lambda: (talib.PLUS_DI(high, low, close, 14), talib.MINUS_DI(high, low, close, 14),
+                             talib.ADX(high, low, close, 14))) if talib else None,
+        "rolling max/min": lambda: (df["high"].rolling(window=52).max(), df["low"].rolling(window=52).min()),
+        "psar": (lambda: talib.SAR(high, low, 0.02, 0.2)) if talib else None,
+        "supertrend": None,
+        "pivot scan": (lambda: legacy_pivot_scan(df, 10)) if len(df) <= legacy_limit else None,
+    }
+    return references
+
+
+def check_parity(df: pd.DataFrame) -> None:
+    """
+    numba ve numpy arka uçları birebir aynı sonucu vermeli; önceki uygulamalarla da tutarlı olmalı
+    """
+    calls = kernels_for(df)
+    for name, call in calls.items():
+        numpy_result = np.asarray(_on("numpy", call), dtype=float)
+        numba_result = np.asarray(_on("numba", call), dtype=float)
+        np.testing.assert_array_equal(numba_result, numpy_result, err_msg=name)
+
+    wilder = kernels.wilder(df["close"].to_numpy(), 14)
+    np.testing.assert_array_equal(wilder, legacy_wilder(df["close"], 14).to_numpy())
+    highest = jit.rolling_max(df["high"].to_numpy(), 52)
+    np.testing.assert_array_equal(highest, df["high"].rolling(window=52).max().to_numpy())
+    if talib is not None:
+        high, low, close = (df[column].to_numpy() for column in ("high", "low", "close"))
+        np.testing.assert_allclose(jit.psar(high, low), talib.SAR(high, low, 0.02, 0.2), rtol=1e-9, equal_nan=True)
+        np.testing.assert_allclose(kernels.dmi(high, low, _true_range(df), 14)[2],
+                                   talib.ADX(high, low, close, 14), rtol=1e-9, atol=1e-9, equal_nan=True)
+
+    # Gösterge motoru: iki arka uçta aynı tablo
+    frames = [_on(backend, lambda: TAIndicators.add_all_indicators(df)) for backend in ("numpy", "numba")]
+    pd.testing.assert_frame_equal(frames[0], frames[1])
+
+
+def main(candle_counts: List[int], repeat: int, legacy_limit: int) -> None:
+    if not jit.numba_available():
+        print("numba kurulu değil; yalnızca numpy arka ucu ölçülebilir")
+        return
+
+    # Derleme (ve disk önbelleği) ölçüm dışında kalsın
+    check_parity(make_ohlcv(2000, seed=7))
+    print(f"parity: numba ve numpy arka uçları birebir aynı (talib: {'var' if talib else 'yok'})")
+
+    print(f"{'candles':>9} {'kernel':>16} {'previous (ms)':>14} {'numpy (ms)':>11} {'numba (ms)':>11} {'speed-up':>9}")
+    for candles in candle_counts:
+        df = make_ohlcv(candles, seed=1)
+        references = references_for(df, legacy_limit)
+        rows = list(kernels_for(df).items())
+        rows.append(("utils view", lambda: TechnicalIndicators.calculate_indicators(df)))
+        rows.append(("ta view", lambda: TAIndicators.add_all_indicators(df)))
+        for name, call in rows:
+            numpy_ms = _timed(lambda: _on("numpy", call), repeat)
+            numba_ms = _timed(lambda: _on("numba", call), repeat)
+            reference = references.get(name)
+            # Önceki uygulama yoksa karşılaştırma numpy arka ucuyla yapılır
+            previous_ms = _timed(reference, 1) if reference else None
+            baseline = previous_ms if previous_ms is not None else numpy_ms
+            previous = f"{previous_ms:.2f}" if previous_ms is not None else "-"
+            print(f"{candles:>9} {name:>16} {previous:>14} {numpy_ms:>11.2f} {numba_ms:>11.2f} "
+                  f"{baseline / numba_ms:>8.1f}x")
+    jit.set_backend(jit.JIT_MODE)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="JIT gösterge çekirdekleri benchmark'ı")
+    parser.add_argument("--candles", type=int, nargs="+", default=[10000, 100000, 1000000], help="Mum sayıları")
+    parser.add_argument("--repeat", type=int, default=3, help="Ölçüm tekrar sayısı (en iyisi alınır)")
+    parser.add_argument("--legacy-limit", type=int, default=100000,
+                        help="Önceki pivot taramasının ölçüleceği en büyük mum sayısı")
+    args = parser.parse_args()
+    main(args.candles, args.repeat, args.legacy_limit)
@@ -0,0 +1,94 @@
+"""
+Kline yanıtı çözme yollarını karşılaştırır:
+
+- mevcut: json.loads + pd.DataFrame(list_of_lists) + sütun başına pd.to_numeric
+- hızlı: utils.klines.decode_klines ile ham baytlardan doğrudan numpy sütunlarına
+
+Kullanım:
+    python -m benchmarks.bench_kline_decoder --rows 100 1000 100000
+"""
+import argparse
+import json
+import time
+from typing import Callable, List
+
+import numpy as np
+import pandas as pd
+
+from utils.klines import columns_to_dataframe, decode_klines
+
+
+def make_payload(rows: int, seed: int = 42) -> bytes:
+    """
+    Binance biçiminde sentetik bir kline yanıtı üretir
+    """
+    rng = np.random.default_rng(seed)
+    start = 1_700_000_000_000
+    close = 30000 * np.exp(np.cumsum(rng.normal(0, 0.001, rows)))
+    data = []
+    for i in range(rows):
+        open_time = start + i * 60_000
+        price = close[i]
+        data.append([
+            open_time,
+            f"{price:.8f}", f"{price * 1.001:.8f}", f"{price * 0.999:.8f}", f"{price * 1.0002:.8f}",
+            f"{rng.uniform(1, 100):.8f}", open_time + 59_999, f"{rng.uniform(1e4, 1e6):.8f}",
+            int(rng.integers(10, 5000)), f"{rng.uniform(1, 50):.8f}", f"{rng.uniform(1e4, 5e5):.8f}", "0",
+        ])
+    return json.dumps(data, separators=(",", ":")).encode()
+
+
+def current_path(raw: bytes) -> pd.DataFrame:
+    """
+    Route'larda kullanılan eski dönüşüm yolu
+    """
+    df = pd.DataFrame(json.loads(raw), columns=[
+        "timestamp", "open", "high", "low", "close", "volume",
+        "close_time", "quote_asset_volume", "number_of_trades",
+        "taker_buy_base_asset_volume", "taker_buy_quote_asset_volume", "ignore"
+    ])
+    for col in ["open", "high", "low", "close", "volume", "quote_asset_volume",
+                "taker_buy_base_asset_volume", "taker_buy_quote_asset_volume"]:
+        df[col] = pd.to_numeric(df[col])
+    df["timestamp"] = pd.to_datetime(df["timestamp"], unit="ms")
+    df.set_index("timestamp", inplace=True)
+    return df
+
+
+def fast_path(raw: bytes) -> pd.DataFrame:
+    return columns_to_dataframe(decode_klines(raw))
+
+
+def _best_of(func: Callable[[bytes], object], raw: bytes, repeat: int) -> float:
+    timings: List[float] = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(raw)
+        timings.append(time.perf_counter() - started)
+    return min(timings) * 1000
+
+
+def main(row_counts: List[int], repeat: int) -> None:
+    print(f"{'rows':>8} {'current (ms)':>14} {'decoder (ms)':>14} {'columns only (ms)':>18} {'speed-up':>9}")
+    for rows in row_counts:
+        raw = make_payload(rows)
+
+        # Sonuçların aynı olduğunu doğrula
+        expected = current_path(raw)
+        actual = fast_path(raw)
+        for col in ["open", "high", "low", "close", "volume", "close_time", "number_of_trades"]:
+            np.testing.assert_array_equal(expected[col].to_numpy(), actual[col].to_numpy())
+        assert (expected.index == actual.index).all()
+
+        current_ms = _best_of(current_path, raw, repeat)
+        fast_ms = _best_of(fast_path, raw, repeat)
+        columns_ms = _best_of(decode_klines, raw, repeat)
+        print(f"{rows:>8} {current_ms:>14.3f} {fast_ms:>14.3f} {columns_ms:>18.3f} {current_ms / fast_ms:>8.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Kline çözücü benchmark'ı")
+    parser.add_argument("--rows", type=int, nargs="+", default=[100, 1000, 100000], help="Satır sayıları")
+    parser.add_argument("--repeat", type=int, default=5, help="Tekrar sayısı (en iyisi raporlanır)")
+    args = parser.parse_args()
+    main(args.rows, args.repeat)
@@ -0,0 +1,113 @@
+"""
+Canlı büyük aralıklı mum türetmeyi (`services.live_candles`) ölçer. Sahte bir 1m akışı
+birçok sembol için oynatılır; türetilen kapanmış mumların `utils.resample` ile aynı 1m
+mumlardan üretilen mumlarla birebir aynı olduğu doğrulanır ve olay başına maliyet ile
+sembol başına yukarı akış (upstream) sayısı raporlanır.
+
+Kullanım:
+    python -m benchmarks.bench_live_candles --symbols 50 --minutes 1440
+"""
+import argparse
+import asyncio
+import time
+from typing import Any, Dict, List
+
+import numpy as np
+
+import services.live_candles as live
+from benchmarks.bench_resample import make_minutes
+from data.binance_streams import kline_row_to_event
+from utils.klines import columns_to_dataframe, empty_columns
+from utils.resample import resample_columns
+
+INTERVALS = ["1m", "5m", "15m", "30m", "1h", "4h", "1d"]
+START = 1_700_006_400_000  # Gün sınırı
+
+
+class FakeClient:
+    """
+    Akış aboneliklerini kaydeden sahte Binance istemcisi
+    """
+    def __init__(self):
+        self.streams: Dict[str, Any] = {}
+
+    async def subscribe_stream(self, stream: str, callback) -> None:
+        self.streams[stream] = callback
+
+    async def unsubscribe_stream(self, stream: str, callback=None) -> None:
+        self.streams.pop(stream, None)
+
+
+class EmptyService:
+    """
+    Başlangıç doldurması için boş mum döndüren sahte servis (akış gün sınırında başlar)
+    """
+    async def get_historical_klines(self, symbol: str, interval: str, start_time: int, priority: int = 0):
+        return {"klines": columns_to_dataframe(empty_columns())}
+
+
+def rows(columns) -> List[List[Any]]:
+    return [
+        [int(columns["open_time"][i])]
+        + [f"{columns[name][i]:.8f}" for name in ("open", "high", "low", "close", "volume")]
+        + [int(columns["close_time"][i]), f"{columns['quote_asset_volume'][i]:.8f}",
+           int(columns["number_of_trades"][i]), f"{columns['taker_buy_base_asset_volume'][i]:.8f}",
+           f"{columns['taker_buy_quote_asset_volume'][i]:.8f}"]
+        for i in range(len(columns["open_time"]))
+    ]
+
+
+async def main(symbol_count: int, minutes: int) -> None:
+    client = FakeClient()
+    live.binance_client = client
+    aggregator = live.LiveCandleAggregator(EmptyService())
+
+    symbols = [f"SYM{i:03d}USDT" for i in range(symbol_count)]
+    closed: Dict[str, Dict[str, List[Dict[str, Any]]]] = {symbol: {interval: [] for interval in INTERVALS}
+                                                           for symbol in symbols}
+    for symbol in symbols:
+        for interval in INTERVALS:
+            async def on_message(data, bucket=closed[symbol][interval]):
+                if data["k"]["x"]:
+                    bucket.append(data["k"])
+            await aggregator.subscribe(symbol, interval, on_message)
+
+    series = {symbol: make_minutes(minutes, seed=i, start=START)[0] for i, symbol in enumerate(symbols)}
+    events = {symbol: [kline_row_to_event(symbol, "1m", row) for row in rows(series[symbol])] for symbol in symbols}
+
+    started = time.perf_counter()
+    for minute in range(minutes):
+        for symbol in symbols:
+            data = events[symbol][minute]
+            # Her 1m mum için bir ara (açık) olay ve bir kapanış olayı
+            await client.streams[f"{symbol.lower()}@kline_1m"]({**data, "k": {**data["k"], "x": False}})
+            await client.streams[f"{symbol.lower()}@kline_1m"](data)
+    elapsed = time.perf_counter() - started
+
+    for symbol in symbols:
+        for interval in INTERVALS:
+            expected = resample_columns(series[symbol], interval)
+            got = closed[symbol][interval]
+            assert len(got) == len(expected["open_time"]), (symbol, interval)
+            np.testing.assert_array_equal([k["t"] for k in got], expected["open_time"])
+            for field, name in (("o", "open"), ("h", "high"), ("l", "low"), ("c", "close"), ("v", "volume"),
+                                ("q", "quote_asset_volume"), ("V", "taker_buy_base_asset_volume")):
+                np.testing.assert_array_equal([float(k[field]) for k in got], expected[name], err_msg=f"{interval} {field}")
+            np.testing.assert_array_equal([k["n"] for k in got], expected["number_of_trades"])
+    print(f"parity: {', '.join(INTERVALS)} kapanmış mumları utils.resample ile aynı")
+
+    stats = aggregator.stats()
+    base_events = stats["base_events"]
+    print(f"semboller: {symbol_count}, aralıklar: {len(INTERVALS)}")
+    print(f"upstream akışlar: {len(client.streams)} (aralık başına akışla: {symbol_count * len(INTERVALS)})")
+    print(f"1m olayları: {base_events}, türetilen olaylar: {stats['derived_events']}")
+    print(f"toplam: {elapsed * 1000:.1f} ms, 1m olayı başına: {elapsed / base_events * 1e6:.1f} µs "
+          f"({len(INTERVALS) - 1} türetilmiş aralık)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Canlı mum türetme benchmark'ı")
+    parser.add_argument("--symbols", type=int, default=50, help="Sembol sayısı")
+    parser.add_argument("--minutes", type=int, default=1440, help="Oynatılacak 1m mum sayısı")
+    args = parser.parse_args()
+    asyncio.run(main(args.symbols, args.minutes))
@@ -0,0 +1,124 @@
+"""
+1m mumlardan büyük aralıklı mum üretimini (`utils.resample`) pandas `resample` ile
+karşılaştırır. Sonuçların borsanın ondalık toplamlarıyla (8 basamaklı tamsayı
+aritmetiğiyle hesaplanan referans) birebir aynı olduğunu; ilk yarım grubun atıldığını ve
+son (açık) mumun o ana kadarki değerleri taşıdığını doğrular.
+
+Kullanım:
+    python -m benchmarks.bench_resample --minutes 10000 144000 1000000
+"""
+import argparse
+import time
+from typing import List
+
+import numpy as np
+import pandas as pd
+
+from utils.intervals import INTERVAL_MS, align_open_time
+from utils.klines import KLINE_COLUMNS, KlineColumns
+from utils.resample import VOLUME_DECIMALS, resample_columns, resample_many
+
+INTERVALS = ["5m", "15m", "1h", "4h", "1d", "1w"]
+SCALE = 10 ** VOLUME_DECIMALS
+VOLUME_COLUMNS = ("volume", "quote_asset_volume", "taker_buy_base_asset_volume", "taker_buy_quote_asset_volume")
+
+
+def make_minutes(minutes: int, seed: int = 0, start: int = 1_700_000_000_000) -> tuple:
+    """
+    Borsadaki gibi 8 ondalık basamaklı 1m mumlar üretir
+
+    Returns:
+        Tuple: Float sütunlar ve hacimlerin tamsayı (x1e8) karşılıkları
+    """
+    rng = np.random.default_rng(seed)
+    open_time = align_open_time(start, "1m") + np.arange(minutes, dtype=np.int64) * INTERVAL_MS["1m"]
+    close = np.round(30000 * np.exp(np.cumsum(rng.normal(0, 0.001, minutes))), 2)
+    open_ = np.round(np.concatenate(([close[0]], close[:-1])), 2)
+    high = np.round(np.maximum(open_, close) * (1 + rng.uniform(0, 0.001, minutes)), 2)
+    low = np.round(np.minimum(open_, close) * (1 - rng.uniform(0, 0.001, minutes)), 2)
+    scaled = {name: rng.integers(0, 50 * SCALE, minutes) for name in VOLUME_COLUMNS}
+    columns = {
+        "open_time": open_time,
+        "open": open_,
+        "high": high,
+        "low": low,
+        "close": close,
+        "close_time": open_time + INTERVAL_MS["1m"] - 1,
+        "number_of_trades": rng.integers(0, 5000, minutes),
+        **{name: values / SCALE for name, values in scaled.items()},
+    }
+    return {name: columns[name].astype(dtype) for name, dtype in KLINE_COLUMNS.items()}, scaled
+
+
+def reference(columns: KlineColumns, scaled: dict, interval: str) -> pd.DataFrame:
+    """
+    Borsa tanımıyla referans: tamsayı hacim toplamları, ilk yarım grup hariç
+    """
+    df = pd.DataFrame({name: columns[name] for name in ("open", "high", "low", "close", "number_of_trades")})
+    for name, values in scaled.items():
+        df[name] = values
+    df["bucket"] = align_open_time(columns["open_time"], interval)
+    grouped = df.groupby("bucket").agg(
+        open=("open", "first"), high=("high", "max"), low=("low", "min"), close=("close", "last"),
+        number_of_trades=("number_of_trades", "sum"),
+        **{name: (name, "sum") for name in VOLUME_COLUMNS},
+    )
+    for name in VOLUME_COLUMNS:
+        grouped[name] = grouped[name] / SCALE
+    if columns["open_time"][0] != df["bucket"].iloc[0]:
+        grouped = grouped.iloc[1:]
+    return grouped
+
+
+def check_parity(columns: KlineColumns, scaled: dict) -> None:
+    for interval in INTERVALS:
+        result = resample_columns(columns, interval)
+        expected = reference(columns, scaled, interval)
+        np.testing.assert_array_equal(result["open_time"], expected.index.to_numpy())
+        np.testing.assert_array_equal(result["close_time"], expected.index.to_numpy() + INTERVAL_MS[interval] - 1)
+        for name in expected.columns:
+            np.testing.assert_array_equal(result[name], expected[name].to_numpy(), err_msg=f"{interval} {name}")
+
+
+def pandas_resample(df: pd.DataFrame, interval: str) -> pd.DataFrame:
+    rule = {"m": "min", "h": "h", "d": "D", "w": "W-MON"}[interval[-1]]
+    options = {"label": "left", "closed": "left"} if rule == "W-MON" else {}
+    return df.resample(f"{interval[:-1]}{rule}", **options).agg({
+        "open": "first", "high": "max", "low": "min", "close": "last", "volume": "sum",
+        "quote_asset_volume": "sum", "number_of_trades": "sum",
+        "taker_buy_base_asset_volume": "sum", "taker_buy_quote_asset_volume": "sum",
+    })
+
+
+def main(minute_counts: List[int], repeat: int) -> None:
+    # Saat, gün ve hafta ortasında başlayan seri: ilk yarım gruplar atılmalı
+    columns, scaled = make_minutes(20_000, seed=7, start=1_700_000_000_000 + 37 * 60_000)
+    check_parity(columns, scaled)
+    print(f"parity: {', '.join(INTERVALS)} aralıkları 8 basamaklı ondalık toplamlarla birebir aynı")
+
+    print(f"{'1m candles':>10} {'pandas resample (ms)':>21} {'reduceat (ms)':>14} {'speed-up':>9}")
+    for minutes in minute_counts:
+        columns, _ = make_minutes(minutes, seed=1)
+        df = pd.DataFrame({name: values for name, values in columns.items() if name != "open_time"},
+                          index=pd.to_datetime(columns["open_time"], unit="ms"))
+        timings = {}
+        for name, run in (
+            ("pandas", lambda: [pandas_resample(df, interval) for interval in INTERVALS]),
+            ("reduceat", lambda: resample_many(columns, INTERVALS)),
+        ):
+            best = float("inf")
+            for _ in range(repeat):
+                started = time.perf_counter()
+                run()
+                best = min(best, (time.perf_counter() - started) * 1000)
+            timings[name] = best
+        print(f"{minutes:>10} {timings['pandas']:>21.2f} {timings['reduceat']:>14.2f} "
+              f"{timings['pandas'] / timings['reduceat']:>8.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Çoklu zaman dilimi yeniden örnekleme benchmark'ı")
+    parser.add_argument("--minutes", type=int, nargs="+", default=[10000, 144000, 1000000], help="1m mum sayıları")
+    parser.add_argument("--repeat", type=int, default=3, help="Ölçüm tekrar sayısı (en iyisi alınır)")
+    args = parser.parse_args()
+    main(args.minutes, args.repeat)
@@ -0,0 +1,96 @@
+"""
+Canlı mum penceresini önceki `pd.concat([...]).iloc[-100:]` yaklaşımıyla karşılaştırır.
+Halka tamponun (`utils.ring_buffer`) her adımda son N mumla aynı olduğunu, açık mumun
+yerinde güncellendiğini ve sütun görünümlerinin kopyasız ve bitişik olduğunu doğrular.
+
+Kullanım:
+    python -m benchmarks.bench_ring_buffer --candles 10000 --window 100 500
+"""
+import argparse
+import time
+from typing import List
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.bench_volume_indicators import make_ohlcv
+from technical_analysis import kernels
+from utils.ring_buffer import DEFAULT_FIELDS, CandleRingBuffer
+
+STEP = 60_000
+
+
+def candles(count: int) -> pd.DataFrame:
+    df = make_ohlcv(count, seed=4)
+    df.index = pd.DatetimeIndex(pd.to_datetime(np.arange(count) * STEP, unit="ms"), name="timestamp")
+    return df
+
+
+def check_parity(df: pd.DataFrame, window: int) -> None:
+    buffer = CandleRingBuffer(window)
+    open_times = df.index.as_unit("ms").asi8
+    data = {name: df[name].to_numpy() for name in DEFAULT_FIELDS}
+    for i, open_time in enumerate(open_times):
+        # Açık mum önce yarım değerlerle eklenir, sonra kapanış değerleriyle yerinde güncellenir
+        buffer.upsert(int(open_time), {"open": data["open"][i], "close": data["open"][i]})
+        buffer.upsert(int(open_time), {name: data[name][i] for name in DEFAULT_FIELDS})
+        start = max(0, i + 1 - window)
+        np.testing.assert_array_equal(buffer.open_times(), open_times[start:i + 1])
+        for name in DEFAULT_FIELDS:
+            column = buffer.column(name)
+            assert column.flags.c_contiguous and not column.flags.writeable
+            np.testing.assert_array_equal(column, data[name][start:i + 1])
+    assert np.shares_memory(buffer.column("close"), buffer._values)
+    assert not buffer.upsert(int(open_times[0]), {"close": 0.0})
+    pd.testing.assert_frame_equal(buffer.to_frame(), df[list(DEFAULT_FIELDS)].iloc[-window:], check_freq=False)
+
+
+def legacy_window(df: pd.DataFrame, window: int) -> pd.DataFrame:
+    """
+    Önceki yaklaşım: her kapanan mumda tek satırlık DataFrame ekleyip son N mumu tutmak
+    """
+    history = df.iloc[:window]
+    for i in range(window, len(df)):
+        history = pd.concat([history, df.iloc[i:i + 1]]).iloc[-window:]
+    return history
+
+
+def ring_window(df: pd.DataFrame, window: int) -> CandleRingBuffer:
+    buffer = CandleRingBuffer(window)
+    open_times = df.index.as_unit("ms").asi8
+    rows = df[list(DEFAULT_FIELDS)].to_dict(orient="records")
+    for open_time, row in zip(open_times, rows):
+        buffer.append(int(open_time), row)
+    return buffer
+
+
+def main(count: int, windows: List[int]) -> None:
+    df = candles(count)
+    for window in windows:
+        check_parity(df.iloc[:3 * window], window)
+    print(f"parity: pencereler {windows} her adımda son mumlarla aynı, görünümler kopyasız")
+
+    print(f"{'window':>7} {'concat (µs/candle)':>19} {'ring (µs/candle)':>17} {'ring memory (KB)':>17} "
+          f"{'rsi on view (µs)':>17}")
+    for window in windows:
+        started = time.perf_counter()
+        legacy_window(df, window)
+        legacy_us = (time.perf_counter() - started) / (count - window) * 1e6
+
+        started = time.perf_counter()
+        buffer = ring_window(df, window)
+        ring_us = (time.perf_counter() - started) / count * 1e6
+
+        kernels.rsi(buffer.column("close"), 14)  # JIT derlemesi ölçüme katılmasın
+        started = time.perf_counter()
+        kernels.rsi(buffer.column("close"), 14)
+        rsi_us = (time.perf_counter() - started) * 1e6
+        print(f"{window:>7} {legacy_us:>19.1f} {ring_us:>17.2f} {buffer.nbytes / 1024:>17.1f} {rsi_us:>17.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Halka tampon benchmark'ı")
+    parser.add_argument("--candles", type=int, default=10000, help="Eklenecek mum sayısı")
+    parser.add_argument("--window", type=int, nargs="+", default=[100, 500], help="Pencere boyutları")
+    args = parser.parse_args()
+    main(args.candles, args.window)
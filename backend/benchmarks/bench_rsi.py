@@ -0,0 +1,73 @@
+"""
+Wilder RSI hesaplamasını eski satır satır döngü ile karşılaştırır ve değerlerin aynı
+olduğunu doğrular.
+
+Kullanım:
+    python -m benchmarks.bench_rsi --candles 1000 100000 1000000
+"""
+import argparse
+import time
+from typing import Callable, List
+
+import numpy as np
+import pandas as pd
+
+from utils.technical_indicators import TechnicalIndicators
+
+
+def legacy_rsi(series: pd.Series, period: int = 14) -> pd.Series:
+    """
+    Önceki sürümdeki döngülü RSI (referans)
+    """
+    delta = series.diff()
+    gain = delta.where(delta > 0, 0)
+    loss = -delta.where(delta < 0, 0)
+    avg_gain = gain.rolling(window=period).mean()
+    avg_loss = loss.rolling(window=period).mean()
+    for i in range(period, len(series)):
+        avg_gain.iloc[i] = (avg_gain.iloc[i-1] * (period-1) + gain.iloc[i]) / period
+        avg_loss.iloc[i] = (avg_loss.iloc[i-1] * (period-1) + loss.iloc[i]) / period
+    rs = avg_gain / avg_loss
+    return 100 - (100 / (1 + rs))
+
+
+def make_close(candles: int, seed: int = 42) -> pd.Series:
+    rng = np.random.default_rng(seed)
+    return pd.Series(30000 * np.exp(np.cumsum(rng.normal(0, 0.001, candles))))
+
+
+def _timed(func: Callable[[], pd.Series]) -> float:
+    started = time.perf_counter()
+    func()
+    return (time.perf_counter() - started) * 1000
+
+
+def main(candle_counts: List[int], legacy_limit: int) -> None:
+    print(f"{'candles':>9} {'loop (ms)':>12} {'vectorized (ms)':>16} {'max abs diff':>13} {'speed-up':>9}")
+    for candles in candle_counts:
+        close = make_close(candles)
+        vectorized_ms = _timed(lambda: TechnicalIndicators.rsi(close, 14))
+        fast = TechnicalIndicators.rsi(close, 14)
+
+        if candles > legacy_limit:
+            print(f"{candles:>9} {'-':>12} {vectorized_ms:>16.2f} {'-':>13} {'-':>9}")
+            continue
+
+        started = time.perf_counter()
+        reference = legacy_rsi(close, 14)
+        legacy_ms = (time.perf_counter() - started) * 1000
+
+        # Eşitlik: NaN konumları aynı, değerler kayan nokta yuvarlama farkı içinde
+        assert (reference.isna() == fast.isna()).all()
+        np.testing.assert_allclose(fast.to_numpy(), reference.to_numpy(), rtol=1e-9, atol=1e-9, equal_nan=True)
+        diff = float(np.nanmax(np.abs(fast.to_numpy() - reference.to_numpy()))) if candles > 14 else 0.0
+        print(f"{candles:>9} {legacy_ms:>12.2f} {vectorized_ms:>16.2f} {diff:>13.2e} {legacy_ms / vectorized_ms:>8.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="RSI benchmark'ı")
+    parser.add_argument("--candles", type=int, nargs="+", default=[1000, 100000, 1000000], help="Mum sayıları")
+    parser.add_argument("--legacy-limit", type=int, default=1000000,
+                        help="Eski döngünün çalıştırılacağı en fazla mum sayısı (büyük seriler dakikalar sürer)")
+    args = parser.parse_args()
+    main(args.candles, args.legacy_limit)
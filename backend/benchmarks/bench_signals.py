@@ -0,0 +1,248 @@
+"""
+Vektörel sinyal üretimini (`technical_analysis.signals`) önceki satır bazlı trend/sinyal
+kurallarıyla karşılaştırır. Referans kurallar her mum için (son ve önceki satırla)
+çalıştırılır ve her mumda vektörel sonuçla aynı olduğu doğrulanır; ardından tüm pencere
+için satır satır değerlendirme ile tek vektörel geçiş ölçülür.
+
+Kullanım:
+    python -m benchmarks.bench_signals --candles 1000 10000 100000
+"""
+import argparse
+import time
+from typing import Any, Dict, List, Mapping
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.bench_volume_indicators import make_ohlcv
+from technical_analysis import signals
+from technical_analysis.indicators import TechnicalIndicators as TAIndicators
+from utils.technical_indicators import TechnicalIndicators as UtilsIndicators
+
+Row = Mapping[str, float]
+
+
+# --- Önceki satır bazlı kurallar (referans) -----------------------------------------------
+
+def legacy_trend(row: Row) -> Dict[str, Any]:
+    """
+    utils görünümü: analyze_trend_row
+    """
+    rules = [
+        (row['close'] > row['sma_20'], ("Fiyat SMA20'nin üzerinde", 1), ("Fiyat SMA20'nin altında", -1)),
+        (row['close'] > row['sma_50'], ("Fiyat SMA50'nin üzerinde", 1), ("Fiyat SMA50'nin altında", -1)),
+        (row['close'] > row['sma_200'], ("Fiyat SMA200'ün üzerinde (Uzun vadeli yükseliş)", 2),
+         ("Fiyat SMA200'ün altında (Uzun vadeli düşüş)", -2)),
+    ]
+    found = [yes if condition else no for condition, yes, no in rules]
+    if row['rsi_14'] > 70:
+        found.append(("RSI aşırı alım bölgesinde (>70)", -1))
+    elif row['rsi_14'] < 30:
+        found.append(("RSI aşırı satım bölgesinde (<30)", 1))
+    found.append(("MACD sinyal çizgisinin üzerinde (Yükseliş)", 1) if row['macd'] > row['macd_signal']
+                 else ("MACD sinyal çizgisinin altında (Düşüş)", -1))
+    found.append(("Stokastik K > D (Yükseliş)", 1) if row['stoch_k'] > row['stoch_d']
+                 else ("Stokastik K < D (Düşüş)", -1))
+    if row['stoch_k'] > 80:
+        found.append(("Stokastik aşırı alım bölgesinde (>80)", -1))
+    elif row['stoch_k'] < 20:
+        found.append(("Stokastik aşırı satım bölgesinde (<20)", 1))
+    if row['close'] > row['bollinger_upper']:
+        found.append(("Fiyat üst Bollinger bandının üzerinde (Aşırı alım)", -1))
+    elif row['close'] < row['bollinger_lower']:
+        found.append(("Fiyat alt Bollinger bandının altında (Aşırı satım)", 1))
+    strength = sum(points for _, points in found)
+    trend = ("Güçlü Yükseliş" if strength >= 4 else "Yükseliş" if strength >= 2 else
+             "Güçlü Düşüş" if strength <= -4 else "Düşüş" if strength <= -2 else "Nötr/Yatay")
+    return {"trend": trend, "strength": strength, "signals": [text for text, _ in found]}
+
+
+def legacy_ratings(row: Row) -> Dict[str, str]:
+    """
+    utils görünümü: get_signals
+    """
+    close, sma_20, sma_50 = row['close'], row['sma_20'], row['sma_50']
+    macd, signal, rsi, k, d = row['macd'], row['macd_signal'], row['rsi_14'], row['stoch_k'], row['stoch_d']
+    return {
+        "overall": legacy_trend(row)["trend"],
+        "ma": ("Güçlü Al" if close > sma_20 and sma_20 > sma_50 else "Al" if close > sma_20 else
+               "Güçlü Sat" if close < sma_20 and sma_20 < sma_50 else "Sat" if close < sma_20 else "Nötr"),
+        "macd": ("Al" if macd > signal and macd > 0 else "Sat" if macd < signal and macd < 0 else
+                 "Nötr/Al" if macd > signal else "Nötr/Sat"),
+        "rsi": ("Aşırı Alım (Sat)" if rsi > 70 else "Aşırı Satım (Al)" if rsi < 30 else
+                "Nötr/Yükseliş" if rsi > 50 else "Nötr/Düşüş"),
+        "stoch": ("Aşırı Alım (Sat)" if k > 80 and d > 80 else "Aşırı Satım (Al)" if k < 20 and d < 20 else
+                  "Nötr/Yükseliş" if k > d else "Nötr/Düşüş"),
+        "bollinger": ("Aşırı Alım (Sat)" if close > row['bollinger_upper'] else
+                      "Aşırı Satım (Al)" if close < row['bollinger_lower'] else
+                      "Nötr/Yükseliş" if close > row['bollinger_middle'] else "Nötr/Düşüş"),
+    }
+
+
+def legacy_states(last: Row, prev: Row) -> Dict[str, Any]:
+    """
+    technical_analysis görünümü: get_trend
+    """
+    ma_up, ema_up, macd_up = last['ma7'] > last['ma25'], last['ema7'] > last['ema25'], last['macd'] > last['macd_signal']
+    rsi = "aşırı alım" if last['rsi'] > 70 else "aşırı satım" if last['rsi'] < 30 else "nötr"
+    stoch = ("aşırı alım" if last['stoch_k'] > 80 and last['stoch_d'] > 80 else
+             "aşırı satım" if last['stoch_k'] < 20 and last['stoch_d'] < 20 else "nötr")
+    cloud = ("yükseliş" if last['close'] > last['ichimoku_senkou_span_a'] and last['close'] > last['ichimoku_senkou_span_b'] else
+             "düşüş" if last['close'] < last['ichimoku_senkou_span_a'] and last['close'] < last['ichimoku_senkou_span_b'] else
+             "kararsız")
+    bullish = sum([ma_up, ema_up, macd_up, rsi != "aşırı alım" and last['rsi'] > 50,
+                   stoch != "aşırı alım" and last['stoch_k'] > last['stoch_d'], cloud == "yükseliş",
+                   last['adx'] > 25 and last['close'] > last['ma25']])
+    bearish = sum([not ma_up, not ema_up, not macd_up, rsi != "aşırı satım" and last['rsi'] < 50,
+                   stoch != "aşırı satım" and last['stoch_k'] < last['stoch_d'], cloud == "düşüş",
+                   last['adx'] > 25 and last['close'] < last['ma25']])
+    upper, middle, lower = last['bb_upper'], last['bb_middle'], last['bb_lower']
+    return {
+        "ma_trend": "yükseliş" if ma_up else "düşüş",
+        "ema_trend": "yükseliş" if ema_up else "düşüş",
+        "rsi_status": rsi,
+        "macd_trend": "yükseliş" if macd_up else "düşüş",
+        "macd_cross": ("alttan yukarı" if macd_up and prev['macd'] <= prev['macd_signal'] else
+                       "üstten aşağı" if last['macd'] < last['macd_signal'] and prev['macd'] >= prev['macd_signal'] else
+                       "yok"),
+        "bollinger_bands": ("üst banda yakın" if last['close'] > upper - (upper - middle) / 3 else
+                            "alt banda yakın" if last['close'] < lower + (middle - lower) / 3 else "ortalamada"),
+        "stochastic": stoch,
+        "adx_strength": "güçlü" if last['adx'] > 25 else "zayıf",
+        "cci_status": "aşırı alım" if last['cci'] > 100 else "aşırı satım" if last['cci'] < -100 else "nötr",
+        "ichimoku_cloud": cloud,
+        "overall_trend": ("güçlü yükseliş" if bullish >= 5 else "yükseliş" if bullish >= 4 else
+                          "güçlü düşüş" if bearish >= 5 else "düşüş" if bearish >= 4 else "kararsız"),
+        "bullish_indicators": bullish,
+        "bearish_indicators": bearish,
+    }
+
+
+def legacy_crossovers(last: Row, prev: Row) -> Dict[str, str]:
+    """
+    technical_analysis görünümü: get_signals
+    """
+    def cross(a: str, b: str) -> str:
+        return ("AL" if prev[a] <= prev[b] and last[a] > last[b] else
+                "SAT" if prev[a] >= prev[b] and last[a] < last[b] else "YOK")
+
+    result = {
+        "ma_crossover": cross('ma7', 'ma25'),
+        "macd": cross('macd', 'macd_signal'),
+        "rsi": ("AL" if prev['rsi'] < 30 and last['rsi'] >= 30 else
+                "SAT" if prev['rsi'] > 70 and last['rsi'] <= 70 else "YOK"),
+        "stochastic": ("AL" if prev['stoch_k'] < 20 and last['stoch_k'] >= 20 and last['stoch_k'] > last['stoch_d'] else
+                       "SAT" if prev['stoch_k'] > 80 and last['stoch_k'] <= 80 and last['stoch_k'] < last['stoch_d'] else
+                       "YOK"),
+        "bollinger": ("AL" if prev['close'] <= prev['bb_lower'] and last['close'] > last['bb_lower'] else
+                      "SAT" if prev['close'] >= prev['bb_upper'] and last['close'] < last['bb_upper'] else "YOK"),
+        "price_action": ("AL" if prev['close'] < prev['ma99'] and last['close'] > last['ma99'] else
+                         "SAT" if prev['close'] > prev['ma99'] and last['close'] < last['ma99'] else "YOK"),
+        "ichimoku": cross('close', 'ichimoku_kijun_sen'),
+    }
+    buy = sum(signal == "AL" for signal in result.values())
+    sell = sum(signal == "SAT" for signal in result.values())
+    result["overall"] = ("GÜÇLÜ_AL" if buy >= 3 and sell == 0 else "AL" if buy > sell else
+                         "GÜÇLÜ_SAT" if sell >= 3 and buy == 0 else "SAT" if sell > buy else "NÖTR")
+    return result
+
+
+def legacy_pass(rows: List[Dict[str, float]], ta_rows: List[Dict[str, float]]) -> None:
+    """
+    Tüm pencere için satır bazlı değerlendirme (mum başına dört kural kümesi)
+    """
+    for i in range(2, len(rows)):
+        legacy_ratings(rows[i])
+        legacy_states(ta_rows[i], ta_rows[i - 1])
+        legacy_crossovers(ta_rows[i], ta_rows[i - 1])
+
+
+def vector_pass(utils_df: pd.DataFrame, ta_df: pd.DataFrame) -> None:
+    UtilsIndicators.signal_series(utils_df)
+    TAIndicators.trend_series(ta_df)
+    TAIndicators.signal_series(ta_df)
+
+
+# --- Doğrulama ---------------------------------------------------------------------------
+
+def check_parity(utils_df: pd.DataFrame, ta_df: pd.DataFrame) -> None:
+    rows = utils_df.to_dict(orient="records")
+    ta_rows = ta_df.to_dict(orient="records")
+    components = signals.strength_components(utils_df)
+    ratings = UtilsIndicators.signal_series(utils_df)
+    states = TAIndicators.trend_series(ta_df)
+    crossovers = TAIndicators.signal_series(ta_df)
+
+    for i, row in enumerate(rows):
+        expected = legacy_trend(row)
+        got = UtilsIndicators._trend_result(row, components, i)
+        assert {key: got[key] for key in expected} == expected, i
+        got = {"overall": signals.TREND_LABELS[ratings["trend"].iat[i]]}
+        got.update({name: labels[ratings[name].iat[i]] for name, labels in signals.RATING_LABELS.items()})
+        assert got == legacy_ratings(row), i
+
+        # İlk mumda önceki satır yoktur; get_trend tek satırda son satırı önceki sayar
+        prev = ta_rows[i - 1] if i else ta_rows[0]
+        got = {name: labels[states[name].iat[i]] for name, labels in signals.TREND_STATE_LABELS.items()}
+        got["bullish_indicators"] = int(states["bullish_indicators"].iat[i])
+        got["bearish_indicators"] = int(states["bearish_indicators"].iat[i])
+        assert got == legacy_states(ta_rows[i], prev), i
+        if i:
+            got = {name: signals.CROSSOVER_LABELS[crossovers[name].iat[i]] for name in signals.CROSSOVER_SIGNALS}
+            got["overall"] = signals.OVERALL_LABELS[crossovers["overall"].iat[i]]
+            assert got == legacy_crossovers(ta_rows[i], prev), i
+
+    # Son satırı okuyan API'ler: aynı sözlükler (anahtar sırası ve Python türleri dahil)
+    for end in (1, 2, 3, 50, len(rows)):
+        expected = legacy_trend(rows[end - 1])
+        trend = UtilsIndicators.analyze_trend(utils_df.iloc[:end])
+        assert [trend[key] for key in expected] == list(expected.values()) and type(trend["strength"]) is int
+        assert list(trend) == ["price", "trend", "strength", "signals", "sma_20", "sma_50", "sma_200",
+                               "rsi", "macd", "macd_signal", "stoch_k", "stoch_d"]
+        assert UtilsIndicators.get_signals(utils_df.iloc[:end]) == legacy_ratings(rows[end - 1])
+        assert list(UtilsIndicators.get_signals(utils_df.iloc[:end])) == list(legacy_ratings(rows[end - 1]))
+        prev = ta_rows[end - 2] if end > 1 else ta_rows[0]
+        expected = legacy_states(ta_rows[end - 1], prev)
+        got = TAIndicators.get_trend(ta_df.iloc[:end])
+        assert got == expected and list(got) == list(expected)
+        assert all(type(got[key]) is int for key in ("bullish_indicators", "bearish_indicators"))
+        got = TAIndicators.get_signals(ta_df.iloc[:end])
+        if end < 3:
+            assert got == {"error": "Yeterli veri yok"}
+        else:
+            expected = legacy_crossovers(ta_rows[end - 1], ta_rows[end - 2])
+            assert got == expected and list(got) == list(expected)
+
+    counts = {name: int((crossovers[name] != 0).sum()) for name in signals.CROSSOVER_SIGNALS}
+    assert all(counts.values()), f"Bazı kesişim sinyalleri hiç oluşmadı: {counts}"
+
+
+def main(candle_counts: List[int]) -> None:
+    base = make_ohlcv(2000, seed=7)
+    check_parity(UtilsIndicators.calculate_indicators(base), TAIndicators.add_all_indicators(base))
+    print("parity: trend, derecelendirme, gösterge durumu ve kesişim sinyalleri her mumda aynı")
+
+    print(f"{'candles':>8} {'row-wise (ms)':>14} {'vector (ms)':>12} {'speedup':>8}")
+    for count in candle_counts:
+        df = make_ohlcv(count, seed=7)
+        utils_df = UtilsIndicators.calculate_indicators(df)
+        ta_df = TAIndicators.add_all_indicators(df)
+        rows = utils_df.to_dict(orient="records")
+        ta_rows = ta_df.to_dict(orient="records")
+
+        started = time.perf_counter()
+        legacy_pass(rows, ta_rows)
+        legacy_ms = (time.perf_counter() - started) * 1000
+
+        vector_pass(utils_df, ta_df)
+        started = time.perf_counter()
+        vector_pass(utils_df, ta_df)
+        vector_ms = (time.perf_counter() - started) * 1000
+        print(f"{count:>8} {legacy_ms:>14.1f} {vector_ms:>12.2f} {legacy_ms / vector_ms:>7.0f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Vektörel sinyal benchmark'ı")
+    parser.add_argument("--candles", type=int, nargs="+", default=[1000, 10000, 100000], help="Mum sayıları")
+    args = parser.parse_args()
+    main(args.candles)
@@ -0,0 +1,96 @@
+"""
+Kapanan her mumda göstergeleri yeniden hesaplamak (pd.concat + calculate_indicators)
+ile artımlı `StreamingIndicators` güncellemesini karşılaştırır. Artımlı değerlerin tüm
+seri üzerindeki toplu hesaplamayla birebir aynı olduğunu doğrular.
+
+Kullanım:
+    python -m benchmarks.bench_streaming --candles 5000 --streams 1000
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.bench_volume_indicators import make_ohlcv
+from technical_analysis.streaming import StreamingIndicators
+from utils.technical_indicators import TechnicalIndicators
+
+WINDOW = 100
+
+
+def check_parity(df: pd.DataFrame) -> None:
+    """
+    Mum mum güncellenen değerler, tüm seri üzerindeki toplu hesaplamayla aynı olmalı
+    """
+    expected = TechnicalIndicators.calculate_indicators(df)
+    state = StreamingIndicators()
+    rows = [
+        dict(state.update(row.open, row.high, row.low, row.close, row.volume, row.taker_buy_base_asset_volume))
+        for row in df.itertuples()
+    ]
+    streamed = pd.DataFrame(rows, index=df.index).fillna(0)
+    for field in TechnicalIndicators.INDICATOR_FIELDS:
+        np.testing.assert_array_equal(streamed[field].to_numpy(), expected[field].to_numpy(), err_msg=field)
+
+
+def recompute_per_candle(df: pd.DataFrame, warmup: int) -> float:
+    """
+    Önceki WebSocket yolu: satır ekle, son 100 satırı tut, tüm göstergeleri yeniden hesapla
+    """
+    frame = TechnicalIndicators.calculate_indicators(df.iloc[:warmup].tail(WINDOW))
+    started = time.perf_counter()
+    for i in range(warmup, len(df)):
+        frame = pd.concat([frame, df.iloc[i:i + 1]]).iloc[-WINDOW:]
+        frame = TechnicalIndicators.calculate_indicators(frame)
+    return (time.perf_counter() - started) / (len(df) - warmup) * 1e6
+
+
+def streaming_per_candle(df: pd.DataFrame, warmup: int) -> float:
+    state = StreamingIndicators.from_frame(df.iloc[:warmup])
+    rows = list(df.iloc[warmup:].itertuples())
+    started = time.perf_counter()
+    for row in rows:
+        state.update(row.open, row.high, row.low, row.close, row.volume, row.taker_buy_base_asset_volume)
+    return (time.perf_counter() - started) / len(rows) * 1e6
+
+
+def many_streams(streams: int, warmup: int) -> float:
+    """
+    `streams` adet sembol/aralık durumunu birer mumla güncellemenin toplam süresi (ms)
+    """
+    df = make_ohlcv(warmup + 1)
+    states = [StreamingIndicators.from_frame(df.iloc[:warmup]) for _ in range(streams)]
+    last = df.iloc[-1].to_dict()
+    started = time.perf_counter()
+    for state in states:
+        state.update(last["open"], last["high"], last["low"], last["close"], last["volume"],
+                     last["taker_buy_base_asset_volume"])
+    return (time.perf_counter() - started) * 1000
+
+
+def main(candles: int, streams: int, recompute_candles: int) -> None:
+    df = make_ohlcv(candles)
+    df.index = pd.date_range("2024-01-01", periods=candles, freq="min", name="timestamp")
+    check_parity(df)
+    print(f"parity: {len(TechnicalIndicators.INDICATOR_FIELDS)} alan, {candles} mum, birebir aynı")
+
+    warmup = WINDOW
+    recompute_df = df.iloc[:warmup + recompute_candles]
+    recompute_us = recompute_per_candle(recompute_df, warmup)
+    streaming_us = streaming_per_candle(df, warmup)
+    print(f"{'method':>22} {'per candle (us)':>16}")
+    print(f"{'concat + recompute':>22} {recompute_us:>16.1f}")
+    print(f"{'streaming update':>22} {streaming_us:>16.1f}")
+    print(f"speed-up: {recompute_us / streaming_us:.0f}x")
+    print(f"{streams} akış x 1 kapanan mum: {many_streams(streams, 250):.1f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Artımlı gösterge benchmark'ı")
+    parser.add_argument("--candles", type=int, default=5000, help="Eşitlik ve artımlı ölçüm için mum sayısı")
+    parser.add_argument("--streams", type=int, default=1000, help="Eşzamanlı izlenen akış sayısı")
+    parser.add_argument("--recompute-candles", type=int, default=300,
+                        help="Yeniden hesaplama yolunun ölçüleceği mum sayısı")
+    args = parser.parse_args()
+    main(args.candles, args.streams, args.recompute_candles)
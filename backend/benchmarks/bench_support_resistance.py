@@ -0,0 +1,111 @@
+"""
+Destek/direnç tespitini önceki `.iloc` döngüsüyle karşılaştırır. Pivotların kaba kuvvet
+pencere karşılaştırmasıyla aynı olduğunu ve kümelerin toleransı aşmadığını doğrular.
+
+Kullanım:
+    python -m benchmarks.bench_support_resistance --candles 1000 10000 100000 1000000
+"""
+import argparse
+import time
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.bench_volume_indicators import make_ohlcv
+from technical_analysis import jit
+from technical_analysis.support_resistance import DEFAULT_TOLERANCE, find_levels, support_resistance
+
+
+def legacy_support_resistance(df: pd.DataFrame, window: int = 10) -> Dict[str, List[float]]:
+    """
+    Önceki `identify_support_resistance` (referans)
+    """
+    if len(df) < window*2:
+        return {"support": [], "resistance": []}
+    df_min = df['low'].rolling(window=window, center=True).min()
+    df_max = df['high'].rolling(window=window, center=True).max()
+    supports = []
+    resistances = []
+    for i in range(window, len(df) - window):
+        if df['low'].iloc[i] == df_min.iloc[i] and df['low'].iloc[i] not in supports:
+            supports.append(round(df['low'].iloc[i], 2))
+    for i in range(window, len(df) - window):
+        if df['high'].iloc[i] == df_max.iloc[i] and df['high'].iloc[i] not in resistances:
+            resistances.append(round(df['high'].iloc[i], 2))
+    current_price = df['close'].iloc[-1]
+    return {
+        "support": [level for level in sorted(supports, reverse=True) if level < current_price][:3],
+        "resistance": [level for level in sorted(resistances) if level > current_price][:3],
+    }
+
+
+def check_parity(df: pd.DataFrame, window: int) -> None:
+    high, low = df['high'].to_numpy(), df['low'].to_numpy()
+    side = window // 2
+    pivot_high, pivot_low = jit.pivots(high, low, side)
+
+    # Kaba kuvvet: her mumu kendi ortalanmış penceresiyle karşılaştır
+    windows_high = np.lib.stride_tricks.sliding_window_view(high, 2 * side + 1)
+    windows_low = np.lib.stride_tricks.sliding_window_view(low, 2 * side + 1)
+    expected_high = np.zeros(len(df), dtype=bool)
+    expected_low = np.zeros(len(df), dtype=bool)
+    expected_high[side:len(df) - side] = high[side:len(df) - side] == windows_high.max(axis=1)
+    expected_low[side:len(df) - side] = low[side:len(df) - side] == windows_low.min(axis=1)
+    np.testing.assert_array_equal(pivot_high, expected_high)
+    np.testing.assert_array_equal(pivot_low, expected_low)
+
+    levels = find_levels(high, low, window)
+    assert sum(level["touches"] for level in levels) == pivot_high.sum() + pivot_low.sum()
+    assert max(level["strength"] for level in levels) == 1.0
+    assert all(a["strength"] >= b["strength"] for a, b in zip(levels, levels[1:]))
+    # Her pivot tam olarak bir seviyeye düşer ve seviyenin genişliği toleransı aşmaz
+    pivot_prices = np.sort(np.concatenate([high[pivot_high], low[pivot_low]]))
+    bounds = np.cumsum([0] + [level["touches"] for level in sorted(levels, key=lambda level: level["price"])])
+    for begin, end in zip(bounds[:-1], bounds[1:]):
+        members = pivot_prices[begin:end]
+        limit = members[0] + abs(members[0]) * DEFAULT_TOLERANCE
+        assert members[-1] <= limit
+        assert end == len(pivot_prices) or pivot_prices[end] > limit
+
+    result = support_resistance(df, window)
+    current_price = df['close'].iloc[-1]
+    assert all(level < current_price for level in result["support"])
+    assert all(level > current_price for level in result["resistance"])
+
+
+def main(candle_counts: List[int], window: int, legacy_limit: int) -> None:
+    check_parity(make_ohlcv(5000, seed=3), window)
+    print(f"parity: pivotlar kaba kuvvet taramasıyla aynı, tolerans {DEFAULT_TOLERANCE:.3%}")
+
+    print(f"{'candles':>9} {'loop (ms)':>12} {'pivot+cluster (ms)':>19} {'pivots':>8} {'levels':>7} {'speed-up':>9}")
+    for candles in candle_counts:
+        df = make_ohlcv(candles, seed=1)
+        high, low = df['high'].to_numpy(), df['low'].to_numpy()
+        support_resistance(df, window)
+
+        started = time.perf_counter()
+        support_resistance(df, window)
+        fast_ms = (time.perf_counter() - started) * 1000
+
+        pivot_high, pivot_low = jit.pivots(high, low, window // 2)
+        levels = len(find_levels(high, low, window))
+        pivots = int(pivot_high.sum() + pivot_low.sum())
+
+        if candles > legacy_limit:
+            print(f"{candles:>9} {'-':>12} {fast_ms:>19.2f} {pivots:>8} {levels:>7} {'-':>9}")
+            continue
+        started = time.perf_counter()
+        legacy_support_resistance(df, window)
+        legacy_ms = (time.perf_counter() - started) * 1000
+        print(f"{candles:>9} {legacy_ms:>12.1f} {fast_ms:>19.2f} {pivots:>8} {levels:>7} {legacy_ms / fast_ms:>8.0f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Destek/direnç benchmark'ı")
+    parser.add_argument("--candles", type=int, nargs="+", default=[1000, 10000, 100000, 1000000], help="Mum sayıları")
+    parser.add_argument("--window", type=int, default=10, help="Pivot penceresi")
+    parser.add_argument("--legacy-limit", type=int, default=100000,
+                        help="Önceki döngünün ölçüleceği en büyük mum sayısı")
+    args = parser.parse_args()
+    main(args.candles, args.window, args.legacy_limit)
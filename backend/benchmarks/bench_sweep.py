@@ -0,0 +1,120 @@
+"""
+Parametre taramasını (`technical_analysis.sweep`) doğrular ve ölçer. Varsayılan
+parametrelerle üretilen sinyallerin ve test sonuçlarının gösterge motoruyla aynı olduğu,
+süreç havuzundan dönen sonuçların tek süreçte hesaplananlarla aynı olduğu ve yarıda
+kesilen taramanın aynı sonuç dosyasıyla kaldığı yerden tamamlandığı doğrulanır.
+
+Kullanım:
+    python -m benchmarks.bench_sweep --symbols 4 --candles 20000 --combos 200 --workers 0
+"""
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.bench_volume_indicators import make_ohlcv
+from technical_analysis import signals
+from technical_analysis.backtest import BacktestConfig, run_backtest
+from technical_analysis.indicators import TechnicalIndicators
+from technical_analysis.sweep import (
+    DEFAULT_SPACE, PRICE_FIELDS, SignalParameters, completed_records, evaluate, grid, random_search,
+    run_sweep, signal_inputs, summarize,
+)
+
+INTERVAL = "5m"
+
+
+def frames_for(symbols: int, candles: int):
+    frames = {}
+    for i in range(symbols):
+        df = make_ohlcv(candles, seed=100 + i)
+        df.index = pd.DatetimeIndex(pd.to_datetime(np.arange(candles) * 300_000, unit="ms"), name="timestamp")
+        frames[f"SYM{i:02d}USDT"] = df
+    return frames
+
+
+def prices_of(df: pd.DataFrame):
+    return {field: df[field].to_numpy(dtype=float) for field in PRICE_FIELDS}
+
+
+def check_defaults(df: pd.DataFrame) -> None:
+    inputs = signal_inputs(prices_of(df), SignalParameters())
+    expected = TechnicalIndicators.signal_series(df)
+    got = signals.crossover_signals(inputs)
+    for name in expected.columns:
+        np.testing.assert_array_equal(got[name], expected[name].to_numpy(), err_msg=name)
+    stats = evaluate(prices_of(df), SignalParameters(), periods_per_year=365 * 288)
+    assert stats == run_backtest(df, INTERVAL).stats
+
+
+def check_pool(frames, combos, workers: int) -> None:
+    by_key = {(record["key"], record["symbol"]): record for record in run_sweep(frames, combos, INTERVAL, workers=workers)}
+    assert len(by_key) == len(combos) * len(frames)
+    for symbol, df in frames.items():
+        cache = {}
+        for combo in combos:
+            expected = evaluate(prices_of(df), combo, periods_per_year=365 * 288, cache=cache)
+            record = by_key[(combo.key(), symbol)]
+            assert {key: record[key] for key in expected} == expected, (symbol, combo)
+
+
+def check_resume(frames, combos, workers: int) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        output = os.path.join(directory, "sweep.jsonl")
+        stream = run_sweep(frames, combos, INTERVAL, output, workers=workers, chunk_size=5)
+        first = [next(stream) for _ in range(7)]
+        stream.close()
+        # Yarıda kesilmiş son satır yok sayılır ve yeniden hesaplanır
+        with open(output, "a", encoding="utf-8") as file:
+            file.write('{"key": "yarım')
+        saved = len(list(completed_records(output)))
+        assert saved >= len(first)
+
+        resumed = list(run_sweep(frames, combos, INTERVAL, output, workers=workers, chunk_size=5))
+        records = list(completed_records(output))
+        pairs = [(record["key"], record["symbol"]) for record in records]
+        assert len(resumed) == len(combos) * len(frames) - saved
+        assert len(set(pairs)) == len(pairs) == len(combos) * len(frames)
+        assert list(run_sweep(frames, combos, INTERVAL, output, workers=workers)) == []
+        assert len(summarize(records)) == len(combos)
+
+        # Farklı ayar ya da veri aralığıyla eski sonuçlar yeniden kullanılmaz, özetler karışmaz
+        short = BacktestConfig(allow_short=True)
+        assert len(list(run_sweep(frames, combos, INTERVAL, output, config=short, workers=workers))) == len(pairs)
+        trimmed = {symbol: df.iloc[1:] for symbol, df in frames.items()}
+        assert len(list(run_sweep(trimmed, combos, INTERVAL, output, workers=workers))) == len(pairs)
+        summary = summarize(list(completed_records(output)))
+        assert len(summary) == 2 * len(combos) and set(summary["allow_short"]) == {False, True}
+
+
+def main(symbols: int, candles: int, combos: int, workers: int) -> None:
+    frames = frames_for(symbols, candles)
+    check_defaults(next(iter(frames.values())))
+    small = grid({"rsi_period": [7, 14], "ma_fast": [5, 9], "stop_atr": [0.0, 2.0]})
+    check_pool(dict(list(frames.items())[:2]), small, workers or 2)
+    check_resume(dict(list(frames.items())[:2]), small, workers or 2)
+    print("parity: varsayılan parametreler = gösterge motoru, havuz = tek süreç, devam ettirme tam ve tekrarsız")
+
+    sample = random_search(DEFAULT_SPACE, combos, seed=1)
+    cores = workers or os.cpu_count()
+    started = time.perf_counter()
+    results = list(run_sweep(frames, sample, INTERVAL, workers=workers))
+    elapsed = time.perf_counter() - started
+    rate = len(results) / elapsed
+    print(f"semboller: {symbols}, mum: {candles}, kümeler: {len(sample)}, işçi: {cores}")
+    print(f"toplam: {elapsed:.1f} s, {rate:.1f} (küme, sembol)/s, "
+          f"10k küme x {symbols} sembol tahmini: {10_000 * symbols / rate / 60:.1f} dk")
+    print(summarize(results).head(5).to_string(index=False))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Parametre taraması benchmark'ı")
+    parser.add_argument("--symbols", type=int, default=4, help="Sembol sayısı")
+    parser.add_argument("--candles", type=int, default=20000, help="Sembol başına mum sayısı")
+    parser.add_argument("--combos", type=int, default=200, help="Rastgele parametre kümesi sayısı")
+    parser.add_argument("--workers", type=int, default=0, help="İşçi süreç sayısı (0: tüm çekirdekler)")
+    args = parser.parse_args()
+    main(args.symbols, args.candles, args.combos, args.workers)
@@ -0,0 +1,123 @@
+"""
+OBV, A/D, CMF ve CVD hesaplamalarını satır satır referans uygulamalarla karşılaştırır
+ve değerlerin aynı olduğunu doğrular.
+
+Kullanım:
+    python -m benchmarks.bench_volume_indicators --candles 1000 100000
+"""
+import argparse
+import time
+from typing import Callable, Dict, List
+
+import numpy as np
+import pandas as pd
+
+from utils.technical_indicators import TechnicalIndicators
+
+
+def make_ohlcv(candles: int, seed: int = 42) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 30000 * np.exp(np.cumsum(rng.normal(0, 0.001, candles)))
+    # Değişmeyen kapanışları ve yüksek == düşük mumlarını da içersin
+    unchanged = np.flatnonzero(rng.random(candles) < 0.05)
+    unchanged = unchanged[unchanged > 0]
+    close[unchanged] = close[unchanged - 1]
+    open_ = np.concatenate(([close[0]], close[:-1]))
+    high = np.maximum(open_, close) * (1 + np.abs(rng.normal(0, 0.0005, candles)))
+    low = np.minimum(open_, close) * (1 - np.abs(rng.normal(0, 0.0005, candles)))
+    flat = rng.random(candles) < 0.01
+    high[flat] = low[flat] = close[flat]
+    volume = rng.lognormal(3, 1, candles)
+    return pd.DataFrame({
+        "open": open_,
+        "high": high,
+        "low": low,
+        "close": close,
+        "volume": volume,
+        "taker_buy_base_asset_volume": volume * rng.uniform(0.3, 0.7, candles),
+    })
+
+
+def reference_obv(df: pd.DataFrame) -> np.ndarray:
+    """
+    Önceki sürümdeki döngülü OBV
+    """
+    close = df['close']
+    volume = df['volume']
+    obv = pd.Series(index=df.index, dtype=float)
+    obv.iloc[0] = 0
+    for i in range(1, len(close)):
+        if close.iloc[i] > close.iloc[i-1]:
+            obv.iloc[i] = obv.iloc[i-1] + volume.iloc[i]
+        elif close.iloc[i] < close.iloc[i-1]:
+            obv.iloc[i] = obv.iloc[i-1] - volume.iloc[i]
+        else:
+            obv.iloc[i] = obv.iloc[i-1]
+    return obv.to_numpy()
+
+
+def _money_flow_volume(df: pd.DataFrame) -> List[float]:
+    values = []
+    for high, low, close, volume in zip(df['high'], df['low'], df['close'], df['volume']):
+        multiplier = ((close - low) - (high - close)) / (high - low) if high != low else 0.0
+        values.append(multiplier * volume)
+    return values
+
+
+def reference_ad(df: pd.DataFrame) -> np.ndarray:
+    ad, total = [], 0.0
+    for value in _money_flow_volume(df):
+        total += value
+        ad.append(total)
+    return np.array(ad)
+
+
+def reference_cmf(df: pd.DataFrame, period: int = 20) -> np.ndarray:
+    flow = _money_flow_volume(df)
+    volume = df['volume'].tolist()
+    cmf = np.full(len(flow), np.nan)
+    for i in range(period - 1, len(flow)):
+        cmf[i] = sum(flow[i - period + 1:i + 1]) / sum(volume[i - period + 1:i + 1])
+    return cmf
+
+
+def reference_cvd(df: pd.DataFrame) -> np.ndarray:
+    cvd, total = [], 0.0
+    for buy, volume in zip(df['taker_buy_base_asset_volume'], df['volume']):
+        total += buy - (volume - buy)
+        cvd.append(total)
+    return np.array(cvd)
+
+
+CASES: Dict[str, tuple] = {
+    "obv": (TechnicalIndicators.obv, reference_obv),
+    "ad": (TechnicalIndicators.accumulation_distribution, reference_ad),
+    "cmf": (TechnicalIndicators.chaikin_money_flow, reference_cmf),
+    "cvd": (TechnicalIndicators.cumulative_volume_delta, reference_cvd),
+}
+
+
+def _timed(func: Callable, df: pd.DataFrame):
+    started = time.perf_counter()
+    result = func(df)
+    return result, (time.perf_counter() - started) * 1000
+
+
+def main(candle_counts: List[int]) -> None:
+    print(f"{'indicator':>9} {'candles':>9} {'loop (ms)':>12} {'vectorized (ms)':>16} {'speed-up':>9}")
+    for candles in candle_counts:
+        df = make_ohlcv(candles)
+        for name, (vectorized, reference) in CASES.items():
+            fast, fast_ms = _timed(vectorized, df)
+            expected, loop_ms = _timed(reference, df)
+            # Kümülatif toplamlar farklı sırada toplandığı için göreli tolerans kullanılır
+            scale = max(float(np.nanmax(np.abs(expected))), 1.0)
+            np.testing.assert_allclose(fast.to_numpy(), expected, rtol=1e-9, atol=1e-9 * scale, equal_nan=True)
+            print(f"{name:>9} {candles:>9} {loop_ms:>12.2f} {fast_ms:>16.2f} {loop_ms / fast_ms:>8.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Hacim göstergeleri benchmark'ı")
+    parser.add_argument("--candles", type=int, nargs="+", default=[1000, 100000], help="Mum sayıları")
+    args = parser.parse_args()
+    main(args.candles)
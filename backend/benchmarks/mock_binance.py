@@ -0,0 +1,596 @@
+"""
+Yük ve gecikme testleri için yerel sahte Binance sunucusu.
+
+`BinanceClient` ve `BinanceService` tarafından kullanılan REST endpoint'lerini
+(klines, ticker/price, ticker/24hr, exchangeInfo, emir endpoint'leri) ve `/ws`, `/stream`
+kline/ticker akışlarını sunar. Fiyatlar her sembol için sabit tohumlu geometrik Brown
+hareketiyle (GBM) dakikalık olarak üretilir; aynı ayarlarla her çalıştırmada aynı mumlar
+döner. Gecikme, jitter, hata enjeksiyonu ve `X-MBX-USED-WEIGHT-1M` başlıkları
+ayarlanabilir.
+
+Kullanım:
+    python -m benchmarks.mock_binance --port 9100 --symbols 50 --latency-ms 20 --jitter-ms 5
+
+Uygulamayı sahte sunucuya yönlendirmek için:
+    BINANCE_BASE_URL=http://127.0.0.1:9100 BINANCE_STREAM_URL=ws://127.0.0.1:9100 python run.py
+
+Diğer benchmark'lar sunucuyu `start_mock_binance(...)` ile süreç içinde başlatabilir.
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import logging
+import random
+import time
+import zlib
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import numpy as np
+from aiohttp import WSMsgType, web
+
+from data.rate_limiter import endpoint_weight
+from utils.intervals import INTERVAL_MS, align_open_time
+
+logger = logging.getLogger("torypto")
+
+MINUTE_MS = 60_000
+DAY_MS = 86_400_000
+# Üretilen fiyat yolunun başladığı gün (2024-01-01 00:00 UTC)
+ANCHOR_MS = 1_704_067_200_000
+# Dakikalık GBM parametreleri (yıllık ~%60 oynaklık)
+MINUTE_VOLATILITY = 0.0008
+MINUTE_DRIFT = 0.0
+
+KNOWN_BASES = [
+    "BTC", "ETH", "BNB", "SOL", "XRP", "ADA", "DOGE", "AVAX", "DOT", "LINK",
+    "MATIC", "LTC", "TRX", "ATOM", "UNI", "ETC", "XLM", "NEAR", "APT", "FIL",
+]
+
+
+def _symbol_names(count: int) -> List[str]:
+    bases = KNOWN_BASES[:count] + [f"SYM{i}" for i in range(max(0, count - len(KNOWN_BASES)))]
+    return [f"{base}USDT" for base in bases]
+
+
+class MarketModel:
+    """
+    Sembol başına deterministik dakikalık mumlar üretir.
+
+    Her gün için 1440 dakikalık getiri, fitil ve hacim değerleri (tohum, sembol, gün)
+    üçlüsünden türetilen bir RNG ile üretilir; günler birbirine kapanış fiyatıyla bağlanır.
+    Daha büyük aralıklar dakikalık mumlardan `np.maximum.reduceat` vb. ile birleştirilir.
+    """
+
+    def __init__(self, symbols: List[str], seed: int = 7, cache_days: int = 512):
+        self.symbols = symbols
+        self.seed = seed
+        self._cache_days = cache_days
+        self._days: "OrderedDict[Tuple[str, int], Dict[str, np.ndarray]]" = OrderedDict()
+        self._day_close: Dict[Tuple[str, int], float] = {}
+        self._start_price = {
+            symbol: float(np.exp(np.random.default_rng([seed, zlib.crc32(symbol.encode())]).uniform(-1, 11)))
+            for symbol in symbols
+        }
+
+    def _rng(self, symbol: str, day: int) -> np.random.Generator:
+        return np.random.default_rng([self.seed, zlib.crc32(symbol.encode()), day])
+
+    def _day_log_returns(self, symbol: str, day: int) -> np.ndarray:
+        return self._rng(symbol, day).normal(MINUTE_DRIFT, MINUTE_VOLATILITY, 1440)
+
+    def _day_open(self, symbol: str, day: int) -> float:
+        """
+        Günün açılış fiyatı: bir önceki günün kapanışı (önbellekli, ileriye doğru zincirlenir)
+        """
+        if day <= 0:
+            return self._start_price[symbol]
+        key = (symbol, day - 1)
+        if key not in self._day_close:
+            # Önbellekteki en yakın günden ileri doğru yürü
+            known = day - 1
+            while known > 0 and (symbol, known - 1) not in self._day_close:
+                known -= 1
+            price = self._start_price[symbol] if known == 0 else self._day_close[(symbol, known - 1)]
+            for d in range(known, day):
+                price *= float(np.exp(self._day_log_returns(symbol, d).sum()))
+                self._day_close[(symbol, d)] = price
+        return self._day_close[key]
+
+    def _day(self, symbol: str, day: int) -> Dict[str, np.ndarray]:
+        key = (symbol, day)
+        cached = self._days.get(key)
+        if cached is not None:
+            self._days.move_to_end(key)
+            return cached
+
+        rng = self._rng(symbol, day)
+        log_returns = rng.normal(MINUTE_DRIFT, MINUTE_VOLATILITY, 1440)
+        wick_up, wick_down = np.abs(rng.normal(0, MINUTE_VOLATILITY / 2, (2, 1440)))
+        volume = rng.lognormal(3, 1, 1440)
+        trades = rng.integers(10, 2000, 1440)
+        taker_ratio = rng.uniform(0.3, 0.7, 1440)
+
+        close = self._day_open(symbol, day) * np.exp(np.cumsum(log_returns))
+        open_ = np.concatenate(([self._day_open(symbol, day)], close[:-1]))
+        data = {
+            "open": open_,
+            "high": np.maximum(open_, close) * (1 + wick_up),
+            "low": np.minimum(open_, close) * (1 - wick_down),
+            "close": close,
+            "volume": volume,
+            "quote_asset_volume": volume * close,
+            "number_of_trades": trades,
+            "taker_buy_base_asset_volume": volume * taker_ratio,
+            "taker_buy_quote_asset_volume": volume * taker_ratio * close,
+        }
+        self._days[key] = data
+        if len(self._days) > self._cache_days:
+            self._days.popitem(last=False)
+        return data
+
+    def minutes(self, symbol: str, start_ms: int, end_ms: int) -> Dict[str, np.ndarray]:
+        """
+        Açılış zamanı [start_ms, end_ms) aralığındaki dakikalık mumları döndürür
+        """
+        first = -(-(max(start_ms, ANCHOR_MS) - ANCHOR_MS) // MINUTE_MS)
+        last = -(-(end_ms - ANCHOR_MS) // MINUTE_MS)
+        if last <= first:
+            return {"open_time": np.empty(0, dtype=np.int64)}
+
+        parts: Dict[str, List[np.ndarray]] = {}
+        for day in range(first // 1440, (last - 1) // 1440 + 1):
+            lo = max(first - day * 1440, 0)
+            hi = min(last - day * 1440, 1440)
+            for name, values in self._day(symbol, day).items():
+                parts.setdefault(name, []).append(values[lo:hi])
+        columns = {name: np.concatenate(values) for name, values in parts.items()}
+        columns["open_time"] = ANCHOR_MS + np.arange(first, last, dtype=np.int64) * MINUTE_MS
+        return columns
+
+    def candles(self, symbol: str, interval: str, start_ms: int, end_ms: int, now_ms: int) -> Dict[str, np.ndarray]:
+        """
+        Açılış zamanı [start_ms, end_ms] aralığındaki `interval` mumlarını döndürür. Açık
+        mum yalnızca `now_ms` anına kadarki dakikalardan oluşturulur.
+        """
+        step = INTERVAL_MS[interval]
+        first_open = align_open_time(max(start_ms, ANCHOR_MS), interval)
+        if first_open < max(start_ms, ANCHOR_MS):
+            first_open += step
+        minutes = self.minutes(symbol, first_open, min(end_ms + step, now_ms + 1))
+        if len(minutes["open_time"]) == 0:
+            return minutes
+        if step == MINUTE_MS:
+            minutes["close_time"] = minutes["open_time"] + MINUTE_MS - 1
+            return minutes
+
+        bucket = align_open_time(int(minutes["open_time"][0]), interval)
+        group = (minutes["open_time"] - bucket) // step
+        starts = np.flatnonzero(np.diff(group, prepend=-1))
+        result = {
+            "open_time": bucket + group[starts] * step,
+            "open": minutes["open"][starts],
+            "high": np.maximum.reduceat(minutes["high"], starts),
+            "low": np.minimum.reduceat(minutes["low"], starts),
+            "close": minutes["close"][np.append(starts[1:], len(group)) - 1],
+        }
+        for name in ("volume", "quote_asset_volume", "number_of_trades",
+                     "taker_buy_base_asset_volume", "taker_buy_quote_asset_volume"):
+            result[name] = np.add.reduceat(minutes[name], starts)
+        result["close_time"] = result["open_time"] + step - 1
+        return result
+
+    def price(self, symbol: str, now_ms: int) -> float:
+        """
+        Şu anki dakikanın kapanış fiyatı
+        """
+        minute = self.minutes(symbol, now_ms - MINUTE_MS + 1, now_ms + 1)
+        return float(minute["close"][-1])
+
+
+def _kline_rows(candles: Dict[str, np.ndarray]) -> List[List[Any]]:
+    if len(candles["open_time"]) == 0:
+        return []
+    return [
+        [int(t), f"{o:.8f}", f"{h:.8f}", f"{l:.8f}", f"{c:.8f}", f"{v:.8f}", int(ct), f"{q:.8f}", int(n),
+         f"{tb:.8f}", f"{tq:.8f}", "0"]
+        for t, o, h, l, c, v, ct, q, n, tb, tq in zip(
+            candles["open_time"], candles["open"], candles["high"], candles["low"], candles["close"],
+            candles["volume"], candles["close_time"], candles["quote_asset_volume"], candles["number_of_trades"],
+            candles["taker_buy_base_asset_volume"], candles["taker_buy_quote_asset_volume"]
+        )
+    ]
+
+
+class MockBinance:
+    """
+    Sahte Binance REST ve WebSocket sunucusu
+
+    Args:
+        symbols: Üretilecek USDT paritesi sayısı
+        seed: Fiyat üretimi için tohum
+        latency_ms: Her REST yanıtına eklenen sabit gecikme
+        jitter_ms: Gecikmeye eklenen ±rastgele sapma
+        error_rate: REST isteklerinin 500 ile yanıtlanma olasılığı
+        weight_limit: Dakikalık ağırlık limiti (aşılırsa 429 + Retry-After)
+        tick_interval: Akışlarda olaylar arası süre (saniye)
+        ws_drop_after: Bu kadar saniye sonra WebSocket bağlantılarını kopar (0 = asla)
+    """
+
+    def __init__(
+        self,
+        symbols: int = 20,
+        seed: int = 7,
+        latency_ms: float = 0.0,
+        jitter_ms: float = 0.0,
+        error_rate: float = 0.0,
+        weight_limit: int = 6000,
+        tick_interval: float = 1.0,
+        ws_drop_after: float = 0.0
+    ):
+        self.model = MarketModel(_symbol_names(symbols), seed=seed)
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.weight_limit = weight_limit
+        self.tick_interval = tick_interval
+        self.ws_drop_after = ws_drop_after
+
+        self._random = random.Random(seed)
+        self._weight_window = 0
+        self._used_weight = 0
+        self._orders: Dict[int, Dict[str, Any]] = {}
+        self._order_ids = itertools.count(1)
+        self.counters = {"requests": 0, "errors": 0, "rate_limited": 0, "ws_connections": 0, "ws_messages": 0}
+
+    # ----- Yardımcılar -----
+
+    @staticmethod
+    def _now_ms() -> int:
+        return int(time.time() * 1000)
+
+    def _symbol(self, value: str) -> str:
+        symbol = value.upper()
+        if symbol not in self.model.symbols:
+            raise web.HTTPBadRequest(
+                text=json.dumps({"code": -1121, "msg": "Invalid symbol."}), content_type="application/json"
+            )
+        return symbol
+
+    def _symbols_param(self, params: Dict[str, Any]) -> List[str]:
+        if "symbol" in params:
+            return [self._symbol(params["symbol"])]
+        if "symbols" in params:
+            return [self._symbol(s) for s in json.loads(params["symbols"])]
+        return self.model.symbols
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler) -> web.StreamResponse:
+        if request.path.startswith("/ws") or request.path.startswith("/stream"):
+            return await handler(request)
+
+        self.counters["requests"] += 1
+        delay = self.latency_ms + self._random.uniform(-self.jitter_ms, self.jitter_ms)
+        if delay > 0:
+            await asyncio.sleep(delay / 1000)
+
+        # Dakikalık ağırlık penceresi
+        window = self._now_ms() // MINUTE_MS
+        if window != self._weight_window:
+            self._weight_window, self._used_weight = window, 0
+        self._used_weight += endpoint_weight(request.path, request.query)
+        headers = {"X-MBX-USED-WEIGHT-1M": str(self._used_weight)}
+
+        if self._used_weight > self.weight_limit:
+            self.counters["rate_limited"] += 1
+            retry_after = 60 - (self._now_ms() // 1000) % 60
+            headers["Retry-After"] = str(retry_after)
+            return web.json_response(
+                {"code": -1003, "msg": "Too much request weight used."}, status=429, headers=headers
+            )
+        if self.error_rate and self._random.random() < self.error_rate:
+            self.counters["errors"] += 1
+            return web.json_response({"code": -1000, "msg": "Injected error."}, status=500, headers=headers)
+
+        response = await handler(request)
+        response.headers.update(headers)
+        return response
+
+    # ----- REST -----
+
+    async def klines(self, request: web.Request) -> web.Response:
+        params = request.query
+        symbol = self._symbol(params["symbol"])
+        interval = params["interval"]
+        if interval not in INTERVAL_MS:
+            return web.json_response({"code": -1120, "msg": "Invalid interval."}, status=400)
+        limit = min(int(params.get("limit", 500)), 1000)
+        step = INTERVAL_MS[interval]
+        now = self._now_ms()
+
+        end = min(int(params["endTime"]), now) if "endTime" in params else now
+        if "startTime" in params:
+            start = int(params["startTime"])
+            end = min(end, align_open_time(start, interval) + limit * step)
+        else:
+            start = align_open_time(end, interval) - (limit - 1) * step
+
+        candles = self.model.candles(symbol, interval, start, end, now)
+        rows = _kline_rows(candles)
+        rows = rows[:limit] if "startTime" in params else rows[-limit:]
+        return web.json_response(rows)
+
+    async def ticker_price(self, request: web.Request) -> web.Response:
+        now = self._now_ms()
+        prices = [{"symbol": s, "price": f"{self.model.price(s, now):.8f}"} for s in self._symbols_param(request.query)]
+        return web.json_response(prices[0] if "symbol" in request.query else prices)
+
+    def _ticker_24h(self, symbol: str, now: int) -> Dict[str, Any]:
+        day = self.model.minutes(symbol, now - DAY_MS + 1, now + 1)
+        open_price, last_price = float(day["open"][0]), float(day["close"][-1])
+        change = last_price - open_price
+        return {
+            "symbol": symbol,
+            "priceChange": f"{change:.8f}",
+            "priceChangePercent": f"{change / open_price * 100:.3f}",
+            "weightedAvgPrice": f"{float(day['quote_asset_volume'].sum() / day['volume'].sum()):.8f}",
+            "openPrice": f"{open_price:.8f}",
+            "highPrice": f"{float(day['high'].max()):.8f}",
+            "lowPrice": f"{float(day['low'].min()):.8f}",
+            "lastPrice": f"{last_price:.8f}",
+            "volume": f"{float(day['volume'].sum()):.8f}",
+            "quoteVolume": f"{float(day['quote_asset_volume'].sum()):.8f}",
+            "openTime": int(day["open_time"][0]),
+            "closeTime": now,
+            "count": int(day["number_of_trades"].sum()),
+        }
+
+    async def ticker_24hr(self, request: web.Request) -> web.Response:
+        now = self._now_ms()
+        tickers = [self._ticker_24h(s, now) for s in self._symbols_param(request.query)]
+        return web.json_response(tickers[0] if "symbol" in request.query else tickers)
+
+    async def exchange_info(self, request: web.Request) -> web.Response:
+        now = self._now_ms()
+        symbols = []
+        for symbol in self.model.symbols:
+            price = self.model.price(symbol, now)
+            tick = 10 ** (np.floor(np.log10(price)) - 4)
+            symbols.append({
+                "symbol": symbol,
+                "status": "TRADING",
+                "baseAsset": symbol[:-4],
+                "quoteAsset": "USDT",
+                "filters": [
+                    {"filterType": "PRICE_FILTER", "minPrice": f"{tick:.8f}", "maxPrice": "1000000.00000000", "tickSize": f"{tick:.8f}"},
+                    {"filterType": "LOT_SIZE", "minQty": "0.00001000", "maxQty": "9000.00000000", "stepSize": "0.00001000"},
+                    {"filterType": "NOTIONAL", "minNotional": "5.00000000"},
+                ],
+            })
+        return web.json_response({
+            "timezone": "UTC",
+            "serverTime": now,
+            "rateLimits": [{"rateLimitType": "REQUEST_WEIGHT", "interval": "MINUTE", "intervalNum": 1, "limit": self.weight_limit}],
+            "symbols": symbols,
+        })
+
+    async def _order_params(self, request: web.Request) -> Dict[str, Any]:
+        params: Dict[str, Any] = dict(request.query)
+        if request.can_read_body:
+            if request.content_type == "application/json":
+                params.update(await request.json())
+            else:
+                params.update(await request.post())
+        return params
+
+    async def create_order(self, request: web.Request) -> web.Response:
+        params = await self._order_params(request)
+        symbol = self._symbol(params["symbol"])
+        order_id = next(self._order_ids)
+        now = self._now_ms()
+        market = params["type"] == "MARKET"
+        price = self.model.price(symbol, now) if market else float(params["price"])
+        order = {
+            "symbol": symbol,
+            "orderId": order_id,
+            "clientOrderId": params.get("newClientOrderId", f"mock{order_id}"),
+            "transactTime": now,
+            "price": f"{price:.8f}",
+            "origQty": f"{float(params['quantity']):.8f}",
+            "executedQty": f"{float(params['quantity']):.8f}" if market else "0.00000000",
+            "status": "FILLED" if market else "NEW",
+            "timeInForce": params.get("timeInForce", "GTC"),
+            "type": params["type"],
+            "side": params["side"],
+        }
+        if not market:
+            self._orders[order_id] = order
+        return web.json_response(order)
+
+    async def cancel_order(self, request: web.Request) -> web.Response:
+        params = await self._order_params(request)
+        order = None
+        if "orderId" in params:
+            order = self._orders.pop(int(params["orderId"]), None)
+        elif "origClientOrderId" in params:
+            for order_id, item in list(self._orders.items()):
+                if item["clientOrderId"] == params["origClientOrderId"]:
+                    order = self._orders.pop(order_id)
+        if order is None:
+            return web.json_response({"code": -2011, "msg": "Unknown order sent."}, status=400)
+        return web.json_response({**order, "status": "CANCELED"})
+
+    async def open_orders(self, request: web.Request) -> web.Response:
+        symbol = request.query.get("symbol")
+        orders = [o for o in self._orders.values() if symbol is None or o["symbol"] == symbol.upper()]
+        return web.json_response(orders)
+
+    async def account(self, request: web.Request) -> web.Response:
+        return web.json_response({
+            "canTrade": True,
+            "updateTime": self._now_ms(),
+            "balances": [{"asset": "USDT", "free": "100000.00000000", "locked": "0.00000000"}]
+            + [{"asset": s[:-4], "free": "1.00000000", "locked": "0.00000000"} for s in self.model.symbols[:5]],
+        })
+
+    # ----- WebSocket -----
+
+    def _stream_event(self, stream: str, now: int, last_open: Dict[str, int]) -> List[Dict[str, Any]]:
+        """
+        Akış için gönderilecek olayları üretir. Kline akışında mum sınırı geçildiyse önce
+        önceki mumun kapanmış hali gönderilir.
+        """
+        symbol_part, _, kind = stream.partition("@")
+        symbol = symbol_part.upper()
+        if symbol not in self.model.symbols:
+            return []
+
+        if kind == "ticker":
+            ticker = self._ticker_24h(symbol, now)
+            return [{
+                "e": "24hrTicker", "E": now, "s": symbol,
+                "p": ticker["priceChange"], "P": ticker["priceChangePercent"], "w": ticker["weightedAvgPrice"],
+                "o": ticker["openPrice"], "h": ticker["highPrice"], "l": ticker["lowPrice"], "c": ticker["lastPrice"],
+                "v": ticker["volume"], "q": ticker["quoteVolume"], "O": ticker["openTime"], "C": now, "n": ticker["count"],
+            }]
+
+        if kind.startswith("kline_") and kind[6:] in INTERVAL_MS:
+            interval = kind[6:]
+            step = INTERVAL_MS[interval]
+            current = align_open_time(now, interval)
+            opens = [current]
+            previous = last_open.get(stream)
+            if previous is not None and previous < current:
+                opens.insert(0, previous)
+            last_open[stream] = current
+
+            events = []
+            candles = self.model.candles(symbol, interval, opens[0], current, now)
+            for row in _kline_rows(candles):
+                closed = row[0] < current
+                events.append({
+                    "e": "kline", "E": now, "s": symbol,
+                    "k": {
+                        "t": row[0], "T": row[6], "s": symbol, "i": interval,
+                        "o": row[1], "h": row[2], "l": row[3], "c": row[4], "v": row[5],
+                        "n": row[8], "x": closed, "q": row[7], "V": row[9], "Q": row[10], "B": "0",
+                    },
+                })
+            return events
+        return []
+
+    async def _serve_ws(self, request: web.Request, streams: Set[str], combined: bool) -> web.WebSocketResponse:
+        ws = web.WebSocketResponse(heartbeat=None)
+        await ws.prepare(request)
+        self.counters["ws_connections"] += 1
+        opened = time.monotonic()
+        last_open: Dict[str, int] = {}
+
+        async def pump():
+            while not ws.closed:
+                now = self._now_ms()
+                for stream in list(streams):
+                    for event in self._stream_event(stream, now, last_open):
+                        payload = {"stream": stream, "data": event} if combined else event
+                        await ws.send_str(json.dumps(payload))
+                        self.counters["ws_messages"] += 1
+                if self.ws_drop_after and time.monotonic() - opened >= self.ws_drop_after:
+                    await ws.close()
+                    break
+                await asyncio.sleep(self.tick_interval)
+
+        task = asyncio.create_task(pump())
+        try:
+            async for msg in ws:
+                if msg.type != WSMsgType.TEXT:
+                    continue
+                command = json.loads(msg.data)
+                method = command.get("method")
+                params = [s.lower() for s in command.get("params", [])]
+                if method == "SUBSCRIBE":
+                    streams.update(params)
+                    await ws.send_str(json.dumps({"result": None, "id": command.get("id")}))
+                elif method == "UNSUBSCRIBE":
+                    streams.difference_update(params)
+                    await ws.send_str(json.dumps({"result": None, "id": command.get("id")}))
+                elif method == "LIST_SUBSCRIPTIONS":
+                    await ws.send_str(json.dumps({"result": sorted(streams), "id": command.get("id")}))
+                else:
+                    await ws.send_str(json.dumps({"error": {"code": 2, "msg": "Invalid request"}, "id": command.get("id")}))
+        finally:
+            task.cancel()
+        return ws
+
+    async def raw_stream(self, request: web.Request) -> web.WebSocketResponse:
+        stream = request.match_info.get("stream")
+        return await self._serve_ws(request, {stream.lower()} if stream else set(), combined=False)
+
+    async def combined_stream(self, request: web.Request) -> web.WebSocketResponse:
+        streams = {s.lower() for s in request.query.get("streams", "").split("/") if s}
+        return await self._serve_ws(request, streams, combined=True)
+
+    async def stats(self, request: web.Request) -> web.Response:
+        return web.json_response({**self.counters, "used_weight": self._used_weight})
+
+    def app(self) -> web.Application:
+        app = web.Application(middlewares=[self._middleware])
+        app.router.add_get("/api/v3/klines", self.klines)
+        app.router.add_get("/api/v3/ticker/price", self.ticker_price)
+        app.router.add_get("/api/v3/ticker/24hr", self.ticker_24hr)
+        app.router.add_get("/api/v3/exchangeInfo", self.exchange_info)
+        app.router.add_post("/api/v3/order", self.create_order)
+        app.router.add_delete("/api/v3/order", self.cancel_order)
+        app.router.add_get("/api/v3/openOrders", self.open_orders)
+        app.router.add_get("/api/v3/account", self.account)
+        app.router.add_get("/ws", self.raw_stream)
+        app.router.add_get("/ws/{stream}", self.raw_stream)
+        app.router.add_get("/stream", self.combined_stream)
+        app.router.add_get("/mock/stats", self.stats)
+        return app
+
+
+async def start_mock_binance(host: str = "127.0.0.1", port: int = 9100, **options) -> Tuple[MockBinance, web.AppRunner]:
+    """
+    Sahte sunucuyu mevcut event loop'ta başlatır
+
+    Returns:
+        Tuple: (sunucu, durdurmak için `await runner.cleanup()` çağrılacak AppRunner)
+    """
+    mock = MockBinance(**options)
+    runner = web.AppRunner(mock.app(), access_log=None)
+    await runner.setup()
+    await web.TCPSite(runner, host, port).start()
+    return mock, runner
+
+
+async def _serve(args: argparse.Namespace) -> None:
+    mock, runner = await start_mock_binance(
+        args.host, args.port,
+        symbols=args.symbols, seed=args.seed, latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate, weight_limit=args.weight_limit, tick_interval=args.tick_interval,
+        ws_drop_after=args.ws_drop_after,
+    )
+    print(f"Sahte Binance http://{args.host}:{args.port} adresinde çalışıyor ({len(mock.model.symbols)} sembol)")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await runner.cleanup()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Yerel sahte Binance sunucusu")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9100)
+    parser.add_argument("--symbols", type=int, default=20, help="USDT paritesi sayısı")
+    parser.add_argument("--seed", type=int, default=7, help="Fiyat üretimi tohumu")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="REST yanıt gecikmesi")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="Gecikmeye eklenen ±sapma")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="500 döndürme olasılığı (0-1)")
+    parser.add_argument("--weight-limit", type=int, default=6000, help="Dakikalık ağırlık limiti")
+    parser.add_argument("--tick-interval", type=float, default=1.0, help="Akış olayları arası saniye")
+    parser.add_argument("--ws-drop-after", type=float, default=0.0, help="WebSocket'leri bu kadar saniye sonra kopar")
+    try:
+        asyncio.run(_serve(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
@@ -10,9 +10,18 @@ import asyncio
 import atexit
 from aiohttp import ClientSession, WSMsgType
 
+from data.rate_limiter import binance_rate_limiter, endpoint_weight, Priority, PriorityTicket
+from data.singleflight import binance_singleflight, request_key
+from data.binance_streams import StreamMultiplexer, StreamCallback, BACKFILL_LIMIT
+
 # Logger
 logger = logging.getLogger("torypto")
 
+# recvWindow dışında kalan zaman damgası hatası (-1021) için imzalı isteğin yeniden deneme sayısı
+SIGNED_REQUEST_RETRIES = int(os.getenv("BINANCE_SIGNED_REQUEST_RETRIES", "1"))
+# Binance: "Timestamp for this request is outside of the recvWindow"
+TIMESTAMP_ERROR_CODE = -1021
+
 class BinanceClient:
     """
     Binance API istemcisi
@@ -44,6 +53,7 @@ class BinanceClient:
         self.BASE_URL = base_url
         self._session = None
         self._ws_connections = {}
+        self._streams = StreamMultiplexer(lambda: self.session, backfill=self._backfill_klines)
         self._cleanup_registered = False
         
         if not self._cleanup_registered:
@@ -80,6 +90,7 @@ class BinanceClient:
                         await ws.close()
                         logger.debug(f"{symbol} için WebSocket bağlantısı kapatıldı")
                 self._ws_connections.clear()
+                await self._streams.close()
                 
                 # HTTP oturumunu kapat
                 await self._session.close()
@@ -123,10 +134,39 @@ class BinanceClient:
         
         return signature
     
+    def _sign(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Parametrelerin zaman damgalı ve imzalı kopyasını döndürür (gönderimden hemen önce çağrılır)
+        """
+        signed_params = dict(params)
+        signed_params['timestamp'] = int(time.time() * 1000)
+        signed_params['signature'] = self._generate_signature(signed_params)
+        return signed_params
+    
+    async def _timestamp_rejected(self, response: aiohttp.ClientResponse) -> bool:
+        """
+        Yanıt, zaman damgası recvWindow dışında kaldığı için reddedildiyse True döner
+        (istek işlenmemiştir, yeniden imzalanıp gönderilebilir)
+        """
+        if response.status != 400:
+            return False
+        try:
+            error_data = await response.json()
+        except Exception:
+            return False
+        if error_data.get("code") != TIMESTAMP_ERROR_CODE:
+            return False
+        binance_rate_limiter.update_from_headers(response.headers)
+        return True
+    
     async def _handle_response(self, response: aiohttp.ClientResponse) -> Any:
         """
         API yanıtını işle
         """
+        binance_rate_limiter.update_from_headers(response.headers)
+        if response.status in (418, 429):
+            binance_rate_limiter.on_rate_limited(response.status, response.headers.get("Retry-After"))
+        
         if response.status == 200:
             return await response.json()
         else:
@@ -138,89 +178,82 @@ class BinanceClient:
             logger.error(error_msg)
             raise Exception(error_msg)
     
-    async def _get(self, endpoint: str, params: Optional[Dict[str, Any]] = None, signed: bool = False) -> Any:
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        signed: bool = False,
+        priority: Union[int, PriorityTicket] = Priority.INTERACTIVE
+    ) -> Any:
         """
-        GET isteği gönder
+        İsteği hız sınırlayıcıdan ağırlık bütçesi ayırarak gönder
         """
         if params is None:
             params = {}
             
         url = f"{self.BASE_URL}{endpoint}"
         
-        if signed:
-            if not self.API_KEY or not self.API_SECRET:
-                raise Exception("İmzalı istek için API anahtarları gerekli")
+        if signed and (not self.API_KEY or not self.API_SECRET):
+            raise Exception("İmzalı istek için API anahtarları gerekli")
+        
+        weight = endpoint_weight(endpoint, params)
+        attempts = SIGNED_REQUEST_RETRIES + 1 if signed else 1
+        session = self.session
+        
+        for attempt in range(attempts):
+            # Bütçe önce ayrılır: düşük öncelikli istek sırada uzun bekleyebilir
+            await binance_rate_limiter.acquire(weight, priority)
             
-            # Zaman damgası ekle
-            params['timestamp'] = int(time.time() * 1000)
+            # Zaman damgası ve imza beklemeden sonra, gönderimden hemen önce eklenir
+            # (her denemede yeniden imzalanır; aksi halde recvWindow aşılır: -1021)
+            request_params = self._sign(params) if signed else params
             
-            # İmza oluştur ve ekle
-            params['signature'] = self._generate_signature(params)
+            try:
+                if method == "POST":
+                    request = session.post(url, json=request_params, headers=self._get_headers())
+                else:
+                    request = session.request(method, url, params=request_params, headers=self._get_headers())
+                async with request as response:
+                    if attempt + 1 < attempts and await self._timestamp_rejected(response):
+                        logger.warning(f"Zaman damgası recvWindow dışında, istek yeniden imzalanıyor: {endpoint}")
+                        continue
+                    return await self._handle_response(response)
+            except Exception as e:
+                logger.error(f"Binance API isteği başarısız: {str(e)}")
+                raise Exception(f"Binance API isteği başarısız: {str(e)}")
+    
+    async def _get(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        signed: bool = False,
+        priority: int = Priority.INTERACTIVE
+    ) -> Any:
+        """
+        GET isteği gönder. İmzasız özdeş GET istekleri tek uçuşta birleştirilir.
+        """
+        if signed:
+            return await self._request("GET", endpoint, params, signed, priority)
         
-        session = await self.session
-            
-        try:
-            async with session.get(url, params=params, headers=self._get_headers()) as response:
-                return await self._handle_response(response)
-        except Exception as e:
-            logger.error(f"Binance API isteği başarısız: {str(e)}")
-            raise Exception(f"Binance API isteği başarısız: {str(e)}")
+        key = request_key("GET", f"{self.BASE_URL}{endpoint}", params)
+        # Aynı isteğe daha öncelikli bir çağıran katılırsa kuyruktaki istek yükseltilir
+        ticket = PriorityTicket(priority)
+        return await binance_singleflight.do(
+            key, lambda: self._request("GET", endpoint, params, signed, ticket), ticket
+        )
     
     async def _post(self, endpoint: str, params: Optional[Dict[str, Any]] = None, signed: bool = False) -> Any:
         """
         POST isteği gönder
         """
-        if params is None:
-            params = {}
-            
-        url = f"{self.BASE_URL}{endpoint}"
-        
-        if signed:
-            if not self.API_KEY or not self.API_SECRET:
-                raise Exception("İmzalı istek için API anahtarları gerekli")
-            
-            # Zaman damgası ekle
-            params['timestamp'] = int(time.time() * 1000)
-            
-            # İmza oluştur ve ekle
-            params['signature'] = self._generate_signature(params)
-        
-        session = await self.session
-            
-        try:
-            async with session.post(url, json=params, headers=self._get_headers()) as response:
-                return await self._handle_response(response)
-        except Exception as e:
-            logger.error(f"Binance API isteği başarısız: {str(e)}")
-            raise Exception(f"Binance API isteği başarısız: {str(e)}")
+        return await self._request("POST", endpoint, params, signed)
     
     async def _delete(self, endpoint: str, params: Optional[Dict[str, Any]] = None, signed: bool = False) -> Any:
         """
         DELETE isteği gönder
         """
-        if params is None:
-            params = {}
-            
-        url = f"{self.BASE_URL}{endpoint}"
-        
-        if signed:
-            if not self.API_KEY or not self.API_SECRET:
-                raise Exception("İmzalı istek için API anahtarları gerekli")
-            
-            # Zaman damgası ekle
-            params['timestamp'] = int(time.time() * 1000)
-            
-            # İmza oluştur ve ekle
-            params['signature'] = self._generate_signature(params)
-        
-        session = await self.session
-            
-        try:
-            async with session.delete(url, params=params, headers=self._get_headers()) as response:
-                return await self._handle_response(response)
-        except Exception as e:
-            logger.error(f"Binance API isteği başarısız: {str(e)}")
-            raise Exception(f"Binance API isteği başarısız: {str(e)}")
+        return await self._request("DELETE", endpoint, params, signed)
     
     # ----- Genel endpointler -----
     
@@ -329,7 +362,8 @@ class BinanceClient:
         interval: str,
         limit: int = 500,
         start_time: Optional[int] = None,
-        end_time: Optional[int] = None
+        end_time: Optional[int] = None,
+        priority: int = Priority.INTERACTIVE
     ) -> List[List[Any]]:
         """
         Kline/Candlestick verilerini al
@@ -346,7 +380,7 @@ class BinanceClient:
         if end_time:
             params["endTime"] = end_time
             
-        return await self._get("/api/v3/klines", params)
+        return await self._get("/api/v3/klines", params, priority=priority)
     
     # ----- Hesap endpointleri (imzalı) -----
     
@@ -471,5 +505,41 @@ class BinanceClient:
             del self._ws_connections[stream_name]
             logger.info(f"{stream_name} için WebSocket bağlantısı kapatıldı")
 
+    # Birleşik akış (combined stream) yönetimi
+    async def subscribe_stream(self, stream_name: str, callback: StreamCallback) -> None:
+        """
+        Akışa paylaşımlı birleşik akış bağlantıları üzerinden abone olur. Aynı akışa
+        birden fazla callback eklenebilir; her biri çözülmüş olay sözlüğünü alır.
+        Bağlantı koparsa otomatik olarak yeniden kurulur ve kline akışlarında kaçırılan
+        kapanmış mumlar REST'ten doldurulup sırayla iletilir.
+        
+        Args:
+            stream_name: Abone olunacak akış adı (örn. "btcusdt@kline_1m")
+            callback: Olay geldiğinde çağrılacak coroutine
+        """
+        await self._streams.subscribe(stream_name, callback)
+        
+    async def unsubscribe_stream(self, stream_name: str, callback: Optional[StreamCallback] = None) -> None:
+        """
+        Callback'i (verilmezse tüm callback'leri) akıştan çıkarır
+        
+        Args:
+            stream_name: Akış adı
+            callback: Çıkarılacak callback
+        """
+        await self._streams.unsubscribe(stream_name, callback)
+        
+    async def _backfill_klines(self, symbol: str, interval: str, start_time: int) -> List[List[Any]]:
+        """
+        Yeniden bağlanma sonrası kaçırılan mumları REST'ten alır
+        """
+        return await self.get_klines(symbol, interval, limit=BACKFILL_LIMIT, start_time=start_time)
+        
+    def stream_stats(self) -> Dict[str, Any]:
+        """
+        Birleşik akış bağlantı, yeniden bağlanma ve boşluk doldurma sayaçlarını döndürür
+        """
+        return self._streams.stats()
+
 # Singleton instance
 binance_client = BinanceClient() 
\ No newline at end of file
@@ -0,0 +1,475 @@
+import asyncio
+import json
+import logging
+import os
+import random
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Set, Tuple
+
+from aiohttp import ClientSession, ClientWebSocketResponse, WSMsgType
+
+# Logger
+logger = logging.getLogger("torypto")
+
+# Birleşik akış (combined stream) uç noktası
+BINANCE_STREAM_URL = os.getenv("BINANCE_STREAM_URL", "wss://stream.binance.com:9443")
+# Tek bir bağlantıya yerleştirilecek en fazla akış sayısı (Binance üst sınırı 1024)
+STREAMS_PER_CONNECTION = int(os.getenv("BINANCE_STREAMS_PER_CONNECTION", "200"))
+# Binance bağlantı başına saniyede en fazla 5 kontrol mesajı kabul eder
+CONTROL_MESSAGE_INTERVAL = float(os.getenv("BINANCE_STREAM_CONTROL_INTERVAL", "0.25"))
+# Yeniden bağlanma bekleme süresinin tabanı ve üst sınırı (saniye, üstel + jitter)
+RECONNECT_BASE_DELAY = float(os.getenv("BINANCE_STREAM_RECONNECT_BASE", "0.5"))
+RECONNECT_MAX_DELAY = float(os.getenv("BINANCE_STREAM_RECONNECT_MAX", "30"))
+# Ping aralığı (saniye); pong bu sürenin yarısında gelmezse bağlantı kapatılıp yeniden kurulur
+STREAM_HEARTBEAT = float(os.getenv("BINANCE_STREAM_HEARTBEAT", "20"))
+# Bu süre boyunca hiçbir çerçeve (veri ya da Binance ping'i) gelmezse yarı açık bağlantı
+# kabul edilir, yeniden bağlanılır ve boşluk doldurulur (saniye)
+STREAM_RECEIVE_TIMEOUT = float(os.getenv("BINANCE_STREAM_RECEIVE_TIMEOUT", "60"))
+# Tek bir boşluk doldurma isteğinde alınacak en fazla mum (daha uzun boşluklar sayfalanır)
+BACKFILL_LIMIT = 1000
+
+StreamCallback = Callable[[Dict[str, Any]], Awaitable[None]]
+# (sembol, aralık, başlangıç açılış zamanı) -> Binance `/api/v3/klines` satırları
+KlineBackfill = Callable[[str, str, int], Awaitable[List[List[Any]]]]
+
+
+def parse_kline_stream(stream: str) -> Optional[Tuple[str, str]]:
+    """
+    "btcusdt@kline_1m" gibi bir akış adından (sembol, aralık) çıkarır
+
+    Returns:
+        Tuple veya kline akışı değilse None
+    """
+    symbol, _, kind = stream.partition("@")
+    if not kind.startswith("kline_"):
+        return None
+    return symbol.upper(), kind[len("kline_"):]
+
+
+def kline_row_to_event(symbol: str, interval: str, row: List[Any]) -> Dict[str, Any]:
+    """
+    REST kline satırını WebSocket kline olayı biçimine dönüştürür (kapanmış mum olarak)
+    """
+    return {
+        "e": "kline",
+        "E": int(row[6]),
+        "s": symbol,
+        "k": {
+            "t": int(row[0]),
+            "T": int(row[6]),
+            "s": symbol,
+            "i": interval,
+            "o": row[1],
+            "h": row[2],
+            "l": row[3],
+            "c": row[4],
+            "v": row[5],
+            "n": int(row[8]),
+            "x": True,
+            "q": row[7],
+            "V": row[9],
+            "Q": row[10],
+            "B": "0",
+        },
+    }
+
+
+class CombinedStreamConnection:
+    """
+    `/stream?streams=` uç noktasına açılmış, denetlenen tek bir fiziksel WebSocket bağlantısı.
+
+    Bağlantı açıkken akışlar SUBSCRIBE/UNSUBSCRIBE mesajlarıyla eklenip çıkarılır.
+    Gelen her mesaj `stream` alanına göre çoklayıcıya iletilir. Bağlantı koparsa tüm
+    akışlarıyla birlikte jitter'lı üstel bekleme ile yeniden kurulur; yeniden kurulduktan
+    sonra canlı mesajlar okunmadan önce `on_reconnect` kancası çalıştırılır.
+    """
+
+    def __init__(
+        self,
+        conn_id: int,
+        dispatch: Callable[[str, Dict[str, Any]], Awaitable[None]],
+        on_reconnect: Callable[["CombinedStreamConnection"], Awaitable[None]]
+    ):
+        self.conn_id = conn_id
+        self.streams: Set[str] = set()
+        self.messages = 0
+        self.reconnects = 0
+        self._dispatch = dispatch
+        self._on_reconnect = on_reconnect
+        self._session: Optional[ClientSession] = None
+        self._ws: Optional[ClientWebSocketResponse] = None
+        self._runner: Optional[asyncio.Task] = None
+        self._request_id = 0
+        self._control_lock = asyncio.Lock()
+        self._last_control = 0.0
+        self._closing = False
+
+    @property
+    def closed(self) -> bool:
+        """
+        Bağlantı kalıcı olarak kapatıldı mı (yeniden bağlanma sırasında False kalır)
+        """
+        return self._closing
+
+    @property
+    def connected(self) -> bool:
+        return self._ws is not None and not self._ws.closed
+
+    async def _connect(self) -> None:
+        streams = sorted(self.streams)
+        url = f"{BINANCE_STREAM_URL}/stream?streams={'/'.join(streams)}"
+        self._ws = await self._session.ws_connect(
+            url, heartbeat=STREAM_HEARTBEAT, receive_timeout=STREAM_RECEIVE_TIMEOUT
+        )
+        # Bağlanırken eklenen akışları kontrol mesajıyla ekle
+        pending = [stream for stream in self.streams if stream not in streams]
+        if pending:
+            await self._send_control("SUBSCRIBE", pending)
+
+    async def open(self, session: ClientSession, streams: List[str]) -> None:
+        """
+        İlk akışlarla bağlantıyı açar ve denetim görevini başlatır
+        """
+        self._session = session
+        self.streams.update(streams)
+        await self._connect()
+        self._runner = asyncio.create_task(self._run())
+        logger.info(f"Birleşik akış bağlantısı #{self.conn_id} kuruldu ({len(streams)} akış)")
+
+    async def subscribe(self, streams: List[str]) -> None:
+        """
+        Bağlantıya yeni akışlar ekler (yeniden bağlanılıyorsa yeni adrese dahil edilir)
+        """
+        self.streams.update(streams)
+        if self.connected:
+            await self._send_control("SUBSCRIBE", streams)
+
+    async def unsubscribe(self, streams: List[str]) -> None:
+        """
+        Akışları bağlantıdan çıkarır
+        """
+        self.streams.difference_update(streams)
+        if self.connected:
+            await self._send_control("UNSUBSCRIBE", streams)
+
+    async def _send_control(self, method: str, streams: List[str]) -> None:
+        async with self._control_lock:
+            # Kontrol mesajı hız sınırını aşarsak Binance bağlantıyı kapatır
+            wait = self._last_control + CONTROL_MESSAGE_INTERVAL - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            self._request_id += 1
+            await self._ws.send_str(json.dumps({"method": method, "params": streams, "id": self._request_id}))
+            self._last_control = time.monotonic()
+
+    async def _run(self) -> None:
+        attempt = 0
+        while not self._closing:
+            if not self.connected:
+                try:
+                    await self._connect()
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    attempt += 1
+                    # Tam jitter: tüm bağlantıların aynı anda yeniden bağlanmasını önler
+                    delay = random.uniform(0, min(RECONNECT_MAX_DELAY, RECONNECT_BASE_DELAY * 2 ** attempt))
+                    logger.warning(f"Birleşik akış #{self.conn_id} yeniden bağlanamadı ({e}), {delay:.1f} sn sonra tekrar")
+                    await asyncio.sleep(delay)
+                    continue
+
+                self.reconnects += 1
+                attempt = 0
+                logger.info(f"Birleşik akış bağlantısı #{self.conn_id} yeniden kuruldu ({len(self.streams)} akış)")
+                try:
+                    await self._on_reconnect(self)
+                except Exception as e:
+                    logger.error(f"Birleşik akış #{self.conn_id} boşluk doldurma hatası: {e}")
+
+            await self._read_loop()
+            if not self._closing:
+                # İlk denemeden önce de kısa bir jitter uygula
+                await asyncio.sleep(random.uniform(0, RECONNECT_BASE_DELAY))
+
+    async def _read_loop(self) -> None:
+        try:
+            async for msg in self._ws:
+                if msg.type == WSMsgType.TEXT:
+                    payload = json.loads(msg.data)
+                    stream = payload.get("stream")
+                    if stream is not None:
+                        self.messages += 1
+                        await self._dispatch(stream, payload["data"])
+                    elif payload.get("error"):
+                        logger.error(f"Birleşik akış #{self.conn_id} kontrol hatası: {payload['error']}")
+                elif msg.type == WSMsgType.CLOSED:
+                    break
+                elif msg.type == WSMsgType.ERROR:
+                    logger.error(f"Birleşik akış #{self.conn_id} WebSocket hatası: {msg.data}")
+                    break
+        except asyncio.CancelledError:
+            raise
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"Birleşik akış #{self.conn_id} {STREAM_RECEIVE_TIMEOUT:.0f} sn boyunca veri almadı, yeniden bağlanılıyor"
+            )
+        except Exception as e:
+            logger.error(f"Birleşik akış #{self.conn_id} işleme hatası: {e}")
+        finally:
+            if not self._closing:
+                logger.warning(f"Birleşik akış bağlantısı #{self.conn_id} koptu")
+            if self._ws is not None and not self._ws.closed:
+                await self._ws.close()
+
+    async def close(self) -> None:
+        """
+        Bağlantıyı kalıcı olarak kapatır ve denetim görevini durdurur
+        """
+        self._closing = True
+        if self._ws is not None and not self._ws.closed:
+            await self._ws.close()
+        if self._runner is not None and self._runner is not asyncio.current_task():
+            self._runner.cancel()
+            try:
+                await self._runner
+            except asyncio.CancelledError:
+                pass
+        self._runner = None
+        logger.info(f"Birleşik akış bağlantısı #{self.conn_id} kapatıldı")
+
+
+class StreamMultiplexer:
+    """
+    Çok sayıda Binance akışını az sayıda birleşik akış bağlantısına yerleştirir.
+
+    Her bağlantıya en fazla `STREAMS_PER_CONNECTION` akış konur; yer kalmadığında yeni
+    bağlantı açılır. Bir akışa birden fazla callback abone olabilir ve callback'ler
+    Binance olayını çözülmüş sözlük olarak alır. Böylece maliyet soket sayısıyla değil,
+    saniyedeki mesaj sayısıyla ölçeklenir.
+
+    Kline akışları için son görülen mum izlenir. Kopan bir bağlantı yeniden kurulduğunda
+    arada kaçırılan kapanmış mumlar `backfill` ile REST'ten alınır ve canlı akış devam
+    etmeden önce aynı callback'lere sırayla kapanmış kline olayı olarak iletilir.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], ClientSession],
+        streams_per_connection: int = STREAMS_PER_CONNECTION,
+        backfill: Optional[KlineBackfill] = None
+    ):
+        self._session_factory = session_factory
+        self.streams_per_connection = streams_per_connection
+        self._backfill = backfill
+        self._callbacks: Dict[str, List[StreamCallback]] = {}
+        self._stream_conn: Dict[str, CombinedStreamConnection] = {}
+        self._connections: List[CombinedStreamConnection] = []
+        self._lock: Optional[asyncio.Lock] = None
+        self._next_conn_id = 0
+        self._messages = 0
+        self._started_at = time.monotonic()
+        # Kline akışı -> (son kapanmış mumun açılış zamanı, son görülen mumun açılış zamanı)
+        self._kline_marks: Dict[str, Tuple[Optional[int], int]] = {}
+        self._reconnects = 0
+        self._gaps_detected = 0
+        self._candles_backfilled = 0
+        self._backfill_errors = 0
+        self._recent_gaps: Deque[Dict[str, Any]] = deque(maxlen=20)
+
+    def _get_lock(self) -> asyncio.Lock:
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        return self._lock
+
+    async def subscribe(self, stream: str, callback: StreamCallback) -> None:
+        """
+        Akışa callback ekler; akış ilk kez isteniyorsa bir bağlantıya yerleştirir
+
+        Args:
+            stream: Akış adı (örn. "btcusdt@kline_1m")
+            callback: Her olayda çözülmüş `data` sözlüğüyle çağrılacak coroutine
+        """
+        stream = stream.lower()
+        async with self._get_lock():
+            callbacks = self._callbacks.setdefault(stream, [])
+            if callback not in callbacks:
+                callbacks.append(callback)
+
+            conn = self._stream_conn.get(stream)
+            if conn is not None and not conn.closed:
+                return
+
+            try:
+                conn = await self._place(stream)
+            except Exception:
+                callbacks.remove(callback)
+                if not callbacks:
+                    del self._callbacks[stream]
+                raise
+            self._stream_conn[stream] = conn
+
+    async def _place(self, stream: str) -> CombinedStreamConnection:
+        # Kalıcı olarak kapanmış bağlantıları ayıkla
+        for conn in [c for c in self._connections if c.closed]:
+            await self._drop(conn)
+
+        for conn in self._connections:
+            if len(conn.streams) < self.streams_per_connection:
+                await conn.subscribe([stream])
+                return conn
+
+        self._next_conn_id += 1
+        conn = CombinedStreamConnection(self._next_conn_id, self._dispatch, self._on_reconnect)
+        await conn.open(self._session_factory(), [stream])
+        self._connections.append(conn)
+        return conn
+
+    async def _drop(self, conn: CombinedStreamConnection) -> None:
+        self._connections.remove(conn)
+        for stream in conn.streams:
+            if self._stream_conn.get(stream) is conn:
+                del self._stream_conn[stream]
+        await conn.close()
+
+    async def unsubscribe(self, stream: str, callback: Optional[StreamCallback] = None) -> None:
+        """
+        Callback'i (verilmezse tüm callback'leri) akıştan çıkarır; akışı dinleyen kalmazsa
+        bağlantıdan çıkarır ve boşalan bağlantıyı kapatır
+        """
+        stream = stream.lower()
+        async with self._get_lock():
+            callbacks = self._callbacks.get(stream, [])
+            if callback is None:
+                callbacks.clear()
+            elif callback in callbacks:
+                callbacks.remove(callback)
+            if callbacks:
+                return
+
+            self._callbacks.pop(stream, None)
+            self._kline_marks.pop(stream, None)
+            conn = self._stream_conn.pop(stream, None)
+            if conn is None:
+                return
+            await conn.unsubscribe([stream])
+            if not conn.streams:
+                await self._drop(conn)
+            logger.info(f"{stream} akış aboneliği kaldırıldı")
+
+    async def _dispatch(self, stream: str, data: Dict[str, Any]) -> None:
+        self._messages += 1
+
+        kline = data.get("k")
+        if kline is not None:
+            last_closed, _ = self._kline_marks.get(stream, (None, 0))
+            open_time = kline["t"]
+            # Boşluk doldurmada zaten iletilmiş bir mum tekrar gelirse atla
+            if last_closed is not None and open_time <= last_closed:
+                return
+            self._kline_marks[stream] = (open_time if kline.get("x") else last_closed, open_time)
+
+        for callback in list(self._callbacks.get(stream, ())):
+            try:
+                await callback(data)
+            except Exception as e:
+                logger.error(f"{stream} akış callback hatası: {e}")
+
+    async def _on_reconnect(self, conn: CombinedStreamConnection) -> None:
+        self._reconnects += 1
+        if self._backfill is None:
+            return
+        for stream in list(conn.streams):
+            if stream not in self._kline_marks:
+                continue
+            # Bir akışın REST hatası bağlantıdaki diğer akışların doldurulmasını durdurmasın
+            try:
+                await self._backfill_stream(stream)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._backfill_errors += 1
+                logger.error(f"{stream} boşluk doldurma hatası: {e}")
+
+    async def _backfill_stream(self, stream: str) -> None:
+        """
+        Son görülen mumdan bu yana kapanmış ve kaçırılmış mumları REST'ten alıp iletir.
+        `BACKFILL_LIMIT`'ten uzun boşluklar sayfa sayfa çekilir; her sayfa bir sonraki
+        istekten önce iletilir.
+        """
+        parsed = parse_kline_stream(stream)
+        if parsed is None:
+            return
+        symbol, interval = parsed
+        last_closed, start_time = self._kline_marks[stream]
+
+        now = int(time.time() * 1000)
+        first_missed: Optional[int] = None
+        last_missed = 0
+        count = 0
+        while True:
+            rows = await self._backfill(symbol, interval, start_time)
+            missed = [
+                row for row in rows
+                if (last_closed is None or int(row[0]) > last_closed) and int(row[6]) < now
+            ]
+            for row in missed:
+                await self._dispatch(stream, kline_row_to_event(symbol, interval, row))
+            if missed:
+                first_missed = int(missed[0][0]) if first_missed is None else first_missed
+                last_missed = int(missed[-1][0])
+                count += len(missed)
+            # Sayfa doluysa ve son mum henüz kapanmış mumlardansa devam et
+            if len(rows) < BACKFILL_LIMIT or int(rows[-1][6]) >= now or int(rows[-1][0]) < start_time:
+                break
+            start_time = int(rows[-1][0]) + 1
+        if not count:
+            return
+
+        self._gaps_detected += 1
+        self._candles_backfilled += count
+        self._recent_gaps.append({
+            "stream": stream,
+            "start": first_missed,
+            "end": last_missed,
+            "missing": count,
+            "at": now,
+        })
+        logger.info(f"{stream} için {count} kaçırılmış mum REST'ten dolduruldu")
+
+    async def close(self) -> None:
+        """
+        Tüm bağlantıları kapatır
+        """
+        for conn in list(self._connections):
+            await conn.close()
+        self._connections.clear()
+        self._stream_conn.clear()
+        self._callbacks.clear()
+        self._kline_marks.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Bağlantı, mesaj, yeniden bağlanma ve boşluk doldurma sayaçlarını döndürür
+        """
+        return {
+            "connections": len(self._connections),
+            "streams": len(self._stream_conn),
+            "streams_per_connection": self.streams_per_connection,
+            "messages": self._messages,
+            "messages_per_second": round(self._messages / max(time.monotonic() - self._started_at, 1e-9), 2),
+            "reconnects": self._reconnects,
+            "gaps_detected": self._gaps_detected,
+            "candles_backfilled": self._candles_backfilled,
+            "backfill_errors": self._backfill_errors,
+            "recent_gaps": list(self._recent_gaps),
+            "per_connection": {
+                conn.conn_id: {
+                    "streams": len(conn.streams),
+                    "connected": conn.connected,
+                    "reconnects": conn.reconnects,
+                    "messages": conn.messages,
+                }
+                for conn in self._connections
+            },
+        }
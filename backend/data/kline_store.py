@@ -0,0 +1,253 @@
+import json
+import logging
+import os
+import threading
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from utils.klines import KLINE_COLUMNS, KlineColumns, empty_columns, select_rows
+
+# Logger
+logger = logging.getLogger("torypto")
+
+# Mum deposunun kök dizini ve etkinlik ayarı
+KLINE_STORE_DIR = os.getenv("KLINE_STORE_DIR", "./kline_store")
+KLINE_STORE_ENABLED = os.getenv("KLINE_STORE_ENABLED", "true").lower() in ("1", "true", "yes")
+
+COVERAGE_FILE = "coverage.json"
+
+
+def _merge_ranges(ranges: List[Tuple[int, int]], step: int) -> List[Tuple[int, int]]:
+    """
+    Kapsanan [başlangıç, bitiş] aralıklarını sıralayıp bitişik olanları birleştirir
+    """
+    merged: List[Tuple[int, int]] = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1] + step:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+class KlineStore:
+    """
+    (sembol, aralık) başına diskte tutulan sütunlu mum deposu.
+
+    Her OHLCV alanı ve zaman damgaları ayrı bir ham little-endian dosyada saklanır ve
+    `np.memmap` ile kopyalanmadan okunur. Yalnızca kapanmış mumlar yazılır. Borsadan
+    hangi açılış zamanı aralıklarının zaten istendiği `coverage.json` dosyasında tutulur;
+    böylece borsanın kendi boşlukları tekrar tekrar sorgulanmaz.
+    """
+
+    def __init__(self, root: str = KLINE_STORE_DIR):
+        self.root = root
+        self._maps: Dict[Tuple[str, str], KlineColumns] = {}
+        self._coverage: Dict[Tuple[str, str], List[Tuple[int, int]]] = {}
+        self._lock = threading.RLock()
+
+    def _dir(self, symbol: str, interval: str) -> str:
+        return os.path.join(self.root, symbol.upper(), interval)
+
+    def _column_path(self, symbol: str, interval: str, column: str) -> str:
+        return os.path.join(self._dir(symbol, interval), f"{column}.bin")
+
+    def _length_on_disk(self, symbol: str, interval: str) -> int:
+        sizes = []
+        for name, dtype in KLINE_COLUMNS.items():
+            path = self._column_path(symbol, interval, name)
+            sizes.append(os.path.getsize(path) // dtype.itemsize if os.path.exists(path) else 0)
+        length = min(sizes)
+
+        # Yarım kalmış bir yazmadan sonra sütunları aynı uzunluğa getir
+        if length != max(sizes):
+            logger.warning(f"{symbol} {interval} mum deposu onarılıyor ({length} satır)")
+            for name, dtype in KLINE_COLUMNS.items():
+                path = self._column_path(symbol, interval, name)
+                if os.path.exists(path):
+                    with open(path, "r+b") as f:
+                        f.truncate(length * dtype.itemsize)
+        return length
+
+    def _columns(self, symbol: str, interval: str) -> KlineColumns:
+        """
+        Sütunların memmap görünümlerini döndürür (önbellekli)
+        """
+        key = (symbol.upper(), interval)
+        columns = self._maps.get(key)
+        if columns is not None:
+            return columns
+
+        with self._lock:
+            length = self._length_on_disk(symbol, interval)
+            if length == 0:
+                columns = empty_columns()
+            else:
+                columns = {
+                    name: np.memmap(self._column_path(symbol, interval, name), dtype=dtype, mode="r", shape=(length,))
+                    for name, dtype in KLINE_COLUMNS.items()
+                }
+            self._maps[key] = columns
+        return columns
+
+    def length(self, symbol: str, interval: str) -> int:
+        """
+        Depodaki mum sayısını döndürür
+        """
+        return len(self._columns(symbol, interval)["open_time"])
+
+    def last_open_time(self, symbol: str, interval: str) -> Optional[int]:
+        """
+        Depodaki son mumun açılış zamanını döndürür (depo boşsa None)
+        """
+        open_time = self._columns(symbol, interval)["open_time"]
+        return int(open_time[-1]) if len(open_time) else None
+
+    def read(
+        self,
+        symbol: str,
+        interval: str,
+        start_time: Optional[int] = None,
+        end_time: Optional[int] = None,
+        limit: Optional[int] = None
+    ) -> KlineColumns:
+        """
+        Açılış zamanı aralığındaki mumları kopyalamadan (memmap görünümü olarak) okur
+
+        Args:
+            symbol: Kripto para sembolü
+            interval: Mum aralığı
+            start_time: Başlangıç açılış zamanı (ms, dahil)
+            end_time: Bitiş açılış zamanı (ms, dahil)
+            limit: Aralıktaki son `limit` mum
+
+        Returns:
+            Dict[str, np.ndarray]: Salt okunur sütun görünümleri
+        """
+        columns = self._columns(symbol, interval)
+        open_time = columns["open_time"]
+
+        # Zaman sütunu sıralı olduğundan ikili arama ile sınırları bul
+        lo = int(np.searchsorted(open_time, start_time, side="left")) if start_time is not None else 0
+        hi = int(np.searchsorted(open_time, end_time, side="right")) if end_time is not None else len(open_time)
+        if limit is not None:
+            lo = max(lo, hi - limit)
+        return select_rows(columns, slice(lo, hi))
+
+    def coverage(self, symbol: str, interval: str) -> List[Tuple[int, int]]:
+        """
+        Borsadan daha önce istenmiş açılış zamanı aralıklarını döndürür
+        """
+        key = (symbol.upper(), interval)
+        if key not in self._coverage:
+            path = os.path.join(self._dir(symbol, interval), COVERAGE_FILE)
+            ranges: List[Tuple[int, int]] = []
+            if os.path.exists(path):
+                with open(path) as f:
+                    ranges = [tuple(item) for item in json.load(f)]
+            self._coverage[key] = ranges
+        return self._coverage[key]
+
+    def missing_ranges(self, symbol: str, interval: str, start_time: int, end_time: int, step: int) -> List[Tuple[int, int]]:
+        """
+        [start_time, end_time] içinde henüz borsadan istenmemiş açılış zamanı aralıklarını döndürür
+
+        Args:
+            symbol: Kripto para sembolü
+            interval: Mum aralığı
+            start_time: İlk açılış zamanı (ms, dahil)
+            end_time: Son açılış zamanı (ms, dahil)
+            step: Mum aralığı (ms)
+
+        Returns:
+            List[Tuple[int, int]]: Eksik aralıklar
+        """
+        missing: List[Tuple[int, int]] = []
+        cursor = start_time
+        for covered_start, covered_end in self.coverage(symbol, interval):
+            if covered_end < cursor:
+                continue
+            if covered_start > end_time:
+                break
+            if covered_start > cursor:
+                missing.append((cursor, min(covered_start - step, end_time)))
+            cursor = max(cursor, covered_end + step)
+            if cursor > end_time:
+                break
+        if cursor <= end_time:
+            missing.append((cursor, end_time))
+        return missing
+
+    def write(
+        self,
+        symbol: str,
+        interval: str,
+        columns: KlineColumns,
+        covered: Optional[List[Tuple[int, int]]] = None,
+        step: int = 0
+    ) -> int:
+        """
+        Kapanmış mumları depoya yazar. Yeni mumlar son mumdan sonra geliyorsa dosyaların
+        sonuna eklenir; aksi halde sütunlar birleştirilip yeniden yazılır.
+
+        Args:
+            symbol: Kripto para sembolü
+            interval: Mum aralığı
+            columns: Yazılacak (kapanmış) mum sütunları
+            covered: Borsadan istenen açılış zamanı aralıkları (kapsama kaydı için)
+            step: Mum aralığı (ms), kapsama aralıklarını birleştirmek için
+
+        Returns:
+            int: Depoya eklenen yeni mum sayısı
+        """
+        key = (symbol.upper(), interval)
+        with self._lock:
+            os.makedirs(self._dir(symbol, interval), exist_ok=True)
+            existing = self._columns(symbol, interval)
+            last = int(existing["open_time"][-1]) if len(existing["open_time"]) else None
+            new_open = columns["open_time"]
+
+            if last is None or len(new_open) == 0 or new_open[0] > last:
+                added = self._append(symbol, interval, columns)
+            else:
+                added = self._merge(symbol, interval, existing, columns)
+
+            # Memmap görünümlerini yeni uzunlukla yeniden açılması için geçersiz kıl
+            self._maps.pop(key, None)
+
+            if covered:
+                ranges = _merge_ranges(self.coverage(symbol, interval) + list(covered), step)
+                self._coverage[key] = ranges
+                with open(os.path.join(self._dir(symbol, interval), COVERAGE_FILE), "w") as f:
+                    json.dump(ranges, f)
+        return added
+
+    def _append(self, symbol: str, interval: str, columns: KlineColumns) -> int:
+        count = len(columns["open_time"])
+        if count == 0:
+            return 0
+        for name, dtype in KLINE_COLUMNS.items():
+            with open(self._column_path(symbol, interval, name), "ab") as f:
+                f.write(np.ascontiguousarray(columns[name], dtype=dtype).tobytes())
+        return count
+
+    def _merge(self, symbol: str, interval: str, existing: KlineColumns, columns: KlineColumns) -> int:
+        before = len(existing["open_time"])
+        combined = {name: np.concatenate([existing[name], columns[name]]) for name in KLINE_COLUMNS}
+        # Aynı açılış zamanına sahip mumlarda mevcut kaydı koru
+        _, unique_idx = np.unique(combined["open_time"], return_index=True)
+        combined = select_rows(combined, unique_idx)
+
+        # Önce tüm sütunları geçici dosyalara yaz, sonra hepsini birden değiştir
+        for name, dtype in KLINE_COLUMNS.items():
+            with open(f"{self._column_path(symbol, interval, name)}.tmp", "wb") as f:
+                f.write(np.ascontiguousarray(combined[name], dtype=dtype).tobytes())
+        for name in KLINE_COLUMNS:
+            path = self._column_path(symbol, interval, name)
+            os.replace(f"{path}.tmp", path)
+        return len(unique_idx) - before
+
+
+# Uygulama genelinde paylaşılan örnek
+kline_store = KlineStore()
@@ -0,0 +1,300 @@
+import asyncio
+import heapq
+import itertools
+import logging
+import os
+import time
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Union
+
+# Logger
+logger = logging.getLogger("torypto")
+
+# Binance IP başına dakikalık istek ağırlığı limiti
+REQUEST_WEIGHT_LIMIT = int(os.getenv("BINANCE_WEIGHT_LIMIT", "6000"))
+# Limitin ne kadarının kullanılacağı (0-1 arası, 418/429 almamak için küçük bir pay bırakılır)
+REQUEST_WEIGHT_HEADROOM = float(os.getenv("BINANCE_WEIGHT_HEADROOM", "0.95"))
+# Ağırlık penceresi (saniye)
+REQUEST_WEIGHT_INTERVAL = 60.0
+
+USED_WEIGHT_HEADER_PREFIX = "x-mbx-used-weight-"
+
+
+class Priority:
+    """
+    İstek öncelikleri. Küçük değer önce işlenir.
+    """
+    INTERACTIVE = 0  # Kullanıcı isteği bekleyen çağrılar
+    BACKGROUND = 10  # Arka plan yenilemeleri ve toplu veri çekme
+
+
+class PriorityTicket:
+    """
+    Kuyrukta bekleyebilen bir isteğin yükseltilebilir önceliği. Birleştirilen (single-flight)
+    bir isteğe daha öncelikli bir çağıran katıldığında istek, kuyruktaki yeri korunmadan
+    yeni önceliğiyle yeniden sıralanır; etkileşimli çağıran arka plan kuyruğunun arkasında
+    beklemez.
+    """
+
+    def __init__(self, priority: int = Priority.INTERACTIVE):
+        self.priority = priority
+        # Kuyrukta bekliyorsa (sınırlayıcı, ağırlık, future)
+        self._waiting: Optional[Tuple["WeightRateLimiter", float, asyncio.Future]] = None
+
+    def raise_to(self, priority: int) -> None:
+        """
+        Önceliği yükseltir (daha küçük değer); düşürme isteği yok sayılır
+
+        Args:
+            priority: Yeni öncelik (bkz. `Priority`)
+        """
+        if priority >= self.priority:
+            return
+        self.priority = priority
+        if self._waiting is not None:
+            limiter, weight, future = self._waiting
+            limiter._requeue(priority, weight, future)
+
+
+def endpoint_weight(endpoint: str, params: Optional[Mapping[str, Any]] = None) -> int:
+    """
+    Binance REST endpoint'inin istek ağırlığını döndürür
+
+    Args:
+        endpoint: API yolu (örn. "/api/v3/ticker/24hr")
+        params: Sorgu parametreleri
+
+    Returns:
+        int: İstek ağırlığı
+    """
+    params = params or {}
+
+    if endpoint == "/api/v3/klines":
+        return 2
+    if endpoint == "/api/v3/ticker/24hr":
+        if "symbol" in params:
+            return 2
+        if "symbols" in params:
+            symbols = params["symbols"]
+            count = len(symbols) if isinstance(symbols, (list, tuple)) else len(str(symbols).split(","))
+            if count <= 20:
+                return 2
+            if count <= 100:
+                return 40
+        return 80
+    if endpoint == "/api/v3/ticker/price":
+        return 2 if "symbol" in params else 4
+    if endpoint == "/api/v3/exchangeInfo":
+        return 20
+    if endpoint == "/api/v3/account":
+        return 20
+    if endpoint == "/api/v3/openOrders":
+        return 6 if "symbol" in params else 80
+    return 1
+
+
+class WeightRateLimiter:
+    """
+    Binance istek ağırlığı için token-bucket hız sınırlayıcı.
+
+    Bütçe dakikalık limite göre sürekli dolar, yanıtlardaki `X-MBX-USED-WEIGHT-*`
+    başlıkları ile sunucunun gördüğü kullanıma eşitlenir. Bütçe yetmediğinde istekler
+    önceliğe göre kuyruğa alınır; etkileşimli çağrılar arka plan yenilemelerinden önce geçer.
+    """
+
+    def __init__(
+        self,
+        limit: int = REQUEST_WEIGHT_LIMIT,
+        interval: float = REQUEST_WEIGHT_INTERVAL,
+        headroom: float = REQUEST_WEIGHT_HEADROOM,
+    ):
+        self.limit = limit
+        self.interval = interval
+        self.capacity = max(1.0, limit * headroom)
+        self.refill_rate = self.capacity / interval
+        self.window_header = f"{USED_WEIGHT_HEADER_PREFIX}{int(interval // 60)}m"
+
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._last_server_used: Optional[int] = None
+
+        # (öncelik, sıra, ağırlık, future)
+        self._queue: List[Tuple[int, int, float, asyncio.Future]] = []
+        self._sequence = itertools.count()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._dispatcher: Optional[asyncio.Task] = None
+
+        self._admitted_requests = 0
+        self._admitted_weight = 0
+        self._queued_requests = 0
+        self._rate_limited_responses = 0
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.refill_rate)
+            self._updated = now
+
+    async def acquire(self, weight: int, priority: Union[int, PriorityTicket] = Priority.INTERACTIVE) -> None:
+        """
+        İstek için gerekli ağırlık bütçesi ayrılana kadar bekler
+
+        Args:
+            weight: İsteğin ağırlığı
+            priority: İstek önceliği (bkz. `Priority`); `PriorityTicket` verilirse istek
+                beklerken önceliği yükseltilebilir
+        """
+        ticket = priority if isinstance(priority, PriorityTicket) else None
+        if ticket is not None:
+            priority = ticket.priority
+        weight = min(float(weight), self.capacity)
+        self._refill()
+
+        # Hızlı yol: kuyruk boş ve bütçe yeterli
+        if not self._queue and time.monotonic() >= self._blocked_until and self._tokens >= weight:
+            self._admit(weight)
+            return
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        heapq.heappush(self._queue, (priority, next(self._sequence), weight, future))
+        self._queued_requests += 1
+        self._ensure_dispatcher()
+        self._wakeup.set()
+        if ticket is None:
+            await future
+            return
+        ticket._waiting = (self, weight, future)
+        try:
+            await future
+        finally:
+            ticket._waiting = None
+
+    def _requeue(self, priority: int, weight: float, future: asyncio.Future) -> None:
+        """
+        Bekleyen isteği yeni önceliğiyle kuyruğa yeniden ekler. Eski kayıt aynı future'ı
+        taşır; future tamamlandığında dağıtıcı tarafından atlanır.
+        """
+        if future.done():
+            return
+        heapq.heappush(self._queue, (priority, next(self._sequence), weight, future))
+        self._ensure_dispatcher()
+        self._wakeup.set()
+
+    def _admit(self, weight: float) -> None:
+        self._tokens -= weight
+        self._admitted_requests += 1
+        self._admitted_weight += int(weight)
+
+    def _ensure_dispatcher(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._dispatcher is None or self._dispatcher.done() or self._dispatcher.get_loop() is not loop:
+            self._wakeup = asyncio.Event()
+            self._dispatcher = asyncio.create_task(self._dispatch())
+
+    async def _dispatch(self) -> None:
+        """
+        Kuyruktaki istekleri öncelik sırasına göre bütçe elverdikçe serbest bırakır
+        """
+        while self._queue:
+            self._wakeup.clear()
+            _, _, weight, future = self._queue[0]
+
+            if future.done():
+                # İptal edilmiş bekleyen
+                heapq.heappop(self._queue)
+                continue
+
+            self._refill()
+            now = time.monotonic()
+            if now < self._blocked_until:
+                delay = self._blocked_until - now
+            elif self._tokens >= weight:
+                heapq.heappop(self._queue)
+                self._admit(weight)
+                future.set_result(None)
+                continue
+            else:
+                delay = (weight - self._tokens) / self.refill_rate
+
+            # Bütçe dolana kadar ya da yeni (daha öncelikli) bir istek gelene kadar bekle
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+
+    def update_from_headers(self, headers: Mapping[str, str]) -> None:
+        """
+        Yanıttaki `X-MBX-USED-WEIGHT-*` başlıklarıyla yerel bütçeyi eşitler
+
+        Args:
+            headers: HTTP yanıt başlıkları
+        """
+        value = headers.get(self.window_header)
+        if value is None:
+            return
+        try:
+            used = int(value)
+        except ValueError:
+            return
+
+        self._refill()
+        server_remaining = self.capacity - used
+        if self._last_server_used is not None and used < self._last_server_used:
+            # Sunucu tarafında yeni pencere başladı
+            self._tokens = min(self.capacity, max(self._tokens, server_remaining))
+        else:
+            self._tokens = min(self._tokens, server_remaining)
+        self._last_server_used = used
+
+    def on_rate_limited(self, status_code: int, retry_after: Optional[str] = None) -> None:
+        """
+        429/418 yanıtı alındığında tüm istekleri Retry-After süresi boyunca durdurur
+
+        Args:
+            status_code: HTTP durum kodu (429 veya 418)
+            retry_after: Retry-After başlığının değeri (saniye)
+        """
+        try:
+            delay = float(retry_after) if retry_after is not None else self.interval
+        except ValueError:
+            delay = self.interval
+
+        self._rate_limited_responses += 1
+        self._blocked_until = max(self._blocked_until, time.monotonic() + delay)
+        self._tokens = 0.0
+        self._updated = time.monotonic()
+        logger.warning(f"Binance hız sınırı aşıldı ({status_code}), {delay:.0f} sn bekleniyor")
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Güncel bütçe ve kuyruk durumunu döndürür
+        """
+        self._refill()
+        # Önceliği yükseltilen istek kuyrukta iki kez bulunabilir; en öncelikli kaydı sayılır
+        waiting: Dict[int, int] = {}
+        for priority, _, _, future in self._queue:
+            if not future.done():
+                waiting[id(future)] = min(priority, waiting.get(id(future), priority))
+        queue_by_priority: Dict[int, int] = {}
+        for priority in waiting.values():
+            queue_by_priority[priority] = queue_by_priority.get(priority, 0) + 1
+
+        return {
+            "limit": self.limit,
+            "capacity": self.capacity,
+            "available_weight": round(max(self._tokens, 0.0), 2),
+            "server_used_weight": self._last_server_used,
+            "queue_depth": sum(queue_by_priority.values()),
+            "queue_by_priority": queue_by_priority,
+            "blocked_for": round(max(0.0, self._blocked_until - time.monotonic()), 2),
+            "admitted_requests": self._admitted_requests,
+            "admitted_weight": self._admitted_weight,
+            "queued_requests": self._queued_requests,
+            "rate_limited_responses": self._rate_limited_responses,
+        }
+
+
+# BinanceClient ve BinanceService tarafından paylaşılan örnek
+binance_rate_limiter = WeightRateLimiter()
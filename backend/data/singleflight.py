@@ -0,0 +1,100 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, Mapping, Optional, Tuple
+
+from data.rate_limiter import PriorityTicket
+
+
+def request_key(method: str, url: str, params: Optional[Mapping[str, Any]] = None) -> Tuple:
+    """
+    Aynı isteği tanımlayan, parametre sırasından bağımsız bir anahtar üretir
+
+    Args:
+        method: HTTP metodu
+        url: Tam istek adresi
+        params: Sorgu parametreleri
+
+    Returns:
+        Tuple: Hashlenebilir istek anahtarı
+    """
+    items = tuple(sorted((str(k), str(v)) for k, v in (params or {}).items()))
+    return (method.upper(), url, items)
+
+
+class SingleFlight:
+    """
+    Eşzamanlı özdeş istekleri tek bir uçuşta birleştirir.
+
+    Aynı anahtar için devam eden bir istek varsa yeni çağıran kendi isteğini göndermez,
+    mevcut isteğin sonucunu (veya hatasını) bekler. Sonuç tüm çağıranlar arasında
+    paylaşıldığı için döndürülen nesneler salt okunurdur; değiştirecek çağıran kopyalamalıdır.
+
+    İstek hız sınırlayıcı kuyruğunda `PriorityTicket` ile bekliyorsa, daha öncelikli bir
+    çağıran katıldığında isteğin önceliği yükseltilir (öncelik terslenmesi olmaz).
+    """
+
+    def __init__(self):
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+        self._tickets: Dict[Hashable, PriorityTicket] = {}
+        self._calls = 0
+        self._executions = 0
+        self._deduplicated = 0
+
+    async def do(
+        self,
+        key: Hashable,
+        func: Callable[[], Awaitable[Any]],
+        ticket: Optional[PriorityTicket] = None
+    ) -> Any:
+        """
+        Anahtar için devam eden isteğe katılır ya da yeni bir istek başlatır
+
+        Args:
+            key: İstek anahtarı (bkz. `request_key`)
+            func: İsteği gönderen coroutine fabrikası
+            ticket: `func`'ın hız sınırlayıcıda kullandığı öncelik; devam eden isteğe
+                katılırken o isteğin önceliği bu önceliğe yükseltilir
+
+        Returns:
+            İsteğin sonucu (tüm çağıranlarla paylaşılır, değiştirilmemelidir)
+        """
+        self._calls += 1
+
+        task = self._inflight.get(key)
+        if task is not None and not task.done():
+            self._deduplicated += 1
+            running = self._tickets.get(key)
+            if ticket is not None and running is not None:
+                running.raise_to(ticket.priority)
+            # Bir çağıranın iptali paylaşılan isteği iptal etmesin
+            return await asyncio.shield(task)
+
+        task = asyncio.ensure_future(func())
+        self._inflight[key] = task
+        if ticket is not None:
+            self._tickets[key] = ticket
+        self._executions += 1
+        task.add_done_callback(lambda finished: self._finish(key, finished))
+        return await asyncio.shield(task)
+
+    def _finish(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+            self._tickets.pop(key, None)
+        # Tüm çağıranlar iptal edildiyse hatanın "alınmadı" uyarısı vermesini önle
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Birleştirme sayaçlarını döndürür
+        """
+        return {
+            "calls": self._calls,
+            "executions": self._executions,
+            "deduplicated": self._deduplicated,
+            "in_flight": len(self._inflight),
+        }
+
+
+# BinanceClient ve BinanceService tarafından paylaşılan örnek
+binance_singleflight = SingleFlight()
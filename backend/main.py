@@ -1,6 +1,7 @@
 from fastapi import FastAPI, Request, HTTPException, Depends
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
+from contextlib import asynccontextmanager
 import logging
 import os
 import sys
@@ -15,8 +16,27 @@ logging.basicConfig(
 )
 logger = logging.getLogger("torypto")
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Uygulama yaşam döngüsü: paylaşımlı kaynakları başlangıçta açar, kapanışta serbest bırakır
+    """
+    from services.binance_service import BinanceService
+    from services.symbol_registry import symbol_registry
+    from data.binance_client import binance_client
+    
+    await BinanceService.start()
+    await symbol_registry.start()
+    try:
+        yield
+    finally:
+        await symbol_registry.shutdown()
+        await binance_client.close()
+        await BinanceService.shutdown()
+
 # FastAPI uygulaması
 app = FastAPI(
+    lifespan=lifespan,
     title="Torypto API",
     description="Kripto para analizi için API servisi",
     version="0.1.0",
@@ -104,6 +124,25 @@ async def health_check():
     """Sağlık kontrolü için endpoint"""
     return {"status": "healthy"}
 
+@app.get("/status/upstream", tags=["status"])
+async def upstream_status():
+    """Binance istek ağırlığı bütçesi, kuyruk, istek birleştirme, akış bağlantıları, canlı mumlar ve gösterge önbelleği durumu"""
+    from data.binance_client import binance_client
+    from data.rate_limiter import binance_rate_limiter
+    from data.singleflight import binance_singleflight
+    from services.indicator_cache import indicator_cache
+    from services.live_candles import live_candles
+    from services.symbol_registry import symbol_registry
+    
+    return {
+        "rate_limiter": binance_rate_limiter.stats(),
+        "singleflight": binance_singleflight.stats(),
+        "symbol_registry": symbol_registry.stats(),
+        "streams": binance_client.stream_stats(),
+        "live_candles": live_candles.stats(),
+        "indicator_cache": indicator_cache.stats()
+    }
+
 @app.get("/test/db")
 async def test_db():
     """Veritabanı bağlantısını test et"""
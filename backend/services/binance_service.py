@@ -1,67 +1,441 @@
 import httpx
 import pandas as pd
 import numpy as np
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Callable, Optional, Tuple
 import os
 import asyncio
+import logging
+import importlib.util
+import time
 from datetime import datetime
 
+from data.rate_limiter import binance_rate_limiter, endpoint_weight, Priority, PriorityTicket
+from data.singleflight import binance_singleflight, request_key
+from data.kline_store import kline_store, KLINE_STORE_ENABLED
+from utils.intervals import INTERVAL_MS, interval_to_ms, align_open_time, find_gaps
+from utils.klines import (
+    KlineColumns, decode_klines, columns_to_dataframe, concat_columns, select_rows, empty_columns
+)
+from utils.resample import resample_many
+
+# Logger
+logger = logging.getLogger("torypto")
+
+# HTTP bağlantı havuzu ayarları (ortam değişkenleri ile yapılandırılabilir)
+HTTP_MAX_CONNECTIONS = int(os.getenv("BINANCE_HTTP_MAX_CONNECTIONS", "50"))
+HTTP_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("BINANCE_HTTP_MAX_KEEPALIVE_CONNECTIONS", "20"))
+HTTP_KEEPALIVE_EXPIRY = float(os.getenv("BINANCE_HTTP_KEEPALIVE_EXPIRY", "30"))
+HTTP_CONNECT_TIMEOUT = float(os.getenv("BINANCE_HTTP_CONNECT_TIMEOUT", "5"))
+HTTP_READ_TIMEOUT = float(os.getenv("BINANCE_HTTP_READ_TIMEOUT", "30"))
+HTTP_POOL_TIMEOUT = float(os.getenv("BINANCE_HTTP_POOL_TIMEOUT", "10"))
+# HTTP/2 için "h2" paketi gerekir; yüklü değilse HTTP/1.1 keep-alive kullanılır
+HTTP2_ENABLED = os.getenv("BINANCE_HTTP2", "true").lower() in ("1", "true", "yes")
+# Geçmiş mum verisi çekerken aynı anda gönderilecek en fazla istek sayısı
+BACKFILL_CONCURRENCY = int(os.getenv("BINANCE_BACKFILL_CONCURRENCY", "8"))
+# Saat kaymasına karşı, bir mum kapandıktan sonra kesinleşmiş sayılması için beklenen süre (ms)
+KLINE_CLOSE_GRACE_MS = int(os.getenv("KLINE_CLOSE_GRACE_MS", "2000"))
+# Çoklu zaman dilimi analizinde tek seferde kullanılacak en fazla 1m taban mum sayısı
+MULTI_TIMEFRAME_MAX_BASE_CANDLES = int(os.getenv("MULTI_TIMEFRAME_MAX_BASE_CANDLES", "200000"))
+
+
+def create_http_client(
+    max_connections: int = HTTP_MAX_CONNECTIONS,
+    max_keepalive_connections: int = HTTP_MAX_KEEPALIVE_CONNECTIONS,
+    keepalive_expiry: float = HTTP_KEEPALIVE_EXPIRY,
+    connect_timeout: float = HTTP_CONNECT_TIMEOUT,
+    read_timeout: float = HTTP_READ_TIMEOUT,
+    pool_timeout: float = HTTP_POOL_TIMEOUT,
+    http2: bool = HTTP2_ENABLED,
+) -> httpx.AsyncClient:
+    """
+    Sınırlı bağlantı havuzuna sahip, keep-alive destekli bir httpx istemcisi oluşturur.
+    
+    Args:
+        max_connections: Aynı anda açık olabilecek en fazla bağlantı sayısı
+        max_keepalive_connections: Havuzda boşta tutulacak en fazla bağlantı sayısı
+        keepalive_expiry: Boştaki bağlantının kapatılmadan önce bekleyeceği süre (saniye)
+        connect_timeout: Bağlantı kurma zaman aşımı (saniye)
+        read_timeout: Yanıt okuma zaman aşımı (saniye)
+        pool_timeout: Havuzdan bağlantı bekleme zaman aşımı (saniye)
+        http2: HTTP/2 kullanılıp kullanılmayacağı
+        
+    Returns:
+        httpx.AsyncClient örneği
+    """
+    if http2 and importlib.util.find_spec("h2") is None:
+        logger.warning("HTTP/2 için 'h2' paketi bulunamadı, HTTP/1.1 kullanılacak")
+        http2 = False
+    
+    return httpx.AsyncClient(
+        http2=http2,
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        ),
+        timeout=httpx.Timeout(
+            read_timeout,
+            connect=connect_timeout,
+            pool=pool_timeout,
+        ),
+        headers={"User-Agent": "Torypto/1.0"},
+    )
+
+
 class BinanceService:
     """
     Binance API ile etkileşim için servis sınıfı.
     Kripto para fiyat verileri ve işlem bilgilerini çeker.
+    
+    Tüm örnekler tek bir paylaşımlı HTTP istemcisini (bağlantı havuzu) kullanır.
+    İstemci FastAPI lifespan içinde `start()` ile açılır ve `shutdown()` ile kapatılır.
     """
     
-    def __init__(self):
-        self.base_url = "https://api.binance.com"
+    # Tüm örnekler arasında paylaşılan HTTP istemcisi
+    _client: Optional[httpx.AsyncClient] = None
+    
+    def __init__(self, base_url: Optional[str] = None):
+        self.base_url = base_url or os.getenv("BINANCE_BASE_URL", "https://api.binance.com")
         self.api_key = os.getenv("BINANCE_API_KEY", "")
         self.api_secret = os.getenv("BINANCE_API_SECRET", "")
-        self.timeout = 30.0
     
-    async def get_klines(self, symbol: str, interval: str, limit: int = 100) -> pd.DataFrame:
+    @classmethod
+    async def start(cls, **client_options) -> None:
+        """
+        Paylaşımlı HTTP istemcisini oluşturur (uygulama başlangıcında çağrılır)
+        
+        Args:
+            client_options: `create_http_client` için havuz ve zaman aşımı ayarları
+        """
+        if cls._client is not None and not cls._client.is_closed:
+            return
+        cls._client = create_http_client(**client_options)
+        logger.info("Binance HTTP istemcisi başlatıldı")
+    
+    @classmethod
+    async def shutdown(cls) -> None:
+        """
+        Paylaşımlı HTTP istemcisini kapatır (uygulama kapanışında çağrılır)
+        """
+        if cls._client is not None and not cls._client.is_closed:
+            await cls._client.aclose()
+            logger.info("Binance HTTP istemcisi kapatıldı")
+        cls._client = None
+    
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """
+        Paylaşımlı HTTP istemcisi. Lifespan dışında (ör. script'lerde) ilk kullanımda oluşturulur.
+        """
+        cls = type(self)
+        if cls._client is None or cls._client.is_closed:
+            cls._client = create_http_client()
+        return cls._client
+    
+    async def _get(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        priority: int = Priority.INTERACTIVE,
+        decode: Optional[Callable[[bytes], Any]] = None
+    ) -> Any:
+        """
+        Paylaşımlı istemci üzerinden GET isteği gönderir ve çözümlenmiş yanıtı döndürür.
+        İstek, ağırlık bütçesi paylaşılan hız sınırlayıcıdan ayrıldıktan sonra gönderilir.
+        Aynı anda yapılan özdeş istekler tek bir upstream çağrısında birleştirilir,
+        bu yüzden döndürülen nesne değiştirilmemelidir.
+        
+        Args:
+            endpoint: API yolu (örn. "/api/v3/klines")
+            params: Sorgu parametreleri
+            priority: Hız sınırlayıcı kuyruğundaki öncelik
+            decode: Ham yanıt gövdesini çözen fonksiyon (varsayılan: JSON)
+            
+        Returns:
+            Çözümlenmiş yanıt
+        """
+        url = f"{self.base_url}{endpoint}"
+        # Aynı isteğe daha öncelikli bir çağıran katılırsa kuyruktaki istek yükseltilir
+        ticket = PriorityTicket(priority)
+        
+        async def fetch() -> Any:
+            await binance_rate_limiter.acquire(endpoint_weight(endpoint, params), ticket)
+            
+            response = await self.client.get(url, params=params)
+            binance_rate_limiter.update_from_headers(response.headers)
+            if response.status_code in (418, 429):
+                binance_rate_limiter.on_rate_limited(response.status_code, response.headers.get("Retry-After"))
+            response.raise_for_status()
+            return decode(response.content) if decode else response.json()
+        
+        key = request_key("GET", url, params) + (getattr(decode, "__name__", None),)
+        return await binance_singleflight.do(key, fetch, ticket)
+    
+    async def get_klines(
+        self,
+        symbol: str,
+        interval: str,
+        limit: int = 100,
+        priority: int = Priority.INTERACTIVE
+    ) -> pd.DataFrame:
         """
         Belirli bir sembol için mum verilerini (OHLCV) çeker ve DataFrame olarak döndürür.
+        Mum deposu etkinse kapanmış mumlar yerel depodan okunur; REST'ten yalnızca
+        depoda olmayan kuyruk ve henüz kapanmamış mum çekilir.
         
         Args:
             symbol: Kripto para sembolü (örn. "BTCUSDT")
             interval: Mum aralığı ("1m", "5m", "15m", "30m", "1h", "4h", "1d", "1w", "1M")
             limit: Kaç tane mum verisi getirileceği (max 1000)
+            priority: Hız sınırlayıcı önceliği
             
         Returns:
             pandas DataFrame ile OHLCV verileri
         """
-        endpoint = f"/api/v3/klines"
+        symbol = symbol.upper()
+        limit = min(limit, 1000)  # Binance maksimum 1000 kayıt döndürür
+        
+        if not KLINE_STORE_ENABLED or interval not in INTERVAL_MS:
+            params = {
+                "symbol": symbol,
+                "interval": interval,
+                "limit": limit
+            }
+            columns = await self._get("/api/v3/klines", params, priority, decode=decode_klines)
+            return columns_to_dataframe(columns)
+        
+        step = interval_to_ms(interval)
+        now = int(time.time() * 1000)
+        current_open = align_open_time(now, interval)
+        settled_open = self._settled_open_time(now, interval)
+        first_needed = current_open - (limit - 1) * step
+        
+        # Depoda eksik olan ilk kapanmış mumdan itibaren çek (eksik yoksa sadece açık mum)
+        missing = await asyncio.to_thread(
+            kline_store.missing_ranges, symbol, interval, first_needed, settled_open, step
+        ) if first_needed <= settled_open else []
+        fetch_start = missing[0][0] if missing else settled_open + step
         params = {
-            "symbol": symbol.upper(),
+            "symbol": symbol,
             "interval": interval,
-            "limit": min(limit, 1000)  # Binance maksimum 1000 kayıt döndürür
+            "startTime": fetch_start,
+            "limit": min(1000, (current_open - fetch_start) // step + 1)
         }
+        fetched = await self._get("/api/v3/klines", params, priority, decode=decode_klines)
         
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.get(f"{self.base_url}{endpoint}", params=params)
-            response.raise_for_status()
-            
-            data = response.json()
+        columns = await asyncio.to_thread(
+            self._store_and_read, symbol, interval, fetched, missing, step, first_needed, settled_open
+        )
+        return columns_to_dataframe(select_rows(columns, slice(-limit, None)))
+    
+    @staticmethod
+    def _store_and_read(
+        symbol: str,
+        interval: str,
+        fetched: KlineColumns,
+        missing: List[Tuple[int, int]],
+        step: int,
+        first_open: int,
+        settled_open: int
+    ) -> KlineColumns:
+        """
+        Çekilen kapanmış mumları depoya yazar ve depodaki aralığı açık mumlarla birleştirir.
+        Disk G/Ç'si (memmap okuma, dosya yazma, kapsama kaydı) içerdiğinden olay döngüsünü
+        bloklamaması için `asyncio.to_thread` ile çağrılır.
+        
+        Returns:
+            KlineColumns: [first_open, settled_open] aralığındaki depo mumları ve açık mumlar
+        """
+        settled = fetched["open_time"] <= settled_open
+        if missing:
+            kline_store.write(symbol, interval, select_rows(fetched, settled), covered=missing, step=step)
+        
+        stored = kline_store.read(symbol, interval, start_time=first_open, end_time=settled_open)
+        # memmap görünümleri burada kopyalanır; disk sayfaları olay döngüsünde okunmaz
+        stored = {name: np.array(values) for name, values in stored.items()}
+        return concat_columns(stored, select_rows(fetched, ~settled))
+    
+    @staticmethod
+    def _settled_open_time(now: int, interval: str) -> int:
+        """
+        Kesin olarak kapanmış (saat kaymasına karşı pay bırakılmış) son mumun açılış zamanı
+        """
+        return align_open_time(now - KLINE_CLOSE_GRACE_MS, interval) - interval_to_ms(interval)
+    
+    async def _fetch_kline_ranges(
+        self,
+        symbol: str,
+        interval: str,
+        ranges: List[Tuple[int, int]],
+        concurrency: int,
+        priority: int
+    ) -> Tuple[KlineColumns, int]:
+        """
+        Açılış zamanı aralıklarını 1000 mumluk pencerelere bölerek eşzamanlı çeker
+        
+        Returns:
+            Tuple: Sıralı ve tekrarsız mum sütunları, gönderilen istek sayısı
+        """
+        step = interval_to_ms(interval)
+        window = step * 1000
+        windows = [
+            (window_start, min(window_start + window - step, end))
+            for start, end in ranges
+            for window_start in range(start, end + 1, window)
+        ]
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        
+        async def fetch_window(window_start: int, window_end: int) -> KlineColumns:
+            params = {
+                "symbol": symbol,
+                "interval": interval,
+                "startTime": window_start,
+                "endTime": window_end + step - 1,
+                "limit": 1000
+            }
+            async with semaphore:
+                return await self._get("/api/v3/klines", params, priority, decode=decode_klines)
+        
+        chunks = await asyncio.gather(*(fetch_window(s, e) for s, e in windows))
+        columns = concat_columns(*chunks)
+        
+        # Açılış zamanına göre sırala ve tekrarları kaldır
+        _, unique_idx = np.unique(columns["open_time"], return_index=True)
+        return select_rows(columns, unique_idx), len(windows)
+    
+    async def _range_columns(
+        self,
+        symbol: str,
+        interval: str,
+        first_open: int,
+        last_open: int,
+        now: int,
+        concurrency: int,
+        priority: int
+    ) -> Tuple[KlineColumns, int]:
+        """
+        Açılış zamanı aralığındaki mumları döndürür; mum deposu etkinse kapanmış mumlar
+        depodan okunur, yalnızca eksik kısımlar ve açık mumlar çekilir
+        
+        Returns:
+            Tuple: Sıralı ve tekrarsız mum sütunları, gönderilen istek sayısı
+        """
+        step = interval_to_ms(interval)
+        if not KLINE_STORE_ENABLED:
+            columns, requests = await self._fetch_kline_ranges(
+                symbol, interval, [(first_open, last_open)], concurrency, priority
+            )
+        else:
+            settled_open = min(self._settled_open_time(now, interval), last_open)
+            missing = await asyncio.to_thread(
+                kline_store.missing_ranges, symbol, interval, first_open, settled_open, step
+            ) if first_open <= settled_open else []
+            # Henüz kapanmamış mumlar her seferinde taze çekilir
+            live_start = max(first_open, settled_open + step)
+            ranges = missing + ([(live_start, last_open)] if live_start <= last_open else [])
             
-            # Binance verileri liste olarak döndürür, DataFrame'e dönüştürüyoruz
-            df = pd.DataFrame(data, columns=[
-                "timestamp", "open", "high", "low", "close", "volume",
-                "close_time", "quote_asset_volume", "number_of_trades",
-                "taker_buy_base_asset_volume", "taker_buy_quote_asset_volume", "ignore"
-            ])
+            fetched, requests = await self._fetch_kline_ranges(symbol, interval, ranges, concurrency, priority)
+            columns = await asyncio.to_thread(
+                self._store_and_read, symbol, interval, fetched, missing, step, first_open, settled_open
+            )
+        
+        return columns, requests
+    
+    async def get_historical_klines(
+        self,
+        symbol: str,
+        interval: str,
+        start_time: int,
+        end_time: Optional[int] = None,
+        concurrency: int = BACKFILL_CONCURRENCY,
+        priority: int = Priority.BACKGROUND
+    ) -> Dict[str, Any]:
+        """
+        Herhangi bir zaman aralığındaki mum verilerini 1000 mumluk pencerelere bölerek
+        eşzamanlı olarak çeker, birleştirir ve tekrarları temizler. Mum deposu etkinse
+        daha önce çekilmiş aralıklar diskten okunur, yalnızca eksik kısımlar istenir.
+        
+        Args:
+            symbol: Kripto para sembolü (örn. "BTCUSDT")
+            interval: Mum aralığı ("1m", "5m", "1h", "1d" vb.; "1M" desteklenmez)
+            start_time: Başlangıç zamanı (ms)
+            end_time: Bitiş zamanı (ms, varsayılan: şimdi)
+            concurrency: Aynı anda gönderilecek en fazla istek sayısı
+            priority: Hız sınırlayıcı önceliği
             
-            # Veri tiplerini düzelt
-            numeric_columns = ["open", "high", "low", "close", "volume", 
-                              "quote_asset_volume", "taker_buy_base_asset_volume", 
-                              "taker_buy_quote_asset_volume"]
-            for col in numeric_columns:
-                df[col] = pd.to_numeric(df[col])
+        Returns:
+            Dict: "klines" (zaman damgası indeksli DataFrame), "gaps" (eksik mum aralıkları)
+                  ve "requests" (gönderilen istek sayısı)
+        """
+        symbol = symbol.upper()
+        step = interval_to_ms(interval)
+        now = int(time.time() * 1000)
+        end_time = min(end_time or now, now)
+        first_open = align_open_time(start_time, interval)
+        if first_open < start_time:
+            first_open += step
+        last_open = align_open_time(end_time, interval)
+        
+        if last_open < first_open:
+            return {"klines": columns_to_dataframe(empty_columns()), "gaps": [], "requests": 0}
+        
+        columns, requests = await self._range_columns(
+            symbol, interval, first_open, last_open, now, concurrency, priority
+        )
+        
+        return {
+            "klines": columns_to_dataframe(columns),
+            "gaps": find_gaps(columns["open_time"], step, first_open, last_open),
+            "requests": requests
+        }
+    
+    async def get_multi_timeframe_klines(
+        self,
+        symbol: str,
+        intervals: List[str],
+        limit: int = 100,
+        priority: int = Priority.INTERACTIVE
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Birden çok aralığın mumlarını tek bir 1m taban seriden üretir. Her aralık için ayrı
+        kline isteği yerine 1m mumlar bir kez çekilir (mum deposu etkinse kapanmış olanlar
+        diskten okunur) ve `utils.resample` ile Binance sınırlarına hizalanarak birleştirilir.
+        
+        Args:
+            symbol: Kripto para sembolü (örn. "BTCUSDT")
+            intervals: Mum aralıkları (örn. ["5m", "1h", "4h", "1d"]; "1M" desteklenmez)
+            limit: Aralık başına mum sayısı (son mum henüz kapanmamış olabilir)
+            priority: Hız sınırlayıcı önceliği
             
-            # Zaman damgasını datetime'a dönüştür
-            df["timestamp"] = pd.to_datetime(df["timestamp"], unit="ms")
-            df.set_index("timestamp", inplace=True)
+        Returns:
+            Dict[str, pd.DataFrame]: Aralık -> açılış zamanı indeksli OHLCV verileri
             
-            return df
+        Raises:
+            ValueError: Desteklenmeyen aralık ya da taban seri `MULTI_TIMEFRAME_MAX_BASE_CANDLES`
+                sınırını aşıyorsa
+        """
+        symbol = symbol.upper()
+        now = int(time.time() * 1000)
+        # Her aralığın ilk mumunun açılışı; taban seri en erkenden başlar
+        first_open = min(
+            align_open_time(now, interval) - (limit - 1) * interval_to_ms(interval)
+            for interval in intervals
+        )
+        last_open = align_open_time(now, "1m")
+        base_candles = (last_open - first_open) // INTERVAL_MS["1m"] + 1
+        if base_candles > MULTI_TIMEFRAME_MAX_BASE_CANDLES:
+            raise ValueError(
+                f"İstenen aralıklar için {base_candles} adet 1m mum gerekiyor "
+                f"(sınır: {MULTI_TIMEFRAME_MAX_BASE_CANDLES}); limit ya da en büyük aralık küçültülmeli"
+            )
+        
+        columns, _ = await self._range_columns(
+            symbol, "1m", first_open, last_open, now, BACKFILL_CONCURRENCY, priority
+        )
+        return {
+            interval: columns_to_dataframe(select_rows(resampled, slice(-limit, None)))
+            for interval, resampled in resample_many(columns, intervals).items()
+        }
     
     async def get_ticker(self, symbol: str) -> Dict[str, Any]:
         """
@@ -76,85 +450,72 @@ class BinanceService:
         endpoint = "/api/v3/ticker/24hr"
         params = {"symbol": symbol.upper()}
         
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.get(f"{self.base_url}{endpoint}", params=params)
-            response.raise_for_status()
-            return response.json()
+        return await self._get(endpoint, params)
     
-    async def get_24h_ticker(self) -> List[Dict[str, Any]]:
+    async def get_24h_ticker(self, priority: int = Priority.INTERACTIVE) -> List[Dict[str, Any]]:
         """
         Tüm semboller için 24 saatlik fiyat değişim bilgilerini döndürür.
         
+        Args:
+            priority: Hız sınırlayıcı önceliği
+            
         Returns:
             Tüm sembollerin 24 saatlik ticker bilgileri
         """
         endpoint = "/api/v3/ticker/24hr"
         
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.get(f"{self.base_url}{endpoint}")
-            response.raise_for_status()
-            
-            # Sadece USDT çiftlerini filtrele
-            all_tickers = response.json()
-            usdt_pairs = [ticker for ticker in all_tickers if ticker['symbol'].endswith('USDT')]
-            
-            return usdt_pairs
+        all_tickers = await self._get(endpoint, priority=priority)
+        
+        # Sadece USDT çiftlerini filtrele
+        usdt_pairs = [ticker for ticker in all_tickers if ticker['symbol'].endswith('USDT')]
+        
+        return usdt_pairs
     
-    async def get_all_prices(self) -> List[Dict[str, Any]]:
+    async def get_all_prices(self, priority: int = Priority.INTERACTIVE) -> List[Dict[str, Any]]:
         """
         Tüm kripto para çiftlerinin güncel fiyatlarını döndürür.
         
+        Args:
+            priority: Hız sınırlayıcı önceliği
+            
         Returns:
             Tüm sembollerin güncel fiyatları
         """
         endpoint = "/api/v3/ticker/price"
         
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.get(f"{self.base_url}{endpoint}")
-            response.raise_for_status()
-            
-            # Sadece USDT çiftlerini filtrele
-            all_prices = response.json()
-            usdt_pairs = [price for price in all_prices if price['symbol'].endswith('USDT')]
-            
-            return usdt_pairs
+        all_prices = await self._get(endpoint, priority=priority)
+        
+        # Sadece USDT çiftlerini filtrele
+        usdt_pairs = [price for price in all_prices if price['symbol'].endswith('USDT')]
+        
+        return usdt_pairs
     
-    async def get_exchange_info(self) -> Dict[str, Any]:
+    async def get_exchange_info(self, priority: int = Priority.INTERACTIVE) -> Dict[str, Any]:
         """
         Borsa bilgilerini ve sembol kısıtlamalarını döndürür.
         
+        Args:
+            priority: Hız sınırlayıcı önceliği
+            
         Returns:
             Borsa kuralları ve sembol bilgileri
         """
         endpoint = "/api/v3/exchangeInfo"
         
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.get(f"{self.base_url}{endpoint}")
-            response.raise_for_status()
-            return response.json()
+        return await self._get(endpoint, priority=priority)
             
     async def get_symbols_info(self) -> List[Dict[str, Any]]:
         """
         USDT çiftleri hakkında filtrelenmiş bilgi döndürür.
+        Veri, önbelleğe alınmış sembol kaydından okunur.
         
         Returns:
             USDT çiftlerinin özet bilgisi
         """
-        exchange_info = await self.get_exchange_info()
+        from services.symbol_registry import symbol_registry
         
-        # USDT çiftlerini filtrele
-        usdt_symbols = [
-            {
-                "symbol": symbol["symbol"],
-                "baseAsset": symbol["baseAsset"],
-                "quoteAsset": symbol["quoteAsset"],
-                "status": symbol["status"]
-            }
-            for symbol in exchange_info["symbols"]
-            if symbol["quoteAsset"] == "USDT" and symbol["status"] == "TRADING"
-        ]
-        
-        return usdt_symbols
+        await symbol_registry.ensure_loaded()
+        return symbol_registry.symbols(quote_asset="USDT", status="TRADING")
         
     # Crypto.py tarafından kullanılan ek metotlar
     async def get_all_symbols(self) -> List[str]:
@@ -164,13 +525,8 @@ class BinanceService:
         Returns:
             List[str]: Kripto para sembollerinin listesi
         """
-        exchange_info = await self.get_exchange_info()
-        symbols = [
-            symbol["symbol"] 
-            for symbol in exchange_info["symbols"]
-            if symbol["quoteAsset"] == "USDT" and symbol["status"] == "TRADING"
-        ]
-        return symbols
+        symbols_info = await self.get_symbols_info()
+        return [symbol["symbol"] for symbol in symbols_info]
         
     async def get_price(self, symbol: str) -> float:
         """
@@ -185,9 +541,5 @@ class BinanceService:
         endpoint = "/api/v3/ticker/price"
         params = {"symbol": symbol.upper()}
         
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.get(f"{self.base_url}{endpoint}", params=params)
-            response.raise_for_status()
-            
-            data = response.json()
-            return float(data["price"]) 
\ No newline at end of file
+        data = await self._get(endpoint, params)
+        return float(data["price"]) 
\ No newline at end of file
@@ -0,0 +1,212 @@
+import asyncio
+import logging
+import os
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Sequence, Tuple
+
+from data.singleflight import SingleFlight
+from services.binance_service import KLINE_CLOSE_GRACE_MS
+from utils.intervals import INTERVAL_MS, align_open_time
+
+# Logger
+logger = logging.getLogger("torypto")
+
+INDICATOR_CACHE_ENABLED = os.getenv("INDICATOR_CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+# Bellekte tutulacak en fazla sonuç (en uzun süredir kullanılmayan çıkarılır)
+INDICATOR_CACHE_MAX_ENTRIES = int(os.getenv("INDICATOR_CACHE_MAX_ENTRIES", "2048"))
+# Sonuçlar hâlâ açık olan son mumu içerdiğinden taze sayılacakları en uzun süre (saniye)
+INDICATOR_CACHE_LIVE_SECONDS = float(os.getenv("INDICATOR_CACHE_LIVE_SECONDS", "5"))
+# Süresi dolan sonucun yenilenirken sunulmaya devam edebileceği süre (saniye)
+INDICATOR_CACHE_STALE_SECONDS = float(os.getenv("INDICATOR_CACHE_STALE_SECONDS", "5"))
+
+
+@dataclass
+class _Entry:
+    value: Any
+    candle: int          # Sonucun hesaplandığı andaki son kapanmış mumun açılış zamanı (ms)
+    expires_at: int      # Taze kabul edildiği son an (ms): canlı süre ya da bir sonraki mum sınırı
+    stale_until: int     # Bu ana kadar eski sonuç sunulup arka planda yenilenebilir (ms)
+
+
+class IndicatorCache:
+    """
+    Kısa ömürlü, mum sınırına duyarlı gösterge sonucu önbelleği.
+
+    Bir sonuç (uç nokta, sembol, aralık, limit, alanlar) serisi ve son kapanmış mumun
+    açılış zamanı için geçerlidir. `get_klines` son satır olarak hâlâ açık olan mumu
+    döndürdüğünden güncel fiyat, son satırın göstergeleri, trend ve sinyaller mum kapanmadan
+    da değişir; bu yüzden sonuç en fazla `live_seconds` ve en geç bir sonraki mum sınırına
+    kadar taze sayılır. Süresi dolan sonuç `stale_seconds` boyunca sunulmaya devam eder ve
+    arka planda tek bir hesaplamayla yenilenir (stale-while-revalidate); sunulan bir sonuç
+    en fazla `live_seconds + stale_seconds` eskidir. Eşzamanlı ıskalamalar `SingleFlight`
+    ile tek hesaplamada birleştirilir; boyut LRU ile sınırlıdır.
+
+    Sonuçlar tüm çağıranlar arasında paylaşıldığı için döndürülen nesneler değiştirilmemelidir.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = INDICATOR_CACHE_MAX_ENTRIES,
+        live_seconds: float = INDICATOR_CACHE_LIVE_SECONDS,
+        stale_seconds: float = INDICATOR_CACHE_STALE_SECONDS,
+        enabled: bool = INDICATOR_CACHE_ENABLED,
+        clock: Callable[[], float] = time.time
+    ):
+        self.max_entries = max_entries
+        self.live_ms = int(live_seconds * 1000)
+        self.stale_ms = int(stale_seconds * 1000)
+        self.enabled = enabled
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self._flight = SingleFlight()
+        self._refreshing: Dict[Tuple, asyncio.Task] = {}
+        self._hits = 0
+        self._stale_hits = 0
+        self._misses = 0
+        self._bypassed = 0
+        self._refreshes = 0
+        self._refresh_errors = 0
+        self._evictions = 0
+
+    @staticmethod
+    def series_key(
+        endpoint: str,
+        symbol: str,
+        interval: str,
+        limit: int,
+        fields: Optional[Sequence[str]] = None
+    ) -> Tuple:
+        """
+        Aynı sonucu üreten istekleri tanımlayan anahtar (mum zamanı hariç)
+
+        Args:
+            endpoint: Uç nokta adı (aynı seri farklı uç noktalarda farklı sonuç üretir)
+            symbol: Kripto para sembolü
+            interval: Mum aralığı
+            limit: Mum sayısı
+            fields: İstenen gösterge alanları (None: varsayılan küme)
+        """
+        return (endpoint, symbol.upper(), interval, limit, tuple(fields) if fields is not None else None)
+
+    def _window(self, interval: str, now: int) -> Tuple[int, int]:
+        """
+        Şu anki son kapanmış mumun açılış zamanı ve sonucun en geç taze kalabileceği an
+        """
+        step = INTERVAL_MS[interval]
+        current_open = align_open_time(now, interval)
+        expires_at = current_open + step
+        # Sınırdan hemen sonra borsa henüz yeni mumu açmamış olabilir (saat kayması);
+        # bu pencerede hesaplanan sonuç tüm mum boyunca değil, yalnızca pay süresince saklanır
+        if now - current_open < KLINE_CLOSE_GRACE_MS:
+            expires_at = current_open + KLINE_CLOSE_GRACE_MS
+        return current_open - step, expires_at
+
+    async def get_or_compute(
+        self,
+        key: Tuple,
+        interval: str,
+        compute: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """
+        Önbellekteki sonucu döndürür ya da hesaplayıp saklar
+
+        Args:
+            key: Seri anahtarı (bkz. `series_key`)
+            interval: Mum aralığı; sabit uzunlukta olmayan aralıklar ("1M") önbelleğe alınmaz
+            compute: Sonucu hesaplayan coroutine fabrikası. Hata fırlatırsa sonuç saklanmaz.
+
+        Returns:
+            Hesaplanan ya da önbellekteki sonuç
+        """
+        if not self.enabled or interval not in INTERVAL_MS:
+            self._bypassed += 1
+            return await compute()
+
+        now = int(self._clock() * 1000)
+        candle, _ = self._window(interval, now)
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry.candle == candle and now < entry.expires_at:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry.value
+            if now < entry.stale_until:
+                self._entries.move_to_end(key)
+                self._stale_hits += 1
+                self._refresh(key, interval, compute)
+                return entry.value
+            del self._entries[key]
+
+        self._misses += 1
+        return await self._flight.do(key + (candle,), lambda: self._fill(key, interval, compute))
+
+    async def _fill(self, key: Tuple, interval: str, compute: Callable[[], Awaitable[Any]]) -> Any:
+        # Pencere hesaplama başlarken belirlenir: hesaplama sürerken mum sınırı geçilirse
+        # sonuç önceki muma aittir ve ilk okumada eski sayılıp yenilenir
+        now = int(self._clock() * 1000)
+        candle, boundary = self._window(interval, now)
+        # Açık mum her istekte değişebilir; sonuç mum sınırından önce de eskir
+        expires_at = min(boundary, now + self.live_ms)
+        value = await compute()
+        self._store(key, _Entry(value, candle, expires_at, expires_at + self.stale_ms))
+        return value
+
+    def _refresh(self, key: Tuple, interval: str, compute: Callable[[], Awaitable[Any]]) -> None:
+        """
+        Eski sonucu arka planda yeniler (aynı anahtar için tek yenileme)
+        """
+        if key in self._refreshing:
+            return
+        candle, _ = self._window(interval, int(self._clock() * 1000))
+
+        async def run() -> None:
+            try:
+                await self._flight.do(key + (candle,), lambda: self._fill(key, interval, compute))
+                self._refreshes += 1
+            except Exception as e:
+                # Eski sonuç stale süresi boyunca sunulmaya devam eder
+                self._refresh_errors += 1
+                logger.warning(f"Gösterge önbelleği yenilenemedi {key}: {e}")
+            finally:
+                self._refreshing.pop(key, None)
+
+        self._refreshing[key] = asyncio.ensure_future(run())
+
+    def _store(self, key: Tuple, entry: _Entry) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def clear(self) -> None:
+        """
+        Tüm sonuçları siler (sayaçlar korunur)
+        """
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        İsabet/ıskalama sayaçlarını ve doluluğu döndürür
+        """
+        lookups = self._hits + self._stale_hits + self._misses
+        return {
+            "enabled": self.enabled,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self._hits,
+            "stale_hits": self._stale_hits,
+            "misses": self._misses,
+            "bypassed": self._bypassed,
+            "hit_ratio": round((self._hits + self._stale_hits) / lookups, 4) if lookups else None,
+            "refreshes": self._refreshes,
+            "refresh_errors": self._refresh_errors,
+            "refreshing": len(self._refreshing),
+            "evictions": self._evictions,
+        }
+
+
+# Uygulama genelinde paylaşılan örnek
+indicator_cache = IndicatorCache()
@@ -0,0 +1,328 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Any, Dict, List, Optional
+
+from data.binance_client import binance_client
+from data.binance_streams import StreamCallback
+from data.rate_limiter import Priority
+from services.binance_service import BinanceService
+from utils.intervals import INTERVAL_MS, align_open_time
+
+# Logger
+logger = logging.getLogger("torypto")
+
+BASE_INTERVAL = "1m"
+BASE_STEP = INTERVAL_MS[BASE_INTERVAL]
+
+# Toplanarak birleştirilen kline alanları
+_SUM_FIELDS = ("v", "q", "V", "Q")
+
+
+def _fields(kline: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Kline olayının birleştirilen alanlarını Decimal olarak alır (borsanın ondalık
+    değerleriyle birebir aynı toplamlar için)
+    """
+    return {
+        "o": Decimal(kline["o"]),
+        "h": Decimal(kline["h"]),
+        "l": Decimal(kline["l"]),
+        "c": Decimal(kline["c"]),
+        "n": int(kline["n"]),
+        **{name: Decimal(kline[name]) for name in _SUM_FIELDS},
+    }
+
+
+def _merge(total: Optional[Dict[str, Any]], part: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Birleştirilmiş muma bir 1m mum ekler (açılış ilk, kapanış son mumdan)
+    """
+    if total is None:
+        return dict(part)
+    return {
+        "o": total["o"],
+        "h": max(total["h"], part["h"]),
+        "l": min(total["l"], part["l"]),
+        "c": part["c"],
+        "n": total["n"] + part["n"],
+        **{name: total[name] + part[name] for name in _SUM_FIELDS},
+    }
+
+
+@dataclass
+class _DerivedCandle:
+    """
+    Bir sembolün tek bir büyük aralıktaki canlı mum durumu
+    """
+    interval: str
+    step: int
+    callbacks: List[StreamCallback] = field(default_factory=list)
+    open_time: Optional[int] = None
+    # Mumun şu ana kadar kapanmış 1m mumlarının birleşimi
+    closed: Optional[Dict[str, Any]] = None
+    last_minute: Optional[int] = None
+    # Başlangıç doldurması bitene kadar gelen 1m olayları
+    pending: Optional[List[Dict[str, Any]]] = field(default_factory=list)
+
+
+@dataclass
+class _SymbolFeed:
+    """
+    Bir sembolün 1m akışı ve ondan türetilen aralıklar
+    """
+    symbol: str
+    callback: StreamCallback
+    base_callbacks: List[StreamCallback] = field(default_factory=list)
+    derived: Dict[str, _DerivedCandle] = field(default_factory=dict)
+
+
+class LiveCandleAggregator:
+    """
+    Büyük aralıklı canlı mumları (5m, 15m, 1h, 4h, 1d...) sembol başına tek bir
+    `{symbol}@kline_1m` akışından türetir.
+
+    Her 1m olayı, sembolün abone olunan tüm aralıklarına katlanır ve aboneler Binance
+    kline olayıyla aynı biçimde (`{"e": "kline", "s": ..., "k": {...}}`) olay alır:
+    açık 1m mumlarda ve ara 1m kapanışlarında `x=False`, aralığın son 1m mumu
+    kapandığında `x=True`. Hacimler Decimal ile toplandığı için değerler borsanın aynı
+    aralıktaki mumuyla birebir aynıdır ve tüm aralıklar birbiriyle tutarlıdır. Bağlantı
+    koptuğunda kaçırılan 1m mumlar akış katmanında REST'ten doldurulup sırayla iletildiği
+    için türetilmiş mumlar da eksiksiz kalır.
+
+    Aralığın ortasında abone olunduğunda mumun o ana kadar kapanmış 1m mumları mum
+    deposundan/REST'ten doldurulur. Sabit uzunlukta olmayan aralıklar ("1M") doğrudan
+    Binance akışına yönlendirilir.
+    """
+
+    def __init__(self, service: Optional[BinanceService] = None):
+        self._service = service or BinanceService()
+        self._feeds: Dict[str, _SymbolFeed] = {}
+        self._lock: Optional[asyncio.Lock] = None
+        self._events = 0
+        self._derived_events = 0
+
+    def _get_lock(self) -> asyncio.Lock:
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        return self._lock
+
+    @staticmethod
+    def _stream(symbol: str, interval: str = BASE_INTERVAL) -> str:
+        return f"{symbol.lower()}@kline_{interval}"
+
+    async def subscribe(self, symbol: str, interval: str, callback: StreamCallback) -> None:
+        """
+        Sembolün belirli aralıktaki canlı mum olaylarına abone olur
+
+        Args:
+            symbol: Kripto para sembolü (örn. "btcusdt")
+            interval: Mum aralığı
+            callback: Her olayda Binance kline olayı biçimindeki sözlükle çağrılacak coroutine
+        """
+        if interval not in INTERVAL_MS:
+            await binance_client.subscribe_stream(self._stream(symbol, interval), callback)
+            return
+
+        symbol = symbol.upper()
+        async with self._get_lock():
+            feed = self._feeds.get(symbol)
+            if feed is None:
+                feed = _SymbolFeed(symbol, callback=lambda data, symbol=symbol: self._on_base(symbol, data))
+                self._feeds[symbol] = feed
+                try:
+                    await binance_client.subscribe_stream(self._stream(symbol), feed.callback)
+                except Exception:
+                    del self._feeds[symbol]
+                    raise
+
+            if interval == BASE_INTERVAL:
+                if callback not in feed.base_callbacks:
+                    feed.base_callbacks.append(callback)
+                return
+
+            candle = feed.derived.get(interval)
+            if candle is not None:
+                if callback not in candle.callbacks:
+                    candle.callbacks.append(callback)
+                return
+            candle = _DerivedCandle(interval, INTERVAL_MS[interval], callbacks=[callback])
+            feed.derived[interval] = candle
+
+        await self._seed(symbol, candle)
+
+    async def _seed(self, symbol: str, candle: _DerivedCandle) -> None:
+        """
+        Açık mumun şu ana kadar kapanmış 1m mumlarını doldurur, ardından bu sürede
+        gelen 1m olaylarını sırayla işler
+        """
+        try:
+            result = await self._service.get_historical_klines(
+                symbol, BASE_INTERVAL, align_open_time(int(time.time() * 1000), candle.interval),
+                priority=Priority.INTERACTIVE
+            )
+            klines = result["klines"]
+            settled = klines[klines["close_time"] < int(time.time() * 1000)]
+            for open_time, row in zip(settled.index.as_unit("ms").asi8, settled.itertuples()):
+                self._fold(candle, int(open_time), {
+                    "o": Decimal(f"{row.open:.8f}"),
+                    "h": Decimal(f"{row.high:.8f}"),
+                    "l": Decimal(f"{row.low:.8f}"),
+                    "c": Decimal(f"{row.close:.8f}"),
+                    "n": int(row.number_of_trades),
+                    "v": Decimal(f"{row.volume:.8f}"),
+                    "q": Decimal(f"{row.quote_asset_volume:.8f}"),
+                    "V": Decimal(f"{row.taker_buy_base_asset_volume:.8f}"),
+                    "Q": Decimal(f"{row.taker_buy_quote_asset_volume:.8f}"),
+                })
+        except Exception as e:
+            # Doldurulamazsa açık mum eksik kalır; bir sonraki aralık sınırından itibaren eksiksizdir
+            logger.warning(f"{symbol} {candle.interval} canlı mum başlangıç verisi alınamadı: {e}")
+            candle.open_time = None
+            candle.closed = None
+
+        pending, candle.pending = candle.pending, None
+        for data in pending or ():
+            await self._derive(symbol, candle, data)
+
+    async def unsubscribe(self, symbol: str, interval: str, callback: StreamCallback) -> None:
+        """
+        Aboneliği kaldırır; sembolün dinlenen aralığı kalmazsa 1m akışından çıkar
+        """
+        if interval not in INTERVAL_MS:
+            await binance_client.unsubscribe_stream(self._stream(symbol, interval), callback)
+            return
+
+        symbol = symbol.upper()
+        async with self._get_lock():
+            feed = self._feeds.get(symbol)
+            if feed is None:
+                return
+            if interval == BASE_INTERVAL:
+                if callback in feed.base_callbacks:
+                    feed.base_callbacks.remove(callback)
+            else:
+                candle = feed.derived.get(interval)
+                if candle is not None and callback in candle.callbacks:
+                    candle.callbacks.remove(callback)
+                if candle is not None and not candle.callbacks:
+                    del feed.derived[interval]
+            if feed.base_callbacks or feed.derived:
+                return
+            del self._feeds[symbol]
+            await binance_client.unsubscribe_stream(self._stream(symbol), feed.callback)
+
+    async def _on_base(self, symbol: str, data: Dict[str, Any]) -> None:
+        feed = self._feeds.get(symbol)
+        if feed is None or data.get("k") is None:
+            return
+        self._events += 1
+        for callback in list(feed.base_callbacks):
+            await self._send(callback, data)
+        for candle in list(feed.derived.values()):
+            if candle.pending is not None:
+                candle.pending.append(data)
+            else:
+                await self._derive(symbol, candle, data)
+
+    def _fold(self, candle: _DerivedCandle, minute: int, part: Dict[str, Any]) -> None:
+        """
+        Kapanmış bir 1m mumu açık muma ekler
+        """
+        bucket = align_open_time(minute, candle.interval)
+        if bucket != candle.open_time:
+            candle.open_time = bucket
+            candle.closed = None
+        candle.closed = _merge(candle.closed, part)
+        candle.last_minute = minute
+
+    async def _derive(self, symbol: str, candle: _DerivedCandle, data: Dict[str, Any]) -> None:
+        kline = data["k"]
+        minute = int(kline["t"])
+        # Başlangıç doldurmasında ya da daha önce işlenmiş bir 1m mum tekrar gelirse atla
+        if candle.last_minute is not None and minute <= candle.last_minute:
+            return
+
+        bucket = align_open_time(minute, candle.interval)
+        if candle.open_time is not None and bucket > candle.open_time and candle.closed is not None:
+            # Önceki mumun son 1m mumu hiç gelmediyse (ör. işlem durdurulmuş) eldekiyle kapat
+            await self._emit(symbol, candle, candle.open_time, candle.closed, data, closed=True)
+            candle.closed = None
+        if bucket != candle.open_time:
+            candle.open_time = bucket
+            candle.closed = None
+
+        part = _fields(kline)
+        if not kline.get("x"):
+            await self._emit(symbol, candle, bucket, _merge(candle.closed, part), data, closed=False)
+            return
+
+        self._fold(candle, minute, part)
+        is_last = minute + BASE_STEP == bucket + candle.step
+        await self._emit(symbol, candle, bucket, candle.closed, data, closed=is_last)
+        if is_last:
+            candle.open_time = None
+            candle.closed = None
+
+    async def _emit(
+        self,
+        symbol: str,
+        candle: _DerivedCandle,
+        open_time: int,
+        values: Dict[str, Any],
+        source: Dict[str, Any],
+        closed: bool
+    ) -> None:
+        """
+        Türetilmiş mumu Binance kline olayı biçiminde abonelere iletir
+        """
+        self._derived_events += 1
+        event = {
+            "e": "kline",
+            "E": source.get("E"),
+            "s": symbol,
+            "k": {
+                "t": open_time,
+                "T": open_time + candle.step - 1,
+                "s": symbol,
+                "i": candle.interval,
+                "o": format(values["o"], "f"),
+                "c": format(values["c"], "f"),
+                "h": format(values["h"], "f"),
+                "l": format(values["l"], "f"),
+                "v": format(values["v"], "f"),
+                "n": values["n"],
+                "x": closed,
+                "q": format(values["q"], "f"),
+                "V": format(values["V"], "f"),
+                "Q": format(values["Q"], "f"),
+                "B": "0",
+            },
+        }
+        for callback in list(candle.callbacks):
+            await self._send(callback, event)
+
+    @staticmethod
+    async def _send(callback: StreamCallback, data: Dict[str, Any]) -> None:
+        try:
+            await callback(data)
+        except Exception as e:
+            logger.error(f"Canlı mum callback hatası: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Dinlenen semboller, türetilen aralıklar ve olay sayaçlarını döndürür
+        """
+        return {
+            "symbols": len(self._feeds),
+            "upstream_streams": len(self._feeds),
+            "derived": {symbol: sorted(feed.derived, key=INTERVAL_MS.get) for symbol, feed in self._feeds.items()},
+            "base_events": self._events,
+            "derived_events": self._derived_events,
+        }
+
+
+# Uygulama genelinde paylaşılan örnek
+live_candles = LiveCandleAggregator()
@@ -0,0 +1,244 @@
+import asyncio
+import logging
+import os
+import time
+from typing import Any, Dict, List, Optional
+
+from data.rate_limiter import Priority
+from services.binance_service import BinanceService
+
+# Logger
+logger = logging.getLogger("torypto")
+
+# exchangeInfo'nun arka planda yenilenme aralığı (saniye)
+SYMBOL_REGISTRY_TTL = float(os.getenv("SYMBOL_REGISTRY_TTL", "3600"))
+# Yenileme başarısız olursa tekrar deneme aralığı (saniye)
+SYMBOL_REGISTRY_RETRY = float(os.getenv("SYMBOL_REGISTRY_RETRY", "60"))
+
+
+def _decimals(step: str) -> int:
+    """
+    "0.01000000" gibi bir adım değerinin ondalık basamak sayısını döndürür
+    """
+    if "." not in step:
+        return 0
+    return len(step.rstrip("0").split(".")[1])
+
+
+def _parse_filters(filters: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    exchangeInfo sembol filtrelerinden sık kullanılan değerleri önceden hesaplar
+
+    Args:
+        filters: Sembolün `filters` listesi
+
+    Returns:
+        Dict: tickSize, stepSize, minQty, minNotional ve hassasiyet bilgileri
+    """
+    parsed: Dict[str, Any] = {
+        "tickSize": None,
+        "minPrice": None,
+        "maxPrice": None,
+        "stepSize": None,
+        "minQty": None,
+        "maxQty": None,
+        "minNotional": None,
+        "pricePrecision": None,
+        "quantityPrecision": None,
+    }
+
+    for item in filters:
+        filter_type = item.get("filterType")
+        if filter_type == "PRICE_FILTER":
+            parsed["tickSize"] = float(item["tickSize"])
+            parsed["minPrice"] = float(item["minPrice"])
+            parsed["maxPrice"] = float(item["maxPrice"])
+            parsed["pricePrecision"] = _decimals(item["tickSize"])
+        elif filter_type == "LOT_SIZE":
+            parsed["stepSize"] = float(item["stepSize"])
+            parsed["minQty"] = float(item["minQty"])
+            parsed["maxQty"] = float(item["maxQty"])
+            parsed["quantityPrecision"] = _decimals(item["stepSize"])
+        elif filter_type in ("MIN_NOTIONAL", "NOTIONAL") and parsed["minNotional"] is None:
+            parsed["minNotional"] = float(item["minNotional"])
+
+    return parsed
+
+
+class SymbolRegistry:
+    """
+    exchangeInfo verisinin bellekteki indekslenmiş kopyası.
+
+    Veri bir kez yüklenir ve arka planda TTL aralığıyla yenilenir. Sembol, baz varlık ve
+    kote varlık için sözlük indeksleri tutulur; böylece sembol sorguları O(1) olur.
+    """
+
+    def __init__(self, service: Optional[BinanceService] = None, ttl: float = SYMBOL_REGISTRY_TTL):
+        self.service = service or BinanceService()
+        self.ttl = ttl
+
+        self._by_symbol: Dict[str, Dict[str, Any]] = {}
+        self._filters: Dict[str, Dict[str, Any]] = {}
+        self._by_base: Dict[str, List[str]] = {}
+        self._by_quote: Dict[str, List[str]] = {}
+        self._loaded_at: Optional[float] = None
+        self._lock: Optional[asyncio.Lock] = None
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._refresh_count = 0
+        self._refresh_errors = 0
+
+    @property
+    def loaded(self) -> bool:
+        return self._loaded_at is not None
+
+    async def load(self, priority: int = Priority.INTERACTIVE) -> None:
+        """
+        exchangeInfo'yu indirir ve tüm indeksleri yeniden oluşturur
+
+        Args:
+            priority: Hız sınırlayıcı önceliği
+        """
+        exchange_info = await self.service.get_exchange_info(priority=priority)
+
+        by_symbol: Dict[str, Dict[str, Any]] = {}
+        filters: Dict[str, Dict[str, Any]] = {}
+        by_base: Dict[str, List[str]] = {}
+        by_quote: Dict[str, List[str]] = {}
+
+        for item in exchange_info.get("symbols", []):
+            symbol = item["symbol"]
+            by_symbol[symbol] = {
+                "symbol": symbol,
+                "baseAsset": item["baseAsset"],
+                "quoteAsset": item["quoteAsset"],
+                "status": item["status"]
+            }
+            filters[symbol] = _parse_filters(item.get("filters", []))
+            by_base.setdefault(item["baseAsset"], []).append(symbol)
+            by_quote.setdefault(item["quoteAsset"], []).append(symbol)
+
+        # İndeksleri tek seferde değiştir, okuyucular hiçbir zaman yarım veri görmez
+        self._by_symbol = by_symbol
+        self._filters = filters
+        self._by_base = by_base
+        self._by_quote = by_quote
+        self._loaded_at = time.time()
+        self._refresh_count += 1
+        logger.info(f"Sembol kaydı yüklendi: {len(by_symbol)} sembol")
+
+    async def ensure_loaded(self) -> None:
+        """
+        Kayıt henüz yüklenmediyse yükler (lifespan dışında kullanım için)
+        """
+        if self.loaded:
+            return
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            if not self.loaded:
+                await self.load()
+
+    async def start(self) -> None:
+        """
+        İlk yüklemeyi yapar ve arka plan yenileme görevini başlatır
+        """
+        try:
+            await self.ensure_loaded()
+        except Exception as e:
+            logger.error(f"Sembol kaydı ilk yüklemesi başarısız: {e}")
+
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._refresh_loop())
+
+    async def shutdown(self) -> None:
+        """
+        Arka plan yenileme görevini durdurur
+        """
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            try:
+                await self._refresh_task
+            except asyncio.CancelledError:
+                pass
+            self._refresh_task = None
+
+    async def _refresh_loop(self) -> None:
+        delay = self.ttl if self.loaded else SYMBOL_REGISTRY_RETRY
+        while True:
+            await asyncio.sleep(delay)
+            try:
+                await self.load(priority=Priority.BACKGROUND)
+                delay = self.ttl
+            except Exception as e:
+                # Eski veriyle hizmet vermeye devam et
+                self._refresh_errors += 1
+                logger.error(f"Sembol kaydı yenilenemedi: {e}")
+                delay = SYMBOL_REGISTRY_RETRY
+
+    def get(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """
+        Sembolün özet bilgisini döndürür
+
+        Args:
+            symbol: Kripto para sembolü (örn. "BTCUSDT")
+
+        Returns:
+            Dict veya sembol bulunamazsa None
+        """
+        return self._by_symbol.get(symbol.upper())
+
+    def get_filters(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """
+        Sembol için önceden hesaplanmış filtre değerlerini (tickSize, stepSize vb.) döndürür
+        """
+        return self._filters.get(symbol.upper())
+
+    def symbols(self, quote_asset: Optional[str] = "USDT", status: Optional[str] = "TRADING") -> List[Dict[str, Any]]:
+        """
+        Kote varlık ve durum filtresine uyan sembollerin özet bilgisini döndürür
+
+        Args:
+            quote_asset: Kote varlık filtresi (None ise tüm semboller)
+            status: Sembol durumu filtresi (None ise tüm durumlar)
+
+        Returns:
+            List[Dict]: Sembol özetleri
+        """
+        if quote_asset:
+            names = self._by_quote.get(quote_asset.upper(), [])
+        else:
+            names = self._by_symbol.keys()
+
+        entries = (self._by_symbol[name] for name in names)
+        if status:
+            return [entry for entry in entries if entry["status"] == status]
+        return list(entries)
+
+    def by_base_asset(self, asset: str) -> List[Dict[str, Any]]:
+        """
+        Belirli bir baz varlığa ait sembolleri döndürür (örn. "BTC")
+        """
+        return [self._by_symbol[name] for name in self._by_base.get(asset.upper(), [])]
+
+    def by_quote_asset(self, asset: str) -> List[Dict[str, Any]]:
+        """
+        Belirli bir kote varlığa ait sembolleri döndürür (örn. "USDT")
+        """
+        return [self._by_symbol[name] for name in self._by_quote.get(asset.upper(), [])]
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Kayıt durumunu döndürür
+        """
+        return {
+            "symbols": len(self._by_symbol),
+            "loaded_at": self._loaded_at,
+            "age": round(time.time() - self._loaded_at, 1) if self._loaded_at else None,
+            "ttl": self.ttl,
+            "refresh_count": self._refresh_count,
+            "refresh_errors": self._refresh_errors,
+        }
+
+
+# Uygulama genelinde paylaşılan örnek
+symbol_registry = SymbolRegistry()
@@ -27,6 +27,9 @@ setup(
             "isort>=5.0.0",
             "mypy>=1.0.0",
         ],
+        "jit": [
+            "numba>=0.58.0",
+        ],
     },
     classifiers=[
         "Development Status :: 3 - Alpha",
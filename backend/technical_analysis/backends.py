@@ -0,0 +1,196 @@
+"""
+TA-Lib tanımlı göstergeler için değiştirilebilir hesaplama arka uçları.
+
+Her arka uç aynı imzalı fonksiyonları (TA-Lib fonksiyonlarının karşılıkları) sağlar:
+- talib: TA-Lib C kütüphanesi (kuruluysa)
+- numba: `kernels` + derlenmiş `jit` döngüleri (numba kuruluysa)
+- numpy: `kernels` + pandas/numpy yolları (her zaman mevcut)
+
+Arka uç `INDICATOR_BACKEND` ortam değişkeniyle (auto | talib | numba | numpy) ya da
+çalışma anında `use_backend` ile seçilir. auto, kurulu olanlar arasından `PREFERENCE`
+sırasıyla ilkini seçer (`INDICATOR_JIT=numpy` ise numba atlanır). Gösterge motoru
+fonksiyonları her hesaplamada etkin arka uçtan alır.
+"""
+import logging
+import os
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from technical_analysis import jit, kernels
+
+logger = logging.getLogger("torypto")
+
+INDICATOR_BACKEND = os.getenv("INDICATOR_BACKEND", "auto").lower()
+
+# auto seçiminde denenecek sıra
+PREFERENCE = ("talib", "numba", "numpy")
+
+Array = np.ndarray
+
+
+@dataclass(frozen=True)
+class Backend:
+    """
+    Aynı imzalı gösterge fonksiyonları kümesi. Girdiler float64 numpy dizileridir;
+    çıktılar girdiyle aynı uzunlukta, ısınma dönemi NaN olan dizilerdir.
+    """
+    name: str
+    ema: Callable[[Array, int], Array]
+    rsi: Callable[[Array, int], Array]
+    macd: Callable[[Array, int, int, int], Tuple[Array, Array, Array]]
+    stddev: Callable[[Array, int], Array]
+    atr: Callable[[Array, Array, Array, int], Array]
+    stoch: Callable[[Array, Array, Array, int, int, int], Tuple[Array, Array]]
+    dmi: Callable[[Array, Array, Array, int], Tuple[Array, Array, Array]]
+    cci: Callable[[Array, Array, Array, int], Array]
+    obv: Callable[[Array, Array], Array]
+    sar: Callable[[Array, Array, float, float], Array]
+    # Etkinleştirilirken çağrılır (ör. jit arka ucunu ayarlamak için)
+    activate: Optional[Callable[[], None]] = None
+
+
+# Ad -> kurulu arka uç
+BACKENDS: Dict[str, Backend] = {}
+
+_active: Backend
+
+
+def register(backend: Backend) -> Backend:
+    """
+    Bir arka ucu kaydeder
+
+    Raises:
+        ValueError: Aynı adla kayıtlı arka uç varsa
+    """
+    if backend.name in BACKENDS:
+        raise ValueError(f"Arka uç zaten kayıtlı: {backend.name}")
+    BACKENDS[backend.name] = backend
+    return backend
+
+
+def available_backends() -> List[str]:
+    """
+    Bu ortamda kullanılabilen arka uçlar (tercih sırasıyla)
+    """
+    return [name for name in PREFERENCE if name in BACKENDS] + [name for name in BACKENDS if name not in PREFERENCE]
+
+
+def _auto() -> str:
+    # INDICATOR_JIT=numpy iken JIT'i yeniden açmamak için numba atlanır
+    for name in available_backends():
+        if not (name == "numba" and jit.JIT_MODE == "numpy"):
+            return name
+    return "numpy"
+
+
+def use_backend(name: str) -> Backend:
+    """
+    Etkin arka ucu seçer
+
+    Args:
+        name: "auto" ya da kayıtlı bir arka uç adı. İstenen arka uç bu ortamda kurulu
+            değilse uyarı verilip auto seçimine düşülür.
+
+    Returns:
+        Backend: Etkin arka uç
+
+    Raises:
+        ValueError: Bilinmeyen arka uç adı
+    """
+    global _active
+    name = name.lower()
+    if name != "auto" and name not in PREFERENCE and name not in BACKENDS:
+        raise ValueError(
+            f"Bilinmeyen gösterge arka ucu: {name}. Geçerli değerler: auto, {', '.join(PREFERENCE)}"
+        )
+    if name != "auto" and name not in BACKENDS:
+        logger.warning(f"Gösterge arka ucu '{name}' bu ortamda kurulu değil; otomatik seçim yapılıyor")
+        name = "auto"
+    if name == "auto":
+        name = _auto()
+
+    backend = BACKENDS[name]
+    if backend.activate is not None:
+        backend.activate()
+    _active = backend
+    return backend
+
+
+def active_backend() -> Backend:
+    """
+    Etkin arka uç
+    """
+    return _active
+
+
+# --- numpy / numba ---------------------------------------------------------------
+
+def _kernel_backend(name: str) -> Backend:
+    """
+    `kernels` fonksiyonlarını kullanan arka uç; numpy ile numba yalnızca `jit` döngülerinin
+    nasıl çalıştığında ayrılır
+    """
+    return Backend(
+        name=name,
+        ema=kernels.ema,
+        rsi=kernels.rsi,
+        macd=kernels.macd,
+        stddev=kernels.rolling_std,
+        atr=lambda high, low, close, period: kernels.atr(kernels.true_range(high, low, close), period),
+        stoch=lambda high, low, close, fastk_period, slowk_period, slowd_period: kernels.stochastic(
+            close, jit.rolling_min(low, fastk_period), jit.rolling_max(high, fastk_period),
+            slowk_period, slowd_period
+        ),
+        dmi=lambda high, low, close, period: kernels.dmi(high, low, kernels.true_range(high, low, close), period),
+        cci=lambda high, low, close, period: kernels.cci((high + low + close) / 3, period),
+        obv=kernels.obv,
+        sar=jit.psar,
+        activate=lambda: jit.set_backend(name),
+    )
+
+
+register(_kernel_backend("numpy"))
+
+if jit.numba_available():
+    register(_kernel_backend("numba"))
+
+
+# --- TA-Lib ----------------------------------------------------------------------
+
+try:
+    import talib
+except ImportError:
+    talib = None
+
+if talib is not None:
+    register(Backend(
+        name="talib",
+        ema=lambda close, period: talib.EMA(close, timeperiod=period),
+        rsi=lambda close, period: talib.RSI(close, timeperiod=period),
+        macd=lambda close, fast, slow, signal: talib.MACD(
+            close, fastperiod=fast, slowperiod=slow, signalperiod=signal
+        ),
+        stddev=lambda close, period: talib.STDDEV(close, timeperiod=period, nbdev=1),
+        atr=lambda high, low, close, period: talib.ATR(high, low, close, timeperiod=period),
+        stoch=lambda high, low, close, fastk_period, slowk_period, slowd_period: talib.STOCH(
+            high, low, close, fastk_period=fastk_period, slowk_period=slowk_period, slowk_matype=0,
+            slowd_period=slowd_period, slowd_matype=0
+        ),
+        dmi=lambda high, low, close, period: (
+            talib.PLUS_DI(high, low, close, timeperiod=period),
+            talib.MINUS_DI(high, low, close, timeperiod=period),
+            talib.ADX(high, low, close, timeperiod=period),
+        ),
+        cci=lambda high, low, close, period: talib.CCI(high, low, close, timeperiod=period),
+        obv=lambda close, volume: talib.OBV(close, volume),
+        sar=lambda high, low, acceleration, maximum: talib.SAR(
+            high, low, acceleration=acceleration, maximum=maximum
+        ),
+        # Motorun geri kalan çekirdekleri (pencere uçları, utils görünümü) JIT ayarını izler
+        activate=lambda: jit.set_backend(jit.JIT_MODE),
+    ))
+
+
+use_backend(INDICATOR_BACKEND)
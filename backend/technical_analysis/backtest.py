@@ -0,0 +1,326 @@
+"""
+Sinyal serileri üzerinde vektörel geriye dönük test (backtest).
+
+`technical_analysis.indicators.TechnicalIndicators.signal_series` ile üretilen her mum
+sinyali (pozitif: AL, negatif: SAT) bir sonraki mumun açılışında işleme dönüştürülür;
+böylece sinyalin hesaplandığı mumun kapanışından önce işlem yapılmaz (ileriye bakma yok).
+Pozisyon tüm sermayeyle açılır; her işlem tarafına komisyon, piyasa emirlerine kayma
+(slippage) uygulanır. Giriş mumundaki ATR'ye göre zarar durdur ve kâr al seviyeleri
+belirlenir; aynı mumda ikisine de dokunulursa temkinli olarak zarar durdur sayılır.
+
+Pozisyon/PnL yolu yola bağımlı olduğundan tek döngüde hesaplanır; numba kuruluysa döngü
+derlenir (`technical_analysis.jit`), özsermaye eğrisi dışındaki metrikler (düşüş, getiri
+dağılımı, Sharpe) numpy dizi işlemleridir.
+"""
+import math
+import os
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from technical_analysis import jit, signals
+from technical_analysis.indicators import TechnicalIndicators
+from utils.intervals import interval_to_ms
+
+# İşlem tarafı başına komisyon oranı (Binance spot varsayılanı %0.1)
+BACKTEST_FEE_RATE = float(os.getenv("BACKTEST_FEE_RATE", "0.001"))
+# Piyasa emirlerinde (sinyal ve zarar durdur) fiyata uygulanan kayma oranı
+BACKTEST_SLIPPAGE = float(os.getenv("BACKTEST_SLIPPAGE", "0.0005"))
+# Tek testte kullanılabilecek en fazla mum sayısı (varsayılan: yaklaşık iki yıllık 1m mum)
+BACKTEST_MAX_CANDLES = int(os.getenv("BACKTEST_MAX_CANDLES", "1100000"))
+
+YEAR_MS = 365 * 24 * 60 * 60 * 1000
+
+# Sinyal olarak kullanılabilecek `signal_series` sütunları
+SIGNAL_NAMES = signals.CROSSOVER_SIGNALS + ("overall",)
+
+# İşlemden çıkış nedenleri
+EXIT_REASONS = {0: "signal", 1: "stop_loss", 2: "take_profit"}
+_EXIT_SIGNAL, _EXIT_STOP, _EXIT_TARGET = 0, 1, 2
+
+TRADE_COLUMNS = ("entry_index", "exit_index", "side", "entry_price", "exit_price", "return", "reason")
+
+
+@dataclass(frozen=True)
+class BacktestConfig:
+    """
+    Geriye dönük test ayarları
+
+    Attributes:
+        fee: İşlem tarafı başına komisyon oranı
+        slippage: Piyasa emirlerinde aleyhe fiyat kayması oranı
+        stop_atr: Zarar durdur mesafesi (ATR katı, 0: kapalı)
+        take_profit_atr: Kâr al mesafesi (ATR katı, 0: kapalı)
+        allow_short: True ise SAT sinyali açığa satış pozisyonu açar, değilse yalnızca
+            uzun pozisyonu kapatır
+    """
+    fee: float = BACKTEST_FEE_RATE
+    slippage: float = BACKTEST_SLIPPAGE
+    stop_atr: float = 2.0
+    take_profit_atr: float = 3.0
+    allow_short: bool = False
+
+
+@dataclass
+class BacktestResult:
+    """
+    Geriye dönük test sonucu: mum başına özsermaye (başlangıç 1.0), düşüş ve pozisyon
+    (1: uzun, -1: kısa, 0: nakit), kapanan işlemler ve özet metrikler
+    """
+    equity: np.ndarray
+    drawdown: np.ndarray
+    position: np.ndarray
+    trades: pd.DataFrame
+    stats: Dict[str, Any]
+    config: BacktestConfig
+    index: Optional[pd.Index] = field(default=None)
+
+    def to_dict(self, points: int = 500, trades: int = 100) -> Dict[str, Any]:
+        """
+        JSON'a uygun özet
+
+        Args:
+            points: Özsermaye eğrisinin en fazla nokta sayısı (eşit aralıklı örneklenir, son mum dahil)
+            trades: Döndürülecek son işlem sayısı
+        """
+        n = len(self.equity)
+        picks = np.unique(np.linspace(0, n - 1, min(points, n)).astype(np.int64)) if n else np.arange(0)
+        # Zaman damgaları ms; indeks zaman değilse mum sırası kullanılır
+        times = (
+            self.index.as_unit("ms").asi8
+            if isinstance(self.index, pd.DatetimeIndex) else np.arange(n)
+        )
+        recent = self.trades.tail(trades).copy()
+        recent["entry_time"] = times[recent["entry_index"].to_numpy()]
+        recent["exit_time"] = times[recent["exit_index"].to_numpy()]
+        recent["side"] = np.where(recent["side"] > 0, "long", "short")
+        recent["reason"] = recent["reason"].map(EXIT_REASONS)
+        return {
+            "config": asdict(self.config),
+            "stats": self.stats,
+            "equity_curve": [
+                {"time": time, "equity": round(float(equity), 6), "drawdown": round(float(drawdown), 6)}
+                for time, equity, drawdown in zip(times[picks].tolist(), self.equity[picks], self.drawdown[picks])
+            ],
+            "trades": recent.to_dict(orient="records"),
+        }
+
+
+def _trade_loop(open_, high, low, close, atr, signal, capacity, fee, slippage, stop_atr, take_profit_atr, allow_short):
+    """
+    Mum başına pozisyon ve özsermaye yolu; (i-1). mumun sinyali i. mumun açılışında
+    uygulanır, zarar durdur/kâr al i. mumun en yüksek/en düşüğüyle denetlenir. Her işlem
+    bir sinyalle açıldığından işlem sayısı `capacity` (sıfır olmayan sinyal sayısı) ile sınırlıdır.
+
+    Returns:
+        Tuple: (özsermaye, pozisyon, işlemler [k x 7], işlem sayısı)
+    """
+    n = len(close)
+    equity = np.empty(n)
+    position = np.zeros(n, dtype=np.int8)
+    trades = np.empty((capacity, 7))
+    count = 0
+    cash = 1.0
+    side = 0
+    entry = 0.0
+    base = 0.0
+    stop = np.nan
+    target = np.nan
+    entry_index = 0
+    for i in range(n):
+        price = open_[i]
+        if i > 0 and price == price:
+            s = signal[i - 1]
+            want = side
+            if s > 0:
+                want = 1
+            elif s < 0:
+                want = -1 if allow_short else 0
+            if want != side:
+                if side != 0:
+                    # Sinyalle çıkış: piyasa emri, kayma aleyhe
+                    fill = price * (1.0 - slippage) if side == 1 else price * (1.0 + slippage)
+                    factor = fill / entry if side == 1 else 2.0 - fill / entry
+                    cash = base * factor * (1.0 - fee)
+                    trades[count, 0] = entry_index
+                    trades[count, 1] = i
+                    trades[count, 2] = side
+                    trades[count, 3] = entry
+                    trades[count, 4] = fill
+                    trades[count, 5] = (1.0 - fee) * (1.0 - fee) * factor - 1.0
+                    trades[count, 6] = _EXIT_SIGNAL
+                    count += 1
+                    side = 0
+                if want != 0:
+                    side = want
+                    entry = price * (1.0 + slippage) if side == 1 else price * (1.0 - slippage)
+                    base = cash * (1.0 - fee)
+                    entry_index = i
+                    distance = atr[i - 1]
+                    stop = entry - side * stop_atr * distance if stop_atr > 0 else np.nan
+                    target = entry + side * take_profit_atr * distance if take_profit_atr > 0 else np.nan
+
+        if side != 0:
+            reason = -1
+            fill = 0.0
+            if side == 1:
+                if low[i] <= stop:
+                    reason = _EXIT_STOP
+                    fill = min(price, stop) * (1.0 - slippage)
+                elif high[i] >= target:
+                    reason = _EXIT_TARGET
+                    fill = max(price, target)
+            else:
+                if high[i] >= stop:
+                    reason = _EXIT_STOP
+                    fill = max(price, stop) * (1.0 + slippage)
+                elif low[i] <= target:
+                    reason = _EXIT_TARGET
+                    fill = min(price, target)
+            if reason >= 0:
+                factor = fill / entry if side == 1 else 2.0 - fill / entry
+                cash = base * factor * (1.0 - fee)
+                trades[count, 0] = entry_index
+                trades[count, 1] = i
+                trades[count, 2] = side
+                trades[count, 3] = entry
+                trades[count, 4] = fill
+                trades[count, 5] = (1.0 - fee) * (1.0 - fee) * factor - 1.0
+                trades[count, 6] = reason
+                count += 1
+                side = 0
+
+        if side == 0:
+            equity[i] = cash
+        else:
+            position[i] = side
+            equity[i] = base * (close[i] / entry if side == 1 else 2.0 - close[i] / entry)
+    return equity, position, trades, count
+
+
+def backtest(
+    signal: np.ndarray,
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    atr: np.ndarray,
+    config: Optional[BacktestConfig] = None,
+    periods_per_year: Optional[float] = None
+) -> BacktestResult:
+    """
+    Sinyal serisini OHLC dizileri üzerinde çalıştırır
+
+    Args:
+        signal: Mum başına sinyal kodu (pozitif: AL, negatif: SAT, 0: yok)
+        open_, high, low, close: Fiyat dizileri
+        atr: Zarar durdur/kâr al mesafeleri için ATR
+        config: Test ayarları (varsayılan: `BacktestConfig()`)
+        periods_per_year: Yıllık mum sayısı (Sharpe oranını yıllıklandırmak için; None ise
+            yıllıklandırılmaz)
+
+    Returns:
+        BacktestResult: Özsermaye eğrisi, düşüş, pozisyonlar, işlemler ve metrikler
+    """
+    config = config or BacktestConfig()
+    arrays = [np.ascontiguousarray(values, dtype=np.float64) for values in (open_, high, low, close, atr)]
+    codes = np.ascontiguousarray(signal, dtype=np.int64)
+    if any(len(values) != len(codes) for values in arrays):
+        raise ValueError("Sinyal ve fiyat dizilerinin uzunlukları aynı olmalı")
+    if not len(codes):
+        raise ValueError("Geriye dönük test için mum verisi yok")
+
+    capacity = int(np.count_nonzero(codes))
+    kernel = jit.loop_kernel(_trade_loop)
+    if kernel is _trade_loop:
+        # Python döngüsü listelerde numpy skalerlerinden hızlıdır
+        arrays = [values.tolist() for values in arrays]
+        codes = codes.tolist()
+    equity, position, trades, count = kernel(
+        *arrays, codes, capacity, float(config.fee), float(config.slippage),
+        float(config.stop_atr), float(config.take_profit_atr), bool(config.allow_short)
+    )
+
+    trades = pd.DataFrame(trades[:count], columns=list(TRADE_COLUMNS))
+    trades = trades.astype({"entry_index": np.int64, "exit_index": np.int64, "side": np.int8, "reason": np.int8})
+    peak = np.maximum.accumulate(equity)
+    drawdown = equity / peak - 1.0
+    close = np.asarray(arrays[3], dtype=np.float64)
+    return BacktestResult(
+        equity=equity,
+        drawdown=drawdown,
+        position=position,
+        trades=trades,
+        stats=_stats(equity, drawdown, position, trades, close, periods_per_year),
+        config=config,
+    )
+
+
+def _stats(
+    equity: np.ndarray,
+    drawdown: np.ndarray,
+    position: np.ndarray,
+    trades: pd.DataFrame,
+    close: np.ndarray,
+    periods_per_year: Optional[float]
+) -> Dict[str, Any]:
+    """
+    Özet metrikler (oranlar ondalık; 0.05 = %5)
+    """
+    returns = np.diff(equity, prepend=1.0) / np.concatenate(([1.0], equity[:-1]))
+    deviation = returns.std()
+    sharpe = returns.mean() / deviation if deviation > 0 else 0.0
+    if periods_per_year:
+        sharpe *= math.sqrt(periods_per_year)
+
+    trade_returns = trades["return"].to_numpy()
+    wins = trade_returns[trade_returns > 0]
+    losses = trade_returns[trade_returns <= 0]
+    valid = close[~np.isnan(close)]
+    return {
+        "total_return": round(float(equity[-1] - 1.0), 6),
+        "buy_and_hold_return": round(float(valid[-1] / valid[0] - 1.0), 6) if len(valid) else 0.0,
+        "max_drawdown": round(float(drawdown.min()), 6),
+        "sharpe": round(float(sharpe), 4),
+        "trades": int(len(trade_returns)),
+        "win_rate": round(len(wins) / len(trade_returns), 4) if len(trade_returns) else 0.0,
+        "average_trade": round(float(trade_returns.mean()), 6) if len(trade_returns) else 0.0,
+        "profit_factor": round(float(wins.sum() / -losses.sum()), 4) if losses.sum() < 0 else None,
+        "exposure": round(float(np.count_nonzero(position)) / len(position), 4),
+        "open_position": int(position[-1]),
+        "candles": int(len(equity)),
+    }
+
+
+def run_backtest(
+    df: pd.DataFrame,
+    interval: str,
+    signal: str = "overall",
+    config: Optional[BacktestConfig] = None
+) -> BacktestResult:
+    """
+    OHLCV verisi üzerinde `TechnicalIndicators.signal_series` sinyallerini test eder
+
+    Args:
+        df: Açılış zamanı indeksli OHLCV DataFrame
+        interval: Mum aralığı (Sharpe oranının yıllıklandırılması için)
+        signal: Kullanılacak sinyal (`SIGNAL_NAMES`; "overall" çoğunluk oylamasıdır)
+        config: Test ayarları
+
+    Raises:
+        ValueError: Bilinmeyen sinyal adı ya da boş veri
+    """
+    if signal not in SIGNAL_NAMES:
+        raise ValueError(f"Bilinmeyen sinyal: {signal}. Geçerli değerler: {', '.join(SIGNAL_NAMES)}")
+    missing = [column for column in TechnicalIndicators.SIGNAL_COLUMNS + ["atr"] if column not in df.columns]
+    if missing:
+        df = TechnicalIndicators.add_all_indicators(df, missing)
+    codes = TechnicalIndicators.signal_series(df)[signal].to_numpy()
+    result = backtest(
+        codes, df["open"], df["high"], df["low"], df["close"], df["atr"],
+        config, YEAR_MS / interval_to_ms(interval)
+    )
+    result.index = df.index
+    return result
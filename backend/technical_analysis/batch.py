@@ -0,0 +1,272 @@
+"""
+Semboller arası toplu (batch) gösterge hesaplama.
+
+Hizalanmış (semboller x zaman) matrisler üzerinde göstergeler eksen 1 boyunca tüm
+semboller için aynı numpy çağrılarıyla hesaplanır. Kayan pencereler `sliding_window_view`
+ile, özyinelemeli ortalamalar (EMA, MACD sinyali, Wilder RSI) zaman ekseninde tek döngüde
+tüm semboller için vektör işlemleriyle güncellenir. Sonuçlar `utils.technical_indicators`
+görünümüyle aynı tanımları izler; piyasa geneli tarama için sembol başına DataFrame
+hattı yerine kullanılır.
+"""
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Mapping, Optional
+
+import numpy as np
+import pandas as pd
+
+from technical_analysis.streaming import ewm_alpha
+from utils.technical_indicators import TechnicalIndicators
+
+# Matris alanları
+PRICE_FIELDS = ("open", "high", "low", "close", "volume", "taker_buy_base_asset_volume")
+
+
+@dataclass
+class MarketMatrix:
+    """
+    Ortak zaman eksenine hizalanmış (semboller x zaman) OHLCV matrisleri.
+    Bir sembolün verisi olmayan zamanlar NaN'dır (ör. yeni listelenmiş semboller).
+    """
+    symbols: List[str]
+    index: pd.Index
+    columns: Dict[str, np.ndarray]
+
+    @classmethod
+    def from_frames(cls, frames: Mapping[str, pd.DataFrame], length: Optional[int] = None) -> "MarketMatrix":
+        """
+        Sembol başına OHLCV DataFrame'lerinden matris oluşturur
+
+        Args:
+            frames: Sembol -> açılış zamanı indeksli OHLCV DataFrame
+            length: Ortak zaman ekseninin son kaç mumu alınacağı (None ise tümü)
+        """
+        symbols = list(frames)
+        if not symbols:
+            return cls([], pd.Index([]), {field: np.empty((0, 0)) for field in ("open", "high", "low", "close", "volume")})
+        
+        # Ortak zaman ekseni: tüm sembollerin açılış zamanlarının birleşimi
+        times = np.unique(np.concatenate([frames[symbol].index.to_numpy() for symbol in symbols]))
+        if length is not None:
+            times = times[-length:]
+        
+        fields = [field for field in PRICE_FIELDS if all(field in frames[symbol].columns for symbol in symbols)]
+        columns = {field: np.full((len(symbols), len(times)), np.nan) for field in fields}
+        for row, symbol in enumerate(symbols):
+            df = frames[symbol]
+            own = df.index.to_numpy()
+            position = np.minimum(np.searchsorted(times, own), max(len(times) - 1, 0))
+            found = times[position] == own if len(times) else np.zeros(len(own), dtype=bool)
+            for field in fields:
+                columns[field][row, position[found]] = df[field].to_numpy(dtype=float)[found]
+        
+        index = pd.Index(times, name=frames[symbols[0]].index.name)
+        return cls(symbols, index, columns)
+
+    @property
+    def shape(self):
+        return self.columns["close"].shape
+
+
+def _rolling(values: np.ndarray, period: int) -> np.ndarray:
+    """
+    Eksen 1 boyunca kayan pencereler (S x (T - period + 1) x period)
+    """
+    return np.lib.stride_tricks.sliding_window_view(values, period, axis=1)
+
+
+def _pad(values: np.ndarray, period: int, total: int) -> np.ndarray:
+    out = np.full((values.shape[0], total), np.nan)
+    if values.shape[1]:
+        out[:, period - 1:] = values
+    return out
+
+
+def rolling_mean(values: np.ndarray, period: int) -> np.ndarray:
+    if values.shape[1] < period:
+        return np.full(values.shape, np.nan)
+    return _pad(_rolling(values, period).mean(axis=2), period, values.shape[1])
+
+
+def rolling_sum(values: np.ndarray, period: int) -> np.ndarray:
+    if values.shape[1] < period:
+        return np.full(values.shape, np.nan)
+    return _pad(_rolling(values, period).sum(axis=2), period, values.shape[1])
+
+
+def rolling_std(values: np.ndarray, period: int, ddof: int = 1) -> np.ndarray:
+    if values.shape[1] < period:
+        return np.full(values.shape, np.nan)
+    return _pad(_rolling(values, period).std(axis=2, ddof=ddof), period, values.shape[1])
+
+
+def rolling_max(values: np.ndarray, period: int) -> np.ndarray:
+    if values.shape[1] < period:
+        return np.full(values.shape, np.nan)
+    return _pad(_rolling(values, period).max(axis=2), period, values.shape[1])
+
+
+def rolling_min(values: np.ndarray, period: int) -> np.ndarray:
+    if values.shape[1] < period:
+        return np.full(values.shape, np.nan)
+    return _pad(_rolling(values, period).min(axis=2), period, values.shape[1])
+
+
+def ewm_mean(values: np.ndarray, alpha: float) -> np.ndarray:
+    """
+    Her satır için `ewm(adjust=False).mean()`; satır başındaki NaN'lar atlanır
+    """
+    out = np.empty_like(values)
+    weighted = np.full(values.shape[0], np.nan)
+    for t in range(values.shape[1]):
+        x = values[:, t]
+        start = np.isnan(weighted) & ~np.isnan(x)
+        update = ~np.isnan(weighted) & ~np.isnan(x)
+        weighted = np.where(start, x, weighted)
+        weighted = np.where(update, ((1 - alpha) * weighted + alpha * x) / ((1 - alpha) + alpha), weighted)
+        out[:, t] = weighted
+    return out
+
+
+def wilder_mean(values: np.ndarray, period: int) -> np.ndarray:
+    """
+    Her satır için `TechnicalIndicators.wilder_smoothing`: satırın ilk `period` geçerli
+    değerinin ortalamasıyla başlar, sonrasında alpha = 1 / period ile güncellenir
+    """
+    alpha = ewm_alpha(alpha=1 / period)
+    out = np.full(values.shape, np.nan)
+    count = np.zeros(values.shape[0], dtype=int)
+    seed_sum = np.zeros(values.shape[0])
+    average = np.full(values.shape[0], np.nan)
+    for t in range(values.shape[1]):
+        x = values[:, t]
+        valid = ~np.isnan(x)
+        count += valid
+        seeding = valid & (count <= period)
+        seed_sum = np.where(seeding, seed_sum + np.where(seeding, x, 0.0), seed_sum)
+        average = np.where(seeding & (count == period), seed_sum / period, average)
+        update = valid & (count > period)
+        average = np.where(update, ((1 - alpha) * average + alpha * x) / ((1 - alpha) + alpha), average)
+        out[:, t] = np.where(count >= period, average, np.nan)
+    return out
+
+
+def _divide(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return numerator / denominator
+
+
+def compute_batch(matrix: MarketMatrix, fields: Optional[Iterable[str]] = None) -> Dict[str, np.ndarray]:
+    """
+    İstenen gösterge alanlarını tüm semboller için hesaplar
+
+    Args:
+        matrix: Hizalanmış OHLCV matrisleri
+        fields: `TechnicalIndicators.INDICATOR_FIELDS` içinden alanlar; None ise tümü
+
+    Returns:
+        Dict: Alan adı -> (semboller x zaman) matris
+    """
+    wanted = set(TechnicalIndicators.INDICATOR_FIELDS if fields is None else fields)
+    unknown = wanted - set(TechnicalIndicators.INDICATOR_FIELDS)
+    if unknown:
+        raise KeyError(f"Bilinmeyen gösterge alanı: {', '.join(sorted(unknown))}")
+
+    close = matrix.columns["close"]
+    out: Dict[str, np.ndarray] = {}
+
+    for period in (20, 50, 200):
+        if f"sma_{period}" in wanted or (period == 20 and wanted & {"bollinger_upper", "bollinger_middle", "bollinger_lower"}):
+            out[f"sma_{period}"] = rolling_mean(close, period)
+
+    if wanted & {"ema_12", "ema_26", "macd", "macd_signal", "macd_histogram"}:
+        out["ema_12"] = ewm_mean(close, ewm_alpha(span=12))
+        out["ema_26"] = ewm_mean(close, ewm_alpha(span=26))
+        out["macd"] = out["ema_12"] - out["ema_26"]
+        out["macd_signal"] = ewm_mean(out["macd"], ewm_alpha(span=9))
+        out["macd_histogram"] = out["macd"] - out["macd_signal"]
+
+    if "rsi_14" in wanted:
+        delta = np.diff(close, axis=1, prepend=np.nan)
+        # Satırın ilk mumunda değişim NaN'dır ve kazanç/kayıp 0 sayılır
+        gain = np.where(delta > 0, delta, 0.0)
+        loss = np.where(delta < 0, -delta, 0.0)
+        gain[np.isnan(close)] = np.nan
+        loss[np.isnan(close)] = np.nan
+        out["rsi_14"] = 100 - (100 / (1 + _divide(wilder_mean(gain, 14), wilder_mean(loss, 14))))
+
+    if wanted & {"bollinger_upper", "bollinger_middle", "bollinger_lower"}:
+        std = rolling_std(close, 20)
+        out["bollinger_middle"] = out["sma_20"]
+        out["bollinger_upper"] = out["sma_20"] + 2 * std
+        out["bollinger_lower"] = out["sma_20"] - 2 * std
+
+    if wanted & {"stoch_k", "stoch_d", "atr", "ad", "cmf"}:
+        high = matrix.columns["high"]
+        low = matrix.columns["low"]
+
+    if wanted & {"stoch_k", "stoch_d"}:
+        lowest = rolling_min(low, 14)
+        out["stoch_k"] = 100 * _divide(close - lowest, rolling_max(high, 14) - lowest)
+        out["stoch_d"] = rolling_mean(out["stoch_k"], 3)
+
+    if "atr" in wanted:
+        previous = np.concatenate([np.full((close.shape[0], 1), np.nan), close[:, :-1]], axis=1)
+        true_range = np.fmax(high - low, np.fmax(np.abs(high - previous), np.abs(low - previous)))
+        out["atr"] = rolling_mean(true_range, 14)
+
+    volume = matrix.columns.get("volume")
+    if "obv" in wanted:
+        direction = np.nan_to_num(np.sign(np.diff(close, axis=1, prepend=np.nan)))
+        out["obv"] = np.where(np.isnan(close), np.nan, np.nancumsum(direction * volume, axis=1))
+
+    if wanted & {"ad", "cmf"}:
+        spread = high - low
+        multiplier = np.where(spread == 0, 0.0, _divide((close - low) - (high - close), spread))
+        money_flow_volume = multiplier * volume
+        out["ad"] = np.where(np.isnan(close), np.nan, np.nancumsum(money_flow_volume, axis=1))
+        out["cmf"] = _divide(rolling_sum(money_flow_volume, 20), rolling_sum(volume, 20))
+
+    taker_buy = matrix.columns.get("taker_buy_base_asset_volume")
+    if "cvd" in wanted and taker_buy is not None:
+        out["cvd"] = np.where(np.isnan(close), np.nan, np.nancumsum(2 * taker_buy - volume, axis=1))
+
+    return {field: values for field, values in out.items() if field in wanted}
+
+
+def snapshot(matrix: MarketMatrix, indicators: Mapping[str, np.ndarray]) -> pd.DataFrame:
+    """
+    Her sembolün son mumundaki değerler (sembol indeksli, NaN değerler 0)
+
+    Returns:
+        pd.DataFrame: `close` ve gösterge sütunları; `TechnicalIndicators.analyze_trend_row`
+        her satırla doğrudan çağrılabilir
+    """
+    close = matrix.columns["close"]
+    has_data = ~np.isnan(close)
+    # Her satırın son geçerli mumu
+    last = close.shape[1] - 1 - np.argmax(has_data[:, ::-1], axis=1)
+    rows = np.arange(close.shape[0])
+    data = {"close": close[rows, last]}
+    for field, values in indicators.items():
+        data[field] = values[rows, last]
+    frame = pd.DataFrame(data, index=pd.Index(matrix.symbols, name="symbol"))
+    return frame[has_data.any(axis=1)].fillna(0)
+
+
+def batch_trends(frames: Mapping[str, pd.DataFrame], length: Optional[int] = None) -> Dict[str, Dict]:
+    """
+    Birden çok sembolün trend analizini tek toplu hesaplamayla yapar
+
+    Args:
+        frames: Sembol -> OHLCV DataFrame
+        length: Kullanılacak son mum sayısı
+
+    Returns:
+        Dict: Sembol -> `TechnicalIndicators.analyze_trend` sonucu
+    """
+    frames = {symbol: df for symbol, df in frames.items() if len(df)}
+    if not frames:
+        return {}
+    matrix = MarketMatrix.from_frames(frames, length)
+    last = snapshot(matrix, compute_batch(matrix, TechnicalIndicators.TREND_FIELDS))
+    return dict(zip(last.index, TechnicalIndicators.analyze_trend_rows(last)))
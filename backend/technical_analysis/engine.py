@@ -0,0 +1,360 @@
+"""
+Tembel (lazy) gösterge motoru.
+
+Her gösterge, bağımlı olduğu alanlarla birlikte bir düğüm olarak kaydedilir (ör. MACD
+EMA'lara, Bollinger orta bandı SMA20'ye bağlıdır). `IndicatorEngine` yalnızca istenen
+alanları ve bunların bağımlılıklarını hesaplar; her alan bir kez hesaplanıp paylaşılır.
+
+İki gösterge ailesi vardır:
+- `utils.technical_indicators` görünümünün kullandığı alanlar (sma_20, rsi_14, macd, ...)
+- TA-Lib tanımlarını izleyen alanlar (`ta_` önekli olanlar, bb_*, adx_14, cci_14, ...);
+  bunlar `technical_analysis.backends` ile seçilen arka uçta (talib / numba / numpy) hesaplanır
+Aynı hesaplamayı paylaşan alanlar (SMA'lar, gerçek aralık, pencere en yüksek/en düşükleri,
+para akışı hacmi) tek düğümdür.
+"""
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from technical_analysis import backends, jit
+from utils.technical_indicators import TechnicalIndicators as Legacy
+
+
+@dataclass(frozen=True)
+class Indicator:
+    """
+    Gösterge düğümü: `func(*bağımlılıklar)` bir seri ya da `outputs` sırasıyla seri demeti döndürür
+    """
+    outputs: Tuple[str, ...]
+    deps: Tuple[str, ...]
+    func: Callable
+
+
+# Alan adı -> düğüm
+INDICATORS: Dict[str, Indicator] = {}
+
+
+def indicator(*outputs: str, deps: Sequence[str]):
+    """
+    Bir fonksiyonu gösterge düğümü olarak kaydeden dekoratör
+    """
+    def register(func: Callable) -> Callable:
+        node = Indicator(tuple(outputs), tuple(deps), func)
+        for name in outputs:
+            if name in INDICATORS:
+                raise ValueError(f"Gösterge zaten kayıtlı: {name}")
+            INDICATORS[name] = node
+        return func
+    return register
+
+
+class IndicatorEngine:
+    """
+    Bir OHLCV DataFrame'i üzerinde istenen göstergeleri tembel ve hafızalı hesaplar
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        """
+        Args:
+            df: OHLCV verilerini içeren DataFrame. Zaten bulunan sütunlar yeniden hesaplanmaz.
+        """
+        self.frame = df
+        self._values: Dict[str, pd.Series] = {}
+
+    def available(self, field: str) -> bool:
+        """
+        Alanın bu veriyle hesaplanıp hesaplanamayacağını döndürür (ör. `cvd` alıcı hacmi ister)
+        """
+        if field in self._values or field in self.frame.columns:
+            return True
+        node = INDICATORS.get(field)
+        return node is not None and all(self.available(dep) for dep in node.deps)
+
+    def get(self, field: str) -> pd.Series:
+        """
+        Alanı (gerekirse bağımlılıklarıyla birlikte) hesaplar ve döndürür
+
+        Raises:
+            KeyError: Alan bilinmiyorsa veya ham veride gerekli sütun yoksa
+        """
+        if field in self._values:
+            return self._values[field]
+        if field in self.frame.columns:
+            return self.frame[field]
+
+        node = INDICATORS.get(field)
+        if node is None:
+            raise KeyError(f"Bilinmeyen gösterge alanı: {field}")
+
+        result = node.func(*(self.get(dep) for dep in node.deps))
+        if len(node.outputs) == 1:
+            result = (result,)
+        for name, values in zip(node.outputs, result):
+            if not isinstance(values, pd.Series):
+                values = pd.Series(values, index=self.frame.index, dtype=float)
+            self._values[name] = values.rename(name)
+        return self._values[field]
+
+    def compute(self, fields: Iterable[str]) -> pd.DataFrame:
+        """
+        İstenen alanları hesaplar
+
+        Returns:
+            pd.DataFrame: Yalnızca istenen alanları içeren, ham veriyle aynı indeksli DataFrame
+        """
+        fields = list(dict.fromkeys(fields))
+        return pd.DataFrame({field: self.get(field) for field in fields}, index=self.frame.index)
+
+    def computed(self) -> List[str]:
+        """
+        Şimdiye kadar hesaplanan alanlar (bağımlılıklar dahil)
+        """
+        return list(self._values)
+
+
+def dependencies(field: str) -> List[str]:
+    """
+    Bir alanın hesaplanması için gereken tüm alanları bağımlılık sırasıyla döndürür
+    """
+    ordered: List[str] = []
+
+    def visit(name: str) -> None:
+        node = INDICATORS.get(name)
+        if node is None or name in ordered:
+            return
+        for dep in node.deps:
+            visit(dep)
+        ordered.extend(output for output in node.outputs if output not in ordered)
+
+    visit(field)
+    return ordered
+
+
+def parse_fields(value: Optional[str], allowed: Sequence[str]) -> Optional[List[str]]:
+    """
+    `fields=` sorgu parametresini (virgülle ayrılmış alan adları) ayrıştırır
+
+    Args:
+        value: Sorgu parametresi değeri; boşsa None döner (tüm alanlar)
+        allowed: Geçerli alan adları
+
+    Raises:
+        ValueError: Bilinmeyen alan adı varsa
+    """
+    if not value:
+        return None
+    fields = [field.strip() for field in value.split(",") if field.strip()]
+    unknown = [field for field in fields if field not in allowed]
+    if unknown:
+        raise ValueError(f"Bilinmeyen alan(lar): {', '.join(unknown)}. Geçerli alanlar: {', '.join(allowed)}")
+    return fields
+
+
+def _values(series: pd.Series) -> np.ndarray:
+    return series.to_numpy(dtype=float)
+
+
+# --- Ortak düğümler ---------------------------------------------------------------
+
+for _period in (7, 20, 25, 50, 99, 200):
+    indicator(f"sma_{_period}", deps=("close",))(lambda close, p=_period: Legacy.sma(close, p))
+
+for _period in (9, 14, 26, 52):
+    indicator(f"highest_high_{_period}", deps=("high",))(lambda high, p=_period: jit.rolling_max(_values(high), p))
+    indicator(f"lowest_low_{_period}", deps=("low",))(lambda low, p=_period: jit.rolling_min(_values(low), p))
+
+
+@indicator("true_range", deps=("high", "low", "close"))
+def _true_range(high, low, close):
+    previous = close.shift()
+    return pd.concat([high - low, (high - previous).abs(), (low - previous).abs()], axis=1).max(axis=1)
+
+
+@indicator("typical_price", deps=("high", "low", "close"))
+def _typical_price(high, low, close):
+    return (high + low + close) / 3
+
+
+@indicator("money_flow_volume", deps=("high", "low", "close", "volume"))
+def _money_flow_volume(high, low, close, volume):
+    frame = pd.DataFrame({"high": high, "low": low, "close": close})
+    return Legacy.money_flow_multiplier(frame) * volume
+
+
+# --- utils.technical_indicators görünümünün göstergeleri --------------------------
+
+for _period in (12, 26):
+    indicator(f"ema_{_period}", deps=("close",))(lambda close, p=_period: Legacy.ema(close, p))
+
+
+@indicator("macd", deps=("ema_12", "ema_26"))
+def _macd(ema_12, ema_26):
+    return ema_12 - ema_26
+
+
+@indicator("macd_signal", deps=("macd",))
+def _macd_signal(macd):
+    return macd.ewm(span=9, adjust=False).mean()
+
+
+@indicator("macd_histogram", deps=("macd", "macd_signal"))
+def _macd_histogram(macd, macd_signal):
+    return macd - macd_signal
+
+
+@indicator("rsi_14", deps=("close",))
+def _rsi_14(close):
+    return Legacy.rsi(close, 14)
+
+
+@indicator("close_std_20", deps=("close",))
+def _close_std_20(close):
+    return close.rolling(window=20).std()
+
+
+@indicator("bollinger_middle", deps=("sma_20",))
+def _bollinger_middle(sma_20):
+    return sma_20
+
+
+@indicator("bollinger_upper", "bollinger_lower", deps=("sma_20", "close_std_20"))
+def _bollinger_bands(sma_20, std):
+    return sma_20 + 2 * std, sma_20 - 2 * std
+
+
+@indicator("stoch_k", deps=("close", "lowest_low_14", "highest_high_14"))
+def _stoch_k(close, lowest_low, highest_high):
+    return 100 * ((close - lowest_low) / (highest_high - lowest_low))
+
+
+@indicator("stoch_d", deps=("stoch_k",))
+def _stoch_d(stoch_k):
+    return stoch_k.rolling(window=3).mean()
+
+
+@indicator("atr", deps=("true_range",))
+def _atr(true_range):
+    return true_range.rolling(window=14).mean()
+
+
+@indicator("obv", deps=("close", "volume"))
+def _obv(close, volume):
+    return Legacy.obv(pd.DataFrame({"close": close, "volume": volume}))
+
+
+@indicator("ad", deps=("money_flow_volume",))
+def _ad(money_flow_volume):
+    return money_flow_volume.cumsum()
+
+
+@indicator("cmf", deps=("money_flow_volume", "volume"))
+def _cmf(money_flow_volume, volume):
+    return money_flow_volume.rolling(window=20).sum() / volume.rolling(window=20).sum()
+
+
+@indicator("cvd", deps=("taker_buy_base_asset_volume", "volume"))
+def _cvd(taker_buy, volume):
+    return Legacy.cumulative_volume_delta(pd.DataFrame({"taker_buy_base_asset_volume": taker_buy, "volume": volume}))
+
+
+# --- TA-Lib tanımlı göstergeler (technical_analysis.indicators görünümü) -----------
+# Fonksiyonlar hesaplama anında etkin arka uçtan (talib / numba / numpy) alınır.
+
+for _period in (7, 25, 99):
+    indicator(f"ta_ema_{_period}", deps=("close",))(
+        lambda close, p=_period: backends.active_backend().ema(_values(close), p)
+    )
+
+
+@indicator("ta_rsi_14", deps=("close",))
+def _ta_rsi_14(close):
+    return backends.active_backend().rsi(_values(close), 14)
+
+
+@indicator("ta_macd", "ta_macd_signal", "ta_macd_hist", deps=("close",))
+def _ta_macd(close):
+    return backends.active_backend().macd(_values(close), 12, 26, 9)
+
+
+@indicator("close_pstd_20", deps=("close",))
+def _close_pstd_20(close):
+    return backends.active_backend().stddev(_values(close), 20)
+
+
+@indicator("bb_middle", deps=("sma_20",))
+def _bb_middle(sma_20):
+    return sma_20
+
+
+@indicator("bb_upper", "bb_lower", deps=("sma_20", "close_pstd_20"))
+def _bb_bands(sma_20, std):
+    return sma_20 + 2 * std, sma_20 - 2 * std
+
+
+@indicator("ta_atr_14", deps=("high", "low", "close"))
+def _ta_atr_14(high, low, close):
+    return backends.active_backend().atr(_values(high), _values(low), _values(close), 14)
+
+
+@indicator("ta_stoch_k", "ta_stoch_d", deps=("high", "low", "close"))
+def _ta_stoch(high, low, close):
+    return backends.active_backend().stoch(_values(high), _values(low), _values(close), 14, 3, 3)
+
+
+@indicator("plus_di_14", "minus_di_14", "adx_14", deps=("high", "low", "close"))
+def _dmi_14(high, low, close):
+    return backends.active_backend().dmi(_values(high), _values(low), _values(close), 14)
+
+
+@indicator("cci_14", deps=("high", "low", "close"))
+def _cci_14(high, low, close):
+    return backends.active_backend().cci(_values(high), _values(low), _values(close), 14)
+
+
+@indicator("ta_obv", deps=("close", "volume"))
+def _ta_obv(close, volume):
+    return backends.active_backend().obv(_values(close), _values(volume))
+
+
+@indicator("psar", deps=("high", "low"))
+def _psar(high, low):
+    return backends.active_backend().sar(_values(high), _values(low), 0.02, 0.2)
+
+
+@indicator("supertrend", "supertrend_direction", deps=("high", "low", "close"))
+def _supertrend(high, low, close):
+    high, low, close = _values(high), _values(low), _values(close)
+    atr = backends.active_backend().atr(high, low, close, 10)
+    return jit.supertrend(high, low, close, atr, 3.0)
+
+
+@indicator("vwap", deps=("typical_price", "volume"))
+def _vwap(typical_price, volume):
+    return (volume * typical_price).cumsum() / volume.cumsum()
+
+
+@indicator("ichimoku_tenkan_sen", deps=("highest_high_9", "lowest_low_9"))
+def _ichimoku_tenkan_sen(highest_high, lowest_low):
+    return (highest_high + lowest_low) / 2
+
+
+@indicator("ichimoku_kijun_sen", deps=("highest_high_26", "lowest_low_26"))
+def _ichimoku_kijun_sen(highest_high, lowest_low):
+    return (highest_high + lowest_low) / 2
+
+
+@indicator("ichimoku_senkou_span_a", deps=("ichimoku_tenkan_sen", "ichimoku_kijun_sen"))
+def _ichimoku_senkou_span_a(tenkan_sen, kijun_sen):
+    return ((tenkan_sen + kijun_sen) / 2).shift(26)
+
+
+@indicator("ichimoku_senkou_span_b", deps=("highest_high_52", "lowest_low_52"))
+def _ichimoku_senkou_span_b(highest_high, lowest_low):
+    return ((highest_high + lowest_low) / 2).shift(26)
+
+
+@indicator("ichimoku_chikou_span", deps=("close",))
+def _ichimoku_chikou_span(close):
+    return close.shift(-26)
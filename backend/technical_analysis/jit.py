@@ -0,0 +1,400 @@
+"""
+Yola bağımlı (özyinelemeli ya da pencereli) gösterge çekirdekleri için isteğe bağlı JIT arka ucu.
+
+Wilder/EMA özyinelemesi, pencere en yüksek/en düşükleri, Parabolic SAR ve SuperTrend
+her mumda bir önceki duruma bağlıdır; pandas bunları ya birden fazla geçişle ya da
+Python döngüsüyle hesaplar. Buradaki döngüler numba kuruluysa makine koduna derlenir
+(yalnızca CPU), değilse aynı sonuçları veren pandas/numpy yollarıyla çalışır.
+
+Arka uç `INDICATOR_JIT` ortam değişkeniyle (auto | numba | numpy) ya da çalışma anında
+`set_backend` ile seçilir. Derleme ilk çağrıda yapılır ve `cache=True` ile diske yazılır.
+numba yolu pandas'ın ewm ve rolling çekirdekleriyle aynı işlem sırasını kullanır; iki arka
+uç birebir aynı değerleri üretir.
+"""
+import logging
+import os
+from typing import Callable, Dict, Tuple
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger("torypto")
+
+# auto: numba kuruluysa kullanılır; numba: numba istenir (yoksa uyarı verilip numpy'a düşülür);
+# numpy: JIT kapalı
+JIT_MODE = os.getenv("INDICATOR_JIT", "auto").lower()
+
+BACKENDS = ("auto", "numba", "numpy")
+
+numba = None
+_backend = "numpy"
+_COMPILED: Dict[Callable, Callable] = {}
+
+
+def _load_numba() -> bool:
+    global numba
+    if numba is None:
+        try:
+            import numba as module
+        except ImportError:
+            return False
+        numba = module
+    return True
+
+
+def set_backend(name: str) -> str:
+    """
+    Gösterge çekirdeklerinin arka ucunu seçer
+
+    Args:
+        name: "auto" (numba kuruluysa numba), "numba" veya "numpy"
+
+    Returns:
+        str: Etkin arka uç ("numba" veya "numpy")
+
+    Raises:
+        ValueError: Bilinmeyen arka uç adı
+    """
+    global _backend
+    name = name.lower()
+    if name not in BACKENDS:
+        raise ValueError(f"Bilinmeyen JIT arka ucu: {name}. Geçerli değerler: {', '.join(BACKENDS)}")
+    if name != "numpy" and _load_numba():
+        _backend = "numba"
+    else:
+        if name == "numba":
+            logger.warning("numba kurulu değil; gösterge çekirdekleri numpy ile çalışacak")
+        _backend = "numpy"
+    return _backend
+
+
+def get_backend() -> str:
+    """
+    Etkin arka ucu döndürür ("numba" veya "numpy")
+    """
+    return _backend
+
+
+def numba_available() -> bool:
+    """
+    numba'nın içe aktarılabilir olup olmadığını döndürür
+    """
+    return _load_numba()
+
+
+def _compiled(func: Callable) -> Callable:
+    """
+    Döngü fonksiyonunun derlenmiş sürümü (ilk çağrıda derlenir, süreç boyunca saklanır)
+    """
+    kernel = _COMPILED.get(func)
+    if kernel is None:
+        kernel = _COMPILED[func] = numba.njit(cache=True, nogil=True)(func)
+    return kernel
+
+
+def loop_kernel(func: Callable) -> Callable:
+    """
+    Yola bağımlı bir döngü fonksiyonunun etkin arka uçtaki sürümü: numba ise derlenmiş
+    çekirdek, değilse fonksiyonun kendisi (çağıran Python listeleri vermelidir)
+    """
+    return _compiled(func) if _backend == "numba" else func
+
+
+def _array(values) -> np.ndarray:
+    return np.ascontiguousarray(values, dtype=np.float64)
+
+
+# --- Döngü çekirdekleri (numba ile derlenir) -----------------------------------------
+
+def _ewm_loop(values, first, seed, alpha, ignore_na):
+    """
+    pandas `ewm(alpha, adjust=False).mean()` çekirdeğinin `first` konumunda `seed` ile
+    başlayan kopyası (aynı işlem sırası, aynı sabit seri kısayolu)
+    """
+    n = len(values)
+    out = np.full(n, np.nan)
+    if first >= n:
+        return out
+    old_wt_factor = 1.0 - alpha
+    weighted = seed
+    out[first] = weighted
+    old_wt = 1.0
+    for i in range(first + 1, n):
+        cur = values[i]
+        is_observation = cur == cur
+        if weighted == weighted:
+            if is_observation or not ignore_na:
+                old_wt *= old_wt_factor
+                if is_observation:
+                    if weighted != cur:
+                        weighted = (old_wt * weighted + alpha * cur) / (old_wt + alpha)
+                    old_wt = 1.0
+        elif is_observation:
+            weighted = cur
+        out[i] = weighted
+    return out
+
+
+def _rolling_extreme_loop(values, window, highest):
+    """
+    Monoton kuyrukla O(n) pencere en yüksek/en düşüğü. Pencerede NaN varsa sonuç NaN'dır
+    (`rolling(window).max()` ile aynı, min_periods=window).
+    """
+    n = len(values)
+    out = np.full(n, np.nan)
+    queue = np.empty(n, dtype=np.int64)
+    head = 0
+    tail = 0
+    nan_count = 0
+    for i in range(n):
+        cur = values[i]
+        if cur != cur:
+            nan_count += 1
+        else:
+            if highest:
+                while tail > head and values[queue[tail - 1]] <= cur:
+                    tail -= 1
+            else:
+                while tail > head and values[queue[tail - 1]] >= cur:
+                    tail -= 1
+            queue[tail] = i
+            tail += 1
+        if i >= window:
+            old = values[i - window]
+            if old != old:
+                nan_count -= 1
+        while tail > head and queue[head] <= i - window:
+            head += 1
+        if i >= window - 1 and nan_count == 0:
+            out[i] = values[queue[head]]
+    return out
+
+
+def _psar_loop(high, low, acceleration, maximum):
+    """
+    TA-Lib SAR: yön ilk iki mumun -DM'sine göre belirlenir, ilk değer 1. konumdadır
+    """
+    n = len(high)
+    out = np.full(n, np.nan)
+    if n < 2:
+        return out
+    if acceleration > maximum:
+        acceleration = maximum
+    af = acceleration
+
+    up = high[1] - high[0]
+    down = low[0] - low[1]
+    is_long = not (down > 0 and down > up)
+
+    if is_long:
+        ep = high[1]
+        sar = low[0]
+    else:
+        ep = low[1]
+        sar = high[0]
+    new_low = low[1]
+    new_high = high[1]
+
+    for today in range(1, n):
+        prev_low = new_low
+        prev_high = new_high
+        new_low = low[today]
+        new_high = high[today]
+        if is_long:
+            if new_low <= sar:
+                # Kısa pozisyona dönüş: SAR son uç noktaya atlar
+                is_long = False
+                sar = ep
+                if sar < prev_high:
+                    sar = prev_high
+                if sar < new_high:
+                    sar = new_high
+                out[today] = sar
+                af = acceleration
+                ep = new_low
+                sar = sar + af * (ep - sar)
+                if sar < prev_high:
+                    sar = prev_high
+                if sar < new_high:
+                    sar = new_high
+            else:
+                out[today] = sar
+                if new_high > ep:
+                    ep = new_high
+                    af += acceleration
+                    if af > maximum:
+                        af = maximum
+                sar = sar + af * (ep - sar)
+                if sar > prev_low:
+                    sar = prev_low
+                if sar > new_low:
+                    sar = new_low
+        else:
+            if new_high >= sar:
+                # Uzun pozisyona dönüş
+                is_long = True
+                sar = ep
+                if sar > prev_low:
+                    sar = prev_low
+                if sar > new_low:
+                    sar = new_low
+                out[today] = sar
+                af = acceleration
+                ep = new_high
+                sar = sar + af * (ep - sar)
+                if sar > prev_low:
+                    sar = prev_low
+                if sar > new_low:
+                    sar = new_low
+            else:
+                out[today] = sar
+                if new_low < ep:
+                    ep = new_low
+                    af += acceleration
+                    if af > maximum:
+                        af = maximum
+                sar = sar + af * (ep - sar)
+                if sar < prev_high:
+                    sar = prev_high
+                if sar < new_high:
+                    sar = new_high
+    return out
+
+
+def _supertrend_loop(close, lower_basic, upper_basic):
+    """
+    SuperTrend bantları ve yönü (TradingView tanımı). Bantlar yalnızca trend yönünde
+    daralır; kapanış karşı bandı geçtiğinde yön değişir.
+    """
+    n = len(close)
+    line = np.full(n, np.nan)
+    direction = np.full(n, np.nan)
+    lower = np.nan
+    upper = np.nan
+    trend = 1.0
+    for i in range(n):
+        lb = lower_basic[i]
+        ub = upper_basic[i]
+        if lb != lb or ub != ub:
+            continue
+        if lower != lower:
+            lower = lb
+            upper = ub
+        else:
+            prev_lower = lower
+            prev_upper = upper
+            prev_close = close[i - 1]
+            lower = max(lb, prev_lower) if prev_close > prev_lower else lb
+            upper = min(ub, prev_upper) if prev_close < prev_upper else ub
+            if trend == -1.0 and close[i] > prev_upper:
+                trend = 1.0
+            elif trend == 1.0 and close[i] < prev_lower:
+                trend = -1.0
+        direction[i] = trend
+        line[i] = lower if trend == 1.0 else upper
+    return line, direction
+
+
+# --- Arka uçtan bağımsız arayüz ------------------------------------------------------
+
+def ewm_from(values: np.ndarray, first: int, seed: float, alpha: float, ignore_na: bool = True) -> np.ndarray:
+    """
+    `first` konumunda `seed` ile başlayan ve sonrasında
+    out[i] = out[i-1] * (1 - alpha) + values[i] * alpha özyinelemesini uygulayan seri.
+
+    Args:
+        values: Girdi dizisi
+        first: İlk çıktı konumu (öncesi NaN)
+        seed: Başlangıç değeri
+        alpha: Yumuşatma katsayısı
+        ignore_na: True ise NaN değerler atlanır (önceki değer korunur), False ise
+            pandas'taki gibi ağırlıkları eskitir
+    """
+    if _backend == "numba":
+        return _compiled(_ewm_loop)(_array(values), first, float(seed), float(alpha), ignore_na)
+    out = np.full(len(values), np.nan)
+    if first >= len(values):
+        return out
+    tail = np.array(values[first:], dtype=float)
+    tail[0] = seed
+    out[first:] = pd.Series(tail).ewm(alpha=alpha, adjust=False, ignore_na=ignore_na).mean().to_numpy()
+    return out
+
+
+def rolling_max(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    `window` uzunluğunda pencere en yükseği (ilk `window - 1` konum NaN)
+    """
+    if _backend == "numba":
+        return _compiled(_rolling_extreme_loop)(_array(values), window, True)
+    return pd.Series(values, dtype=float).rolling(window=window).max().to_numpy(copy=True)
+
+
+def rolling_min(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    `window` uzunluğunda pencere en düşüğü (ilk `window - 1` konum NaN)
+    """
+    if _backend == "numba":
+        return _compiled(_rolling_extreme_loop)(_array(values), window, False)
+    return pd.Series(values, dtype=float).rolling(window=window).min().to_numpy(copy=True)
+
+
+def pivots(high: np.ndarray, low: np.ndarray, window: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Ortalanmış pencere taraması: i. mumun yükseği [i-window, i+window] aralığının en
+    yükseğiyse pivot tepe, düşüğü en düşüğüyse pivot diptir. Her iki yanında `window`
+    mum bulunmayan konumlar pivot sayılmaz.
+
+    Returns:
+        Tuple: (pivot_high, pivot_low) boolean dizileri
+    """
+    high, low = _array(high), _array(low)
+    n = len(high)
+    span = 2 * window + 1
+    pivot_high = np.zeros(n, dtype=bool)
+    pivot_low = np.zeros(n, dtype=bool)
+    if n < span:
+        return pivot_high, pivot_low
+    # Pencere sonu i+window olan genişlik `span` pencere i. muma ortalanmıştır
+    pivot_high[window:n - window] = high[window:n - window] == rolling_max(high, span)[span - 1:]
+    pivot_low[window:n - window] = low[window:n - window] == rolling_min(low, span)[span - 1:]
+    return pivot_high, pivot_low
+
+
+def psar(high: np.ndarray, low: np.ndarray, acceleration: float = 0.02, maximum: float = 0.2) -> np.ndarray:
+    """
+    Parabolic SAR (TA-Lib SAR ile aynı tanım, ilk değer 1. konumda)
+    """
+    if _backend == "numba":
+        return _compiled(_psar_loop)(_array(high), _array(low), float(acceleration), float(maximum))
+    # Yol bağımlı; numpy karşılığı olmadığından döngü Python listeleri üzerinde çalışır
+    return _psar_loop(_array(high).tolist(), _array(low).tolist(), acceleration, maximum)
+
+
+def supertrend(
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    atr: np.ndarray,
+    multiplier: float = 3.0
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    SuperTrend çizgisi ve yönü (1: yükseliş, -1: düşüş)
+
+    Args:
+        high, low, close: Fiyat dizileri
+        atr: Ortalama gerçek aralık (ilk geçerli konumu SuperTrend'in de ilk konumudur)
+        multiplier: ATR çarpanı
+
+    Returns:
+        Tuple: (supertrend, direction)
+    """
+    middle = (_array(high) + _array(low)) / 2
+    offset = multiplier * _array(atr)
+    lower_basic, upper_basic = middle - offset, middle + offset
+    if _backend == "numba":
+        return _compiled(_supertrend_loop)(_array(close), lower_basic, upper_basic)
+    return _supertrend_loop(_array(close).tolist(), lower_basic.tolist(), upper_basic.tolist())
+
+
+set_backend(JIT_MODE)
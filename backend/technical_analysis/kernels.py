@@ -0,0 +1,218 @@
+"""
+TA-Lib ile aynı tanımları kullanan, saf numpy/pandas gösterge çekirdekleri.
+
+Fonksiyonlar float64 numpy dizileri alır ve aynı uzunlukta dizi döndürür. İlk geçerli
+değerden önceki konumlar TA-Lib'in "lookback" davranışındaki gibi NaN'dır. Üssel
+özyineleme (`ewm_from`) `technical_analysis.jit` üzerinden seçili arka uçta çalışır.
+"""
+from typing import Tuple
+
+import numpy as np
+import pandas as pd
+
+from technical_analysis.jit import ewm_from
+
+# TA-Lib'in sıfır kabul ettiği eşik (TA_IS_ZERO)
+ZERO_EPSILON = 1e-8
+
+
+def _is_zero(values: np.ndarray) -> np.ndarray:
+    return np.abs(values) < ZERO_EPSILON
+
+
+def seeded_ema(values: np.ndarray, period: int, alpha: float, start: int = 0) -> np.ndarray:
+    """
+    İlk değeri values[start:start+period] basit ortalaması olan üssel ortalama
+    (TA-Lib EMA ve Wilder yumuşatmasının ortak biçimi)
+    """
+    first = start + period - 1
+    if first >= len(values):
+        return np.full(len(values), np.nan)
+    return ewm_from(values, first, float(np.mean(values[start:first + 1])), alpha)
+
+
+def sma(values: np.ndarray, period: int) -> np.ndarray:
+    """
+    Basit hareketli ortalama
+    """
+    return pd.Series(values).rolling(window=period).mean().to_numpy(copy=True)
+
+
+def ema(values: np.ndarray, period: int) -> np.ndarray:
+    """
+    TA-Lib EMA: ilk `period` değerin ortalamasıyla başlar, k = 2 / (period + 1)
+    """
+    return seeded_ema(values, period, 2.0 / (period + 1))
+
+
+def wilder(values: np.ndarray, period: int, start: int = 0) -> np.ndarray:
+    """
+    Wilder yumuşatması (alpha = 1 / period), values[start:start+period] ortalamasıyla başlar
+    """
+    return seeded_ema(values, period, 1.0 / period, start)
+
+
+def rsi(close: np.ndarray, period: int = 14) -> np.ndarray:
+    """
+    TA-Lib RSI: değişimler 1. mumdan başlar, ilk değer `period` konumundadır
+    """
+    delta = np.diff(close, prepend=np.nan)
+    gain = np.where(delta > 0, delta, 0.0)
+    loss = np.where(delta < 0, -delta, 0.0)
+    avg_gain = wilder(gain, period, start=1)
+    avg_loss = wilder(loss, period, start=1)
+    total = avg_gain + avg_loss
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out = np.where(_is_zero(total), 0.0, 100 * avg_gain / total)
+    out[np.isnan(total)] = np.nan
+    return out
+
+
+def macd(close: np.ndarray, fast: int = 12, slow: int = 26, signal: int = 9) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    TA-Lib MACD: hızlı EMA yavaş EMA ile aynı konumda başlayacak şekilde tohumlanır,
+    sinyal çizgisi MACD'nin ilk `signal` değerinin ortalamasıyla başlar.
+
+    Returns:
+        Tuple: (macd, signal, histogram)
+    """
+    first = slow - 1
+    fast_ema = seeded_ema(close, fast, 2.0 / (fast + 1), start=first - fast + 1)
+    slow_ema = seeded_ema(close, slow, 2.0 / (slow + 1))
+    line = fast_ema - slow_ema
+    signal_line = seeded_ema(line, signal, 2.0 / (signal + 1), start=first)
+    line[:first + signal - 1] = np.nan
+    return line, signal_line, line - signal_line
+
+
+def rolling_std(values: np.ndarray, period: int) -> np.ndarray:
+    """
+    Popülasyon standart sapması (TA-Lib BBANDS/STDDEV ile aynı, ddof=0)
+    """
+    return pd.Series(values).rolling(window=period).std(ddof=0).to_numpy(copy=True)
+
+
+def true_range(high: np.ndarray, low: np.ndarray, close: np.ndarray) -> np.ndarray:
+    """
+    Gerçek aralık: max(yüksek - düşük, |yüksek - önceki kapanış|, |düşük - önceki kapanış|).
+    İlk mumda önceki kapanış olmadığından yüksek - düşük kullanılır.
+    """
+    previous = np.empty_like(close)
+    previous[:1] = np.nan
+    previous[1:] = close[:-1]
+    return np.fmax(high - low, np.fmax(np.abs(high - previous), np.abs(low - previous)))
+
+
+def atr(true_range: np.ndarray, period: int = 14) -> np.ndarray:
+    """
+    TA-Lib ATR: gerçek aralığın 1. mumdan itibaren Wilder ortalaması
+    """
+    return wilder(true_range, period, start=1)
+
+
+def stochastic(
+    close: np.ndarray,
+    lowest_low: np.ndarray,
+    highest_high: np.ndarray,
+    slowk_period: int = 3,
+    slowd_period: int = 3
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    TA-Lib STOCH (yavaş stokastik, SMA yumuşatma). Aralık sıfırsa hızlı %K 0 kabul edilir.
+
+    Returns:
+        Tuple: (slow_k, slow_d)
+    """
+    spread = highest_high - lowest_low
+    with np.errstate(divide="ignore", invalid="ignore"):
+        fast_k = np.where(spread == 0, 0.0, 100 * (close - lowest_low) / spread)
+    fast_k[np.isnan(spread)] = np.nan
+    slow_k = sma(fast_k, slowk_period)
+    slow_d = sma(slow_k, slowd_period)
+    # TA-Lib iki çıktıyı da aynı konumdan başlatır
+    slow_k[np.isnan(slow_d)] = np.nan
+    return slow_k, slow_d
+
+
+def directional_movement(high: np.ndarray, low: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    +DM ve -DM (ilk konum NaN)
+    """
+    up = np.diff(high, prepend=np.nan)
+    down = -np.diff(low, prepend=np.nan)
+    plus_dm = np.where((up > 0) & (up > down), up, 0.0)
+    minus_dm = np.where((down > 0) & (down > up), down, 0.0)
+    plus_dm[0] = minus_dm[0] = np.nan
+    return plus_dm, minus_dm
+
+
+def dmi(
+    high: np.ndarray,
+    low: np.ndarray,
+    true_range: np.ndarray,
+    period: int = 14
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    TA-Lib PLUS_DI, MINUS_DI ve ADX.
+
+    DM ve TR toplamları ilk `period - 1` değerle başlar ve her mumda
+    toplam = toplam - toplam / period + değer ile güncellenir; bu, toplam / period
+    üzerinde alpha = 1 / period olan üssel ortalamaya eşittir. ADX, ilk `period` DX
+    değerinin ortalamasıyla başlar ve Wilder yumuşatmasıyla devam eder.
+
+    Returns:
+        Tuple: (plus_di, minus_di, adx)
+    """
+    n = len(high)
+    nan = np.full(n, np.nan)
+    if n <= 2 * period - 1:
+        return nan, nan.copy(), nan.copy()
+
+    plus_dm, minus_dm = directional_movement(high, low)
+    alpha = 1.0 / period
+
+    def smoothed(values: np.ndarray) -> np.ndarray:
+        return ewm_from(values, period - 1, float(np.sum(values[1:period])) / period, alpha)
+
+    sm_plus, sm_minus, sm_tr = smoothed(plus_dm), smoothed(minus_dm), smoothed(true_range)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        valid_tr = ~_is_zero(sm_tr)
+        plus_di = np.where(valid_tr, 100 * sm_plus / sm_tr, 0.0)
+        minus_di = np.where(valid_tr, 100 * sm_minus / sm_tr, 0.0)
+        di_sum = plus_di + minus_di
+        dx = np.where(valid_tr & ~_is_zero(di_sum), 100 * np.abs(minus_di - plus_di) / di_sum, np.nan)
+    plus_di[:period] = minus_di[:period] = np.nan
+    dx[:period] = np.nan
+
+    # Geçersiz DX değerleri ilk toplama 0 olarak girer, sonrasında ADX'i değiştirmez
+    first = 2 * period - 1
+    seed = float(np.nansum(dx[period:first + 1])) / period
+    adx = ewm_from(dx, first, seed, alpha)
+    return plus_di, minus_di, adx
+
+
+def cci(typical_price: np.ndarray, period: int = 14) -> np.ndarray:
+    """
+    TA-Lib CCI: (TP - SMA(TP)) / (0.015 * ortalama mutlak sapma)
+    """
+    out = np.full(len(typical_price), np.nan)
+    if len(typical_price) < period:
+        return out
+    windows = np.lib.stride_tricks.sliding_window_view(typical_price, period)
+    mean = windows.mean(axis=1)
+    deviation = np.abs(windows - mean[:, None]).mean(axis=1)
+    current = typical_price[period - 1:] - mean
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out[period - 1:] = np.where(_is_zero(deviation), 0.0, current / (0.015 * deviation))
+    return out
+
+
+def obv(close: np.ndarray, volume: np.ndarray) -> np.ndarray:
+    """
+    TA-Lib OBV: ilk değer ilk mumun hacmidir
+    """
+    if len(close) == 0:
+        return np.empty(0)
+    direction = np.sign(np.diff(close, prepend=close[0]))
+    return volume[0] + np.cumsum(np.nan_to_num(direction) * volume)
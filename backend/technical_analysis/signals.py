@@ -0,0 +1,279 @@
+"""
+Vektörel sinyal üretimi.
+
+Trend ve alım-satım kuralları satır satır Python karşılaştırmaları yerine tüm pencere
+için boolean numpy dizileriyle tek geçişte değerlendirilir. Her fonksiyon alan adı ->
+dizi eşlemesi (DataFrame ya da sözlük) alır ve her mum için tamsayı kodlardan oluşan
+diziler döndürür; kodların metin karşılıkları `*_LABELS` sözlüklerindedir. Böylece
+sinyaller grafikte çizilebilir ve geriye dönük test edilebilir; son satırı okuyan
+API'ler (`analyze_trend`, `get_trend`, `get_signals`) yalnızca son elemanı okur.
+
+NaN içeren karşılaştırmalar satır bazlı koddaki gibi yanlış (False) sayılır. Önceki mumu
+okuyan kurallarda ilk mumun önceki değeri NaN'dır.
+"""
+from typing import Any, Dict, Iterable, Mapping
+
+import numpy as np
+
+Arrays = Dict[str, np.ndarray]
+
+BUY = 1
+NONE = 0
+SELL = -1
+
+
+def _arrays(data: Mapping[str, Any], names: Iterable[str]) -> Arrays:
+    """
+    İstenen alanları float64 dizilere dönüştürür (tek satırlık sözlükler için 1 elemanlı)
+    """
+    return {name: np.atleast_1d(np.asarray(data[name], dtype=float)) for name in names}
+
+
+def _previous(values: np.ndarray) -> np.ndarray:
+    """
+    Bir önceki mumun değeri (ilk mum için NaN)
+    """
+    out = np.empty_like(values)
+    out[:1] = np.nan
+    out[1:] = values[:-1]
+    return out
+
+
+def _cross_up(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    return (_previous(a) <= _previous(b)) & (a > b)
+
+
+def _cross_down(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    return (_previous(a) >= _previous(b)) & (a < b)
+
+
+def _code(buy: np.ndarray, sell: np.ndarray) -> np.ndarray:
+    """
+    AL önceliklidir (satır bazlı koşul zincirindeki sırayla aynı)
+    """
+    return np.where(buy, BUY, np.where(sell, SELL, NONE)).astype(np.int8)
+
+
+def _select(conditions, choices, default: int = 0) -> np.ndarray:
+    return np.select(conditions, choices, default).astype(np.int8)
+
+
+# --- utils.technical_indicators görünümü ----------------------------------------------
+
+# Trend gücü kodları (bkz. `trend_codes`)
+TREND_LABELS = {2: "Güçlü Yükseliş", 1: "Yükseliş", 0: "Nötr/Yatay", -1: "Düşüş", -2: "Güçlü Düşüş"}
+
+RATING_LABELS = {
+    "ma": {2: "Güçlü Al", 1: "Al", 0: "Nötr", -1: "Sat", -2: "Güçlü Sat"},
+    "macd": {2: "Al", 1: "Nötr/Al", -1: "Nötr/Sat", -2: "Sat"},
+    "rsi": {2: "Aşırı Satım (Al)", 1: "Nötr/Yükseliş", -1: "Nötr/Düşüş", -2: "Aşırı Alım (Sat)"},
+    "stoch": {2: "Aşırı Satım (Al)", 1: "Nötr/Yükseliş", -1: "Nötr/Düşüş", -2: "Aşırı Alım (Sat)"},
+    "bollinger": {2: "Aşırı Satım (Al)", 1: "Nötr/Yükseliş", -1: "Nötr/Düşüş", -2: "Aşırı Alım (Sat)"},
+}
+
+# Trend gücü bileşeni -> (kod -> sinyal metni); sıra `analyze_trend` sinyal listesinin sırasıdır
+STRENGTH_LABELS = {
+    "sma_20": {1: "Fiyat SMA20'nin üzerinde", -1: "Fiyat SMA20'nin altında"},
+    "sma_50": {1: "Fiyat SMA50'nin üzerinde", -1: "Fiyat SMA50'nin altında"},
+    "sma_200": {2: "Fiyat SMA200'ün üzerinde (Uzun vadeli yükseliş)", -2: "Fiyat SMA200'ün altında (Uzun vadeli düşüş)"},
+    "rsi": {-1: "RSI aşırı alım bölgesinde (>70)", 1: "RSI aşırı satım bölgesinde (<30)"},
+    "macd": {1: "MACD sinyal çizgisinin üzerinde (Yükseliş)", -1: "MACD sinyal çizgisinin altında (Düşüş)"},
+    "stoch_cross": {1: "Stokastik K > D (Yükseliş)", -1: "Stokastik K < D (Düşüş)"},
+    "stoch_zone": {-1: "Stokastik aşırı alım bölgesinde (>80)", 1: "Stokastik aşırı satım bölgesinde (<20)"},
+    "bollinger": {-1: "Fiyat üst Bollinger bandının üzerinde (Aşırı alım)", 1: "Fiyat alt Bollinger bandının altında (Aşırı satım)"},
+}
+
+STRENGTH_FIELDS = (
+    "close", "sma_20", "sma_50", "sma_200", "rsi_14", "macd", "macd_signal",
+    "stoch_k", "stoch_d", "bollinger_upper", "bollinger_lower",
+)
+RATING_FIELDS = (
+    "close", "sma_20", "sma_50", "macd", "macd_signal", "rsi_14",
+    "stoch_k", "stoch_d", "bollinger_upper", "bollinger_middle", "bollinger_lower",
+)
+
+
+def trend_codes(strength: np.ndarray) -> np.ndarray:
+    """
+    Trend gücü skorlarını `TREND_LABELS` kodlarına dönüştürür
+    """
+    strength = np.asarray(strength)
+    return _select([strength >= 4, strength >= 2, strength <= -4, strength <= -2], [2, 1, -2, -1])
+
+
+def strength_components(data: Mapping[str, Any]) -> Arrays:
+    """
+    Her mum için trend gücü bileşenleri (`STRENGTH_LABELS` kodları), toplam güç ve trend kodu
+
+    Args:
+        data: `STRENGTH_FIELDS` alanlarını içeren DataFrame ya da sözlük
+    """
+    a = _arrays(data, STRENGTH_FIELDS)
+    close, k = a["close"], a["stoch_k"]
+    parts = {
+        "sma_20": np.where(close > a["sma_20"], 1, -1),
+        "sma_50": np.where(close > a["sma_50"], 1, -1),
+        "sma_200": np.where(close > a["sma_200"], 2, -2),
+        "rsi": _select([a["rsi_14"] > 70, a["rsi_14"] < 30], [-1, 1]),
+        "macd": np.where(a["macd"] > a["macd_signal"], 1, -1),
+        "stoch_cross": np.where(k > a["stoch_d"], 1, -1),
+        "stoch_zone": _select([k > 80, k < 20], [-1, 1]),
+        "bollinger": _select([close > a["bollinger_upper"], close < a["bollinger_lower"]], [-1, 1]),
+    }
+    out = {name: values.astype(np.int8) for name, values in parts.items()}
+    strength = np.sum([values.astype(np.int16) for values in out.values()], axis=0)
+    out["strength"] = strength
+    out["trend"] = trend_codes(strength)
+    return out
+
+
+def rating_signals(data: Mapping[str, Any]) -> Arrays:
+    """
+    Her mum için gösterge bazlı al/sat derecelendirmeleri (`RATING_LABELS` kodları)
+
+    Args:
+        data: `RATING_FIELDS` alanlarını içeren DataFrame ya da sözlük
+    """
+    a = _arrays(data, RATING_FIELDS)
+    close, sma_20, macd, signal, rsi = a["close"], a["sma_20"], a["macd"], a["macd_signal"], a["rsi_14"]
+    k, d = a["stoch_k"], a["stoch_d"]
+    return {
+        "ma": _select(
+            [(close > sma_20) & (sma_20 > a["sma_50"]), close > sma_20,
+             (close < sma_20) & (sma_20 < a["sma_50"]), close < sma_20],
+            [2, 1, -2, -1]
+        ),
+        "macd": _select([(macd > signal) & (macd > 0), (macd < signal) & (macd < 0), macd > signal], [2, -2, 1], -1),
+        "rsi": _select([rsi > 70, rsi < 30, rsi > 50], [-2, 2, 1], -1),
+        "stoch": _select([(k > 80) & (d > 80), (k < 20) & (d < 20), k > d], [-2, 2, 1], -1),
+        "bollinger": _select(
+            [close > a["bollinger_upper"], close < a["bollinger_lower"], close > a["bollinger_middle"]],
+            [-2, 2, 1], -1
+        ),
+    }
+
+
+# --- technical_analysis.indicators görünümü ---------------------------------------------
+
+CROSSOVER_LABELS = {BUY: "AL", NONE: "YOK", SELL: "SAT"}
+OVERALL_LABELS = {2: "GÜÇLÜ_AL", 1: "AL", 0: "NÖTR", -1: "SAT", -2: "GÜÇLÜ_SAT"}
+
+# Kesişim sinyalleri (sıra `get_signals` sözlüğünün sırasıdır)
+CROSSOVER_SIGNALS = ("ma_crossover", "macd", "rsi", "stochastic", "bollinger", "price_action", "ichimoku")
+
+CROSSOVER_FIELDS = (
+    "close", "ma7", "ma25", "ma99", "macd", "macd_signal", "rsi", "stoch_k", "stoch_d",
+    "bb_upper", "bb_lower", "ichimoku_kijun_sen",
+)
+TREND_STATE_FIELDS = (
+    "close", "ma7", "ma25", "ema7", "ema25", "rsi", "macd", "macd_signal",
+    "bb_upper", "bb_middle", "bb_lower", "stoch_k", "stoch_d", "adx", "cci",
+    "ichimoku_senkou_span_a", "ichimoku_senkou_span_b",
+)
+
+TREND_STATE_LABELS = {
+    "ma_trend": {BUY: "yükseliş", SELL: "düşüş"},
+    "ema_trend": {BUY: "yükseliş", SELL: "düşüş"},
+    "rsi_status": {1: "aşırı alım", 0: "nötr", -1: "aşırı satım"},
+    "macd_trend": {BUY: "yükseliş", SELL: "düşüş"},
+    "macd_cross": {BUY: "alttan yukarı", NONE: "yok", SELL: "üstten aşağı"},
+    "bollinger_bands": {1: "üst banda yakın", 0: "ortalamada", -1: "alt banda yakın"},
+    "stochastic": {1: "aşırı alım", 0: "nötr", -1: "aşırı satım"},
+    "adx_strength": {1: "güçlü", 0: "zayıf"},
+    "cci_status": {1: "aşırı alım", 0: "nötr", -1: "aşırı satım"},
+    "ichimoku_cloud": {BUY: "yükseliş", NONE: "kararsız", SELL: "düşüş"},
+    "overall_trend": {2: "güçlü yükseliş", 1: "yükseliş", 0: "kararsız", -1: "düşüş", -2: "güçlü düşüş"},
+}
+
+
+def crossover_signals(data: Mapping[str, Any]) -> Arrays:
+    """
+    Her mum için kesişim sinyalleri (`CROSSOVER_LABELS` kodları), AL/SAT oy sayıları ve
+    çoğunluk oylamasıyla birleşik sinyal (`OVERALL_LABELS` kodları)
+
+    Args:
+        data: `CROSSOVER_FIELDS` alanlarını içeren DataFrame ya da sözlük
+    """
+    a = _arrays(data, CROSSOVER_FIELDS)
+    close, rsi, k, d = a["close"], a["rsi"], a["stoch_k"], a["stoch_d"]
+    prev_close, prev_rsi, prev_k = _previous(close), _previous(rsi), _previous(k)
+
+    out = {
+        "ma_crossover": _code(_cross_up(a["ma7"], a["ma25"]), _cross_down(a["ma7"], a["ma25"])),
+        "macd": _code(_cross_up(a["macd"], a["macd_signal"]), _cross_down(a["macd"], a["macd_signal"])),
+        "rsi": _code((prev_rsi < 30) & (rsi >= 30), (prev_rsi > 70) & (rsi <= 70)),
+        "stochastic": _code(
+            (prev_k < 20) & (k >= 20) & (k > d),
+            (prev_k > 80) & (k <= 80) & (k < d)
+        ),
+        "bollinger": _code(_cross_up(close, a["bb_lower"]), _cross_down(close, a["bb_upper"])),
+        "price_action": _code(
+            (prev_close < _previous(a["ma99"])) & (close > a["ma99"]),
+            (prev_close > _previous(a["ma99"])) & (close < a["ma99"])
+        ),
+        "ichimoku": _code(_cross_up(close, a["ichimoku_kijun_sen"]), _cross_down(close, a["ichimoku_kijun_sen"])),
+    }
+    votes = np.stack([out[name] for name in CROSSOVER_SIGNALS])
+    buy = (votes == BUY).sum(axis=0)
+    sell = (votes == SELL).sum(axis=0)
+    out["buy_votes"] = buy
+    out["sell_votes"] = sell
+    out["overall"] = _select(
+        [(buy >= 3) & (sell == 0), buy > sell, (sell >= 3) & (buy == 0), sell > buy],
+        [2, 1, -2, -1]
+    )
+    return out
+
+
+def trend_states(data: Mapping[str, Any]) -> Arrays:
+    """
+    Her mum için gösterge durumları (`TREND_STATE_LABELS` kodları), yükseliş/düşüş
+    gösteren gösterge sayıları ve genel trend
+
+    Args:
+        data: `TREND_STATE_FIELDS` alanlarını içeren DataFrame ya da sözlük
+    """
+    a = _arrays(data, TREND_STATE_FIELDS)
+    close, rsi, k, d, adx = a["close"], a["rsi"], a["stoch_k"], a["stoch_d"], a["adx"]
+    upper, middle, lower = a["bb_upper"], a["bb_middle"], a["bb_lower"]
+    span_a, span_b = a["ichimoku_senkou_span_a"], a["ichimoku_senkou_span_b"]
+
+    ma_up = a["ma7"] > a["ma25"]
+    ema_up = a["ema7"] > a["ema25"]
+    macd_up = a["macd"] > a["macd_signal"]
+    rsi_status = _select([rsi > 70, rsi < 30], [1, -1])
+    stoch_status = _select([(k > 80) & (d > 80), (k < 20) & (d < 20)], [1, -1])
+    cloud = _select([(close > span_a) & (close > span_b), (close < span_a) & (close < span_b)], [BUY, SELL])
+    strong = adx > 25
+
+    bullish = (
+        ma_up.astype(np.int8) + ema_up + macd_up
+        + ((rsi_status != 1) & (rsi > 50))
+        + ((stoch_status != 1) & (k > d))
+        + (cloud == BUY)
+        + (strong & (close > a["ma25"]))
+    )
+    bearish = (
+        (~ma_up).astype(np.int8) + ~ema_up + ~macd_up
+        + ((rsi_status != -1) & (rsi < 50))
+        + ((stoch_status != -1) & (k < d))
+        + (cloud == SELL)
+        + (strong & (close < a["ma25"]))
+    )
+    return {
+        "ma_trend": np.where(ma_up, BUY, SELL).astype(np.int8),
+        "ema_trend": np.where(ema_up, BUY, SELL).astype(np.int8),
+        "rsi_status": rsi_status,
+        "macd_trend": np.where(macd_up, BUY, SELL).astype(np.int8),
+        "macd_cross": _code(_cross_up(a["macd"], a["macd_signal"]), _cross_down(a["macd"], a["macd_signal"])),
+        "bollinger_bands": _select(
+            [close > upper - (upper - middle) / 3, close < lower + (middle - lower) / 3], [1, -1]
+        ),
+        "stochastic": stoch_status,
+        "adx_strength": strong.astype(np.int8),
+        "cci_status": _select([a["cci"] > 100, a["cci"] < -100], [1, -1]),
+        "ichimoku_cloud": cloud,
+        "bullish_indicators": bullish,
+        "bearish_indicators": bearish,
+        "overall_trend": _select([bullish >= 5, bullish >= 4, bearish >= 5, bearish >= 4], [2, 1, -2, -1]),
+    }
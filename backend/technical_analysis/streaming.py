@@ -0,0 +1,453 @@
+"""
+Akan (streaming) mumlar için artımlı göstergeler.
+
+Her sınıf bir sonraki değeri önceki durumdan mum başına O(1) (amortize) maliyetle üretir:
+EMA/MACD/Wilder RSI özyinelemeyle, SMA/Bollinger/CMF Kahan toplamlı kayan pencerelerle,
+stokastik ve Ichimoku en yüksek/en düşükleri monoton kuyruklarla, OBV/A-D/CVD/VWAP
+kümülatif toplamlarla güncellenir.
+
+Güncelleme formülleri pandas'ın `ewm(adjust=False)` ve `rolling()` çekirdekleriyle aynı
+sırayla hesaplanır; böylece aynı mumlar tek tek verildiğinde sonuçlar
+`utils.technical_indicators` görünümünün toplu (batch) hesaplamasıyla aynı olur.
+"""
+import math
+from collections import deque
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+NAN = float("nan")
+
+
+def ewm_alpha(span: Optional[float] = None, alpha: Optional[float] = None) -> float:
+    """
+    pandas'ın kullandığı etkin alpha değeri (span/alpha önce kütle merkezine çevrilir)
+    """
+    com = (span - 1) / 2 if span is not None else (1 - alpha) / alpha
+    return 1.0 / (1.0 + float(com))
+
+
+class EWMean:
+    """
+    `Series.ewm(alpha=..., adjust=False).mean()` ile aynı artımlı üssel ortalama
+    """
+    __slots__ = ("alpha", "value", "_old_wt")
+
+    def __init__(self, span: Optional[float] = None, alpha: Optional[float] = None):
+        self.alpha = ewm_alpha(span, alpha)
+        self.value = NAN
+        self._old_wt = 1.0
+
+    def update(self, x: float) -> float:
+        if self.value != self.value:
+            if x == x:
+                self.value = x
+            return self.value
+        self._old_wt *= 1.0 - self.alpha
+        if x == x:
+            if self.value != x:
+                self.value = (self._old_wt * self.value + self.alpha * x) / (self._old_wt + self.alpha)
+            self._old_wt = 1.0
+        return self.value
+
+
+class WilderAverage:
+    """
+    `TechnicalIndicators.wilder_smoothing` ile aynı: ilk `period` değerin ortalamasıyla
+    başlar, sonrasında alpha = 1 / period ile güncellenir
+    """
+    __slots__ = ("period", "_seed", "_ewm")
+
+    def __init__(self, period: int):
+        self.period = period
+        self._seed = []
+        self._ewm = EWMean(alpha=1 / period)
+
+    @property
+    def value(self) -> float:
+        return self._ewm.value
+
+    def update(self, x: float) -> float:
+        if self._seed is not None:
+            self._seed.append(x)
+            if len(self._seed) < self.period:
+                return NAN
+            self._ewm.update(float(np.asarray(self._seed, dtype=float).mean()))
+            self._seed = None
+            return self._ewm.value
+        return self._ewm.update(x)
+
+
+class _KahanWindow:
+    """
+    Kayan pencere için pandas'ın Kahan telafili ekleme/çıkarma toplamı
+    """
+    __slots__ = ("period", "window", "nobs", "total", "_comp_add", "_comp_remove",
+                 "neg_ct", "same_ct", "prev_value")
+
+    def __init__(self, period: int):
+        self.period = period
+        self.window = deque()
+        self.nobs = 0
+        self.total = 0.0
+        self._comp_add = 0.0
+        self._comp_remove = 0.0
+        self.neg_ct = 0
+        self.same_ct = 0
+        self.prev_value = NAN
+
+    def push(self, x: float) -> None:
+        self.window.append(x)
+        if len(self.window) > self.period:
+            old = self.window.popleft()
+            if old == old:
+                self.nobs -= 1
+                y = -old - self._comp_remove
+                t = self.total + y
+                self._comp_remove = t - self.total - y
+                self.total = t
+                if math.copysign(1.0, old) < 0:
+                    self.neg_ct -= 1
+        if x == x:
+            self.nobs += 1
+            y = x - self._comp_add
+            t = self.total + y
+            self._comp_add = t - self.total - y
+            self.total = t
+            if math.copysign(1.0, x) < 0:
+                self.neg_ct += 1
+            if x == self.prev_value:
+                self.same_ct += 1
+            else:
+                self.same_ct = 1
+            self.prev_value = x
+
+
+class RollingMean(_KahanWindow):
+    """
+    `Series.rolling(period).mean()` ile aynı kayan ortalama
+    """
+    __slots__ = ()
+
+    def update(self, x: float) -> float:
+        self.push(x)
+        if self.nobs < self.period:
+            return NAN
+        result = self.total / self.nobs
+        if self.same_ct >= self.nobs:
+            return self.prev_value
+        if self.neg_ct == 0 and result < 0:
+            return 0.0
+        if self.neg_ct == self.nobs and result > 0:
+            return 0.0
+        return result
+
+
+class RollingSum(_KahanWindow):
+    """
+    `Series.rolling(period).sum()` ile aynı kayan toplam
+    """
+    __slots__ = ()
+
+    def update(self, x: float) -> float:
+        self.push(x)
+        if self.nobs < self.period:
+            return NAN
+        if self.same_ct >= self.nobs:
+            return self.prev_value * self.nobs
+        return self.total
+
+
+class RollingStd:
+    """
+    `Series.rolling(period).std(ddof)` ile aynı kayan standart sapma (Welford, Kahan telafili)
+    """
+    __slots__ = ("period", "ddof", "window", "nobs", "mean", "ssqdm", "_comp_add",
+                 "_comp_remove", "same_ct", "prev_value")
+
+    def __init__(self, period: int, ddof: int = 1):
+        self.period = period
+        self.ddof = ddof
+        self.window = deque()
+        self.nobs = 0
+        self.mean = 0.0
+        self.ssqdm = 0.0
+        self._comp_add = 0.0
+        self._comp_remove = 0.0
+        self.same_ct = 0
+        self.prev_value = NAN
+
+    def update(self, x: float) -> float:
+        self.window.append(x)
+        # pandas önce pencereden çıkan değeri siler, sonra yeni değeri ekler
+        if len(self.window) > self.period:
+            old = self.window.popleft()
+            if old == old:
+                self.nobs -= 1
+                if self.nobs:
+                    prev_mean = self.mean - self._comp_remove
+                    y = old - self._comp_remove
+                    t = y - self.mean
+                    self._comp_remove = t + self.mean - y
+                    self.mean -= t / self.nobs
+                    self.ssqdm -= (old - prev_mean) * (old - self.mean)
+                else:
+                    self.mean = 0.0
+                    self.ssqdm = 0.0
+        if x == x:
+            if x == self.prev_value:
+                self.same_ct += 1
+            else:
+                self.same_ct = 1
+            self.prev_value = x
+            self.nobs += 1
+            prev_mean = self.mean - self._comp_add
+            y = x - self._comp_add
+            t = y - self.mean
+            self._comp_add = t + self.mean - y
+            self.mean = self.mean + t / self.nobs
+            self.ssqdm += (x - prev_mean) * (x - self.mean)
+
+        if self.nobs < self.period or self.nobs <= self.ddof:
+            return NAN
+        if self.nobs == 1 or self.same_ct >= self.nobs:
+            return 0.0
+        variance = self.ssqdm / (self.nobs - self.ddof)
+        return math.sqrt(variance) if variance > 0 else 0.0
+
+
+class RollingExtreme:
+    """
+    Monoton kuyrukla kayan en yüksek (`highest=True`) veya en düşük değer
+    """
+    __slots__ = ("period", "highest", "_queue", "_count")
+
+    def __init__(self, period: int, highest: bool):
+        self.period = period
+        self.highest = highest
+        self._queue = deque()  # (sıra, değer), değerler monoton
+        self._count = 0
+
+    def update(self, x: float) -> float:
+        queue = self._queue
+        if self.highest:
+            while queue and queue[-1][1] <= x:
+                queue.pop()
+        else:
+            while queue and queue[-1][1] >= x:
+                queue.pop()
+        queue.append((self._count, x))
+        if queue[0][0] <= self._count - self.period:
+            queue.popleft()
+        self._count += 1
+        return queue[0][1] if self._count >= self.period else NAN
+
+
+class Lag:
+    """
+    Değeri `periods` mum geciktirir (`Series.shift(periods)`)
+    """
+    __slots__ = ("periods", "_buffer")
+
+    def __init__(self, periods: int):
+        self.periods = periods
+        self._buffer = deque(maxlen=periods + 1)
+
+    def update(self, x: float) -> float:
+        self._buffer.append(x)
+        return self._buffer[0] if len(self._buffer) > self.periods else NAN
+
+
+def _divide(numerator: float, denominator: float) -> float:
+    """
+    numpy bölme davranışı: 0/0 NaN, x/0 işaretli sonsuz
+    """
+    if denominator == 0:
+        return NAN if numerator == 0 or numerator != numerator else math.copysign(math.inf, numerator) * math.copysign(1.0, denominator)
+    return numerator / denominator
+
+
+class StreamingIndicators:
+    """
+    `utils.technical_indicators.TechnicalIndicators.INDICATOR_FIELDS` alanlarını mum mum
+    güncelleyen durum. Tüm mumlar toplu hesaplamaya verildiğinde son satırla aynı değerleri üretir.
+    """
+    __slots__ = ("count", "last_open_time", "values", "_sma", "_ema", "_macd_signal", "_std_20",
+                 "_gain", "_loss", "_low_14", "_high_14", "_stoch_d", "_atr", "_mfv_sum",
+                 "_volume_sum", "_prev_close", "_obv", "_ad", "_cvd")
+
+    def __init__(self):
+        self.count = 0
+        self.last_open_time: Optional[int] = None
+        self.values: Dict[str, float] = {}
+        self._sma = {period: RollingMean(period) for period in (20, 50, 200)}
+        self._ema = {period: EWMean(span=period) for period in (12, 26)}
+        self._macd_signal = EWMean(span=9)
+        self._std_20 = RollingStd(20)
+        self._gain = WilderAverage(14)
+        self._loss = WilderAverage(14)
+        self._low_14 = RollingExtreme(14, highest=False)
+        self._high_14 = RollingExtreme(14, highest=True)
+        self._stoch_d = RollingMean(3)
+        self._atr = RollingMean(14)
+        self._mfv_sum = RollingSum(20)
+        self._volume_sum = RollingSum(20)
+        self._prev_close = NAN
+        self._obv = 0.0
+        self._ad = 0.0
+        self._cvd = 0.0
+
+    def update(
+        self,
+        open_: float,
+        high: float,
+        low: float,
+        close: float,
+        volume: float,
+        taker_buy_volume: Optional[float] = None,
+        open_time: Optional[int] = None
+    ) -> Dict[str, float]:
+        """
+        Kapanmış bir mumu işler
+
+        Args:
+            open_, high, low, close, volume: Mum değerleri
+            taker_buy_volume: Alıcı (taker buy) hacmi; verilirse `cvd` hesaplanır
+            open_time: Mumun açılış zamanı (ms); bilgi amaçlı saklanır
+
+        Returns:
+            Dict: Alan adı -> güncel değer (ısınma dönemindeki alanlar NaN)
+        """
+        values = self.values
+        prev_close = self._prev_close
+
+        for period, sma in self._sma.items():
+            values[f"sma_{period}"] = sma.update(close)
+
+        ema_12 = values["ema_12"] = self._ema[12].update(close)
+        ema_26 = values["ema_26"] = self._ema[26].update(close)
+        macd = values["macd"] = ema_12 - ema_26
+        signal = values["macd_signal"] = self._macd_signal.update(macd)
+        values["macd_histogram"] = macd - signal
+
+        # RSI: ilk mumun değişimi NaN'dır ve kazanç/kayıp 0 sayılır
+        delta = close - prev_close
+        avg_gain = self._gain.update(delta if delta > 0 else 0.0)
+        avg_loss = self._loss.update(-delta if delta < 0 else -0.0)
+        values["rsi_14"] = 100 - (100 / (1 + _divide(avg_gain, avg_loss)))
+
+        std = self._std_20.update(close)
+        middle = values["sma_20"]
+        values["bollinger_middle"] = middle
+        values["bollinger_upper"] = middle + 2 * std
+        values["bollinger_lower"] = middle - 2 * std
+
+        lowest = self._low_14.update(low)
+        highest = self._high_14.update(high)
+        stoch_k = values["stoch_k"] = 100 * _divide(close - lowest, highest - lowest)
+        values["stoch_d"] = self._stoch_d.update(stoch_k)
+
+        true_range = high - low
+        if prev_close == prev_close:
+            true_range = max(true_range, abs(high - prev_close), abs(low - prev_close))
+        values["atr"] = self._atr.update(true_range)
+
+        # Kapanış yükseldiyse +hacim, düştüyse -hacim; ilk mumda yön 0'dır
+        direction = 1.0 if close > prev_close else -1.0 if close < prev_close else 0.0
+        self._obv += direction * volume
+        values["obv"] = self._obv
+
+        spread = high - low
+        multiplier = ((close - low) - (high - close)) / spread if spread != 0 else 0.0
+        money_flow_volume = multiplier * volume
+        self._ad += money_flow_volume
+        values["ad"] = self._ad
+        values["cmf"] = _divide(self._mfv_sum.update(money_flow_volume), self._volume_sum.update(volume))
+
+        if taker_buy_volume is not None:
+            self._cvd += 2 * taker_buy_volume - volume
+            values["cvd"] = self._cvd
+
+        self._prev_close = close
+        self.count += 1
+        if open_time is not None:
+            self.last_open_time = open_time
+        return values
+
+    def snapshot(self, fill_value: Optional[float] = None) -> Dict[str, float]:
+        """
+        Güncel değerlerin kopyası. `fill_value` verilirse NaN değerler onunla doldurulur
+        (toplu hesaplamadaki `fillna(0)` davranışı için).
+        """
+        if fill_value is None:
+            return dict(self.values)
+        return {key: fill_value if value != value else value for key, value in self.values.items()}
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> "StreamingIndicators":
+        """
+        Geçmiş mumlarla ısıtılmış durum oluşturur (O(n), bir kez)
+
+        Args:
+            df: Açılış zamanı indeksli OHLCV DataFrame (yalnızca kapanmış mumlar)
+        """
+        state = cls()
+        taker_buy = (df["taker_buy_base_asset_volume"].to_numpy(dtype=float).tolist()
+                     if "taker_buy_base_asset_volume" in df.columns else [None] * len(df))
+        open_times = (df.index.as_unit("ms").asi8.tolist()
+                      if isinstance(df.index, pd.DatetimeIndex) else [None] * len(df))
+        columns = [df[column].to_numpy(dtype=float).tolist() for column in ("open", "high", "low", "close", "volume")]
+        for i in range(len(df)):
+            state.update(
+                columns[0][i], columns[1][i], columns[2][i], columns[3][i], columns[4][i],
+                taker_buy[i],
+                open_times[i]
+            )
+        return state
+
+
+class StreamingVWAP:
+    """
+    Kümülatif VWAP (gösterge motorundaki `vwap` alanı)
+    """
+    __slots__ = ("_price_volume", "_volume")
+
+    def __init__(self):
+        self._price_volume = 0.0
+        self._volume = 0.0
+
+    def update(self, high: float, low: float, close: float, volume: float) -> float:
+        self._price_volume += volume * ((high + low + close) / 3)
+        self._volume += volume
+        return _divide(self._price_volume, self._volume)
+
+
+class StreamingIchimoku:
+    """
+    Ichimoku bileşenleri (gösterge motorundaki `ichimoku_*` alanları). Chikou span ileriye
+    bakan bir kaydırma olduğundan son mumda her zaman NaN'dır.
+    """
+    __slots__ = ("_high_9", "_low_9", "_high_26", "_low_26", "_high_52", "_low_52", "_span_a", "_span_b")
+
+    def __init__(self):
+        self._high_9 = RollingExtreme(9, highest=True)
+        self._low_9 = RollingExtreme(9, highest=False)
+        self._high_26 = RollingExtreme(26, highest=True)
+        self._low_26 = RollingExtreme(26, highest=False)
+        self._high_52 = RollingExtreme(52, highest=True)
+        self._low_52 = RollingExtreme(52, highest=False)
+        self._span_a = Lag(26)
+        self._span_b = Lag(26)
+
+    def update(self, high: float, low: float, close: float) -> Dict[str, float]:
+        tenkan_sen = (self._high_9.update(high) + self._low_9.update(low)) / 2
+        kijun_sen = (self._high_26.update(high) + self._low_26.update(low)) / 2
+        span_b = (self._high_52.update(high) + self._low_52.update(low)) / 2
+        return {
+            "ichimoku_tenkan_sen": tenkan_sen,
+            "ichimoku_kijun_sen": kijun_sen,
+            "ichimoku_senkou_span_a": self._span_a.update((tenkan_sen + kijun_sen) / 2),
+            "ichimoku_senkou_span_b": self._span_b.update(span_b),
+            "ichimoku_chikou_span": NAN,
+        }
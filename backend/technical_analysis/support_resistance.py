@@ -0,0 +1,120 @@
+"""
+Doğrusal zamanlı destek/direnç tespiti.
+
+1. Pivotlar tek geçişte bulunur: mumun yükseği ortalanmış pencerenin en yükseğine eşitse
+   tepe, düşüğü en düşüğüne eşitse dip (`jit.pivots`, O(n)).
+2. Pivot fiyatları sıralanır ve kümenin en düşük fiyatından en fazla `tolerance` (göreli)
+   uzaktaki fiyatlar aynı seviyede birleştirilir (O(k log k), k = pivot sayısı).
+3. Her seviye dokunma sayısı ve yakınlığa göre ağırlıklandırılmış bir güç skoru taşır.
+"""
+from typing import Any, Dict, List
+
+import numpy as np
+import pandas as pd
+
+from technical_analysis import jit
+
+# Bir seviyede birleştirilen pivotların en düşüğü ile en yükseği arasındaki en büyük göreli fark
+DEFAULT_TOLERANCE = 0.005
+
+
+def _cluster_starts(prices: np.ndarray, tolerance: float) -> np.ndarray:
+    """
+    Sıralı fiyatları, her küme en düşük fiyatının (1 + tolerance) katını aşmayacak şekilde
+    böler. Her küme için tek bir ikili arama yapılır; döngü pivot değil küme sayısı kadardır.
+    """
+    starts = []
+    start = 0
+    while start < len(prices):
+        starts.append(start)
+        start = int(np.searchsorted(prices, prices[start] + abs(prices[start]) * tolerance, side="right"))
+    return np.asarray(starts, dtype=np.int64)
+
+
+def find_levels(
+    high: np.ndarray,
+    low: np.ndarray,
+    window: int = 10,
+    tolerance: float = DEFAULT_TOLERANCE
+) -> List[Dict[str, Any]]:
+    """
+    Pivot tepe ve diplerini yakın fiyatlarda kümeleyerek seviyeleri bulur
+
+    Args:
+        high: Yüksek fiyatlar
+        low: Düşük fiyatlar
+        window: Pivot penceresinin genişliği (mumun iki yanında window // 2 mum)
+        tolerance: Bir seviyedeki en yüksek ve en düşük pivot arasındaki en büyük göreli fark
+
+    Returns:
+        List[Dict]: Güce göre azalan sırada seviyeler. Her seviye:
+            price (kümedeki pivotların ortalaması), touches (dokunma sayısı),
+            strength (0-1, en güçlü seviye 1), candles_ago (son dokunuştan bu yana mum)
+    """
+    high = np.asarray(high, dtype=float)
+    low = np.asarray(low, dtype=float)
+    n = len(high)
+    pivot_high, pivot_low = jit.pivots(high, low, max(1, window // 2))
+
+    positions = np.concatenate([np.flatnonzero(pivot_high), np.flatnonzero(pivot_low)])
+    if len(positions) == 0:
+        return []
+    prices = np.concatenate([high[pivot_high], low[pivot_low]])
+
+    order = np.argsort(prices, kind="stable")
+    prices, positions = prices[order], positions[order]
+
+    starts = _cluster_starts(prices, tolerance)
+
+    # Yakın zamandaki dokunuşlar daha ağır: en eski 0.5, en yeni 1
+    weights = 0.5 + 0.5 * positions / max(n - 1, 1)
+    touches = np.diff(np.append(starts, len(prices)))
+    level_prices = np.add.reduceat(prices, starts) / touches
+    scores = np.add.reduceat(weights, starts)
+    last_touch = np.maximum.reduceat(positions, starts)
+    strength = scores / scores.max()
+
+    ranked = np.lexsort((-last_touch, -strength))
+    return [
+        {
+            "price": float(level_prices[i]),
+            "touches": int(touches[i]),
+            "strength": round(float(strength[i]), 3),
+            "candles_ago": int(n - 1 - last_touch[i]),
+        }
+        for i in ranked
+    ]
+
+
+def support_resistance(
+    df: pd.DataFrame,
+    window: int = 10,
+    tolerance: float = DEFAULT_TOLERANCE,
+    limit: int = 3
+) -> Dict[str, Any]:
+    """
+    Son kapanışın altındaki seviyeleri destek, üstündekileri direnç olarak ayırır
+
+    Args:
+        df: OHLCV DataFrame
+        window: Pivot penceresinin genişliği
+        tolerance: Seviye kümeleme toleransı (göreli)
+        limit: Her yönde döndürülecek en fazla seviye
+
+    Returns:
+        Dict: support/resistance (güce göre sıralı seviye fiyatları) ve
+            levels (aynı seviyelerin dokunma sayısı ve güç skorlarıyla ayrıntısı)
+    """
+    empty = {"support": [], "resistance": [], "levels": {"support": [], "resistance": []}}
+    if len(df) < window * 2:
+        return empty
+
+    current_price = float(df['close'].iloc[-1])
+    levels = find_levels(df['high'].to_numpy(), df['low'].to_numpy(), window, tolerance)
+    supports = [level for level in levels if level["price"] < current_price][:limit]
+    resistances = [level for level in levels if level["price"] > current_price][:limit]
+    return {
+        "support": [level["price"] for level in supports],
+        "resistance": [level["price"] for level in resistances],
+        "levels": {"support": supports, "resistance": resistances},
+    }
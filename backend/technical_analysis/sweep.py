@@ -0,0 +1,582 @@
+"""
+Sinyal kuralları için paralel parametre taraması.
+
+Gösterge periyotları (MA, RSI, MACD, Bollinger) ve ATR tabanlı zarar durdur/kâr al
+çarpanları için ızgara (`grid`) ya da rastgele (`random_search`) parametre kümeleri
+üretilir; her küme her sembolde `technical_analysis.backtest` ile test edilir.
+
+- Tüm sembollerin OHLC dizileri tek bir paylaşılan bellek bloğuna bir kez kopyalanır;
+  işçi süreçler bloğa başlangıçta bağlanır, görevlerle yalnızca sembol adı ve parametreler
+  gönderilir (veri görev başına pickle edilmez).
+- Görev, bir sembol ve ardışık parametre kümelerinden oluşan bir parçadır; parça içinde
+  aynı periyotlu göstergeler bir kez hesaplanır.
+- Sonuçlar görevler tamamlandıkça döndürülür ve JSON satırları olarak dosyaya eklenir;
+  aynı dosyayla yeniden başlatılan tarama tamamlanmış sonuçları atlar. Her kayıt test
+  ayarlarını (sinyal, aralık, komisyon, kayma, açığa satış) ve sembolün veri aralığını
+  taşır; ayarı ya da verisi farklı kayıtlar yeniden kullanılmaz.
+
+Komut satırından:
+    python -m technical_analysis.sweep --symbols BTCUSDT ETHUSDT --interval 1h --days 365 \\
+        --random 10000 --output sweep.jsonl --end 2025-01-01
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import logging
+import multiprocessing
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import asdict, dataclass, fields, replace
+from multiprocessing import shared_memory
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from technical_analysis import backends, jit, signals
+from technical_analysis.backtest import SIGNAL_NAMES, YEAR_MS, BacktestConfig, backtest
+from utils.intervals import align_open_time, interval_to_ms
+
+logger = logging.getLogger("torypto")
+
+# İşçi süreç sayısı (0: tüm çekirdekler)
+SWEEP_WORKERS = int(os.getenv("SWEEP_WORKERS", "0"))
+# Görev başına parametre kümesi sayısı
+SWEEP_CHUNK_SIZE = int(os.getenv("SWEEP_CHUNK_SIZE", "25"))
+# İşçi süreç başlatma yöntemi (spawn | forkserver | fork)
+SWEEP_START_METHOD = os.getenv("SWEEP_START_METHOD", "spawn")
+
+# Paylaşılan bellekte tutulan fiyat alanları (satır sırası)
+PRICE_FIELDS = ("open", "high", "low", "close")
+
+
+@dataclass(frozen=True)
+class SignalParameters:
+    """
+    Sinyal kurallarının parametreleri; varsayılanlar `TechnicalIndicators.COLUMNS`
+    tanımlarıyla aynıdır (MA 7/25/99, RSI 14, MACD 12/26/9, Bollinger 20/2)
+    """
+    ma_fast: int = 7
+    ma_slow: int = 25
+    ma_long: int = 99
+    rsi_period: int = 14
+    macd_fast: int = 12
+    macd_slow: int = 26
+    macd_signal: int = 9
+    bb_period: int = 20
+    bb_std: float = 2.0
+    stop_atr: float = 2.0
+    take_profit_atr: float = 3.0
+
+    def valid(self) -> bool:
+        """
+        Periyotların pozitif ve sıralı olup olmadığı (hızlı < yavaş)
+        """
+        periods = (self.ma_fast, self.ma_slow, self.ma_long, self.rsi_period,
+                   self.macd_fast, self.macd_slow, self.macd_signal, self.bb_period)
+        return (
+            min(periods) >= 1
+            and self.ma_fast < self.ma_slow < self.ma_long
+            and self.macd_fast < self.macd_slow
+            and self.bb_std > 0
+        )
+
+    def key(self) -> str:
+        """
+        Parametre kümesinin kalıcı anahtarı (sonuç dosyasında devam etmek için)
+        """
+        return json.dumps(asdict(self), sort_keys=True)
+
+
+PARAMETER_NAMES = tuple(field.name for field in fields(SignalParameters))
+
+
+def run_key(signal: str, config: BacktestConfig, interval: str) -> str:
+    """
+    Test ayarlarının kalıcı anahtarı. Zarar durdur ve kâr al parametre kümesinden geldiği
+    için dahil edilmez; sinyal, aralık, komisyon, kayma ve açığa satış değişirse sonuçlar da değişir.
+    """
+    settings = {name: value for name, value in asdict(config).items() if name not in ("stop_atr", "take_profit_atr")}
+    return json.dumps({"signal": signal, "interval": interval, **settings}, sort_keys=True)
+
+
+def data_range(df: pd.DataFrame) -> Dict[str, int]:
+    """
+    Sembol verisinin kimliği: ilk ve son mumun açılış zamanı (epoch ms) ve mum sayısı
+    """
+    index = df.index
+    if isinstance(index, pd.DatetimeIndex):
+        open_times = index.as_unit("ms").asi8
+        return {"start": int(open_times[0]), "end": int(open_times[-1]), "candles": len(df)}
+    return {"start": 0, "end": len(df) - 1, "candles": len(df)}
+
+
+def record_id(record: Mapping[str, Any]) -> Tuple:
+    """
+    Sonuç kaydının devam anahtarı: (ayarlar, parametreler, sembol, veri aralığı)
+    """
+    return record["run"], record["key"], record["symbol"], record["start"], record["end"], record["candles"]
+
+# Komut satırında parametre verilmezse kullanılan arama uzayı
+DEFAULT_SPACE: Dict[str, List[Any]] = {
+    "ma_fast": [5, 7, 9, 12],
+    "ma_slow": [20, 25, 30, 50],
+    "ma_long": [99, 150, 200],
+    "rsi_period": [7, 14, 21],
+    "macd_fast": [8, 12],
+    "macd_slow": [21, 26],
+    "macd_signal": [7, 9],
+    "bb_period": [20, 30],
+    "bb_std": [2.0, 2.5],
+    "stop_atr": [0.0, 1.5, 2.0, 3.0],
+    "take_profit_atr": [0.0, 2.0, 3.0, 4.0],
+}
+
+
+def _check_space(space: Mapping[str, Sequence[Any]]) -> List[str]:
+    unknown = [name for name in space if name not in PARAMETER_NAMES]
+    if unknown:
+        raise ValueError(f"Bilinmeyen parametre(ler): {', '.join(unknown)}. Geçerli: {', '.join(PARAMETER_NAMES)}")
+    return list(space)
+
+
+def grid(space: Mapping[str, Sequence[Any]]) -> List[SignalParameters]:
+    """
+    Arama uzayındaki tüm geçerli parametre kümeleri (belirleyici sırayla)
+
+    Args:
+        space: Parametre adı -> denenecek değerler; verilmeyen parametreler varsayılanında kalır
+
+    Raises:
+        ValueError: Bilinmeyen parametre adı
+    """
+    names = _check_space(space)
+    combos = (SignalParameters(**dict(zip(names, values))) for values in itertools.product(*(space[n] for n in names)))
+    return [combo for combo in combos if combo.valid()]
+
+
+def random_search(space: Mapping[str, Sequence[Any]], count: int, seed: int = 0) -> List[SignalParameters]:
+    """
+    Arama uzayından tekrarsız rastgele geçerli parametre kümeleri. Aynı tohum aynı kümeleri
+    aynı sırayla üretir (yarıda kalan tarama aynı komutla sürdürülebilir).
+
+    Args:
+        space: Parametre adı -> denenecek değerler
+        count: İstenen küme sayısı (geçerli küme sayısı daha azsa hepsi)
+        seed: Rastgele sayı üreteci tohumu
+
+    Raises:
+        ValueError: Bilinmeyen parametre adı
+    """
+    names = _check_space(space)
+    sizes = [len(space[name]) for name in names]
+    total = int(np.prod(sizes, dtype=object))
+    rng = np.random.default_rng(seed)
+    seen = set()
+    result: List[SignalParameters] = []
+    attempts = 0
+    while len(result) < count and len(seen) < total and attempts < 50 * count:
+        attempts += 1
+        picks = tuple(int(rng.integers(size)) for size in sizes)
+        if picks in seen:
+            continue
+        seen.add(picks)
+        combo = SignalParameters(**{name: space[name][i] for name, i in zip(names, picks)})
+        if combo.valid():
+            result.append(combo)
+    return result
+
+
+def signal_inputs(
+    prices: Mapping[str, np.ndarray],
+    params: SignalParameters,
+    cache: Optional[Dict[Tuple, np.ndarray]] = None
+) -> Dict[str, np.ndarray]:
+    """
+    `signals.crossover_signals` alanlarını ve ATR'yi verilen periyotlarla hesaplar.
+    Varsayılan parametrelerde değerler gösterge motorununkilerle aynıdır.
+
+    Args:
+        prices: open/high/low/close dizileri
+        params: Gösterge periyotları
+        cache: (gösterge, periyotlar) -> dizi; aynı fiyat dizileri için paylaşılırsa
+            tekrarlanan göstergeler bir kez hesaplanır
+    """
+    cache = {} if cache is None else cache
+    backend = backends.active_backend()
+    high, low, close = prices["high"], prices["low"], prices["close"]
+
+    def memo(key: Tuple, compute):
+        if key not in cache:
+            cache[key] = compute()
+        return cache[key]
+
+    def sma(period: int) -> np.ndarray:
+        return memo(("sma", period), lambda: pd.Series(close).rolling(window=period).mean().to_numpy())
+
+    macd, macd_signal, _ = memo(
+        ("macd", params.macd_fast, params.macd_slow, params.macd_signal),
+        lambda: backend.macd(close, params.macd_fast, params.macd_slow, params.macd_signal)
+    )
+    std = memo(("std", params.bb_period), lambda: backend.stddev(close, params.bb_period))
+    stoch_k, stoch_d = memo(("stoch",), lambda: backend.stoch(high, low, close, 14, 3, 3))
+    return {
+        "close": close,
+        "ma7": sma(params.ma_fast),
+        "ma25": sma(params.ma_slow),
+        "ma99": sma(params.ma_long),
+        "macd": macd,
+        "macd_signal": macd_signal,
+        "rsi": memo(("rsi", params.rsi_period), lambda: backend.rsi(close, params.rsi_period)),
+        "stoch_k": stoch_k,
+        "stoch_d": stoch_d,
+        "bb_upper": sma(params.bb_period) + params.bb_std * std,
+        "bb_lower": sma(params.bb_period) - params.bb_std * std,
+        "ichimoku_kijun_sen": memo(
+            ("kijun",), lambda: (jit.rolling_max(high, 26) + jit.rolling_min(low, 26)) / 2
+        ),
+        "atr": memo(("atr",), lambda: backend.atr(high, low, close, 14)),
+    }
+
+
+def evaluate(
+    prices: Mapping[str, np.ndarray],
+    params: SignalParameters,
+    signal: str = "overall",
+    config: Optional[BacktestConfig] = None,
+    periods_per_year: Optional[float] = None,
+    cache: Optional[Dict[Tuple, np.ndarray]] = None
+) -> Dict[str, Any]:
+    """
+    Bir parametre kümesini tek sembolün fiyatlarında test eder
+
+    Returns:
+        Dict: `backtest` özet metrikleri
+    """
+    inputs = signal_inputs(prices, params, cache)
+    codes = signals.crossover_signals(inputs)[signal]
+    config = replace(config or BacktestConfig(), stop_atr=params.stop_atr, take_profit_atr=params.take_profit_atr)
+    result = backtest(
+        codes, prices["open"], prices["high"], prices["low"], prices["close"], inputs["atr"],
+        config, periods_per_year
+    )
+    return result.stats
+
+
+# --- İşçi süreç --------------------------------------------------------------------
+
+# İşçi süreçte paylaşılan bellek bloğu ve sembol -> fiyat görünümleri
+_worker: Dict[str, Any] = {}
+
+
+def _attach(name: str, layout: Dict[str, Tuple[int, int]], total: int) -> None:
+    """
+    İşçi süreç başlatıcısı: paylaşılan bloğa bağlanıp sembol başına kopyasız görünümler oluşturur
+    """
+    block = shared_memory.SharedMemory(name=name)
+    data = np.ndarray((len(PRICE_FIELDS), total), dtype=np.float64, buffer=block.buf)
+    data.flags.writeable = False
+    _worker["block"] = block
+    _worker["prices"] = {
+        symbol: {field: data[row, start:end] for row, field in enumerate(PRICE_FIELDS)}
+        for symbol, (start, end) in layout.items()
+    }
+
+
+def _run_task(
+    symbol: str,
+    combos: List[Dict[str, Any]],
+    signal: str,
+    config: BacktestConfig,
+    periods_per_year: Optional[float],
+    identity: Dict[str, Any]
+) -> List[Dict[str, Any]]:
+    """
+    Bir sembolde ardışık parametre kümelerini test eder (göstergeler parça içinde paylaşılır)
+
+    Args:
+        identity: Her kayda eklenen ayar anahtarı ("run") ve veri aralığı
+    """
+    prices = _worker["prices"][symbol]
+    cache: Dict[Tuple, np.ndarray] = {}
+    results = []
+    for values in combos:
+        params = SignalParameters(**values)
+        stats = evaluate(prices, params, signal, config, periods_per_year, cache)
+        results.append({"key": params.key(), "symbol": symbol, **identity, "params": values, **stats})
+    return results
+
+
+# --- Tarama ------------------------------------------------------------------------
+
+def completed_records(output: Optional[str]) -> Iterator[Dict[str, Any]]:
+    """
+    Sonuç dosyasındaki kayıtlar (yarıda kesilmiş son satır atlanır, yeniden hesaplanır)
+    """
+    if not output or not os.path.exists(output):
+        return
+    with open(output, encoding="utf-8") as file:
+        for line in file:
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                continue
+
+
+def completed(output: Optional[str]) -> set:
+    """
+    Sonuç dosyasındaki tamamlanmış kayıtların devam anahtarları (bkz. `record_id`).
+    Ayar ya da veri aralığı bilgisi olmayan (eski biçimli) kayıtlar yok sayılır.
+    """
+    done = set()
+    for record in completed_records(output):
+        try:
+            done.add(record_id(record))
+        except KeyError:
+            continue
+    return done
+
+
+def _open_output(output: str):
+    """
+    Sonuç dosyasını ekleme için açar; yarıda kesilmiş son satır yeni kayıtlarla
+    birleşmesin diye satır sonuyla kapatılır
+    """
+    broken = False
+    if os.path.exists(output) and os.path.getsize(output):
+        with open(output, "rb") as existing:
+            existing.seek(-1, os.SEEK_END)
+            broken = existing.read(1) != b"\n"
+    file = open(output, "a", encoding="utf-8")
+    if broken:
+        file.write("\n")
+    return file
+
+
+def _share(frames: Mapping[str, pd.DataFrame]) -> Tuple[shared_memory.SharedMemory, Dict[str, Tuple[int, int]], int]:
+    """
+    Sembollerin OHLC dizilerini tek paylaşılan bellek bloğuna kopyalar
+    """
+    layout: Dict[str, Tuple[int, int]] = {}
+    total = 0
+    for symbol, df in frames.items():
+        layout[symbol] = (total, total + len(df))
+        total += len(df)
+    block = shared_memory.SharedMemory(create=True, size=max(1, len(PRICE_FIELDS) * total * 8))
+    data = np.ndarray((len(PRICE_FIELDS), total), dtype=np.float64, buffer=block.buf)
+    for symbol, df in frames.items():
+        start, end = layout[symbol]
+        for row, field in enumerate(PRICE_FIELDS):
+            data[row, start:end] = df[field].to_numpy(dtype=float)
+    return block, layout, total
+
+
+def run_sweep(
+    frames: Mapping[str, pd.DataFrame],
+    combos: Sequence[SignalParameters],
+    interval: str,
+    output: Optional[str] = None,
+    signal: str = "overall",
+    config: Optional[BacktestConfig] = None,
+    workers: int = SWEEP_WORKERS,
+    chunk_size: int = SWEEP_CHUNK_SIZE
+) -> Iterator[Dict[str, Any]]:
+    """
+    Parametre kümelerini tüm sembollerde süreç havuzunda test eder; sonuçları görevler
+    tamamlandıkça döndürür
+
+    Args:
+        frames: Sembol -> OHLCV DataFrame
+        combos: Test edilecek parametre kümeleri
+        interval: Mum aralığı (Sharpe oranının yıllıklandırılması için)
+        output: Sonuçların eklendiği JSON satırları dosyası; dosyada aynı ayarlar, parametreler,
+            sembol ve veri aralığıyla tamamlanmış sonuçlar yeniden hesaplanmaz
+        signal: Kullanılacak sinyal (`backtest.SIGNAL_NAMES`)
+        config: Komisyon/kayma/açığa satış ayarları (zarar durdur ve kâr al parametrelerden gelir)
+        workers: İşçi süreç sayısı (0: tüm çekirdekler)
+        chunk_size: Görev başına parametre kümesi sayısı
+
+    Yields:
+        Dict: "key", "symbol", "run" (`run_key`), veri aralığı ("start", "end", "candles"),
+        "params" ve `backtest` özet metrikleri
+
+    Raises:
+        ValueError: Bilinmeyen sinyal adı
+    """
+    if signal not in SIGNAL_NAMES:
+        raise ValueError(f"Bilinmeyen sinyal: {signal}. Geçerli değerler: {', '.join(SIGNAL_NAMES)}")
+    config = config or BacktestConfig()
+    periods_per_year = YEAR_MS / interval_to_ms(interval)
+    frames = {symbol: df for symbol, df in frames.items() if len(df)}
+
+    run = run_key(signal, config, interval)
+    identities = {symbol: {"run": run, **data_range(df)} for symbol, df in frames.items()}
+    done = completed(output)
+    tasks = []
+    skipped = 0
+    for symbol, identity in identities.items():
+        pending = [
+            asdict(combo) for combo in combos
+            if record_id({"key": combo.key(), "symbol": symbol, **identity}) not in done
+        ]
+        skipped += len(combos) - len(pending)
+        tasks.extend((symbol, pending[i:i + chunk_size]) for i in range(0, len(pending), chunk_size))
+    if done:
+        logger.info(f"Tarama sürdürülüyor: {skipped} sonuç mevcut ({len(done) - skipped} kayıt farklı "
+                    f"ayar/veriye ait, yeniden kullanılmaz), {len(tasks)} görev kaldı")
+    if not tasks:
+        return
+
+    block, layout, total = _share(frames)
+    workers = workers or os.cpu_count() or 1
+    pool = ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context(SWEEP_START_METHOD),
+        initializer=_attach,
+        initargs=(block.name, layout, total),
+    )
+    file = _open_output(output) if output else None
+    try:
+        queue = iter(tasks)
+        running = set()
+        while True:
+            # Bellekte tüm görevler yerine işçi başına iki görev beklesin
+            for symbol, chunk in itertools.islice(queue, 2 * workers - len(running)):
+                running.add(pool.submit(
+                    _run_task, symbol, chunk, signal, config, periods_per_year, identities[symbol]
+                ))
+            if not running:
+                break
+            finished, running = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                results = future.result()
+                if file:
+                    file.writelines(json.dumps(record) + "\n" for record in results)
+                    file.flush()
+                yield from results
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+        if file:
+            file.close()
+        block.close()
+        block.unlink()
+
+
+def summarize(results: Sequence[Mapping[str, Any]], sort_by: str = "sharpe") -> pd.DataFrame:
+    """
+    Test ayarları ve parametre kümesi başına semboller üzerinden ortalama metrikler.
+    Farklı ayarlarla yapılmış taramalar ayrı satırlarda özetlenir; birden fazla ayar varsa
+    ayar sütunları (sinyal, aralık, komisyon, ...) da eklenir.
+
+    Returns:
+        pd.DataFrame: Parametre sütunları, sembol sayısı ve ortalama getiri/Sharpe/düşüş/
+        kazanma oranı ile toplam işlem sayısı; `sort_by` ortalamasına göre azalan sırada
+    """
+    if not results:
+        return pd.DataFrame()
+    df = pd.DataFrame(results)
+    if "run" not in df.columns:
+        df["run"] = "{}"
+    df["run"] = df["run"].fillna("{}")
+    grouped = df.groupby(["run", "key"], sort=False)
+    summary = grouped.agg(
+        symbols=("symbol", "nunique"),
+        total_return=("total_return", "mean"),
+        sharpe=("sharpe", "mean"),
+        max_drawdown=("max_drawdown", "mean"),
+        win_rate=("win_rate", "mean"),
+        trades=("trades", "sum"),
+    )
+    parts = [pd.DataFrame([json.loads(key) for _, key in summary.index], index=summary.index)]
+    if summary.index.get_level_values("run").nunique() > 1:
+        parts.insert(0, pd.DataFrame([json.loads(run) for run, _ in summary.index], index=summary.index))
+    return pd.concat([*parts, summary], axis=1).sort_values(sort_by, ascending=False).reset_index(drop=True)
+
+
+# --- Komut satırı --------------------------------------------------------------------
+
+def _parse_space(items: Sequence[str]) -> Dict[str, List[Any]]:
+    """
+    "ad=değer1,değer2" biçimindeki parametreleri arama uzayına dönüştürür
+    """
+    space: Dict[str, List[Any]] = {}
+    types = {field.name: field.type for field in fields(SignalParameters)}
+    for item in items:
+        name, _, values = item.partition("=")
+        if name not in types or not values:
+            raise ValueError(f"Geçersiz parametre: {item}. Biçim: ad=değer1,değer2 ({', '.join(PARAMETER_NAMES)})")
+        cast = float if types[name] in (float, "float") else int
+        space[name] = [cast(value) for value in values.split(",")]
+    return space
+
+
+def _parse_end(value: Optional[str], interval: str) -> int:
+    """
+    Veri aralığının bitişi (epoch ms). Verilmezse son kapanmış mum; aynı bitişle yeniden
+    çalıştırılan tarama aynı veriyi yükler ve kaldığı yerden sürer.
+    """
+    if value is None:
+        return align_open_time(int(time.time() * 1000), interval) - 1
+    if value.isdigit():
+        return int(value)
+    return int(pd.Timestamp(value, tz="UTC").timestamp() * 1000) - 1
+
+
+async def _load(symbols: Sequence[str], interval: str, days: int, end_time: int) -> Dict[str, pd.DataFrame]:
+    from services.binance_service import BinanceService
+
+    service = BinanceService()
+    start_time = end_time + 1 - days * 24 * 60 * 60 * 1000
+    histories = await asyncio.gather(
+        *(service.get_historical_klines(symbol, interval, start_time, end_time) for symbol in symbols)
+    )
+    return {symbol.upper(): history["klines"] for symbol, history in zip(symbols, histories)}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Sinyal parametre taraması")
+    parser.add_argument("--symbols", nargs="+", required=True, help="Semboller")
+    parser.add_argument("--interval", default="1h", help="Mum aralığı")
+    parser.add_argument("--days", type=int, default=365, help="Geçmiş veri (gün)")
+    parser.add_argument("--end", default=None,
+                        help="Veri bitişi: YYYY-MM-DD ya da epoch ms (varsayılan: son kapanmış mum). "
+                             "Tarama sonraki günlerde sürdürülecekse sabitlenmelidir")
+    parser.add_argument("--param", action="append", default=[], help="Arama uzayı: ad=değer1,değer2 (tekrarlanabilir)")
+    parser.add_argument("--random", type=int, default=0, help="Rastgele arama küme sayısı (0: tam ızgara)")
+    parser.add_argument("--seed", type=int, default=0, help="Rastgele arama tohumu")
+    parser.add_argument("--signal", default="overall", help=f"Sinyal: {', '.join(SIGNAL_NAMES)}")
+    parser.add_argument("--allow-short", action="store_true", help="SAT sinyalinde açığa satış")
+    parser.add_argument("--workers", type=int, default=SWEEP_WORKERS, help="İşçi süreç sayısı (0: tüm çekirdekler)")
+    parser.add_argument("--output", default="sweep.jsonl", help="Sonuç dosyası (varsa kaldığı yerden sürdürülür)")
+    parser.add_argument("--top", type=int, default=20, help="Gösterilecek en iyi küme sayısı")
+    args = parser.parse_args()
+
+    space = _parse_space(args.param) if args.param else DEFAULT_SPACE
+    combos = random_search(space, args.random, args.seed) if args.random else grid(space)
+    frames = asyncio.run(_load(args.symbols, args.interval, args.days, _parse_end(args.end, args.interval)))
+    config = BacktestConfig(allow_short=args.allow_short)
+
+    started = time.perf_counter()
+    total = len(combos) * len(frames)
+    count = 0
+    for count, _ in enumerate(run_sweep(frames, combos, args.interval, args.output, args.signal, config,
+                                        args.workers), start=1):
+        if count % 100 == 0:
+            print(f"\r{count} yeni sonuç / {total} ({time.perf_counter() - started:.0f} s)", end="", flush=True)
+    print(f"\r{count} yeni sonuç / {total} ({time.perf_counter() - started:.0f} s)")
+
+    # Yalnızca bu taramanın ayarları, parametreleri ve verisiyle üretilmiş kayıtlar özetlenir
+    run = run_key(args.signal, config, args.interval)
+    wanted = {
+        record_id({"run": run, "key": combo.key(), "symbol": symbol, **data_range(df)})
+        for symbol, df in frames.items() if len(df) for combo in combos
+    }
+    results = [record for record in completed_records(args.output) if record_id(record) in wanted]
+    with pd.option_context("display.width", 200, "display.max_columns", None):
+        print(summarize(results).head(args.top).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,8 @@
+"""
+Testler `backend/` dizininden çalıştırılır (`python -m pytest tests`); modüller
+`backend/` köküne göre içe aktarılır.
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,176 @@
+"""
+Testlerde paylaşılan sabit tohumlu veri üreteçleri ve satır satır referans uygulamalar.
+`benchmarks` script'lerinden bağımsızdır; testler yalnızca bu modüle ve uygulama koduna dayanır.
+"""
+from typing import Callable, Dict, List
+
+import numpy as np
+import pandas as pd
+
+from technical_analysis import jit, kernels
+from technical_analysis.backends import Backend
+
+# Arka uç karşılaştırmalarında kullanılan tolerans
+RTOL = 1e-8
+ATOL = 1e-8
+
+Arrays = Dict[str, np.ndarray]
+
+
+def make_close(candles: int, seed: int = 42) -> pd.Series:
+    rng = np.random.default_rng(seed)
+    return pd.Series(30000 * np.exp(np.cumsum(rng.normal(0, 0.001, candles))))
+
+
+def make_ohlcv(candles: int, seed: int = 42) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 30000 * np.exp(np.cumsum(rng.normal(0, 0.001, candles)))
+    # Değişmeyen kapanışları ve yüksek == düşük mumlarını da içersin
+    unchanged = np.flatnonzero(rng.random(candles) < 0.05)
+    unchanged = unchanged[unchanged > 0]
+    close[unchanged] = close[unchanged - 1]
+    open_ = np.concatenate(([close[0]], close[:-1]))
+    high = np.maximum(open_, close) * (1 + np.abs(rng.normal(0, 0.0005, candles)))
+    low = np.minimum(open_, close) * (1 - np.abs(rng.normal(0, 0.0005, candles)))
+    flat = rng.random(candles) < 0.01
+    high[flat] = low[flat] = close[flat]
+    volume = rng.lognormal(3, 1, candles)
+    return pd.DataFrame({
+        "open": open_,
+        "high": high,
+        "low": low,
+        "close": close,
+        "volume": volume,
+        "taker_buy_base_asset_volume": volume * rng.uniform(0.3, 0.7, candles),
+    })
+
+
+def with_time_index(df: pd.DataFrame, step_ms: int) -> pd.DataFrame:
+    """
+    Sıfırdan başlayan, `step_ms` aralıklı açılış zamanı indeksi ekler
+    """
+    df = df.copy()
+    df.index = pd.DatetimeIndex(pd.to_datetime(np.arange(len(df)) * step_ms, unit="ms"), name="timestamp")
+    return df
+
+
+def arrays(df: pd.DataFrame) -> Arrays:
+    return {column: df[column].to_numpy(dtype=float) for column in ("open", "high", "low", "close", "volume")}
+
+
+def legacy_rsi(series: pd.Series, period: int = 14) -> pd.Series:
+    """
+    Önceki sürümdeki döngülü RSI (referans)
+    """
+    delta = series.diff()
+    gain = delta.where(delta > 0, 0)
+    loss = -delta.where(delta < 0, 0)
+    avg_gain = gain.rolling(window=period).mean()
+    avg_loss = loss.rolling(window=period).mean()
+    for i in range(period, len(series)):
+        avg_gain.iloc[i] = (avg_gain.iloc[i-1] * (period-1) + gain.iloc[i]) / period
+        avg_loss.iloc[i] = (avg_loss.iloc[i-1] * (period-1) + loss.iloc[i]) / period
+    rs = avg_gain / avg_loss
+    return 100 - (100 / (1 + rs))
+
+
+def reference_obv(df: pd.DataFrame) -> np.ndarray:
+    """
+    Önceki sürümdeki döngülü OBV
+    """
+    close = df['close']
+    volume = df['volume']
+    obv = pd.Series(index=df.index, dtype=float)
+    obv.iloc[0] = 0
+    for i in range(1, len(close)):
+        if close.iloc[i] > close.iloc[i-1]:
+            obv.iloc[i] = obv.iloc[i-1] + volume.iloc[i]
+        elif close.iloc[i] < close.iloc[i-1]:
+            obv.iloc[i] = obv.iloc[i-1] - volume.iloc[i]
+        else:
+            obv.iloc[i] = obv.iloc[i-1]
+    return obv.to_numpy()
+
+
+def _money_flow_volume(df: pd.DataFrame) -> List[float]:
+    values = []
+    for high, low, close, volume in zip(df['high'], df['low'], df['close'], df['volume']):
+        multiplier = ((close - low) - (high - close)) / (high - low) if high != low else 0.0
+        values.append(multiplier * volume)
+    return values
+
+
+def reference_ad(df: pd.DataFrame) -> np.ndarray:
+    ad, total = [], 0.0
+    for value in _money_flow_volume(df):
+        total += value
+        ad.append(total)
+    return np.array(ad)
+
+
+def reference_cmf(df: pd.DataFrame, period: int = 20) -> np.ndarray:
+    flow = _money_flow_volume(df)
+    volume = df['volume'].tolist()
+    cmf = np.full(len(flow), np.nan)
+    for i in range(period - 1, len(flow)):
+        cmf[i] = sum(flow[i - period + 1:i + 1]) / sum(volume[i - period + 1:i + 1])
+    return cmf
+
+
+def reference_cvd(df: pd.DataFrame) -> np.ndarray:
+    cvd, total = [], 0.0
+    for buy, volume in zip(df['taker_buy_base_asset_volume'], df['volume']):
+        total += buy - (volume - buy)
+        cvd.append(total)
+    return np.array(cvd)
+
+
+def legacy_wilder(series: pd.Series, period: int) -> pd.Series:
+    """
+    Önceki `TechnicalIndicators.wilder_smoothing` (pandas Series üzerinde ewm)
+    """
+    result = pd.Series(np.nan, index=series.index, dtype=float)
+    tail = series.iloc[period-1:].astype(float)
+    tail.iloc[0] = series.iloc[:period].mean()
+    result.iloc[period-1:] = tail.ewm(alpha=1/period, adjust=False).mean().to_numpy()
+    return result
+
+
+def true_range(df: pd.DataFrame) -> np.ndarray:
+    high, low, close = (df[column].to_numpy() for column in ("high", "low", "close"))
+    previous = np.roll(close, 1)
+    result = np.maximum(high - low, np.maximum(np.abs(high - previous), np.abs(low - previous)))
+    result[0] = high[0] - low[0]
+    return result
+
+
+# Gösterge adı -> arka uç ve OHLCV dizileriyle çağrı
+BACKEND_CALLS: Dict[str, Callable[[Backend, Arrays], object]] = {
+    "ema(25)": lambda b, a: b.ema(a["close"], 25),
+    "rsi(14)": lambda b, a: b.rsi(a["close"], 14),
+    "macd(12,26,9)": lambda b, a: b.macd(a["close"], 12, 26, 9),
+    "stddev(20)": lambda b, a: b.stddev(a["close"], 20),
+    "atr(14)": lambda b, a: b.atr(a["high"], a["low"], a["close"], 14),
+    "stoch(14,3,3)": lambda b, a: b.stoch(a["high"], a["low"], a["close"], 14, 3, 3),
+    "dmi/adx(14)": lambda b, a: b.dmi(a["high"], a["low"], a["close"], 14),
+    "cci(14)": lambda b, a: b.cci(a["high"], a["low"], a["close"], 14),
+    "obv": lambda b, a: b.obv(a["close"], a["volume"]),
+    "sar(0.02,0.2)": lambda b, a: b.sar(a["high"], a["low"], 0.02, 0.2),
+}
+
+
+def jit_kernels(df: pd.DataFrame) -> Dict[str, Callable[[], object]]:
+    """
+    Etkin `jit` arka ucuyla çalışan yola bağımlı çekirdek çağrıları
+    """
+    high, low, close = (df[column].to_numpy() for column in ("high", "low", "close"))
+    ranges = true_range(df)
+    atr = kernels.atr(ranges, 10)
+    return {
+        "wilder": lambda: kernels.wilder(close, 14),
+        "dmi/adx": lambda: kernels.dmi(high, low, ranges, 14),
+        "rolling max/min": lambda: (jit.rolling_max(high, 52), jit.rolling_min(low, 52)),
+        "psar": lambda: jit.psar(high, low),
+        "supertrend": lambda: jit.supertrend(high, low, close, atr),
+        "pivot scan": lambda: jit.pivots(high, low, 10),
+    }
@@ -0,0 +1,88 @@
+"""
+Gösterge arka uçları (talib, numba, numpy) ve `jit` çekirdekleri: her arka uç numpy arka
+ucuyla tolerans içinde (NaN konumları dahil) aynı değerleri, numba ve numpy `jit` yolları
+birebir aynı değerleri üretir. Bu ortamda kurulu olmayan arka uçlar atlanır.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from technical_analysis import backends, jit, kernels
+from technical_analysis.indicators import TechnicalIndicators as TAIndicators
+from tests.helpers import ATOL, BACKEND_CALLS, RTOL, arrays, jit_kernels, legacy_wilder, make_ohlcv, true_range
+
+try:
+    import talib
+except ImportError:
+    talib = None
+
+
+@pytest.fixture(scope="module")
+def df():
+    return make_ohlcv(3000, seed=5)
+
+
+@pytest.fixture(autouse=True)
+def restore_backends():
+    yield
+    backends.use_backend(backends.INDICATOR_BACKEND)
+    jit.set_backend(jit.JIT_MODE)
+
+
+def _backend(name: str) -> backends.Backend:
+    if name not in backends.BACKENDS:
+        pytest.skip(f"{name} arka ucu bu ortamda kurulu değil")
+    return backends.use_backend(name)
+
+
+def _outputs(result):
+    return tuple(result) if isinstance(result, tuple) else (result,)
+
+
+def _assert_close(got, want, message: str) -> None:
+    np.testing.assert_array_equal(np.isnan(got), np.isnan(want), err_msg=f"{message}: NaN konumları")
+    np.testing.assert_allclose(got, want, rtol=RTOL, atol=ATOL, equal_nan=True, err_msg=message)
+
+
+@pytest.mark.parametrize("indicator", list(BACKEND_CALLS))
+@pytest.mark.parametrize("name", backends.PREFERENCE)
+def test_backend_matches_numpy(df, name, indicator):
+    data = arrays(df)
+    expected = _outputs(BACKEND_CALLS[indicator](backends.use_backend("numpy"), data))
+    got = _outputs(BACKEND_CALLS[indicator](_backend(name), data))
+    assert len(got) == len(expected)
+    for index, (values, want) in enumerate(zip(got, expected)):
+        _assert_close(np.asarray(values, dtype=float), want, f"{name} {indicator} çıktı {index}")
+
+
+@pytest.mark.parametrize("name", backends.PREFERENCE)
+def test_indicator_table_matches_numpy(df, name):
+    backends.use_backend("numpy")
+    expected = TAIndicators.add_all_indicators(df)
+    _backend(name)
+    pd.testing.assert_frame_equal(TAIndicators.add_all_indicators(df), expected, rtol=RTOL, atol=ATOL)
+
+
+@pytest.mark.parametrize("kernel", list(jit_kernels(make_ohlcv(10))))
+def test_jit_numba_matches_numpy(df, kernel):
+    if not jit.numba_available():
+        pytest.skip("numba bu ortamda kurulu değil")
+    call = jit_kernels(df)[kernel]
+    jit.set_backend("numpy")
+    expected = np.asarray(call(), dtype=float)
+    jit.set_backend("numba")
+    np.testing.assert_array_equal(np.asarray(call(), dtype=float), expected)
+
+
+def test_jit_matches_pandas_references(df):
+    np.testing.assert_array_equal(kernels.wilder(df["close"].to_numpy(), 14), legacy_wilder(df["close"], 14).to_numpy())
+    np.testing.assert_array_equal(jit.rolling_max(df["high"].to_numpy(), 52), df["high"].rolling(window=52).max().to_numpy())
+    np.testing.assert_array_equal(jit.rolling_min(df["low"].to_numpy(), 52), df["low"].rolling(window=52).min().to_numpy())
+
+
+@pytest.mark.skipif(talib is None, reason="TA-Lib bu ortamda kurulu değil")
+def test_jit_matches_talib(df):
+    high, low, close = (df[column].to_numpy() for column in ("high", "low", "close"))
+    np.testing.assert_allclose(jit.psar(high, low), talib.SAR(high, low, 0.02, 0.2), rtol=1e-9, equal_nan=True)
+    np.testing.assert_allclose(kernels.dmi(high, low, true_range(df), 14)[2], talib.ADX(high, low, close, 14),
+                               rtol=1e-9, atol=1e-9, equal_nan=True)
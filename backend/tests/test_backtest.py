@@ -0,0 +1,162 @@
+"""
+Geriye dönük test döngüsü: sinyal bir sonraki mumun açılışında işleme dönüşür, komisyon ve
+kayma iki tarafta uygulanır, ATR'ye göre zarar durdur/kâr al mum içinde denetlenir (ikisi
+birden tetiklenirse zarar durdur), açığa satış `allow_short` ile açılır; numba ve numpy
+döngüleri birebir aynı sonucu verir.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from technical_analysis import jit
+from technical_analysis.backtest import BacktestConfig, backtest, run_backtest
+from tests.helpers import make_ohlcv, with_time_index
+
+OPEN = np.array([100.0, 100, 102, 104, 106, 108, 110])
+CLOSE = OPEN + 1
+HIGH = CLOSE + 0.5
+LOW = OPEN - 0.5
+ATR = np.full(len(OPEN), 1.0)
+# 1. mumda AL -> 2. mumun açılışında (102) giriş; 4. mumda SAT -> 5. mumun açılışında (108) çıkış
+SIGNAL = np.array([0, 1, 0, 0, -1, 0, 0])
+
+
+def _config(**kwargs) -> BacktestConfig:
+    values = {"fee": 0.0, "slippage": 0.0, "stop_atr": 0.0, "take_profit_atr": 0.0}
+    values.update(kwargs)
+    return BacktestConfig(**values)
+
+
+def _exits(result):
+    return result.trades[["exit_index", "exit_price", "reason"]].values.tolist()
+
+
+@pytest.fixture(autouse=True, params=["numpy", "numba"])
+def loop_backend(request):
+    if request.param == "numba" and not jit.numba_available():
+        pytest.skip("numba bu ortamda kurulu değil")
+    jit.set_backend(request.param)
+    yield request.param
+    jit.set_backend(jit.JIT_MODE)
+
+
+def test_signal_fills_at_next_open():
+    result = backtest(SIGNAL, OPEN, HIGH, LOW, CLOSE, ATR, _config())
+    assert result.trades[["entry_index", "entry_price", "side"]].values.tolist() == [[2, 102.0, 1]]
+    assert _exits(result) == [[5, 108.0, 0]]
+    assert result.trades["return"].tolist() == [108 / 102 - 1]
+    assert result.position.tolist() == [0, 0, 1, 1, 1, 0, 0]
+    np.testing.assert_allclose(result.equity[2:5], CLOSE[2:5] / 102)
+    assert result.equity[-1] == result.equity[5] == 108 / 102
+    assert result.stats["trades"] == 1 and result.stats["open_position"] == 0
+
+
+def test_fee_and_slippage_on_both_sides():
+    # Giriş aleyhe 102 * 1.001, çıkış 108 * 0.999; komisyon iki tarafta %0.1
+    result = backtest(SIGNAL, OPEN, HIGH, LOW, CLOSE, ATR, _config(fee=0.001, slippage=0.001))
+    expected = 0.999 * 0.999 * (108 * 0.999) / (102 * 1.001) - 1
+    np.testing.assert_allclose(result.trades["entry_price"], [102 * 1.001])
+    np.testing.assert_allclose(result.trades["exit_price"], [108 * 0.999])
+    np.testing.assert_allclose(result.trades["return"], [expected])
+    np.testing.assert_allclose(result.equity[-1], 1 + expected)
+
+
+def test_atr_stop_loss():
+    # Giriş 102, ATR 1 -> durdurma 100; 3. mumun düşüğü 99 (açılış 101)
+    low = LOW.copy()
+    low[3] = 99.0
+    open_ = OPEN.copy()
+    open_[3] = 101.0
+    result = backtest(SIGNAL, open_, HIGH, low, CLOSE, ATR, _config(stop_atr=2.0))
+    assert _exits(result) == [[3, 100.0, 1]]
+    assert result.position.tolist() == [0, 0, 1, 0, 0, 0, 0]
+
+    # Açılış durdurmanın altındaysa (boşluk) açılıştan çıkılır
+    open_[3] = 99.5
+    result = backtest(SIGNAL, open_, HIGH, low, CLOSE, ATR, _config(stop_atr=2.0))
+    assert _exits(result) == [[3, 99.5, 1]]
+
+    # Durdurma gerçekleşen girişten (102 * 1.001) ölçülür ve piyasa emridir: kayma aleyhe
+    open_[3] = 101.0
+    result = backtest(SIGNAL, open_, HIGH, low, CLOSE, ATR, _config(stop_atr=2.0, slippage=0.001))
+    np.testing.assert_allclose(result.trades["exit_price"], [(102 * 1.001 - 2) * 0.999])
+
+
+def test_atr_take_profit():
+    # Giriş 102, hedef 102 + 3 = 105; 3. mumun yükseği 105.5
+    result = backtest(SIGNAL, OPEN, HIGH, LOW, CLOSE, ATR, _config(take_profit_atr=3.0))
+    assert _exits(result) == [[3, 105.0, 2]]
+
+    # Hedef limit emirdir: gerçekleşen girişten (102 * 1.001) ölçülür, çıkışta kayma yok
+    result = backtest(SIGNAL, OPEN, HIGH, LOW, CLOSE, ATR, _config(take_profit_atr=3.0, slippage=0.001))
+    assert result.trades[["exit_index", "reason"]].values.tolist() == [[3, 2]]
+    np.testing.assert_allclose(result.trades["exit_price"], [102 * 1.001 + 3])
+
+
+def test_stop_wins_when_stop_and_target_hit_in_same_bar():
+    # 3. mum hem durdurmaya (100) hem hedefe (105) dokunur; mum içi sıra bilinmediğinden
+    # kötümser varsayımla zarar durdur uygulanır
+    low = LOW.copy()
+    low[3] = 99.0
+    open_ = OPEN.copy()
+    open_[3] = 101.0
+    assert HIGH[3] >= 105
+    result = backtest(SIGNAL, open_, HIGH, low, CLOSE, ATR, _config(stop_atr=2.0, take_profit_atr=3.0))
+    assert _exits(result) == [[3, 100.0, 1]]
+
+
+def test_short_requires_allow_short():
+    result = backtest(SIGNAL, OPEN, HIGH, LOW, CLOSE, ATR, _config())
+    assert (result.position >= 0).all()
+
+    # SAT sinyali uzun pozisyonu kapatıp 5. mumun açılışında (108) kısa pozisyon açar
+    result = backtest(SIGNAL, OPEN, HIGH, LOW, CLOSE, ATR, _config(allow_short=True))
+    assert result.trades["side"].tolist() == [1]
+    assert result.position.tolist() == [0, 0, 1, 1, 1, -1, -1]
+    np.testing.assert_allclose(result.equity[-1], (108 / 102) * (2 - CLOSE[-1] / 108))
+    assert result.stats["open_position"] == -1
+
+
+def test_short_stop_and_target():
+    # 1. mumda SAT -> 2. mumun açılışında (102) kısa giriş; durdurma 104, hedef 99
+    signal = np.array([0, -1, 0, 0, 0, 0, 0])
+    config = _config(stop_atr=2.0, allow_short=True)
+    result = backtest(signal, OPEN, HIGH, LOW, CLOSE, ATR, config)
+    assert result.trades["side"].tolist() == [-1]
+    assert _exits(result) == [[3, 104.0, 1]]
+    np.testing.assert_allclose(result.trades["return"], [2 - 104 / 102 - 1])
+
+    # Düşen seride giriş 106 (2. mumun açılışı), hedef 103; 3. mumun düşüğü 103.5.
+    # 4. mum hedefin altında (102) açılır: boşlukta açılıştan çıkılır
+    falling = OPEN[::-1].copy()
+    config = _config(take_profit_atr=3.0, allow_short=True)
+    result = backtest(signal, falling, falling + 1.5, falling - 0.5, falling + 1, ATR, config)
+    assert _exits(result) == [[4, 102.0, 2]]
+    np.testing.assert_allclose(result.trades["return"], [2 - 102 / 106 - 1])
+
+
+def test_input_validation():
+    with pytest.raises(ValueError):
+        backtest(SIGNAL[:-1], OPEN, HIGH, LOW, CLOSE, ATR)
+    with pytest.raises(ValueError):
+        backtest(SIGNAL[:0], OPEN[:0], HIGH[:0], LOW[:0], CLOSE[:0], ATR[:0])
+
+
+@pytest.mark.parametrize("config", [
+    BacktestConfig(),
+    BacktestConfig(allow_short=True, stop_atr=1.0, take_profit_atr=1.5),
+], ids=["long", "short"])
+def test_loop_matches_numpy_backend(loop_backend, config):
+    if loop_backend == "numpy":
+        pytest.skip("numpy döngüsü referanstır")
+    df = with_time_index(make_ohlcv(5000, seed=17), 60_000)
+    jit.set_backend("numpy")
+    expected = run_backtest(df, "1m", config=config)
+    jit.set_backend(loop_backend)
+    got = run_backtest(df, "1m", config=config)
+    # Tüm çıkış nedenleri karşılaştırmaya girer
+    assert len(expected.trades) > 100 and set(expected.trades["reason"]) == {0, 1, 2}
+    np.testing.assert_array_equal(got.equity, expected.equity)
+    np.testing.assert_array_equal(got.position, expected.position)
+    pd.testing.assert_frame_equal(got.trades, expected.trades)
+    assert got.stats == expected.stats
@@ -0,0 +1,99 @@
+"""
+İmzalı istekler: zaman damgası ve imza hız sınırlayıcı beklemesinden sonra eklenir,
+recvWindow hatasında (-1021) istek yeniden imzalanıp gönderilir.
+"""
+import asyncio
+import time
+
+import pytest
+
+from data import binance_client as module
+from data.binance_client import BinanceClient
+
+
+class FakeResponse:
+    def __init__(self, status, body):
+        self.status = status
+        self.body = body
+        self.headers = {}
+        self.reason = "Bad Request"
+
+    async def json(self):
+        return self.body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class FakeSession:
+    closed = False
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.sent = []
+
+    def request(self, method, url, params=None, headers=None):
+        self.sent.append((time.time() * 1000, dict(params)))
+        return self.responses.pop(0)
+
+
+@pytest.fixture
+def client(monkeypatch):
+    instance = BinanceClient()
+    monkeypatch.setattr(instance, "API_KEY", "key")
+    monkeypatch.setattr(instance, "API_SECRET", "secret")
+    acquired = []
+
+    async def acquire(weight, priority=0):
+        # Düşük öncelikli isteğin kuyrukta beklemesi
+        await asyncio.sleep(0.05)
+        acquired.append(int(time.time() * 1000))
+
+    monkeypatch.setattr(module.binance_rate_limiter, "acquire", acquire)
+    monkeypatch.setattr(module.binance_rate_limiter, "update_from_headers", lambda headers: None)
+    yield instance, acquired
+    instance._session = None
+
+
+def test_timestamp_is_stamped_after_acquire(client):
+    instance, acquired = client
+    session = FakeSession([FakeResponse(200, {"ok": True})])
+    instance._session = session
+    params = {"symbol": "BTCUSDT"}
+
+    assert asyncio.run(instance._request("GET", "/api/v3/account", params, signed=True)) == {"ok": True}
+    (sent_at, sent), = session.sent
+    assert acquired[0] <= sent["timestamp"] <= sent_at
+    assert sent["signature"] == instance._generate_signature(
+        {key: value for key, value in sent.items() if key != "signature"}
+    )
+    # Çağıranın parametreleri değiştirilmez
+    assert params == {"symbol": "BTCUSDT"}
+
+
+def test_recv_window_rejection_is_resigned(client):
+    instance, acquired = client
+    session = FakeSession([
+        FakeResponse(400, {"code": -1021, "msg": "Timestamp for this request is outside of the recvWindow."}),
+        FakeResponse(200, {"ok": True}),
+    ])
+    instance._session = session
+
+    assert asyncio.run(instance._request("GET", "/api/v3/account", {}, signed=True)) == {"ok": True}
+    first, second = (sent for _, sent in session.sent)
+    assert len(acquired) == 2
+    assert second["timestamp"] >= acquired[1] > first["timestamp"]
+    assert second["signature"] != first["signature"]
+
+
+def test_other_errors_are_not_retried(client):
+    instance, _ = client
+    session = FakeSession([FakeResponse(400, {"code": -1100, "msg": "Illegal characters"})])
+    instance._session = session
+
+    with pytest.raises(Exception, match="-1100"):
+        asyncio.run(instance._request("GET", "/api/v3/account", {}, signed=True))
+    assert len(session.sent) == 1
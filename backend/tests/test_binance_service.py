@@ -0,0 +1,78 @@
+"""
+Mum deposu: disk G/Ç'si (kapsama okuma, yazma, memmap okuma) olay döngüsü dışında yapılır;
+ikinci istek aynı aralığı depodan okur.
+"""
+import asyncio
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from data.kline_store import KlineStore
+from services import binance_service
+from services.binance_service import BinanceService
+from utils.klines import KLINE_COLUMNS
+
+STEP = 60_000
+
+
+def _columns(start: int, end: int):
+    open_time = np.arange(start, end + 1, STEP, dtype=np.int64)
+    price = 100 + (open_time // STEP % 50).astype(float)
+    columns = {name: price.astype(dtype) for name, dtype in KLINE_COLUMNS.items()}
+    columns["open_time"] = open_time
+    columns["close_time"] = open_time + STEP - 1
+    return columns
+
+
+@pytest.fixture
+def store(monkeypatch, tmp_path):
+    loop_threads = set()
+    store_threads = []
+
+    class RecordingStore(KlineStore):
+        def missing_ranges(self, *args, **kwargs):
+            store_threads.append(threading.get_ident())
+            return super().missing_ranges(*args, **kwargs)
+
+        def write(self, *args, **kwargs):
+            store_threads.append(threading.get_ident())
+            return super().write(*args, **kwargs)
+
+        def read(self, *args, **kwargs):
+            store_threads.append(threading.get_ident())
+            return super().read(*args, **kwargs)
+
+    requests = []
+
+    async def fake_get(self, endpoint, params=None, priority=0, decode=None):
+        loop_threads.add(threading.get_ident())
+        requests.append(params)
+        end = params.get("endTime", params["startTime"] + (params["limit"] - 1) * STEP)
+        return _columns(params["startTime"], min(end, int(time.time() * 1000)) // STEP * STEP)
+
+    monkeypatch.setattr(binance_service, "kline_store", RecordingStore(str(tmp_path)))
+    monkeypatch.setattr(binance_service, "KLINE_STORE_ENABLED", True)
+    monkeypatch.setattr(BinanceService, "_get", fake_get)
+    return loop_threads, store_threads, requests
+
+
+def test_store_io_runs_off_the_event_loop(store):
+    loop_threads, store_threads, requests = store
+    service = BinanceService()
+    now = int(time.time() * 1000)
+
+    async def scenario():
+        first = await service.get_historical_klines("BTCUSDT", "1m", now - 3000 * STEP, now)
+        fetched = len(requests)
+        second = await service.get_historical_klines("BTCUSDT", "1m", now - 3000 * STEP, now)
+        klines = await service.get_klines("BTCUSDT", "1m", limit=500)
+        return first, second, fetched, klines
+
+    first, second, fetched, klines = asyncio.run(scenario())
+    assert store_threads and not loop_threads & set(store_threads)
+    assert len(first["klines"]) == len(second["klines"]) >= 2999
+    # İkinci istekte kapanmış mumlar depodan okunur, yalnızca açık mum(lar) çekilir
+    assert len(requests) - fetched <= 2
+    assert len(klines) == 500
@@ -0,0 +1,73 @@
+"""
+Birleşik akış bağlantıları: yarı açık bağlantıda okuma zaman aşımı yeniden bağlanmaya
+yol açar; yeniden bağlanmada boşluk doldurma akış başına hataya dayanıklıdır ve
+`BACKFILL_LIMIT`'ten uzun boşlukları sayfalar.
+"""
+import asyncio
+import time
+
+from data.binance_streams import BACKFILL_LIMIT, CombinedStreamConnection, StreamMultiplexer
+
+STEP = 60_000
+
+
+def _row(open_time: int):
+    return [open_time, "1", "2", "0.5", "1.5", "10", open_time + STEP - 1, "15", 0, 5, "7.5", "0"]
+
+
+def test_backfill_pages_and_isolates_stream_errors():
+    now = int(time.time() * 1000) // STEP * STEP
+    last_seen = now - 2500 * STEP
+    requested = []
+
+    async def backfill(symbol, interval, start_time):
+        requested.append((symbol, start_time))
+        if symbol == "ETHUSDT":
+            raise RuntimeError("REST hatası")
+        first = -(-start_time // STEP) * STEP
+        return [_row(t) for t in range(first, min(first + BACKFILL_LIMIT * STEP, now + STEP), STEP)]
+
+    async def scenario():
+        mux = StreamMultiplexer(lambda: None, backfill=backfill)
+        received = []
+
+        async def on_kline(data):
+            received.append(data["k"]["t"])
+
+        conn = CombinedStreamConnection(1, mux._dispatch, mux._on_reconnect)
+        conn.streams.update({"ethusdt@kline_1m", "btcusdt@kline_1m"})
+        for stream in conn.streams:
+            mux._callbacks[stream] = [on_kline]
+            mux._kline_marks[stream] = (last_seen - STEP, last_seen)
+        await mux._on_reconnect(conn)
+        return mux, received
+
+    mux, received = asyncio.run(scenario())
+    # Açık mum hariç [last_seen, now) aralığındaki tüm mumlar sırayla ve tekrarsız iletilir
+    assert received == list(range(last_seen, now, STEP))
+    assert len([r for r in requested if r[0] == "BTCUSDT"]) == 3
+    stats = mux.stats()
+    assert stats["backfill_errors"] == 1 and stats["candles_backfilled"] == 2500
+
+
+def test_receive_timeout_closes_half_open_socket():
+    class SilentSocket:
+        closed = False
+
+        def __aiter__(self):
+            return self
+
+        async def __anext__(self):
+            raise asyncio.TimeoutError()
+
+        async def close(self):
+            self.closed = True
+
+    async def scenario():
+        conn = CombinedStreamConnection(1, None, None)
+        conn._ws = SilentSocket()
+        await conn._read_loop()
+        return conn
+
+    conn = asyncio.run(scenario())
+    assert not conn.connected
@@ -0,0 +1,61 @@
+"""
+`/crypto/klines`: `fields` ile istenen gösterge sütunları döndürülür, bilinmeyen alanlar
+400 ile reddedilir.
+"""
+import numpy as np
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from api.routes import crypto
+from technical_analysis.indicators import TechnicalIndicators
+from tests.helpers import make_ohlcv
+from utils.klines import columns_to_dataframe
+
+STEP = 3_600_000
+CANDLES = 150
+
+
+@pytest.fixture
+def client(monkeypatch):
+    df = make_ohlcv(CANDLES, seed=11)
+    open_time = np.arange(CANDLES, dtype=np.int64) * STEP
+    klines = columns_to_dataframe({
+        "open_time": open_time,
+        **{column: df[column].to_numpy() for column in ("open", "high", "low", "close", "volume")},
+        "close_time": open_time + STEP - 1,
+        "quote_asset_volume": (df["volume"] * df["close"]).to_numpy(),
+        "number_of_trades": np.full(CANDLES, 10, dtype=np.int64),
+        "taker_buy_base_asset_volume": df["taker_buy_base_asset_volume"].to_numpy(),
+        "taker_buy_quote_asset_volume": (df["taker_buy_base_asset_volume"] * df["close"]).to_numpy(),
+    })
+
+    async def get_klines(symbol, interval, limit=100, priority=0):
+        return klines.iloc[-limit:]
+
+    monkeypatch.setattr(crypto.binance_service, "get_klines", get_klines)
+    app = FastAPI()
+    app.include_router(crypto.router)
+    return TestClient(app)
+
+
+def test_klines_with_selected_fields(client):
+    response = client.get("/crypto/klines/TESTUSDT", params={"add_indicators": "true", "fields": "rsi,macd", "limit": 120})
+    assert response.status_code == 200
+    body = response.json()
+    assert len(body["data"]) == 120
+    row = body["data"][-1]
+    assert {"rsi", "macd"} <= set(row)
+    assert not set(row) & (set(TechnicalIndicators.COLUMNS) - {"rsi", "macd"})
+    assert {"trend_analysis", "signals", "support_resistance"} <= set(body)
+
+
+def test_klines_with_all_indicators(client):
+    response = client.get("/crypto/klines/TESTUSDT", params={"add_indicators": "true", "limit": 110})
+    assert response.status_code == 200
+    assert set(TechnicalIndicators.COLUMNS) <= set(response.json()["data"][-1])
+
+
+def test_klines_rejects_unknown_field(client):
+    response = client.get("/crypto/klines/TESTUSDT", params={"add_indicators": "true", "fields": "rsi,nope"})
+    assert response.status_code == 400
@@ -0,0 +1,179 @@
+"""
+Gösterge önbelleği: sonuç açık mum nedeniyle en fazla canlı süre ve en geç mum sınırına
+kadar taze sayılır, süresi dolan sonuç arka planda yenilenirken sunulur, eşzamanlı
+ıskalamalar birleştirilir ve boyut LRU ile sınırlanır.
+"""
+import asyncio
+
+import pytest
+
+from services.binance_service import KLINE_CLOSE_GRACE_MS
+from services.indicator_cache import IndicatorCache
+
+STEP = 60_000
+# 1m mumunun ortası (saniye)
+MID_CANDLE = 1_700_000_000 * 1000 // STEP * STEP / 1000 + 30
+
+
+class Clock:
+    def __init__(self, now: float = MID_CANDLE):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class Compute:
+    """Her çağrıda artan değer döndüren hesaplama"""
+
+    def __init__(self, fail: bool = False):
+        self.calls = 0
+        self.fail = fail
+
+    async def __call__(self):
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        if self.fail:
+            raise RuntimeError("hesaplama hatası")
+        return self.calls
+
+
+def _cache(clock: Clock, **kwargs) -> IndicatorCache:
+    kwargs.setdefault("live_seconds", 5)
+    kwargs.setdefault("stale_seconds", 5)
+    return IndicatorCache(max_entries=kwargs.pop("max_entries", 16), enabled=True, clock=clock, **kwargs)
+
+
+KEY = IndicatorCache.series_key("test", "BTCUSDT", "1m", 100)
+
+
+def test_live_ttl_caps_freshness_within_candle():
+    async def scenario():
+        clock, compute = Clock(), Compute()
+        cache = _cache(clock)
+        assert await cache.get_or_compute(KEY, "1m", compute) == 1
+        clock.now += 4
+        assert await cache.get_or_compute(KEY, "1m", compute) == 1
+        assert compute.calls == 1
+
+        # Aynı mum içinde canlı süre doldu: eski sonuç sunulur ve arka planda yenilenir
+        clock.now += 2
+        assert await cache.get_or_compute(KEY, "1m", compute) == 1
+        await asyncio.sleep(0.05)
+        assert compute.calls == 2
+        assert await cache.get_or_compute(KEY, "1m", compute) == 2
+        stats = cache.stats()
+        assert (stats["hits"], stats["stale_hits"], stats["misses"], stats["refreshes"]) == (2, 1, 1, 1)
+
+    asyncio.run(scenario())
+
+
+def test_boundary_expires_before_live_ttl():
+    async def scenario():
+        # Sınıra 1 saniye kala hesaplanan sonuç canlı süre dolmadan sınırda eskir
+        clock, compute = Clock(MID_CANDLE + 29), Compute()
+        cache = _cache(clock, live_seconds=60, stale_seconds=0)
+        assert await cache.get_or_compute(KEY, "1m", compute) == 1
+        clock.now += 0.5
+        assert await cache.get_or_compute(KEY, "1m", compute) == 1
+        clock.now += 0.5 + KLINE_CLOSE_GRACE_MS / 1000
+        assert await cache.get_or_compute(KEY, "1m", compute) == 2
+        assert cache.stats()["misses"] == 2
+
+    asyncio.run(scenario())
+
+
+def test_grace_window_after_boundary_is_short_lived():
+    async def scenario():
+        # Sınırdan hemen sonra (borsa yeni mumu henüz açmamış olabilir) yalnızca pay süresince saklanır
+        clock, compute = Clock(MID_CANDLE + 30.5), Compute()
+        cache = _cache(clock, live_seconds=60, stale_seconds=0)
+        assert await cache.get_or_compute(KEY, "1m", compute) == 1
+        clock.now = MID_CANDLE + 30 + KLINE_CLOSE_GRACE_MS / 1000
+        assert await cache.get_or_compute(KEY, "1m", compute) == 2
+
+    asyncio.run(scenario())
+
+
+def test_stale_while_revalidate_refreshes_once():
+    async def scenario():
+        clock, compute = Clock(), Compute()
+        cache = _cache(clock)
+        await cache.get_or_compute(KEY, "1m", compute)
+        clock.now += 6
+        values = await asyncio.gather(*(cache.get_or_compute(KEY, "1m", compute) for _ in range(5)))
+        assert values == [1] * 5
+        assert cache.stats()["refreshing"] == 1
+        await asyncio.sleep(0.05)
+        assert compute.calls == 2
+        assert cache.stats()["refreshing"] == 0
+
+        # Eski sunum süresi de geçtiyse sonuç beklenerek yeniden hesaplanır
+        clock.now += 11
+        assert await cache.get_or_compute(KEY, "1m", compute) == 3
+        assert cache.stats()["misses"] == 2
+
+    asyncio.run(scenario())
+
+
+def test_failed_refresh_keeps_stale_result():
+    async def scenario():
+        clock, compute = Clock(), Compute()
+        cache = _cache(clock)
+        await cache.get_or_compute(KEY, "1m", compute)
+        clock.now += 6
+        compute.fail = True
+        assert await cache.get_or_compute(KEY, "1m", compute) == 1
+        await asyncio.sleep(0.05)
+        assert cache.stats()["refresh_errors"] == 1
+        assert await cache.get_or_compute(KEY, "1m", compute) == 1
+
+        # Eski sunum süresi dolduktan sonra hata çağırana iletilir
+        clock.now += 5
+        with pytest.raises(RuntimeError):
+            await cache.get_or_compute(KEY, "1m", compute)
+
+    asyncio.run(scenario())
+
+
+def test_concurrent_misses_share_one_computation():
+    async def scenario():
+        compute = Compute()
+        cache = _cache(Clock())
+        values = await asyncio.gather(*(cache.get_or_compute(KEY, "1m", compute) for _ in range(10)))
+        assert values == [1] * 10
+        assert compute.calls == 1
+
+    asyncio.run(scenario())
+
+
+def test_lru_eviction():
+    async def scenario():
+        cache = _cache(Clock(), max_entries=2)
+        keys = [IndicatorCache.series_key("test", symbol, "1m", 100) for symbol in ("AAA", "BBB", "CCC")]
+        computes = [Compute() for _ in keys]
+        await cache.get_or_compute(keys[0], "1m", computes[0])
+        await cache.get_or_compute(keys[1], "1m", computes[1])
+        # İlk anahtar kullanıldı; en uzun süredir kullanılmayan ikinci anahtardır
+        await cache.get_or_compute(keys[0], "1m", computes[0])
+        await cache.get_or_compute(keys[2], "1m", computes[2])
+        assert cache.stats()["entries"] == 2
+        assert cache.stats()["evictions"] == 1
+
+        await cache.get_or_compute(keys[0], "1m", computes[0])
+        await cache.get_or_compute(keys[1], "1m", computes[1])
+        assert [compute.calls for compute in computes] == [1, 2, 1]
+
+    asyncio.run(scenario())
+
+
+def test_variable_length_interval_bypasses_cache():
+    async def scenario():
+        compute = Compute()
+        cache = _cache(Clock())
+        key = IndicatorCache.series_key("test", "BTCUSDT", "1M", 100)
+        assert await cache.get_or_compute(key, "1M", compute) == 1
+        assert await cache.get_or_compute(key, "1M", compute) == 2
+        assert cache.stats()["bypassed"] == 2
+
+    asyncio.run(scenario())
@@ -0,0 +1,31 @@
+"""
+Vektörleştirilmiş Wilder RSI: elle hesaplanan küçük girdiler ve satır satır referans
+döngüsüyle aynı değerler.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from tests.helpers import legacy_rsi, make_close
+from utils.technical_indicators import TechnicalIndicators
+
+
+def test_rsi_fixed():
+    # Sürekli yükselişte kayıp 0 -> RSI 100; ilk `period - 1` değer NaN
+    rsi = TechnicalIndicators.rsi(pd.Series(np.arange(1.0, 21.0)), 14)
+    assert rsi.iloc[:13].isna().all()
+    assert (rsi.iloc[13:] == 100).all()
+    # Değişimler +2, -1, +3: ilk ortalama basit (1 / 0), sonrakiler Wilder
+    # (kazanç 0.5, 1.75; kayıp 0.5, 0.25)
+    rsi = TechnicalIndicators.rsi(pd.Series([10.0, 12.0, 11.0, 14.0]), 2)
+    assert np.isnan(rsi.iloc[0])
+    np.testing.assert_allclose(rsi.iloc[1:], [100.0, 50.0, 87.5])
+
+
+@pytest.mark.parametrize("period", [2, 14, 30])
+def test_rsi_matches_wilder_reference(period):
+    close = make_close(600)
+    expected = legacy_rsi(close, period)
+    got = TechnicalIndicators.rsi(close, period)
+    assert (got.isna() == expected.isna()).all()
+    np.testing.assert_allclose(got.to_numpy(), expected.to_numpy(), rtol=1e-9, atol=1e-9, equal_nan=True)
@@ -0,0 +1,45 @@
+"""
+Birleştirilen istekler: daha öncelikli bir çağıran katıldığında hız sınırlayıcı
+kuyruğundaki istek yükseltilir.
+"""
+import asyncio
+
+from data.rate_limiter import Priority, PriorityTicket, WeightRateLimiter
+from data.singleflight import SingleFlight
+
+
+def test_interactive_caller_promotes_background_flight():
+    async def scenario():
+        # Saniyede 10 ağırlık; bütçe tükenince istekler sırayla kuyruktan çıkar
+        limiter = WeightRateLimiter(limit=10, interval=1.0, headroom=1.0)
+        await limiter.acquire(10)
+        flight = SingleFlight()
+        admitted = []
+
+        async def request(name, priority):
+            await limiter.acquire(5, priority)
+            admitted.append(name)
+            return {"name": name}
+
+        backlog = [asyncio.ensure_future(request(f"bg{i}", Priority.BACKGROUND)) for i in range(4)]
+        ticket = PriorityTicket(Priority.BACKGROUND)
+        shared = asyncio.ensure_future(flight.do("klines", lambda: request("shared", ticket), ticket))
+        await asyncio.sleep(0.01)
+        assert limiter.stats()["queue_by_priority"] == {Priority.BACKGROUND: 5}
+
+        joined = await flight.do("klines", lambda: request("duplicate", Priority.INTERACTIVE),
+                                 PriorityTicket(Priority.INTERACTIVE))
+        assert joined == {"name": "shared"} and await shared is joined
+        # Yükseltilen istek arka plan kuyruğunun önüne geçer
+        assert admitted == ["shared"]
+        await asyncio.gather(*backlog)
+        assert admitted[1:] == [f"bg{i}" for i in range(4)]
+        assert flight.stats()["deduplicated"] == 1
+
+    asyncio.run(scenario())
+
+
+def test_lower_priority_join_does_not_demote():
+    ticket = PriorityTicket(Priority.INTERACTIVE)
+    ticket.raise_to(Priority.BACKGROUND)
+    assert ticket.priority == Priority.INTERACTIVE
@@ -0,0 +1,48 @@
+"""
+Parametre taramasının devam anahtarı: aynı ayar ve veriyle tamamlanan sonuçlar atlanır,
+farklı sinyal, test ayarı, aralık ya da veri aralığıyla yeniden hesaplanır.
+"""
+import pytest
+
+from technical_analysis.backtest import BacktestConfig
+from technical_analysis.sweep import completed_records, grid, run_sweep, summarize
+from tests.helpers import make_ohlcv, with_time_index
+
+COMBOS = grid({"rsi_period": [7, 14], "stop_atr": [0.0, 2.0]})
+
+
+@pytest.fixture(scope="module")
+def frames():
+    return {
+        symbol: with_time_index(make_ohlcv(1500, seed=30 + i), 3_600_000)
+        for i, symbol in enumerate(("AAAUSDT", "BBBUSDT"))
+    }
+
+
+def _sweep(frames, output, **kwargs):
+    kwargs.setdefault("interval", "1h")
+    return list(run_sweep(frames, COMBOS, output=output, workers=1, **kwargs))
+
+
+def test_resume_skips_only_matching_runs(frames, tmp_path):
+    output = str(tmp_path / "sweep.jsonl")
+    total = len(COMBOS) * len(frames)
+    assert len(_sweep(frames, output)) == total
+    assert _sweep(frames, output) == []
+
+    assert len(_sweep(frames, output, signal="macd")) == total
+    assert len(_sweep(frames, output, config=BacktestConfig(allow_short=True))) == total
+    assert len(_sweep(frames, output, interval="4h")) == total
+    assert len(_sweep({symbol: df.iloc[:-1] for symbol, df in frames.items()}, output)) == total
+    assert _sweep(frames, output, signal="macd") == []
+
+
+def test_summarize_keeps_runs_apart(frames, tmp_path):
+    output = str(tmp_path / "sweep.jsonl")
+    _sweep(frames, output)
+    _sweep(frames, output, config=BacktestConfig(allow_short=True))
+
+    summary = summarize(list(completed_records(output)))
+    assert len(summary) == 2 * len(COMBOS)
+    assert (summary["symbols"] == len(frames)).all()
+    assert set(summary["allow_short"]) == {False, True}
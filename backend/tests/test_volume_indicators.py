@@ -0,0 +1,57 @@
+"""
+Vektörleştirilmiş OBV, A/D, CMF ve CVD: elle hesaplanan küçük girdiler ve satır satır
+referans döngüleriyle aynı değerler.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from tests.helpers import make_ohlcv, reference_ad, reference_cmf, reference_cvd, reference_obv
+from utils.technical_indicators import TechnicalIndicators
+
+# Gösterge -> (vektörleştirilmiş uygulama, referans döngü)
+CASES = {
+    "obv": (TechnicalIndicators.obv, reference_obv),
+    "ad": (TechnicalIndicators.accumulation_distribution, reference_ad),
+    "cmf": (TechnicalIndicators.chaikin_money_flow, reference_cmf),
+    "cvd": (TechnicalIndicators.cumulative_volume_delta, reference_cvd),
+}
+
+# Değişmeyen kapanış (3. mum) ve yüksek == düşük mum (4. mum) içeren sabit girdi
+FIXED = pd.DataFrame({
+    "high": [11.0, 12.0, 12.0, 11.0, 13.0],
+    "low": [9.0, 10.0, 10.0, 11.0, 11.0],
+    "close": [10.0, 12.0, 12.0, 11.0, 12.0],
+    "volume": [100.0, 200.0, 50.0, 80.0, 40.0],
+    "taker_buy_base_asset_volume": [60.0, 150.0, 25.0, 20.0, 30.0],
+})
+
+
+def test_obv_fixed():
+    # Yükselişte hacim eklenir, düşüşte çıkarılır, değişmeyen kapanışta aynı kalır
+    assert TechnicalIndicators.obv(FIXED).tolist() == [0.0, 200.0, 200.0, 120.0, 160.0]
+
+
+def test_accumulation_distribution_fixed():
+    # Çarpan: ((c - l) - (h - c)) / (h - l) -> 0, 1, 1, 0 (h == l), 0
+    assert TechnicalIndicators.accumulation_distribution(FIXED).tolist() == [0.0, 200.0, 250.0, 250.0, 250.0]
+
+
+def test_chaikin_money_flow_fixed():
+    cmf = TechnicalIndicators.chaikin_money_flow(FIXED, period=2)
+    assert np.isnan(cmf.iloc[0])
+    np.testing.assert_allclose(cmf.iloc[1:], [200 / 300, 250 / 250, 50 / 130, 0.0])
+
+
+def test_cumulative_volume_delta_fixed():
+    # Alıcı - satıcı hacmi: 20, 100, 0, -40, 20
+    assert TechnicalIndicators.cumulative_volume_delta(FIXED).tolist() == [20.0, 120.0, 120.0, 80.0, 100.0]
+
+
+@pytest.mark.parametrize("name", sorted(CASES))
+def test_volume_indicators_match_reference(name):
+    vectorized, reference = CASES[name]
+    df = make_ohlcv(2000)
+    expected = reference(df)
+    scale = max(float(np.nanmax(np.abs(expected))), 1.0)
+    np.testing.assert_allclose(vectorized(df).to_numpy(), expected, rtol=1e-9, atol=1e-9 * scale, equal_nan=True)
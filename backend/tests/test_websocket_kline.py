@@ -0,0 +1,131 @@
+"""
+`/ws/kline` uç noktası: ilk veri JSON olarak gönderilir, kapanan mum canlı güncelleme
+olarak iletilir ve istemci ayrıldığında abonelik kaldırılır.
+"""
+import asyncio
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from api.routes import websocket
+from utils.klines import columns_to_dataframe
+
+STEP = 60_000
+CANDLES = 60
+
+
+def _klines(last_open: int) -> pd.DataFrame:
+    rng = np.random.default_rng(7)
+    open_time = last_open - STEP * np.arange(CANDLES)[::-1]
+    close = 30000 * np.exp(np.cumsum(rng.normal(0, 0.002, CANDLES)))
+    volume = rng.uniform(1, 10, CANDLES)
+    return columns_to_dataframe({
+        "open_time": open_time,
+        "open": close * 0.999,
+        "high": close * 1.002,
+        "low": close * 0.997,
+        "close": close,
+        "volume": volume,
+        "close_time": open_time + STEP - 1,
+        "quote_asset_volume": volume * close,
+        "number_of_trades": np.full(CANDLES, 10, dtype=np.int64),
+        "taker_buy_base_asset_volume": volume / 2,
+        "taker_buy_quote_asset_volume": volume * close / 2,
+    })
+
+
+@pytest.fixture
+def live(monkeypatch):
+    last_open = (int(time.time() * 1000) // STEP - 1) * STEP
+    calls = {"subscribe": 0, "unsubscribe": 0}
+    callbacks = {"subscribe": [], "unsubscribe": []}
+
+    async def get_klines(symbol, interval, limit=100, priority=0):
+        return _klines(last_open)
+
+    async def subscribe(symbol, interval, callback):
+        calls["subscribe"] += 1
+        callbacks["subscribe"].append(callback)
+        # Abonelikten kısa süre sonra bir sonraki mumun kapandığı olay gelir
+        event = {"k": {
+            "t": last_open + STEP, "T": last_open + 2 * STEP - 1, "x": True,
+            "o": "30000", "h": "30100", "l": "29900", "c": "30050", "v": "5",
+            "q": "150250", "n": 12, "V": "2.5", "Q": "75125",
+        }}
+        asyncio.get_running_loop().call_later(0.05, lambda: asyncio.ensure_future(callback(event)))
+
+    async def unsubscribe(symbol, interval, callback):
+        calls["unsubscribe"] += 1
+        callbacks["unsubscribe"].append(callback)
+
+    monkeypatch.setattr(websocket.binance_service, "get_klines", get_klines)
+    monkeypatch.setattr(websocket.live_candles, "subscribe", subscribe)
+    monkeypatch.setattr(websocket.live_candles, "unsubscribe", unsubscribe)
+    app = FastAPI()
+    app.include_router(websocket.router)
+    return TestClient(app), last_open, calls, callbacks
+
+
+def test_initial_data_and_live_update(live):
+    client, last_open, calls, _ = live
+    with client.websocket_connect("/ws/kline/btcusdt?interval=1m") as session:
+        initial = session.receive_json()
+        assert initial["event"] == "initial_data"
+        klines = initial["data"]["klines"]
+        assert len(klines) == CANDLES
+        assert klines[-1]["open_time"] == last_open
+        assert klines[-1]["close_time"] == last_open + STEP - 1
+
+        update = session.receive_json()
+        assert update["event"] == "kline_update"
+        assert update["data"]["kline"]["open_time"] == last_open + STEP
+        assert update["data"]["kline"]["close"] == "30050"
+        assert update["data"]["indicators"]["number_of_trades"] == 12
+        assert 0 < update["data"]["indicators"]["rsi_14"] < 100
+        assert set(update["data"]["signals"]) >= {"overall"}
+
+    assert calls == {"subscribe": 1, "unsubscribe": 1}
+    assert "btcusdt_1m" not in websocket.connected_indicator_clients
+    assert "btcusdt_1m" not in websocket.indicator_callbacks
+    assert "btcusdt_1m" not in websocket.indicator_states
+
+
+def test_warmup_failure_releases_client(live, monkeypatch):
+    client, _, calls, _ = live
+
+    async def get_klines(symbol, interval, limit=100, priority=0):
+        raise RuntimeError("bağlantı yok")
+
+    monkeypatch.setattr(websocket.binance_service, "get_klines", get_klines)
+    with client.websocket_connect("/ws/kline/ethusdt?interval=1m") as session:
+        with pytest.raises(Exception):
+            session.receive_json()
+
+    assert calls == {"subscribe": 0, "unsubscribe": 0}
+    assert "ethusdt_1m" not in websocket.connected_indicator_clients
+
+
+def test_first_client_leaving_keeps_subscription(live):
+    # Abonelik ilk istemcinin callback'iyle yapılır; ilk istemci önce ayrılsa da son istemci
+    # ayrılırken aynı callback ile abonelikten çıkılır
+    client, _, calls, callbacks = live
+    first = client.websocket_connect("/ws/kline/solusdt?interval=1m")
+    second = client.websocket_connect("/ws/kline/solusdt?interval=1m")
+    first.__enter__()
+    assert first.receive_json()["event"] == "initial_data"
+    second.__enter__()
+    assert second.receive_json()["event"] == "initial_data"
+
+    first.__exit__(None, None, None)
+    assert calls["unsubscribe"] == 0
+    assert "solusdt_1m" in websocket.indicator_callbacks
+
+    second.__exit__(None, None, None)
+    assert calls == {"subscribe": 1, "unsubscribe": 1}
+    assert callbacks["unsubscribe"][0] is callbacks["subscribe"][0]
+    assert "solusdt_1m" not in websocket.indicator_callbacks
+    assert "solusdt_1m" not in websocket.connected_indicator_clients
@@ -0,0 +1,89 @@
+import numpy as np
+from typing import Dict, List
+
+# Binance mum aralıklarının milisaniye karşılıkları ("1M" takvim ayına bağlı olduğu için yoktur)
+INTERVAL_MS: Dict[str, int] = {
+    "1m": 60_000,
+    "3m": 3 * 60_000,
+    "5m": 5 * 60_000,
+    "15m": 15 * 60_000,
+    "30m": 30 * 60_000,
+    "1h": 3_600_000,
+    "2h": 2 * 3_600_000,
+    "4h": 4 * 3_600_000,
+    "6h": 6 * 3_600_000,
+    "8h": 8 * 3_600_000,
+    "12h": 12 * 3_600_000,
+    "1d": 86_400_000,
+    "3d": 3 * 86_400_000,
+    "1w": 7 * 86_400_000,
+}
+
+# Haftalık mumlar Pazartesi 00:00 UTC'de açılır; Unix epoch (1970-01-01) bir Perşembe günüdür
+WEEK_OFFSET_MS = 4 * 86_400_000
+
+
+def interval_to_ms(interval: str) -> int:
+    """
+    Mum aralığının milisaniye cinsinden uzunluğunu döndürür
+
+    Args:
+        interval: Mum aralığı (örn. "1m", "1h", "1d")
+
+    Returns:
+        int: Aralığın milisaniye karşılığı
+
+    Raises:
+        ValueError: Desteklenmeyen aralık
+    """
+    try:
+        return INTERVAL_MS[interval]
+    except KeyError:
+        raise ValueError(f"Desteklenmeyen mum aralığı: {interval}")
+
+
+def align_open_time(timestamp_ms: int, interval: str) -> int:
+    """
+    Zaman damgasını içeren mumun Binance açılış zamanını döndürür
+
+    Args:
+        timestamp_ms: Milisaniye cinsinden zaman damgası
+        interval: Mum aralığı
+
+    Returns:
+        int: Mumun açılış zamanı (ms)
+    """
+    step = interval_to_ms(interval)
+    offset = WEEK_OFFSET_MS if interval == "1w" else 0
+    return (timestamp_ms - offset) // step * step + offset
+
+
+def find_gaps(open_times: np.ndarray, step: int, first_open: int, last_open: int) -> List[Dict[str, int]]:
+    """
+    Sıralı açılış zamanlarında beklenen ama gelmeyen mum aralıklarını bulur
+    
+    Args:
+        open_times: Sıralı, tekrarsız açılış zamanları (ms)
+        step: Mum aralığı (ms)
+        first_open: Beklenen ilk açılış zamanı (ms)
+        last_open: Beklenen son açılış zamanı (ms)
+        
+    Returns:
+        List[Dict]: Her boşluk için "start", "end" (ms, dahil) ve "missing" (mum sayısı)
+    """
+    if len(open_times) == 0:
+        return [{"start": first_open, "end": last_open, "missing": (last_open - first_open) // step + 1}]
+    
+    # Baş ve son sınırları ekleyerek ardışık farkları incele
+    bounded = np.concatenate(([first_open - step], open_times, [last_open + step]))
+    diffs = np.diff(bounded)
+    gap_idx = np.nonzero(diffs > step)[0]
+    
+    return [
+        {
+            "start": int(bounded[i] + step),
+            "end": int(bounded[i + 1] - step),
+            "missing": int(diffs[i] // step - 1)
+        }
+        for i in gap_idx
+    ]
@@ -0,0 +1,124 @@
+import numpy as np
+import pandas as pd
+from typing import Any, Dict, List, Optional
+
+# Binance kline alanlarının sütun adları ve tipleri (son alan olan "ignore" saklanmaz)
+KLINE_COLUMNS: Dict[str, np.dtype] = {
+    "open_time": np.dtype("<i8"),
+    "open": np.dtype("<f8"),
+    "high": np.dtype("<f8"),
+    "low": np.dtype("<f8"),
+    "close": np.dtype("<f8"),
+    "volume": np.dtype("<f8"),
+    "close_time": np.dtype("<i8"),
+    "quote_asset_volume": np.dtype("<f8"),
+    "number_of_trades": np.dtype("<i8"),
+    "taker_buy_base_asset_volume": np.dtype("<f8"),
+    "taker_buy_quote_asset_volume": np.dtype("<f8"),
+}
+
+KlineColumns = Dict[str, np.ndarray]
+
+# Binance yanıtındaki her kline satırının alan sayısı ("ignore" dahil)
+KLINE_FIELD_COUNT = len(KLINE_COLUMNS) + 1
+# Ham yanıttan silinecek karakterler: geriye yalnızca virgülle ayrılmış sayılar kalır
+_KLINE_DELETE_BYTES = b'[]" \t\r\n'
+
+
+def empty_columns() -> KlineColumns:
+    """
+    Boş kline sütunları döndürür
+    """
+    return {name: np.empty(0, dtype=dtype) for name, dtype in KLINE_COLUMNS.items()}
+
+
+def rows_to_columns(rows: List[List[Any]]) -> KlineColumns:
+    """
+    Binance kline satır listesini sütun dizilerine dönüştürür
+
+    Args:
+        rows: Binance `/api/v3/klines` yanıtı
+
+    Returns:
+        Dict[str, np.ndarray]: Sütun adı -> dizi
+    """
+    if not rows:
+        return empty_columns()
+
+    return {
+        name: np.array([row[i] for row in rows], dtype=dtype)
+        for i, (name, dtype) in enumerate(KLINE_COLUMNS.items())
+    }
+
+
+def decode_klines(raw: bytes) -> KlineColumns:
+    """
+    Binance `/api/v3/klines` yanıtının ham baytlarını, satır başına Python nesnesi
+    oluşturmadan doğrudan float64/int64 sütunlarına çözer.
+
+    Köşeli parantezler ve tırnaklar silindiğinde yanıt virgülle ayrılmış sayılardan
+    oluşur; bu metin numpy'nin C ayrıştırıcısıyla tek seferde okunur.
+
+    Args:
+        raw: HTTP yanıt gövdesi
+
+    Returns:
+        Dict[str, np.ndarray]: Sütun adı -> dizi
+
+    Raises:
+        ValueError: Yanıt kline listesi değilse
+    """
+    if not raw.lstrip().startswith(b"["):
+        raise ValueError(f"Beklenmeyen kline yanıtı: {raw[:200]!r}")
+
+    body = raw.translate(None, _KLINE_DELETE_BYTES)
+    if not body:
+        return empty_columns()
+
+    flat = np.fromstring(body, dtype=np.float64, sep=",")
+    if flat.size % KLINE_FIELD_COUNT:
+        raise ValueError("Kline yanıtı beklenen alan sayısına bölünemiyor")
+
+    # (alan, satır) düzeninde tek bir bitişik blok; float sütunlar bu bloğun görünümleridir
+    table = np.ascontiguousarray(flat.reshape(-1, KLINE_FIELD_COUNT).T)
+    return {
+        name: table[i] if dtype == table.dtype else table[i].astype(dtype)
+        for i, (name, dtype) in enumerate(KLINE_COLUMNS.items())
+    }
+
+
+def select_rows(columns: KlineColumns, index: Any) -> KlineColumns:
+    """
+    Tüm sütunlara aynı maske veya dilimi uygular
+    """
+    return {name: values[index] for name, values in columns.items()}
+
+
+def concat_columns(*parts: KlineColumns) -> KlineColumns:
+    """
+    Sütun kümelerini uç uca ekler
+    """
+    parts = [part for part in parts if len(part["open_time"])]
+    if not parts:
+        return empty_columns()
+    if len(parts) == 1:
+        return parts[0]
+    return {name: np.concatenate([part[name] for part in parts]) for name in KLINE_COLUMNS}
+
+
+def columns_to_dataframe(columns: KlineColumns, index_name: Optional[str] = "timestamp") -> pd.DataFrame:
+    """
+    Kline sütunlarını açılış zamanı indeksli DataFrame'e dönüştürür
+
+    Args:
+        columns: Kline sütunları
+        index_name: İndeks adı
+
+    Returns:
+        pd.DataFrame: OHLCV verileri
+    """
+    index = pd.DatetimeIndex(pd.to_datetime(columns["open_time"], unit="ms"), name=index_name)
+    return pd.DataFrame(
+        {name: values for name, values in columns.items() if name != "open_time"},
+        index=index,
+    )
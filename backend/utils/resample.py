@@ -0,0 +1,92 @@
+import numpy as np
+from typing import Dict, Iterable
+
+from utils.intervals import align_open_time, interval_to_ms
+from utils.klines import KLINE_COLUMNS, KlineColumns, empty_columns, select_rows
+
+# Binance hacim alanlarının ondalık hassasiyeti: toplamlar bu hassasiyete yuvarlanarak
+# borsanın ondalık toplamıyla aynı float değeri verir
+VOLUME_DECIMALS = 8
+
+# Toplanarak birleştirilen alanlar
+_SUM_COLUMNS = (
+    "volume",
+    "quote_asset_volume",
+    "number_of_trades",
+    "taker_buy_base_asset_volume",
+    "taker_buy_quote_asset_volume",
+)
+
+
+def resample_columns(columns: KlineColumns, interval: str, base_interval: str = "1m") -> KlineColumns:
+    """
+    Küçük aralıklı mumlardan (varsayılan 1m) Binance sınırlarına hizalı büyük aralıklı
+    mumlar üretir. Gruplar sıralı açılış zamanlarının değiştiği konumlardan bulunur ve
+    her alan tek bir `reduceat` çağrısıyla birleştirilir: açılış ilk, kapanış son mumdan,
+    en yüksek/en düşük maksimum/minimum, hacimler ve işlem sayısı toplamdır.
+
+    İlk grup aralık sınırından başlamıyorsa (taban seri sınırın ortasında başlıyorsa)
+    borsadaki mumla aynı olmayacağı için atılır. Son grup, taban serinin açık mumunu
+    içeriyorsa borsadaki henüz kapanmamış mum gibi o ana kadarki değerleri taşır.
+
+    Args:
+        columns: Açılış zamanına göre sıralı, tekrarsız taban mum sütunları
+        interval: Hedef mum aralığı (örn. "5m", "4h", "1w")
+        base_interval: Taban mum aralığı
+
+    Returns:
+        Dict[str, np.ndarray]: Hedef aralıktaki mum sütunları
+
+    Raises:
+        ValueError: Hedef aralık taban aralığın katı değilse
+    """
+    step = interval_to_ms(interval)
+    base_step = interval_to_ms(base_interval)
+    if step % base_step:
+        raise ValueError(f"{interval} aralığı {base_interval} mumlarından oluşturulamaz")
+    if step == base_step or not len(columns["open_time"]):
+        return columns if step == base_step else empty_columns()
+
+    open_time = columns["open_time"]
+    bucket = align_open_time(open_time, interval)
+    starts = np.flatnonzero(np.diff(bucket, prepend=bucket[0] - step))
+    if open_time[0] != bucket[0]:
+        starts = starts[1:]
+        if not len(starts):
+            return empty_columns()
+        columns = select_rows(columns, slice(starts[0], None))
+        bucket = bucket[starts[0]:]
+        starts = starts - starts[0]
+    ends = np.append(starts[1:], len(bucket)) - 1
+
+    result = {
+        "open_time": bucket[starts],
+        "open": columns["open"][starts],
+        "high": np.maximum.reduceat(columns["high"], starts),
+        "low": np.minimum.reduceat(columns["low"], starts),
+        "close": columns["close"][ends],
+        "close_time": bucket[starts] + step - 1,
+    }
+    for name in _SUM_COLUMNS:
+        total = np.add.reduceat(columns[name], starts)
+        result[name] = total if total.dtype.kind == "i" else np.round(total, VOLUME_DECIMALS)
+    return {name: result[name].astype(dtype, copy=False) for name, dtype in KLINE_COLUMNS.items()}
+
+
+def resample_many(
+    columns: KlineColumns,
+    intervals: Iterable[str],
+    base_interval: str = "1m"
+) -> Dict[str, KlineColumns]:
+    """
+    Aynı taban seriden birden çok aralık üretir
+
+    Args:
+        columns: Açılış zamanına göre sıralı, tekrarsız taban mum sütunları
+        intervals: Hedef mum aralıkları
+        base_interval: Taban mum aralığı
+
+    Returns:
+        Dict[str, Dict[str, np.ndarray]]: Aralık -> mum sütunları
+    """
+    return {interval: resample_columns(columns, interval, base_interval) for interval in intervals}
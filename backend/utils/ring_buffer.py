@@ -0,0 +1,154 @@
+import numpy as np
+import pandas as pd
+from typing import Dict, Mapping, Optional, Sequence
+
+# Varsayılan olarak tutulan mum alanları (açılış zamanı ayrıca int64 olarak tutulur)
+DEFAULT_FIELDS = ("open", "high", "low", "close", "volume", "taker_buy_base_asset_volume")
+
+
+class CandleRingBuffer:
+    """
+    Sabit kapasiteli, önceden ayrılmış, sütun yönelimli OHLCV mum tamponu.
+
+    Her değer depoda iki kez (i ve i + kapasite konumlarına) yazılır; böylece son
+    `len(self)` mum her zaman depoda bitişik bir dilimdir ve sütunlar kopyasız, bitişik
+    numpy görünümleri olarak okunur. Ekleme ve açık mumun yerinde güncellenmesi O(1)'dir;
+    mum başına bellek ayrılmaz, bellek kullanımı kapasiteyle sabittir.
+
+    Görünümler salt okunurdur ve sonraki eklemelerde değişebilir; saklanacaksa
+    kopyalanmalıdır.
+    """
+
+    def __init__(self, capacity: int, fields: Sequence[str] = DEFAULT_FIELDS):
+        """
+        Args:
+            capacity: Tutulacak en fazla mum sayısı
+            fields: Float64 olarak tutulacak alanlar
+
+        Raises:
+            ValueError: Kapasite pozitif değilse
+        """
+        if capacity < 1:
+            raise ValueError("Tampon kapasitesi pozitif olmalı")
+        self.capacity = capacity
+        self.fields = tuple(fields)
+        self._index = {name: row for row, name in enumerate(self.fields)}
+        self._values = np.full((len(self.fields), 2 * capacity), np.nan)
+        self._open_time = np.zeros(2 * capacity, dtype=np.int64)
+        # Bir sonraki yazma konumu (0 <= _head < kapasite) ve dolu mum sayısı
+        self._head = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Tamponun sabit bellek kullanımı (bayt)
+        """
+        return self._values.nbytes + self._open_time.nbytes
+
+    @property
+    def last_open_time(self) -> Optional[int]:
+        """
+        Son mumun açılış zamanı (ms); tampon boşsa None
+        """
+        return int(self._open_time[self._head - 1 + self.capacity]) if self._size else None
+
+    def _write(self, position: int, open_time: int, values: Mapping[str, float]) -> None:
+        mirror = position + self.capacity
+        self._open_time[position] = self._open_time[mirror] = open_time
+        for name, value in values.items():
+            row = self._index.get(name)
+            if row is not None:
+                self._values[row, position] = self._values[row, mirror] = value
+
+    def append(self, open_time: int, values: Mapping[str, float]) -> None:
+        """
+        Yeni mum ekler; tampon doluysa en eski mumun üzerine yazar
+
+        Args:
+            open_time: Açılış zamanı (ms)
+            values: Alan -> değer (verilmeyen alanlar NaN olur, bilinmeyen alanlar yok sayılır)
+        """
+        for row in range(len(self.fields)):
+            self._values[row, self._head] = self._values[row, self._head + self.capacity] = np.nan
+        self._write(self._head, open_time, values)
+        self._head = (self._head + 1) % self.capacity
+        self._size = min(self._size + 1, self.capacity)
+
+    def update_last(self, values: Mapping[str, float]) -> None:
+        """
+        Son mumu (ör. henüz kapanmamış mum) yerinde günceller
+
+        Raises:
+            IndexError: Tampon boşsa
+        """
+        if not self._size:
+            raise IndexError("Boş tamponda güncellenecek mum yok")
+        position = (self._head - 1) % self.capacity
+        self._write(position, int(self._open_time[position]), values)
+
+    def upsert(self, open_time: int, values: Mapping[str, float]) -> bool:
+        """
+        Açılış zamanı son mumla aynıysa onu günceller, daha yeniyse ekler
+
+        Returns:
+            bool: Mum eklendi ya da güncellendiyse True; son mumdan eski mum yok sayılır
+        """
+        last = self.last_open_time
+        if last is not None and open_time < last:
+            return False
+        if open_time == last:
+            self.update_last(values)
+        else:
+            self.append(open_time, values)
+        return True
+
+    def _window(self) -> slice:
+        end = self._head + self.capacity if self._size else 0
+        return slice(end - self._size, end)
+
+    def open_times(self) -> np.ndarray:
+        """
+        Açılış zamanları (eskiden yeniye), kopyasız salt okunur görünüm
+        """
+        view = self._open_time[self._window()]
+        view.flags.writeable = False
+        return view
+
+    def column(self, name: str) -> np.ndarray:
+        """
+        Bir alanın değerleri (eskiden yeniye), kopyasız bitişik salt okunur görünüm
+
+        Raises:
+            KeyError: Tamponda olmayan alan
+        """
+        view = self._values[self._index[name], self._window()]
+        view.flags.writeable = False
+        return view
+
+    def columns(self) -> Dict[str, np.ndarray]:
+        """
+        Tüm alanların kopyasız görünümleri
+        """
+        return {name: self.column(name) for name in self.fields}
+
+    def extend_frame(self, df: pd.DataFrame) -> None:
+        """
+        Açılış zamanı indeksli OHLCV DataFrame'inin son `capacity` mumunu ekler
+        """
+        df = df.iloc[-self.capacity:]
+        open_times = df.index.as_unit("ms").asi8
+        present = [name for name in self.fields if name in df.columns]
+        data = {name: df[name].to_numpy(dtype=float) for name in present}
+        for i, open_time in enumerate(open_times):
+            self.upsert(int(open_time), {name: data[name][i] for name in present})
+
+    def to_frame(self, index_name: str = "timestamp") -> pd.DataFrame:
+        """
+        Tamponun kopyasını açılış zamanı indeksli DataFrame olarak döndürür
+        """
+        index = pd.DatetimeIndex(pd.to_datetime(self.open_times(), unit="ms"), name=index_name)
+        return pd.DataFrame({name: self.column(name).copy() for name in self.fields}, index=index)
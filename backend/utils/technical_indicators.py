@@ -1,74 +1,76 @@
 import pandas as pd
 import numpy as np
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, List, Mapping, Optional, Union
+
+from technical_analysis import signals
+from technical_analysis.jit import ewm_from
+from technical_analysis.support_resistance import support_resistance
 
 class TechnicalIndicators:
     """
     Kripto para analizi için teknik göstergeler hesaplama yardımcısı
     """
     
+    # Varsayılan olarak hesaplanan gösterge alanları (motor alan adlarıyla aynı)
+    INDICATOR_FIELDS: List[str] = [
+        'sma_20', 'sma_50', 'sma_200',
+        'ema_12', 'ema_26',
+        'macd', 'macd_signal', 'macd_histogram',
+        'rsi_14',
+        'bollinger_upper', 'bollinger_middle', 'bollinger_lower',
+        'stoch_k', 'stoch_d',
+        'atr', 'obv', 'ad', 'cmf', 'cvd',
+    ]
+    
+    # Trend ve sinyal analizinin okuduğu alanlar
+    TREND_FIELDS: List[str] = [
+        'sma_20', 'sma_50', 'sma_200',
+        'rsi_14', 'macd', 'macd_signal',
+        'stoch_k', 'stoch_d',
+        'bollinger_upper', 'bollinger_middle', 'bollinger_lower',
+    ]
+    
     @staticmethod
-    def calculate_indicators(df: pd.DataFrame) -> pd.DataFrame:
+    def calculate_indicators(df: pd.DataFrame, fields: Optional[List[str]] = None) -> pd.DataFrame:
         """
         Fiyat verileri üzerinde teknik göstergeleri hesaplar
         
         Args:
             df: OHLCV verilerini içeren DataFrame
                 [timestamp, open, high, low, close, volume, ...]
+            fields: Hesaplanacak alanlar; None ise INDICATOR_FIELDS içinden veriyle
+                hesaplanabilenlerin tümü. Yalnızca istenen alanlar ve bağımlılıkları hesaplanır.
                 
         Returns:
             pd.DataFrame: Göstergeler eklenmiş DataFrame
         """
-        # Veri setini kopyala (yan etkileri önle)
-        result_df = df.copy()
-        
-        # SMA (Basit Hareketli Ortalama)
-        result_df['sma_20'] = TechnicalIndicators.sma(result_df['close'], 20)
-        result_df['sma_50'] = TechnicalIndicators.sma(result_df['close'], 50)
-        result_df['sma_200'] = TechnicalIndicators.sma(result_df['close'], 200)
-        
-        # EMA (Üssel Hareketli Ortalama)
-        result_df['ema_12'] = TechnicalIndicators.ema(result_df['close'], 12)
-        result_df['ema_26'] = TechnicalIndicators.ema(result_df['close'], 26)
+        from technical_analysis.engine import IndicatorEngine
         
-        # MACD (Hareketli Ortalama Yakınsama/Iraksama)
-        macd_result = TechnicalIndicators.macd(result_df['close'])
-        result_df['macd'] = macd_result['macd']
-        result_df['macd_signal'] = macd_result['signal']
-        result_df['macd_histogram'] = macd_result['histogram']
+        engine = IndicatorEngine(df)
+        if fields is None:
+            fields = [field for field in TechnicalIndicators.INDICATOR_FIELDS if engine.available(field)]
         
-        # RSI (Göreceli Güç Endeksi)
-        result_df['rsi_14'] = TechnicalIndicators.rsi(result_df['close'], 14)
-        
-        # Bollinger Bantları
-        bollinger = TechnicalIndicators.bollinger_bands(result_df['close'])
-        result_df['bollinger_upper'] = bollinger['upper']
-        result_df['bollinger_middle'] = bollinger['middle']
-        result_df['bollinger_lower'] = bollinger['lower']
-        
-        # Stokastik Osilatör
-        stoch = TechnicalIndicators.stochastic(result_df)
-        result_df['stoch_k'] = stoch['k']
-        result_df['stoch_d'] = stoch['d']
-        
-        # ATR (Ortalama Gerçek Aralık)
-        result_df['atr'] = TechnicalIndicators.atr(result_df)
+        # Veri setini kopyala (yan etkileri önle)
+        result_df = df.copy()
+        for field in fields:
+            result_df[field] = engine.get(field)
         
-        # OBV (Bir Dengeli Hacim)
-        result_df['obv'] = TechnicalIndicators.obv(result_df)
-
-        # İçerik temizleme (NaN değerleri kaldır veya doldur)
         # Teknik göstergeler genellikle periyot sayısı kadar NaN değerler içerir
-        # result_df = result_df.dropna()  # ya da
         result_df = result_df.fillna(0)  # Geçiş kolaylığı için 0 ile doldurma
         
         return result_df
     
+    @staticmethod
+    def _with_fields(df: pd.DataFrame, fields: List[str]) -> pd.DataFrame:
+        """DataFrame'de eksik olan alanları hesaplayıp ekler"""
+        missing = [field for field in fields if field not in df.columns]
+        return TechnicalIndicators.calculate_indicators(df, missing) if missing else df
+    
     # Uyumluluk için metot isimleri
     @staticmethod
-    def add_all_indicators(df: pd.DataFrame) -> pd.DataFrame:
+    def add_all_indicators(df: pd.DataFrame, fields: Optional[List[str]] = None) -> pd.DataFrame:
         """calculate_indicators metodunun diğer adı - crypto.py için uyumluluk"""
-        return TechnicalIndicators.calculate_indicators(df)
+        return TechnicalIndicators.calculate_indicators(df, fields)
     
     @staticmethod
     def analyze_trend(df: pd.DataFrame) -> Dict[str, Any]:
@@ -76,110 +78,108 @@ class TechnicalIndicators:
         Teknik göstergeleri kullanarak trendin durumunu analiz eder
         
         Args:
-            df: Teknik göstergeler içeren DataFrame
+            df: Teknik göstergeler içeren DataFrame (eksik alanlar hesaplanır)
+            
+        Returns:
+            Dict: Trend analizi sonuçları (son mum)
+        """
+        df = TechnicalIndicators._with_fields(df, TechnicalIndicators.TREND_FIELDS)
+        
+        # Trend gücü tüm pencere için hesaplanır, son mumun değerleri okunur
+        components = signals.strength_components(df)
+        return TechnicalIndicators._trend_result(df.iloc[-1], components, -1)
+    
+    @staticmethod
+    def analyze_trend_row(last_row: Mapping[str, float]) -> Dict[str, Any]:
+        """
+        Tek bir satırın (son mum) değerlerinden trend analizi yapar
+        
+        Args:
+            last_row: `close` ve TREND_FIELDS alanlarını içeren satır (Series veya sözlük)
             
         Returns:
             Dict: Trend analizi sonuçları
         """
-        # Son fiyat ve göstergeleri al
-        last_row = df.iloc[-1]
-        
-        # Trend analizi
-        trend = {
-            "price": last_row['close'],
-            "trend": "Belirsiz",
-            "strength": 0,
-            "signals": [],
-            "sma_20": last_row['sma_20'],
-            "sma_50": last_row['sma_50'],
-            "sma_200": last_row['sma_200'],
-            "rsi": last_row['rsi_14'],
-            "macd": last_row['macd'],
-            "macd_signal": last_row['macd_signal'],
-            "stoch_k": last_row['stoch_k'],
-            "stoch_d": last_row['stoch_d']
+        return TechnicalIndicators._trend_result(last_row, signals.strength_components(last_row), 0)
+    
+    @staticmethod
+    def analyze_trend_rows(rows: pd.DataFrame) -> List[Dict[str, Any]]:
+        """
+        Her satırı ayrı bir son mum sayarak trend analizi yapar (ör. sembol başına son
+        satırlar); trend gücü tüm satırlar için tek geçişte hesaplanır
+        
+        Args:
+            rows: `close` ve TREND_FIELDS sütunlarını içeren DataFrame
+            
+        Returns:
+            List[Dict]: Satır sırasıyla `analyze_trend_row` sonuçları
+        """
+        components = signals.strength_components(rows)
+        return [
+            TechnicalIndicators._trend_result(row, components, i)
+            for i, row in enumerate(rows.to_dict(orient="records"))
+        ]
+    
+    @staticmethod
+    def _trend_result(row: Mapping[str, float], components: Dict[str, np.ndarray], i: int) -> Dict[str, Any]:
+        """
+        Satır değerleri ve `signals.strength_components` dizilerinin i. elemanından trend sonucu
+        """
+        strength = int(components["strength"][i])
+        return {
+            "price": row['close'],
+            "trend": signals.TREND_LABELS[int(components["trend"][i])],
+            "strength": strength,
+            "signals": [
+                labels[int(components[name][i])]
+                for name, labels in signals.STRENGTH_LABELS.items()
+                if components[name][i]
+            ],
+            "sma_20": row['sma_20'],
+            "sma_50": row['sma_50'],
+            "sma_200": row['sma_200'],
+            "rsi": row['rsi_14'],
+            "macd": row['macd'],
+            "macd_signal": row['macd_signal'],
+            "stoch_k": row['stoch_k'],
+            "stoch_d": row['stoch_d']
         }
+    
+    @staticmethod
+    def trend_label(strength: float) -> str:
+        """
+        Trend gücü skorunun etiketi
+        """
+        return signals.TREND_LABELS[int(signals.trend_codes(strength))]
+    
+    @staticmethod
+    def analyze_confluence(frames: Mapping[str, pd.DataFrame]) -> Dict[str, Any]:
+        """
+        Aynı sembolün farklı zaman dilimlerindeki trendlerinin ne ölçüde aynı yönü
+        gösterdiğini (uyum) analiz eder
         
-        signals = []
-        strength = 0
-        
-        # MA analizleri
-        if last_row['close'] > last_row['sma_20']:
-            signals.append("Fiyat SMA20'nin üzerinde")
-            strength += 1
-        else:
-            signals.append("Fiyat SMA20'nin altında")
-            strength -= 1
-        
-        if last_row['close'] > last_row['sma_50']:
-            signals.append("Fiyat SMA50'nin üzerinde")
-            strength += 1
-        else:
-            signals.append("Fiyat SMA50'nin altında")
-            strength -= 1
-        
-        if last_row['close'] > last_row['sma_200']:
-            signals.append("Fiyat SMA200'ün üzerinde (Uzun vadeli yükseliş)")
-            strength += 2
-        else:
-            signals.append("Fiyat SMA200'ün altında (Uzun vadeli düşüş)")
-            strength -= 2
-        
-        # RSI analizi
-        if last_row['rsi_14'] > 70:
-            signals.append("RSI aşırı alım bölgesinde (>70)")
-            strength -= 1
-        elif last_row['rsi_14'] < 30:
-            signals.append("RSI aşırı satım bölgesinde (<30)")
-            strength += 1
-        
-        # MACD analizi
-        if last_row['macd'] > last_row['macd_signal']:
-            signals.append("MACD sinyal çizgisinin üzerinde (Yükseliş)")
-            strength += 1
-        else:
-            signals.append("MACD sinyal çizgisinin altında (Düşüş)")
-            strength -= 1
-        
-        # Stokastik analizi
-        if last_row['stoch_k'] > last_row['stoch_d']:
-            signals.append("Stokastik K > D (Yükseliş)")
-            strength += 1
-        else:
-            signals.append("Stokastik K < D (Düşüş)")
-            strength -= 1
-        
-        if last_row['stoch_k'] > 80:
-            signals.append("Stokastik aşırı alım bölgesinde (>80)")
-            strength -= 1
-        elif last_row['stoch_k'] < 20:
-            signals.append("Stokastik aşırı satım bölgesinde (<20)")
-            strength += 1
-        
-        # Bollinger Bantları analizi
-        if last_row['close'] > last_row['bollinger_upper']:
-            signals.append("Fiyat üst Bollinger bandının üzerinde (Aşırı alım)")
-            strength -= 1
-        elif last_row['close'] < last_row['bollinger_lower']:
-            signals.append("Fiyat alt Bollinger bandının altında (Aşırı satım)")
-            strength += 1
-        
-        # Trend belirleme
-        if strength >= 4:
-            trend["trend"] = "Güçlü Yükseliş"
-        elif strength >= 2:
-            trend["trend"] = "Yükseliş"
-        elif strength <= -4:
-            trend["trend"] = "Güçlü Düşüş"
-        elif strength <= -2:
-            trend["trend"] = "Düşüş"
-        else:
-            trend["trend"] = "Nötr/Yatay"
-        
-        trend["strength"] = strength
-        trend["signals"] = signals
-        
-        return trend
+        Args:
+            frames: Aralık -> OHLCV verileri (küçükten büyüğe)
+            
+        Returns:
+            Dict: Aralık başına trend, yükseliş/düşüş gösteren aralık sayısı, ortalama güç,
+                  genel trend ve uyum oranı (yönü çoğunlukla aynı olan aralıkların oranı)
+        """
+        timeframes = {interval: TechnicalIndicators.analyze_trend(df) for interval, df in frames.items()}
+        strengths = [trend["strength"] for trend in timeframes.values()]
+        bullish = sum(strength >= 2 for strength in strengths)
+        bearish = sum(strength <= -2 for strength in strengths)
+        score = sum(strengths) / len(strengths) if strengths else 0
+        
+        return {
+            "trend": TechnicalIndicators.trend_label(score),
+            "score": round(score, 2),
+            "bullish": bullish,
+            "bearish": bearish,
+            "neutral": len(strengths) - bullish - bearish,
+            "alignment": round(max(bullish, bearish) / len(strengths), 2) if strengths else 0,
+            "timeframes": timeframes
+        }
     
     # Uyumluluk için metot isimleri
     @staticmethod
@@ -191,104 +191,44 @@ class TechnicalIndicators:
     def get_signals(df: pd.DataFrame) -> Dict[str, str]:
         """
         Alım-satım sinyallerini döndürür - crypto.py için uyumluluk
+        
+        Sinyaller `signal_series` ile tüm pencere için hesaplanır, son mumunki döndürülür.
         """
-        last_row = df.iloc[-1]
-        prev_row = df.iloc[-2] if len(df) > 1 else None
+        series = TechnicalIndicators.signal_series(df)
+        last = series.iloc[-1]
         
-        signals = {
-            "overall": "Nötr",
-            "ma": "Nötr",
-            "macd": "Nötr", 
-            "rsi": "Nötr",
-            "stoch": "Nötr",
-            "bollinger": "Nötr"
-        }
+        result = {"overall": signals.TREND_LABELS[int(last["trend"])]}
+        for name, labels in signals.RATING_LABELS.items():
+            result[name] = labels[int(last[name])]
+        return result
+    
+    @staticmethod
+    def signal_series(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Her mum için trend gücü ve gösterge bazlı al/sat derecelendirmeleri
         
-        # Trend analizi sonuçlarını al
-        trend_analysis = TechnicalIndicators.analyze_trend(df)
-        signals["overall"] = trend_analysis["trend"]
-        
-        # MA sinyali
-        if last_row['close'] > last_row['sma_20'] and last_row['sma_20'] > last_row['sma_50']:
-            signals["ma"] = "Güçlü Al"
-        elif last_row['close'] > last_row['sma_20']:
-            signals["ma"] = "Al"
-        elif last_row['close'] < last_row['sma_20'] and last_row['sma_20'] < last_row['sma_50']:
-            signals["ma"] = "Güçlü Sat"
-        elif last_row['close'] < last_row['sma_20']:
-            signals["ma"] = "Sat"
-            
-        # MACD sinyali
-        if last_row['macd'] > last_row['macd_signal'] and last_row['macd'] > 0:
-            signals["macd"] = "Al"
-        elif last_row['macd'] < last_row['macd_signal'] and last_row['macd'] < 0:
-            signals["macd"] = "Sat"
-        elif last_row['macd'] > last_row['macd_signal']:
-            signals["macd"] = "Nötr/Al"
-        else:
-            signals["macd"] = "Nötr/Sat"
-            
-        # RSI sinyali
-        if last_row['rsi_14'] > 70:
-            signals["rsi"] = "Aşırı Alım (Sat)"
-        elif last_row['rsi_14'] < 30:
-            signals["rsi"] = "Aşırı Satım (Al)"
-        elif last_row['rsi_14'] > 50:
-            signals["rsi"] = "Nötr/Yükseliş"
-        else:
-            signals["rsi"] = "Nötr/Düşüş"
-        
-        # Stochastic sinyali
-        if last_row['stoch_k'] > 80 and last_row['stoch_d'] > 80:
-            signals["stoch"] = "Aşırı Alım (Sat)"
-        elif last_row['stoch_k'] < 20 and last_row['stoch_d'] < 20:
-            signals["stoch"] = "Aşırı Satım (Al)"
-        elif last_row['stoch_k'] > last_row['stoch_d']:
-            signals["stoch"] = "Nötr/Yükseliş"
-        else:
-            signals["stoch"] = "Nötr/Düşüş"
-            
-        # Bollinger Bands sinyali
-        if last_row['close'] > last_row['bollinger_upper']:
-            signals["bollinger"] = "Aşırı Alım (Sat)"
-        elif last_row['close'] < last_row['bollinger_lower']:
-            signals["bollinger"] = "Aşırı Satım (Al)"
-        elif last_row['close'] > last_row['bollinger_middle']:
-            signals["bollinger"] = "Nötr/Yükseliş"
-        else:
-            signals["bollinger"] = "Nötr/Düşüş"
+        Args:
+            df: Teknik göstergeler içeren DataFrame (eksik alanlar hesaplanır)
             
-        return signals
+        Returns:
+            pd.DataFrame: df ile aynı indeksli `strength`, `trend` (`signals.TREND_LABELS`
+                kodları) ve `ma`, `macd`, `rsi`, `stoch`, `bollinger` (`signals.RATING_LABELS`
+                kodları) sütunları
+        """
+        df = TechnicalIndicators._with_fields(df, TechnicalIndicators.TREND_FIELDS)
+        components = signals.strength_components(df)
+        data = {"strength": components["strength"], "trend": components["trend"]}
+        data.update(signals.rating_signals(df))
+        return pd.DataFrame(data, index=df.index)
     
     @staticmethod
-    def identify_support_resistance(df: pd.DataFrame, window: int = 10) -> Dict[str, List[float]]:
+    def identify_support_resistance(df: pd.DataFrame, window: int = 10) -> Dict[str, Any]:
         """
         Destek ve direnç seviyelerini belirler - crypto.py için uyumluluk
-        """
-        # Son satır
-        last_close = df['close'].iloc[-1]
-        
-        # Minimum ve maksimum değerler
-        highs = df['high'].rolling(window=window, center=True).max()
-        lows = df['low'].rolling(window=window, center=True).min()
-        
-        # NaN değerleri kaldır
-        highs = highs.dropna()
-        lows = lows.dropna()
         
-        # Son 100 veri noktası içindeki önemli seviyeler
-        recent_highs = highs.tail(100).sort_values(ascending=False).unique()[:3]
-        recent_lows = lows.tail(100).sort_values().unique()[:3]
-        
-        # Mevcut fiyata göre direnç ve destek seviyeleri
-        resistance_levels = [level for level in recent_highs if level > last_close]
-        support_levels = [level for level in recent_lows if level < last_close]
-        
-        # Sonuç
-        return {
-            "support": support_levels.tolist() if hasattr(support_levels, 'tolist') else list(support_levels),
-            "resistance": resistance_levels.tolist() if hasattr(resistance_levels, 'tolist') else list(resistance_levels)
-        }
+        Bkz. `technical_analysis.support_resistance.support_resistance`
+        """
+        return support_resistance(df, window)
     
     @staticmethod
     def sma(series: pd.Series, period: int) -> pd.Series:
@@ -321,6 +261,22 @@ class TechnicalIndicators:
             'histogram': macd_histogram
         }
     
+    @staticmethod
+    def wilder_smoothing(series: pd.Series, period: int) -> pd.Series:
+        """
+        Wilder yumuşatması: ilk `period` değerin basit ortalamasıyla başlar, sonrasında
+        avg[i] = (avg[i-1] * (period-1) + x[i]) / period özyinelemesini uygular.
+        
+        Özyineleme alpha=1/period olan `ewm(adjust=False)` ile aynıdır ve
+        `technical_analysis.jit` üzerinden seçili arka uçta (numba/numpy) çalışır.
+        """
+        if len(series) < period:
+            return pd.Series(np.nan, index=series.index, dtype=float)
+        
+        values = series.to_numpy(dtype=float)
+        smoothed = ewm_from(values, period - 1, series.iloc[:period].mean(), 1 / period, ignore_na=False)
+        return pd.Series(smoothed, index=series.index)
+    
     @staticmethod
     def rsi(series: pd.Series, period: int = 14) -> pd.Series:
         """Göreceli Güç Endeksi (RSI) hesaplar"""
@@ -331,14 +287,9 @@ class TechnicalIndicators:
         gain = delta.where(delta > 0, 0)
         loss = -delta.where(delta < 0, 0)
         
-        # İlk ortalamalar
-        avg_gain = gain.rolling(window=period).mean()
-        avg_loss = loss.rolling(window=period).mean()
-        
-        # Üssel ortalamalar (ilk değerleri döngü dışında hesapla)
-        for i in range(period, len(series)):
-            avg_gain.iloc[i] = (avg_gain.iloc[i-1] * (period-1) + gain.iloc[i]) / period
-            avg_loss.iloc[i] = (avg_loss.iloc[i-1] * (period-1) + loss.iloc[i]) / period
+        # Wilder ortalamaları (ilk değer basit ortalama, sonrası 1/period ağırlıklı)
+        avg_gain = TechnicalIndicators.wilder_smoothing(gain, period)
+        avg_loss = TechnicalIndicators.wilder_smoothing(loss, period)
         
         # RS ve RSI hesaplama
         rs = avg_gain / avg_loss
@@ -421,18 +372,52 @@ class TechnicalIndicators:
         Returns:
             pd.Series: OBV değerleri
         """
+        # Kapanış yükseldiyse +hacim, düştüyse -hacim, değişmediyse 0; ilk mumda OBV 0'dır
+        direction = np.sign(df['close'].diff()).fillna(0)
+        return (direction * df['volume']).cumsum().astype(float)
+    
+    @staticmethod
+    def money_flow_multiplier(df: pd.DataFrame) -> pd.Series:
+        """
+        Para akışı çarpanı: ((kapanış - düşük) - (yüksek - kapanış)) / (yüksek - düşük)
+        Yüksek ve düşüğün eşit olduğu mumlarda 0 kabul edilir.
+        """
+        high = df['high']
+        low = df['low']
         close = df['close']
-        volume = df['volume']
-        
-        obv = pd.Series(index=df.index)
-        obv.iloc[0] = 0
-        
-        for i in range(1, len(close)):
-            if close.iloc[i] > close.iloc[i-1]:
-                obv.iloc[i] = obv.iloc[i-1] + volume.iloc[i]
-            elif close.iloc[i] < close.iloc[i-1]:
-                obv.iloc[i] = obv.iloc[i-1] - volume.iloc[i]
-            else:
-                obv.iloc[i] = obv.iloc[i-1]
-                
-        return obv 
\ No newline at end of file
+        
+        spread = (high - low).replace(0, np.nan)
+        return (((close - low) - (high - close)) / spread).fillna(0)
+    
+    @staticmethod
+    def accumulation_distribution(df: pd.DataFrame) -> pd.Series:
+        """
+        Birikim/Dağılım (A/D) çizgisi hesaplar
+        
+        Returns:
+            pd.Series: Para akışı hacminin kümülatif toplamı
+        """
+        return (TechnicalIndicators.money_flow_multiplier(df) * df['volume']).cumsum()
+    
+    @staticmethod
+    def chaikin_money_flow(df: pd.DataFrame, period: int = 20) -> pd.Series:
+        """
+        Chaikin Para Akışı (CMF) hesaplar
+        
+        Returns:
+            pd.Series: period boyunca para akışı hacmi toplamı / hacim toplamı
+        """
+        money_flow_volume = TechnicalIndicators.money_flow_multiplier(df) * df['volume']
+        return money_flow_volume.rolling(window=period).sum() / df['volume'].rolling(window=period).sum()
+    
+    @staticmethod
+    def cumulative_volume_delta(df: pd.DataFrame) -> pd.Series:
+        """
+        Kümülatif Hacim Deltası (CVD) hesaplar. Alıcı (taker buy) hacminden satıcı
+        hacmi (toplam hacim - alıcı hacmi) çıkarılıp kümülatif toplanır.
+        
+        Returns:
+            pd.Series: CVD değerleri
+        """
+        buy_volume = df['taker_buy_base_asset_volume']
+        return (2 * buy_volume - df['volume']).cumsum() 
\ No newline at end of file